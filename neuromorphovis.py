@@ -32,13 +32,14 @@ import sys
 import subprocess
 
 # Append the internal modules into the system paths to avoid Blender importing conflicts
-import_paths = ['nmv/interface/cli', 'nmv/file/ops', 'nmv/slurm']
+import_paths = ['nmv/interface/cli', 'nmv/file/ops', 'nmv/slurm', 'nmv/utilities']
 for import_path in import_paths:
     sys.path.append(('%s/%s' % (os.path.dirname(os.path.realpath(__file__)), import_path)))
     
 # Internal imports
 import arguments_parser
 import file_ops
+import profiler
 import slurm
 
 
@@ -90,6 +91,7 @@ def create_shell_commands_for_local_execution(arguments,
        arguments.render_neuron_morphology_360 or            \
        arguments.render_neuron_morphology_progressive or    \
        arguments.export_morphology_swc or                   \
+       arguments.export_morphology_h5 or                    \
        arguments.export_morphology_segments or              \
        arguments.export_morphology_blend:
 
@@ -116,7 +118,8 @@ def create_shell_commands_for_local_execution(arguments,
        arguments.export_neuron_mesh_ply or                  \
        arguments.export_neuron_mesh_obj or                  \
        arguments.export_neuron_mesh_stl or                  \
-       arguments.export_neuron_mesh_blend:
+       arguments.export_neuron_mesh_blend or                \
+       arguments.export_neuron_mesh_nmv:
 
         # Add this command to the list
         shell_commands.append('%s -b --verbose 0 --python %s -- %s' %
@@ -136,13 +139,17 @@ def run_local_neuromorphovis(arguments):
         Command line arguments.
     """
 
-    # Target and GID options are only available on the BBP visualization clusters
-    if arguments.input == 'target' or arguments.input == 'gid':
+    # A single GID can be loaded locally from a local cells table (.csv or .h5)
+    local_cells_table = arguments.blue_config is not None and \
+        os.path.splitext(arguments.blue_config)[1].lower() in ['.csv', '.h5', '.hdf5']
+
+    # Otherwise, target and GID options are only available on the BBP visualization clusters
+    if arguments.input == 'target' or (arguments.input == 'gid' and not local_cells_table):
         print('ERROR, Target and GID options are only available on the BBP visualization clusters')
         exit(0)
 
-    # Load morphology files (.H5 or .SWC)
-    elif arguments.input == 'file':
+    # Load morphology files (.H5 or .SWC), or a GID from a local cells table
+    elif arguments.input == 'file' or arguments.input == 'gid':
 
         # Get the arguments string list
         arguments_string = arguments_parser.get_arguments_string(arguments=arguments)
@@ -163,19 +170,31 @@ def run_local_neuromorphovis(arguments):
     # Load a directory morphology files (.H5 or .SWC)
     elif arguments.input == 'directory':
 
-        # Get all the morphology files in this directory
-        morphology_files = file_ops.get_files_in_directory(arguments.morphology_directory, '.h5')
-        morphology_files.extend(file_ops.get_files_in_directory(
-            arguments.morphology_directory, '.swc'))
+        # Get all the morphology files in this directory, or in the list if it is given
+        morphology_files = file_ops.get_morphology_files(
+            morphology_directory=arguments.morphology_directory,
+            morphology_list=arguments.morphology_list)
 
-        # If the directory is empty, give an error message
+        # If the directory, or the list, is empty, give an error message
         if len(morphology_files) == 0:
-            print('ERROR: The directory [%s] does NOT contain any morphology files' %
-                  arguments.morphology_directory)
+            print('ERROR: The %s [%s] does NOT contain any morphology files' % (
+                ('list', arguments.morphology_list) if arguments.morphology_list is not None
+                else ('directory', arguments.morphology_directory)))
+            exit(0)
 
         # A list of all the commands to be executed
         shell_commands = list()
 
+        # All the morphologies are analyzed by a single Blender instance, the other tasks are
+        # executed for every morphology file
+        if arguments.analyze_morphology:
+            cli_morphology_analysis = '%s/nmv/interface/cli/morphology_analysis.py' % \
+                os.path.dirname(os.path.realpath(__file__))
+            shell_commands.append('%s -b --verbose 0 --python %s -- %s' % (
+                arguments.blender, cli_morphology_analysis,
+                arguments_parser.get_arguments_string(arguments=arguments)))
+            arguments.analyze_morphology = False
+
         # Construct the commands for every individual morphology file
         for morphology_file in morphology_files:
 
@@ -195,6 +214,14 @@ def run_local_neuromorphovis(arguments):
             print('*******************************************************************************')
             subprocess.call(shell_command, shell=True)
 
+        # Merge the profiling reports of all the neurons into a single report
+        if arguments.profile:
+            merged_report = profiler.merge_profiling_reports(
+                directory='%s/%s' % (arguments.output_directory, file_ops.Paths.STATS_FOLDER),
+                report_format=arguments.profile_format)
+            if merged_report is not None:
+                print('Profiling report [%s]' % merged_report)
+
     else:
         print('ERROR: Input data source, use \'file, gid, target or directory\'')
         exit(0)
@@ -65,6 +65,8 @@ if [ "$ADD_NUCLEUS" == "yes" ];
 # Export morphology
 if [ "$EXPORT_NEURON_MORPHOLOGY_SWC" == "yes" ];
     then BOOL_ARGS+=' --export-morphology-swc'; fi
+if [ "$EXPORT_NEURON_MORPHOLOGY_H5" == "yes" ];
+    then BOOL_ARGS+=' --export-morphology-h5'; fi
 if [ "$EXPORT_NEURON_MORPHOLOGY_BLEND" == "yes" ];
     then BOOL_ARGS+=' --export-morphology-blend '; fi
 if [ "#EXPORT_NEURON_MORPHOLOGY_SEGMENTS" == "yes" ];
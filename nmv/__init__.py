@@ -17,12 +17,13 @@
 
 # System imports
 import sys
+import importlib
+import importlib.util
 
-# Internal imports
-import nmv.file
-
-# Create the logger
-logger = nmv.file.Logger()
+# The subpackages of NeuroMorphoVis, imported on their first access
+SUBPACKAGES = ['analysis', 'bbox', 'bmeshi', 'builders', 'consts', 'edit', 'enums', 'file',
+               'geometry', 'interface', 'mesh', 'neurorender', 'options', 'physics', 'rendering',
+               'scene', 'shading', 'skeleton', 'slurm', 'utilities']
 
 
 ####################################################################################################
@@ -36,3 +37,139 @@ def kill(option=0):
     """
 
     sys.exit(option)
+
+
+####################################################################################################
+# @import_submodule_names
+####################################################################################################
+def import_submodule_names(package_name,
+                           submodule):
+    """Imports a submodule of a package and returns the names it exports with 'import *'.
+
+    :param package_name:
+        The name of the package.
+    :param submodule:
+        The relative name of the submodule, for example '.ops'.
+    :return:
+        A tuple of the imported submodule and a list of its exported names.
+    """
+
+    module = importlib.import_module(submodule, package_name)
+    names = getattr(module, '__all__', None)
+    if names is None:
+        names = [name for name in module.__dict__ if not name.startswith('_')]
+    return module, names
+
+
+####################################################################################################
+# @load_package_lazily
+####################################################################################################
+def load_package_lazily(package_name,
+                        package_globals,
+                        submodules):
+    """Replaces the 'from .submodule import *' imports of a package with lazy imports. The names
+    of the package are resolved on their first access from the submodules in the given order, and
+    then cached in the package, therefore importing a package only costs its __init__ and the
+    modules are imported when they are needed.
+
+    Python versions older than 3.7 do not support the module-level __getattr__, and the
+    submodules are imported directly.
+
+    :param package_name:
+        The name of the package, __name__ in its __init__.
+    :param package_globals:
+        The globals() of the package.
+    :param submodules:
+        A list of the relative names of the submodules, in the order of their star imports.
+    """
+
+    # Import everything directly, like 'from .submodule import *'
+    if sys.version_info < (3, 7):
+        for submodule in submodules:
+            module, names = import_submodule_names(package_name, submodule)
+            package_globals.update({name: getattr(module, name) for name in names})
+        return
+
+    # The exported names of all the submodules, for 'import *' and dir()
+    def get_all_names():
+        all_names = list()
+        for submodule in submodules:
+            all_names.extend(import_submodule_names(package_name, submodule)[1])
+        return sorted(set(all_names))
+
+    # Resolves a missing name in the package
+    def __getattr__(name):
+
+        # Only the public names are exported by the submodules
+        if name == '__all__':
+            return get_all_names()
+        if name.startswith('_'):
+            raise AttributeError("module '%s' has no attribute '%s'" % (package_name, name))
+
+        # A submodule of the package
+        if '.%s' % name in submodules:
+            value = importlib.import_module('.%s' % name, package_name)
+
+        # A name exported by one of the submodules, the last one wins like with 'import *'
+        else:
+            for submodule in reversed(submodules):
+                module = importlib.import_module(submodule, package_name)
+                value = getattr(module, name, package_globals)
+                if value is not package_globals:
+                    break
+
+            # Any other submodule of the package that is not imported in its __init__
+            else:
+                if importlib.util.find_spec('%s.%s' % (package_name, name)) is None:
+                    raise AttributeError(
+                        "module '%s' has no attribute '%s'" % (package_name, name))
+                value = importlib.import_module('.%s' % name, package_name)
+
+        # Cache the name, the next accesses do not call __getattr__
+        package_globals[name] = value
+        return value
+
+    # Lists all the names of the package
+    def __dir__():
+        return sorted(set(package_globals.keys()) | set(get_all_names()))
+
+    package_globals['__getattr__'] = __getattr__
+    package_globals['__dir__'] = __dir__
+
+
+####################################################################################################
+# @__getattr__
+####################################################################################################
+def __getattr__(name):
+    """Creates the logger and the profiler on their first use and imports the subpackages on
+    their first access, without loading the rest of NeuroMorphoVis.
+
+    :param name:
+        The name of the attribute.
+    :return:
+        The value of the attribute.
+    """
+
+    global logger, profiler
+
+    # Create the logger, the modules are imported directly to avoid loading their packages
+    if name == 'logger':
+        logger = importlib.import_module('nmv.file.logger').Logger()
+        return logger
+
+    # Create the profiler, disabled unless requested, see nmv.utilities.Profiler
+    if name == 'profiler':
+        profiler = importlib.import_module('nmv.utilities.profiler').Profiler()
+        return profiler
+
+    # A subpackage
+    if name in SUBPACKAGES:
+        return importlib.import_module('nmv.%s' % name)
+
+    raise AttributeError("module 'nmv' has no attribute '%s'" % name)
+
+
+# Python versions older than 3.7 do not support the module-level __getattr__
+if sys.version_info < (3, 7):
+    logger = __getattr__('logger')
+    profiler = __getattr__('profiler')
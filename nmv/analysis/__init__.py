@@ -15,8 +15,12 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .kernels import *
-from .structs import *
-from .plotting import *
-from .analysis_items import *
-from .analysis_distributions import *
+# Import the modules on the first access to their names, see nmv.load_package_lazily
+import nmv
+nmv.load_package_lazily(__name__, globals(), [
+    '.kernels',
+    '.structs',
+    '.plotting',
+    '.analysis_items',
+    '.analysis_distributions',
+    '.batch_analysis'])
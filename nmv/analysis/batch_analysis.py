@@ -0,0 +1,187 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import csv
+import multiprocessing
+
+# Internal imports
+import nmv.analysis
+import nmv.file
+
+
+####################################################################################################
+# @get_batch_analysis_columns
+####################################################################################################
+def get_batch_analysis_columns():
+    """Gets the columns of the aggregated analysis table of a batch of morphologies. Every row
+    has the global analysis items and the results of the per-arbor items for the entire
+    morphology.
+
+    :return:
+        A list of the names of the columns.
+    """
+
+    columns = ['Morphology', 'File']
+    columns.extend([item.variable for item in nmv.analysis.ui_global_analysis_items])
+    columns.extend([item.variable for item in nmv.analysis.ui_per_arbor_analysis_items])
+    return columns
+
+
+####################################################################################################
+# @analyze_morphology_items
+####################################################################################################
+def analyze_morphology_items(morphology):
+    """Applies the kernels of the analysis items on a morphology. The items are shared by all the
+    morphologies of a batch and no UI variables are registered, therefore the results are
+    returned instead of being stored in the items.
+
+    :param morphology:
+        A given morphology to analyze.
+    :return:
+        A dictionary of the results, keyed by the variables of the items.
+    """
+
+    results = dict()
+
+    # The global items
+    for item in nmv.analysis.ui_global_analysis_items:
+        if item.kernel is not None:
+            results[item.variable] = item.kernel(morphology)
+
+    # The per-arbor items, only the result of the entire morphology is reported
+    for item in nmv.analysis.ui_per_arbor_analysis_items:
+        if item.kernel is not None:
+            results[item.variable] = item.kernel(morphology).morphology_result
+
+    return results
+
+
+####################################################################################################
+# @analyze_morphology_file
+####################################################################################################
+def analyze_morphology_file(morphology_file):
+    """Loads a morphology file and applies the analysis kernels on it.
+
+    :param morphology_file:
+        The path to the morphology file.
+    :return:
+        The loaded morphology and the results of the analysis, or None for the morphology if it
+        cannot be loaded and None for the results if it cannot be analyzed. Any error is reported
+        and does not stop the analysis of the rest of the batch.
+    """
+
+    morphology = None
+    try:
+
+        # Load the morphology
+        loading_flag, morphology = nmv.file.read_morphology_from_file_naively(morphology_file)
+        if not loading_flag:
+            return None, None
+
+        # Analyze it
+        return morphology, analyze_morphology_items(morphology)
+
+    except Exception as e:
+        nmv.logger.log('ERROR: Failed to analyze the morphology file [%s]: %s' %
+                       (morphology_file, e))
+        return morphology, None
+
+
+####################################################################################################
+# @analyze_morphology_file_task
+####################################################################################################
+def analyze_morphology_file_task(morphology_file):
+    """Analyzes a morphology file in a worker process. The morphology is not returned to avoid
+    sending it back to the main process.
+
+    :param morphology_file:
+        The path to the morphology file.
+    :return:
+        The label of the morphology, or None if it cannot be loaded, and the analysis results.
+    """
+
+    morphology, results = analyze_morphology_file(morphology_file)
+    return morphology.label if morphology is not None else None, results
+
+
+####################################################################################################
+# @analyze_morphology_files
+####################################################################################################
+def analyze_morphology_files(morphology_files,
+                             output_file,
+                             processes=1,
+                             callback=None):
+    """Analyzes a batch of morphology files in a single process, or in a pool of worker processes
+    forked from this process, and streams the results into a single table. Every row is written
+    once its morphology is analyzed, in the order of the given files, and the morphologies that
+    cannot be analyzed get rows without results.
+
+    :param morphology_files:
+        A list of the paths of the morphology files.
+    :param output_file:
+        The path to the output .csv file.
+    :param processes:
+        The number of the worker processes.
+    :param callback:
+        An optional function that is called with every analyzed morphology, for example to plot
+        its results. It is only called if the morphologies are analyzed in this process.
+    :return:
+        The number of the analyzed morphologies.
+    """
+
+    # Analyze the morphologies in a pool, the results are received in order
+    pool = None
+    if processes > 1:
+        pool = multiprocessing.Pool(processes)
+        analyses = pool.imap(analyze_morphology_file_task, morphology_files, chunksize=4)
+
+    # Or in this process, with the same shared analysis items
+    else:
+        def analyze_in_process(morphology_file):
+            morphology, results = analyze_morphology_file(morphology_file)
+            if callback is not None and results is not None:
+                callback(morphology)
+            return morphology.label if morphology is not None else None, results
+        analyses = map(analyze_in_process, morphology_files)
+
+    columns = get_batch_analysis_columns()
+    number_analyzed_morphologies = 0
+    try:
+        with open(output_file, 'w', newline='') as table_file:
+            writer = csv.writer(table_file)
+            writer.writerow(columns)
+
+            # Write every row once it is ready, the failed morphologies get empty rows
+            for morphology_file, (label, results) in zip(morphology_files, analyses):
+                row = ['' if label is None else label, morphology_file]
+                if results is None:
+                    nmv.logger.log('ERROR: Cannot analyze the morphology file [%s]' %
+                                   morphology_file)
+                    row.extend([''] * len(columns[2:]))
+                else:
+                    row.extend(['' if results.get(column) is None else results[column]
+                                for column in columns[2:]])
+                    number_analyzed_morphologies += 1
+                writer.writerow(row)
+                table_file.flush()
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    return number_analyzed_morphologies
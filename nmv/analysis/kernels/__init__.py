@@ -15,8 +15,11 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .arbor import *
-from .morphology import *
-from .section import *
-from .functional import *
-from .distributions import *
+# Import the modules on the first access to their names, see nmv.load_package_lazily
+import nmv
+nmv.load_package_lazily(__name__, globals(), [
+    '.arbor',
+    '.morphology',
+    '.section',
+    '.functional',
+    '.distributions'])
@@ -15,12 +15,15 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .common import *
-from .area_ops import *
-from .lengths_ops import *
-from .samples_ops import *
-from .volume_ops import *
-from .global_ops import *
-from .structure_ops import *
-from .soma_ops import *
-from .angle_ops import *
+# Import the modules on the first access to their names, see nmv.load_package_lazily
+import nmv
+nmv.load_package_lazily(__name__, globals(), [
+    '.common',
+    '.area_ops',
+    '.lengths_ops',
+    '.samples_ops',
+    '.volume_ops',
+    '.global_ops',
+    '.structure_ops',
+    '.soma_ops',
+    '.angle_ops'])
@@ -15,9 +15,11 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .angle_ops import *
-from .area_ops import *
-from .lengths_ops import *
-from .samples_ops import *
-from .volume_ops import *
-
+# Import the modules on the first access to their names, see nmv.load_package_lazily
+import nmv
+nmv.load_package_lazily(__name__, globals(), [
+    '.angle_ops',
+    '.area_ops',
+    '.lengths_ops',
+    '.samples_ops',
+    '.volume_ops'])
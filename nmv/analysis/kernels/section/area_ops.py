@@ -15,9 +15,6 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-# System imports
-import math
-
 
 ####################################################################################################
 # @compute_section_surface_area_from_segments
@@ -33,35 +30,8 @@ def compute_section_surface_area_from_segments(section):
         Section total surface area in square microns.
     """
 
-    # Section surface area
-    section_surface_area = 0.0
-
-    # If the section has less than two samples, then report the error
-    if len(section.samples) < 2:
-
-        # Return 0
-        return section_surface_area
-
-    # Integrate the surface area between each two successive samples
-    for i in range(len(section.samples) - 1):
-
-        # Retrieve the data of the samples along each segment on the section
-        p0 = section.samples[i].point
-        p1 = section.samples[i + 1].point
-        r0 = section.samples[i].radius
-        r1 = section.samples[i + 1].radius
-
-        # Compute the segment lateral area
-        segment_length = (p0 - p1).length
-        r_sum = r0 + r1
-        r_diff = r0 - r1
-        segment_lateral_area = math.pi * r_sum * math.sqrt((r_diff * r_diff) + segment_length)
-
-        # Compute the segment surface area and append it to the total section surface area
-        section_surface_area += segment_lateral_area + math.pi * ((r0 * r0) + (r1 * r1))
-
-    # Return the section surface area
-    return section_surface_area
+    # Get the surface area from the cached geometry of the section
+    return section.get_geometry().surface_area
 
 
 ####################################################################################################
@@ -77,27 +47,8 @@ def compute_segments_surface_areas_in_section(section,
         A list to collect the resulting data.
     """
 
-    # If the section has less than two samples, then report the error
-    if len(section.samples) < 2:
-        return
-
-    # Integrate the surface area between each two successive samples
-    for i in range(len(section.samples) - 1):
-
-        # Retrieve the data of the samples along each segment on the section
-        p0 = section.samples[i].point
-        p1 = section.samples[i + 1].point
-        r0 = section.samples[i].radius
-        r1 = section.samples[i + 1].radius
-
-        # Compute the segment lateral area
-        segment_length = (p0 - p1).length
-        r_sum = r0 + r1
-        r_diff = r0 - r1
-        segment_lateral_area = math.pi * r_sum * math.sqrt((r_diff * r_diff) + segment_length)
-
-        # Compute the segment surface area and append it list
-        segments_surface_areas.append(segment_lateral_area + math.pi * ((r0 * r0) + (r1 * r1)))
+    # Append the surface areas of the segments from the cached geometry of the section
+    segments_surface_areas.extend(section.get_geometry().segments_surface_areas.tolist())
 
 
 ####################################################################################################
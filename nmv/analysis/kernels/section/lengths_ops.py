@@ -29,22 +29,8 @@ def compute_segments_lengths(section,
         A list to collect the resulting data.
     """
 
-    # The section must have at least two samples to form one segment
-    if len(section.samples) < 2:
-        return
-
-    # Iterate over each segment in the section
-    for i in range(len(section.samples) - 1):
-
-        # Retrieve the points along each segment on the section
-        point_0 = section.samples[i].point
-        point_1 = section.samples[i + 1].point
-
-        # Compute the segment length
-        segment_length = (point_1 - point_0).length
-
-        # Append it to the list
-        segments_lengths.append(segment_length)
+    # Append the lengths of the segments from the cached geometry of the section
+    segments_lengths.extend(section.get_geometry().segments_lengths.tolist())
 
 
 ####################################################################################################
@@ -64,27 +50,8 @@ def compute_section_length(section):
         Section total length in microns.
     """
 
-    # Section length
-    section_length = 0.0
-
-    # If the section has less than two samples, then report the error
-    if len(section.samples) < 2:
-
-        # Return
-        return section_length
-
-    # Integrate the distance between each two successive samples
-    for i in range(len(section.samples) - 1):
-
-        # Retrieve the points along each segment on the section
-        point_0 = section.samples[i].point
-        point_1 = section.samples[i + 1].point
-
-        # Update the section length
-        section_length += (point_1 - point_0).length
-
-    # Return the section length
-    return section_length
+    # Get the length from the cached geometry of the section
+    return section.get_geometry().length
 
 
 ####################################################################################################
@@ -15,8 +15,6 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-import math
-
 
 ####################################################################################################
 # @compute_section_volume_from_segments
@@ -33,29 +31,8 @@ def compute_section_volume_from_segments(section):
         Section total volume in cube microns.
     """
 
-    # Section volume
-    section_volume = 0.0
-
-    # If the section has less than two samples, then report the error
-    if len(section.samples) < 2:
-
-        # Return 0
-        return section_volume
-
-    # Integrate the volume between each two successive samples
-    for i in range(len(section.samples) - 1):
-
-        # Retrieve the data of the samples along each segment on the section
-        p0 = section.samples[i].point
-        p1 = section.samples[i + 1].point
-        r0 = section.samples[i].radius
-        r1 = section.samples[i + 1].radius
-
-        # Compute the segment volume and append to the total section volume
-        section_volume += (1.0 / 3.0) * math.pi * (p0 - p1).length * (r0 * r0 + r0 * r1 + r1 * r1)
-
-    # Return the section volume
-    return section_volume
+    # Get the volume from the cached geometry of the section
+    return section.get_geometry().volume
 
 
 ####################################################################################################
@@ -95,21 +72,7 @@ def compute_segments_volumes_in_section(section,
         A list to collect the resulting data.
     """
 
-    # If the section has less than two samples, then report the error
-    if len(section.samples) < 2:
-        return
-
-    # Integrate the volume between each two successive samples
-    for i in range(len(section.samples) - 1):
-
-        # Retrieve the data of the samples along each segment on the section
-        p0 = section.samples[i].point
-        p1 = section.samples[i + 1].point
-        r0 = section.samples[i].radius
-        r1 = section.samples[i + 1].radius
+    # Append the volumes of the segments from the cached geometry of the section
+    segments_volumes.extend(section.get_geometry().segments_volumes.tolist())
 
-        # Compute the segment volume and append to the total section volume
-        segment_volume = (1.0 / 3.0) * math.pi * (p0 - p1).length * (r0 * r0 + r0 * r1 + r1 * r1)
 
-        # Append to the list
-        segments_volumes.append(segment_volume)
@@ -15,7 +15,10 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .analysis_item import *
-from .analysis_data import *
-from .analysis_distribution import *
-from .morphology_analysis_result import *
+# Import the modules on the first access to their names, see nmv.load_package_lazily
+import nmv
+nmv.load_package_lazily(__name__, globals(), [
+    '.analysis_item',
+    '.analysis_data',
+    '.analysis_distribution',
+    '.morphology_analysis_result'])
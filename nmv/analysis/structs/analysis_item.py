@@ -15,12 +15,6 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-# Blender imports
-import bpy
-from bpy.props import IntProperty
-from bpy.props import FloatProperty
-
-
 ####################################################################################################
 # AnalysisItem
 ####################################################################################################
@@ -90,6 +84,11 @@ class AnalysisItem:
              The prefix 'in string format' that is used to tag or identify the analysis component.
         """
 
+        # Blender is only needed to register the variables, the kernels run without it
+        import bpy
+        from bpy.props import IntProperty
+        from bpy.props import FloatProperty
+
         # Append a little detail to the description to indicate if this is morphology or arbor
         if 'Morphology' in variable_prefix:
             description = '%s %s' % (self.description, '. This value is reported for the morphology')
@@ -131,6 +130,11 @@ class AnalysisItem:
             A given morphology to analyze.
         """
 
+        # Blender is only needed to register the variables, the kernels run without it
+        import bpy
+        from bpy.props import IntProperty
+        from bpy.props import FloatProperty
+
         # Float entry
         if self.data_format == 'FLOAT':
             setattr(bpy.types.Scene, '%s' % self.variable,
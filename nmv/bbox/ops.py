@@ -18,6 +18,9 @@
 # System imports
 import math
 
+# External imports
+import numpy
+
 # Blender imports
 import bpy
 from mathutils import Vector
@@ -30,6 +33,36 @@ import nmv.mesh
 import nmv.scene
 
 
+####################################################################################################
+# @compute_points_bounding_box
+####################################################################################################
+def compute_points_bounding_box(points):
+    """Return the bounding box of an array of points.
+
+    :param points:
+        An Nx3 array of points.
+    :return:
+        The bounding box of the given points. If the array is empty, the bounding box is inverted,
+        i.e. p_min is larger than p_max, similar to the union of an empty list of bounding boxes.
+    """
+
+    # Empty array
+    if len(points) == 0:
+        return nmv.bbox.BoundingBox(p_min=Vector((1e10, 1e10, 1e10)),
+                                    p_max=Vector((-1e10, -1e10, -1e10)))
+
+    # Compute the min and max points in one pass
+    points = numpy.asarray(points, dtype=numpy.float64).reshape(-1, 3)
+    p_min = Vector(points.min(axis=0).tolist())
+    p_max = Vector(points.max(axis=0).tolist())
+
+    # Build bounding box object
+    bounding_box = nmv.bbox.BoundingBox(p_min=p_min, p_max=p_max)
+
+    # Return a reference to it
+    return bounding_box
+
+
 ####################################################################################################
 # @extend_bounding_boxes
 ####################################################################################################
@@ -42,30 +75,10 @@ def extend_bounding_boxes(bounding_boxes_list):
         The union bounding box of all the given bounding boxes.
     """
 
-    # Initialize the min and max points
-    p_min = Vector((1e10, 1e10, 1e10))
-    p_max = Vector((-1e10, -1e10, -1e10))
-
-    for bounding_box in bounding_boxes_list:
-        if bounding_box.p_min[0] < p_min[0]:
-            p_min[0] = bounding_box.p_min[0]
-        if bounding_box.p_min[1] < p_min[1]:
-            p_min[1] = bounding_box.p_min[1]
-        if bounding_box.p_min[2] < p_min[2]:
-            p_min[2] = bounding_box.p_min[2]
-
-        if bounding_box.p_max[0] > p_max[0]:
-            p_max[0] = bounding_box.p_max[0]
-        if bounding_box.p_max[1] > p_max[1]:
-            p_max[1] = bounding_box.p_max[1]
-        if bounding_box.p_max[2] > p_max[2]:
-            p_max[2] = bounding_box.p_max[2]
-
-    # Build bounding box object
-    bounding_box = nmv.bbox.BoundingBox(p_min, p_max)
-
-    # Return a reference to it
-    return bounding_box
+    # Stack the corners of all the bounding boxes and compute the union in one pass
+    corners = [(bounding_box.p_min[:], bounding_box.p_max[:])
+               for bounding_box in bounding_boxes_list]
+    return compute_points_bounding_box(numpy.array(corners).reshape(-1, 3))
 
 
 ####################################################################################################
@@ -91,6 +104,23 @@ def get_object_bounding_box(scene_object):
     return bounding_box
 
 
+####################################################################################################
+# @get_object_bounding_box_corners
+####################################################################################################
+def get_object_bounding_box_corners(scene_object):
+    """Return the eight corners of the bounding box of a given object, translated to its location.
+
+    :param scene_object:
+        An object existing in the scene.
+    :return:
+        An 8x3 array of the corners of the bounding box of the object.
+    """
+
+    # The corners of the local bounding box, adjusted by the location of the object
+    return numpy.array(scene_object.bound_box, dtype=numpy.float64).reshape(8, 3) + \
+        numpy.array(scene_object.location[:], dtype=numpy.float64)
+
+
 ####################################################################################################
 # @confirm_object_bounding_box
 ####################################################################################################
@@ -103,50 +133,8 @@ def confirm_object_bounding_box(scene_object):
         The bounding box of the given object.
     """
 
-    # Compute the bounding box of the object from the vertices
-    box = scene_object.bound_box
-
-    # Compute the bounding box from the vertices of the object
-    verts = list()
-    verts.append((box[0][0], box[0][1], box[0][2]))
-    verts.append((box[1][0], box[1][1], box[1][2]))
-    verts.append((box[2][0], box[2][1], box[2][2]))
-    verts.append((box[3][0], box[3][1], box[3][2]))
-    verts.append((box[4][0], box[4][1], box[4][2]))
-    verts.append((box[5][0], box[5][1], box[5][2]))
-    verts.append((box[6][0], box[6][1], box[6][2]))
-    verts.append((box[7][0], box[7][1], box[7][2]))
-
-    # Initialize the min and max points
-    p_min = Vector((10000000, 10000000, 10000000))
-    p_max = Vector((-10000000, -10000000, -10000000))
-
-    for point in range(0, len(verts)):
-        if verts[point][0] < p_min[0]:
-            p_min[0] = verts[point][0]
-        if verts[point][1] < p_min[1]:
-            p_min[1] = verts[point][1]
-        if verts[point][2] < p_min[2]:
-            p_min[2] = verts[point][2]
-        if verts[point][0] > p_max[0]:
-            p_max[0] = verts[point][0]
-        if verts[point][1] > p_max[1]:
-            p_max[1] = verts[point][1]
-        if verts[point][2] > p_max[2]:
-            p_max[2] = verts[point][2]
-
-    # Get object location
-    location = scene_object.location
-
-    # Adjust the bounding box transform
-    p_min += location
-    p_max += location
-
-    # Build bounding box object
-    bounding_box = nmv.bbox.BoundingBox(p_min=p_min, p_max=p_max)
-
-    # Return a reference to it
-    return bounding_box
+    # Compute the bounding box from the corners of the object
+    return compute_points_bounding_box(get_object_bounding_box_corners(scene_object))
 
 
 ####################################################################################################
@@ -161,18 +149,11 @@ def get_objects_bounding_box(objects):
         The bounding box of a group of objects.
     """
 
-    # Get a list of all the bounding boxes of the given objects in the scene
-    objects_bboxes_list = list()
-
-    for scene_object in objects:
-        bbox = confirm_object_bounding_box(scene_object)
-        objects_bboxes_list.append(bbox)
-
-    # Compute the largest bounding box of all the given ones
-    objects_bounding_box = extend_bounding_boxes(objects_bboxes_list)
-
-    # Return a reference to the union bounding box
-    return objects_bounding_box
+    # Stack the corners of all the objects and compute the union bounding box in one pass
+    corners = [get_object_bounding_box_corners(scene_object) for scene_object in objects]
+    if len(corners) == 0:
+        return compute_points_bounding_box(numpy.zeros((0, 3)))
+    return compute_points_bounding_box(numpy.concatenate(corners))
 
 
 ####################################################################################################
@@ -15,7 +15,9 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .bmesh_face_ops import *
-from .bmesh_object_ops import *
-from .bmesh_vertex_ops import *
-
+# Import the modules on the first access to their names, see nmv.load_package_lazily
+import nmv
+nmv.load_package_lazily(__name__, globals(), [
+    '.bmesh_face_ops',
+    '.bmesh_object_ops',
+    '.bmesh_vertex_ops'])
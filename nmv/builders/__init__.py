@@ -15,8 +15,11 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .soma import *
-from .nucleus import *
-from .morphology import *
-from .mesh import *
-from .spine import *
+# Import the modules on the first access to their names, see nmv.load_package_lazily
+import nmv
+nmv.load_package_lazily(__name__, globals(), [
+    '.soma',
+    '.nucleus',
+    '.morphology',
+    '.mesh',
+    '.spine'])
@@ -15,8 +15,13 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .common import *
-from .meta_builder import *
-from .piecewise_builder import *
-from .union_builder import *
-from .skinning_builder import *
+# Import the modules on the first access to their names, see nmv.load_package_lazily
+import nmv
+nmv.load_package_lazily(__name__, globals(), [
+    '.common',
+    '.meta_planner',
+    '.implicit_mesher',
+    '.meta_builder',
+    '.piecewise_builder',
+    '.union_builder',
+    '.skinning_builder'])
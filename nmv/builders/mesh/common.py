@@ -21,6 +21,7 @@ import os
 
 # Blender imports
 import bpy
+import numpy
 
 # Internal imports
 import nmv.scene
@@ -84,6 +85,56 @@ def create_skeleton_materials(builder):
     nmv.shading.create_material_specific_illumination(builder.options.shading.mesh_material)
 
 
+####################################################################################################
+# @get_mesh_materials
+####################################################################################################
+def get_mesh_materials(builder):
+    """Gets a list of all the materials that the given builder can assign to the neuron mesh.
+
+    :param builder:
+        An object of the builder that is used to reconstruct the neuron mesh.
+    :return:
+        A list of the materials, in the order they are created.
+    """
+
+    # Return the list
+    return builder.soma_materials + builder.axons_materials + builder.basal_dendrites_materials + \
+        builder.apical_dendrites_materials + builder.spines_materials
+
+
+####################################################################################################
+# @update_mesh_materials
+####################################################################################################
+def update_mesh_materials(builder):
+    """Re-creates the materials of a neuron mesh that is already reconstructed by the given builder,
+    following a change in the shading options, and assigns them to the mesh objects without
+    reconstructing the mesh again.
+
+    :param builder:
+        An object of the builder that has reconstructed the neuron mesh.
+    :return:
+        True if the materials are updated, or False if some of the mesh objects have materials
+        that are not created by the builder, and therefore the mesh must be reconstructed again.
+    """
+
+    # Find the materials of the mesh objects before they are removed with the old materials
+    mesh_objects = get_neuron_mesh_objects(builder=builder)
+    materials_indices = nmv.shading.get_materials_indices(
+        mesh_objects, get_mesh_materials(builder=builder))
+    if materials_indices is None:
+        return False
+
+    # Remove the lights of the old materials, without deleting the selected mesh objects
+    nmv.scene.ops.deselect_all()
+    nmv.scene.ops.clear_lights()
+
+    # Create the new materials and assign them to the mesh objects
+    create_skeleton_materials(builder=builder)
+    nmv.shading.set_materials_from_indices(
+        mesh_objects, materials_indices, get_mesh_materials(builder=builder))
+    return True
+
+
 ####################################################################################################
 # @update_morphology_skeleton
 ####################################################################################################
@@ -266,33 +317,99 @@ def adjust_texture_mapping_of_all_meshes(builder, texspace_size=5.0):
 
 
 ####################################################################################################
-# @select_arbor_to_soma_vertices
+# @get_arbors_to_connect_to_soma
 ####################################################################################################
-def select_arbor_to_soma_vertices(soma_mesh,
-                                  arbor):
-    """Selects a set of vertices to smooth an arbor that is connected to the soma.
+def get_arbors_to_connect_to_soma(builder):
+    """Gets a list of the arbors that will be connected to the soma, with respect to the options.
+
+    :param builder:
+        An object of the builder that is used to reconstruct the neuron mesh.
+    :return:
+        A list of the root sections of the arbors, in the order of the connection.
+    """
+
+    arbors = list()
+
+    # Axons
+    if not builder.options.morphology.ignore_axons:
+        if builder.morphology.has_axons():
+            arbors.extend(builder.morphology.axons)
+
+    # Apical dendrites
+    if not builder.options.morphology.ignore_apical_dendrites:
+        if builder.morphology.has_apical_dendrites():
+            arbors.extend(builder.morphology.apical_dendrites)
+
+    # Basal dendrites
+    if not builder.options.morphology.ignore_basal_dendrites:
+        if builder.morphology.has_basal_dendrites():
+            arbors.extend(builder.morphology.basal_dendrites)
+
+    # Return the list
+    return arbors
+
+
+####################################################################################################
+# @get_arbor_to_soma_bridging_point
+####################################################################################################
+def get_arbor_to_soma_bridging_point(arbor):
+    """Gets the point where a given arbor is bridged to the soma, right before its initial segment.
 
-    :param soma_mesh:
-        A reference to the mesh object of the soma.
     :param arbor:
-        A reference to the mesh object of the arbor.
+        A given arbor.
+    :return:
+        The bridging point.
     """
 
-    # Get the arbor starting point at its initial segment
+    # Get the arbor starting point at its initial segment and its direction
     branch_starting_point = arbor.samples[0].point
-
-    # Get its direction
     branch_direction = arbor.samples[0].point.normalized()
 
     # The bridging point is computed
-    bridging_point = branch_starting_point - 0.75 * branch_direction
+    return branch_starting_point - 0.75 * branch_direction
+
+
+####################################################################################################
+# @resolve_arbors_to_soma_faces
+####################################################################################################
+def resolve_arbors_to_soma_faces(builder,
+                                 arbors):
+    """Resolves the soma faces that will be bridged to the given arbors against the face centers
+    of the soma mesh, and caches the vertices of every face in the arbor.
+
+    NOTE: Every face is bridged to a single arbor, since a bridged face is removed from the soma
+    mesh. The faces are given in the order of the connection, every arbor gets the nearest face
+    that is not taken by a previous arbor.
 
-    # The smoothing extent (radius) is assumed to be double that radius of the initial sample
-    smoothing_extent = arbor.samples[0].radius * 2.0
+    NOTE: The vertices of the soma mesh keep their indices when the arbors are joined to it,
+    since the soma is always the active object of the joint operation, and therefore the cached
+    vertices are valid during the entire bridging process.
 
-    # Select the vertices that need to be smoothed
-    nmv.mesh.ops.select_vertices_within_extent(
-        mesh_object=soma_mesh, point=bridging_point, radius=smoothing_extent)
+    :param builder:
+        An object of the builder that is used to reconstruct the neuron mesh.
+    :param arbors:
+        A list of the arbors to be connected to the soma.
+    """
+
+    # Clear the faces cached from a previous reconstruction of the same morphology
+    for arbor in arbors:
+        arbor.soma_face_vertices = None
+
+    # Only the arbors that are connected to the soma
+    connected_arbors = [arbor for arbor in arbors if arbor.connected_to_soma]
+    if len(connected_arbors) == 0 or builder.soma_mesh is None:
+        return
+
+    # Give a unique face to every bridging point
+    faces_centers = nmv.mesh.ops.get_faces_centers(builder.soma_mesh)
+    faces_indices = nmv.mesh.ops.get_indices_of_nearest_unique_faces_to_points(
+        faces_centers, [get_arbor_to_soma_bridging_point(arbor) for arbor in connected_arbors])
+
+    # Cache the vertices of the faces, the arbors without faces look them up while bridging
+    for arbor, face_index in zip(connected_arbors, faces_indices):
+        if face_index >= 0:
+            arbor.soma_face_vertices = list(
+                builder.soma_mesh.data.polygons[int(face_index)].vertices)
 
 
 ####################################################################################################
@@ -301,6 +418,9 @@ def select_arbor_to_soma_vertices(soma_mesh,
 def smooth_arbors_to_soma_connections(builder):
     """Smooths the connectivity between the arbors and the soma.
 
+    The vertices around all the connections are resolved in a single pass over the vertices of the
+    soma mesh and selected at once.
+
     :param builder:
         An object of the builder that is used to reconstruct the neuron mesh.
     """
@@ -316,23 +436,17 @@ def smooth_arbors_to_soma_connections(builder):
 
     if builder.options.mesh.soma_connection == nmv.enums.Meshing.SomaConnection.CONNECTED:
 
-        # Connecting apical dendrites
-        if not builder.options.morphology.ignore_apical_dendrites:
-            if builder.morphology.has_apical_dendrites():
-                for arbor in builder.morphology.apical_dendrites:
-                    select_arbor_to_soma_vertices(soma_mesh=builder.soma_mesh, arbor=arbor)
+        # The smoothing extent (radius) is assumed to be double that radius of the initial sample
+        arbors = get_arbors_to_connect_to_soma(builder=builder)
+        if len(arbors) > 0:
+            vertices_groups = nmv.mesh.ops.get_indices_of_vertices_within_extents(
+                positions=nmv.mesh.ops.get_vertices_positions(builder.soma_mesh),
+                points=[get_arbor_to_soma_bridging_point(arbor) for arbor in arbors],
+                radii=[arbor.samples[0].radius * 2.0 for arbor in arbors])
 
-        # Connecting basal dendrites
-        if not builder.options.morphology.ignore_basal_dendrites:
-            if builder.morphology.has_basal_dendrites():
-                for arbor in builder.morphology.basal_dendrites:
-                    select_arbor_to_soma_vertices(soma_mesh=builder.soma_mesh, arbor=arbor)
-
-        # Connecting axons
-        if not builder.options.morphology.ignore_axons:
-            if builder.morphology.has_axons():
-                for arbor in builder.morphology.axons:
-                    select_arbor_to_soma_vertices(soma_mesh=builder.soma_mesh, arbor=arbor)
+            # Select the vertices that need to be smoothed
+            for vertices_group in vertices_groups:
+                nmv.mesh.ops.select_vertices_by_indices(builder.soma_mesh, vertices_group)
 
     if builder.options.mesh.soma_type == \
             nmv.enums.Soma.Representation.META_BALLS:
@@ -373,26 +487,17 @@ def connect_arbors_to_soma(builder):
     if builder.options.mesh.soma_connection == nmv.enums.Meshing.SomaConnection.CONNECTED:
         nmv.logger.info('Connecting arbors to soma')
 
-        # Connecting axons
-        if not builder.options.morphology.ignore_axons:
-            if builder.morphology.has_axons():
-                for arbor in builder.morphology.axons:
-                    nmv.logger.detail(arbor.label)
-                    builder.soma_mesh = connection_function(builder.soma_mesh, arbor)
-
-        # Connecting apical dendrites
-        if not builder.options.morphology.ignore_apical_dendrites:
-            if builder.morphology.has_apical_dendrites():
-                for arbor in builder.morphology.apical_dendrites:
-                    nmv.logger.detail(arbor.label)
-                    builder.soma_mesh = connection_function(builder.soma_mesh, arbor)
-
-        # Connecting basal dendrites
-        if not builder.options.morphology.ignore_basal_dendrites:
-            if builder.morphology.has_basal_dendrites():
-                for arbor in builder.morphology.basal_dendrites:
-                    nmv.logger.detail(arbor.label)
-                    builder.soma_mesh = connection_function(builder.soma_mesh, arbor)
+        # Get the arbors in the order of their connection
+        arbors = get_arbors_to_connect_to_soma(builder=builder)
+
+        # Resolve the soma faces of all the arbors at once, only needed for the bridging
+        if builder.options.mesh.soma_type == nmv.enums.Soma.Representation.SOFT_BODY:
+            resolve_arbors_to_soma_faces(builder=builder, arbors=arbors)
+
+        # Connect the arbors
+        for arbor in arbors:
+            nmv.logger.detail(arbor.label)
+            builder.soma_mesh = connection_function(builder.soma_mesh, arbor)
 
         # Adjust the normals
         nmv.mesh.adjust_normals(mesh_object=builder.soma_mesh)
@@ -673,21 +778,15 @@ def transform_to_global_coordinates(builder):
             # Get neuron objects
             neuron_mesh_objects = get_neuron_mesh_objects(builder=builder, exclude_spines=False)
 
-            # Do it mesh by mesh
-            for i, neuron_mesh_object in enumerate(neuron_mesh_objects):
-                # Show the progress
-                nmv.utilities.show_progress(
-                    '* Transforming to global coordinates', float(i),
-                    float(len(neuron_mesh_objects)))
-
-                # Transforming to global coordinates
-                nmv.skeleton.ops.transform_to_global_coordinates(
-                    mesh_object=neuron_mesh_object,
-                    blue_config=builder.options.morphology.blue_config,
-                    gid=builder.options.morphology.gid)
+            # Get the transformation matrix once, the circuit is loaded to read it
+            transformation_matrix = nmv.skeleton.ops.get_transformation_matrix(
+                blue_config=builder.options.morphology.blue_config,
+                gid=builder.options.morphology.gid)
+            if transformation_matrix is None:
+                return
 
-            # Show the progress
-            nmv.utilities.show_progress('* Transforming to global coordinates', 0, 0, done=True)
+            # Transform all the vertices of every mesh at once
+            nmv.mesh.transform_mesh_objects(neuron_mesh_objects, transformation_matrix)
 
             # Don't proceed
             return
@@ -764,6 +863,76 @@ def update_samples_indices_per_arbor(section,
         update_samples_indices_per_arbor(child, index, max_branching_order)
 
 
+################################################################################################
+# @compute_arbor_samples_arrays
+################################################################################################
+def compute_arbor_samples_arrays(arbor,
+                                 starting_index,
+                                 max_branching_order):
+    """Updates the global indices of all the samples along the given arbor and collects their
+    positions, radii and connectivity (the skeleton graph of the arbor) in a single traversal.
+
+    The sections are visited in the same pre-order as update_samples_indices_per_arbor, and
+    therefore the resulting indices are identical. The entries below the starting index are
+    reserved to the auxiliary samples and must be filled by the caller, and their edges are not
+    included.
+
+    :param arbor:
+        The root section of a given arbor.
+    :param starting_index:
+        The global index of the first sample of the arbor.
+    :param max_branching_order:
+        The maximum branching order of the arbor requested by the user.
+    :return:
+        A tuple of three NumPy arrays (positions, radii, edges) of shape (N, 3), (N,) and (M, 2)
+        respectively, where the i-th sample entry corresponds to the sample whose arbor_idx is i,
+        and every edge links a sample to its parent.
+    """
+
+    # Lists of the positions and radii of the samples, indexed by the arbor index
+    positions = [(0.0, 0.0, 0.0)] * starting_index
+    radii = [0.0] * starting_index
+
+    # A list of the edges of the graph, each edge is a pair of (parent, child) indices
+    edges = list()
+
+    # Use an explicit stack to avoid the recursion overhead, children are pushed in reverse
+    # order to preserve the pre-order of the recursive implementation
+    stack = [arbor]
+    while stack:
+        section = stack.pop()
+
+        # If the order goes beyond the maximum requested by the user, ignore the samples
+        if section.branching_order > max_branching_order:
+            continue
+
+        # The first sample of the root section gets a new index, otherwise, it is the same as
+        # the index of the last sample of the parent section
+        if section.is_root():
+            section.samples[0].arbor_idx = len(positions)
+            positions.append(tuple(section.samples[0].point))
+            radii.append(section.samples[0].radius)
+        else:
+            section.samples[0].arbor_idx = section.parent.samples[-1].arbor_idx
+
+        # Update the indices of the rest of the samples along the section
+        parent_idx = section.samples[0].arbor_idx
+        for sample in section.samples[1:]:
+            sample.arbor_idx = len(positions)
+            positions.append(tuple(sample.point))
+            radii.append(sample.radius)
+            edges.append((parent_idx, sample.arbor_idx))
+            parent_idx = sample.arbor_idx
+
+        # Visit the children
+        stack.extend(reversed(section.children))
+
+    # Return the arrays
+    return numpy.array(positions, dtype=numpy.float32), \
+        numpy.array(radii, dtype=numpy.float32), \
+        numpy.array(edges, dtype=numpy.int32).reshape(-1, 2)
+
+
 ################################################################################################
 # @select_vertex
 ################################################################################################
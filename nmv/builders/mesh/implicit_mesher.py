@@ -0,0 +1,375 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import multiprocessing
+
+import numpy
+
+
+####################################################################################################
+# @evaluate_meta_field
+####################################################################################################
+def evaluate_meta_field(origin,
+                        voxel_size,
+                        dimensions,
+                        centers,
+                        radii,
+                        stiffness=2.0):
+    """Evaluates the sum-of-spheres field of a list of meta elements on a regular grid.
+
+    The field is identical to the one used by the Blender metaball polygonizer, where every
+    element contributes with stiffness * (1 - d^2 / r^2)^3 within its radius r.
+
+    :param origin:
+        The position of the first sample of the grid.
+    :param voxel_size:
+        The spacing between the samples of the grid.
+    :param dimensions:
+        The number of the samples along each axis.
+    :param centers:
+        An (E, 3) array of the centers of the elements.
+    :param radii:
+        An (E,) array of the radii of the elements.
+    :param stiffness:
+        The stiffness of the elements, by default 2.0 similar to Blender.
+    :return:
+        A 3D array of the field values.
+    """
+
+    origin = numpy.asarray(origin, dtype=numpy.float64)
+    dimensions = numpy.asarray(dimensions, dtype=numpy.int64)
+    field = numpy.zeros(tuple(dimensions), dtype=numpy.float64)
+
+    # The sample coordinates along every axis
+    axes = [origin[i] + voxel_size * numpy.arange(dimensions[i]) for i in range(3)]
+
+    # The sub-grid that is covered by every element
+    lower = numpy.maximum(numpy.ceil((centers - radii[:, None] - origin) / voxel_size), 0)
+    upper = numpy.minimum(numpy.floor((centers + radii[:, None] - origin) / voxel_size) + 1,
+                          dimensions)
+    lower = lower.astype(numpy.int64)
+    upper = upper.astype(numpy.int64)
+
+    # Accumulate the contribution of every element in its sub-grid only
+    for i in range(len(radii)):
+        x0, y0, z0 = lower[i]
+        x1, y1, z1 = upper[i]
+        if x0 >= x1 or y0 >= y1 or z0 >= z1:
+            continue
+
+        dx = (axes[0][x0:x1] - centers[i][0]) ** 2
+        dy = (axes[1][y0:y1] - centers[i][1]) ** 2
+        dz = (axes[2][z0:z1] - centers[i][2]) ** 2
+        falloff = 1.0 - (dx[:, None, None] + dy[None, :, None] + dz[None, None, :]) / \
+            (radii[i] * radii[i])
+        numpy.maximum(falloff, 0.0, out=falloff)
+        field[x0:x1, y0:y1, z0:z1] += stiffness * falloff * falloff * falloff
+
+    # Return the field
+    return field
+
+
+####################################################################################################
+# @extract_surface_nets
+####################################################################################################
+def extract_surface_nets(field,
+                         threshold):
+    """Extracts a quad surface from a sampled field using the surface nets (dual contouring with
+    mass-point vertices) algorithm.
+
+    A single vertex is placed in every cell that is crossed by the surface at the average of the
+    crossing points along the edges of the cell, and a quad is emitted for every edge crossing
+    between the four cells that share the edge. The quads are emitted only for the edges that
+    start within the samples [1, N - 2], i.e. the first and the last two layers of samples are only
+    used as a padding, which is used to tile the domain.
+
+    :param field:
+        A 3D array of the field values.
+    :param threshold:
+        The iso-value of the surface, the inside is where the field is above it.
+    :return:
+        A tuple (cells, vertices, quads), where cells is a (V, 3) array of the indices of the
+        cells that have vertices, vertices is a (V, 3) array of their positions in grid units,
+        and quads is a (Q, 4) array of indices into the vertices, oriented outwards.
+    """
+
+    values = field - threshold
+    inside = values > 0
+    cells_shape = tuple(numpy.array(values.shape) - 1)
+
+    # Accumulators for the crossing points of the edges of every cell
+    sums = numpy.zeros(cells_shape + (3,))
+    counts = numpy.zeros(cells_shape)
+
+    # The quads, as lists of cell indices per axis
+    quads = list()
+
+    for axis in range(3):
+
+        # Values at both ends of every edge along this axis
+        lower_slice = [slice(None)] * 3
+        upper_slice = [slice(None)] * 3
+        lower_slice[axis] = slice(None, -1)
+        upper_slice[axis] = slice(1, None)
+        v0 = values[tuple(lower_slice)]
+        v1 = values[tuple(upper_slice)]
+        crossing = inside[tuple(lower_slice)] != inside[tuple(upper_slice)]
+
+        # The crossing point of the edges, in grid units
+        t = numpy.where(crossing, v0 / numpy.where(crossing, v0 - v1, 1.0), 0.0)
+        points = numpy.stack(numpy.meshgrid(*[numpy.arange(n) for n in v0.shape],
+                                            indexing='ij'), axis=-1).astype(numpy.float64)
+        points[..., axis] += t
+
+        # Every edge is shared by four cells, add its crossing point to all of them
+        others = [a for a in range(3) if a != axis]
+        for d0 in (0, 1):
+            for d1 in (0, 1):
+                edge_slice = [slice(None)] * 3
+                edge_slice[others[0]] = slice(d0, d0 + cells_shape[others[0]])
+                edge_slice[others[1]] = slice(d1, d1 + cells_shape[others[1]])
+                edge_slice = tuple(edge_slice)
+                sums += numpy.where(crossing[edge_slice][..., None], points[edge_slice], 0.0)
+                counts += crossing[edge_slice]
+
+        # The edges that emit quads, ignoring the first and last layers of samples
+        owned = numpy.zeros(crossing.shape, dtype=bool)
+        owned_slice = [slice(1, -2)] * 3
+        owned_slice[axis] = slice(1, -1)
+        owned[tuple(owned_slice)] = True
+        edges = numpy.argwhere(crossing & owned)
+        if len(edges) == 0:
+            continue
+
+        # The four cells around every edge, in a counter-clockwise order around the axis
+        a, b = others if (others[1] - others[0]) % 3 == 1 else others[::-1]
+        ring = list()
+        for da, db in ((1, 1), (0, 1), (0, 0), (1, 0)):
+            cell = edges.copy()
+            cell[:, a] -= da
+            cell[:, b] -= db
+            ring.append(cell)
+        ring = numpy.stack(ring, axis=1)
+
+        # Flip the quads where the inside is at the upper end of the edge
+        flip = ~inside[tuple(edges.T)]
+        ring[flip] = ring[flip][:, ::-1]
+        quads.append(ring)
+
+    if len(quads) == 0:
+        return numpy.zeros((0, 3), dtype=numpy.int64), numpy.zeros((0, 3)), \
+            numpy.zeros((0, 4), dtype=numpy.int64)
+    quads = numpy.concatenate(quads)
+
+    # Only keep the vertices that are used by the quads
+    flat_quads = numpy.ravel_multi_index(tuple(quads.reshape(-1, 3).T), cells_shape)
+    used, inverse = numpy.unique(flat_quads, return_inverse=True)
+    cells = numpy.stack(numpy.unravel_index(used, cells_shape), axis=1)
+    vertices = sums[tuple(cells.T)] / counts[tuple(cells.T)][:, None]
+
+    # Return the surface
+    return cells, vertices, inverse.reshape(-1, 4)
+
+
+####################################################################################################
+# @get_meta_tiles
+####################################################################################################
+def get_meta_tiles(centers,
+                   radii,
+                   tile_extent,
+                   padding):
+    """Finds the tiles of a sparse grid that intersect the influence spheres of the elements.
+
+    :param centers:
+        An (E, 3) array of the centers of the elements.
+    :param radii:
+        An (E,) array of the radii of the elements.
+    :param tile_extent:
+        The size of every tile in world units.
+    :param padding:
+        An extra margin around every element to account for the padding of the tiles.
+    :return:
+        A tuple (tiles, elements), where tiles is a (T, 3) array of the integer coordinates of
+        the tiles, and elements is a list of arrays of the indices of the elements per tile.
+    """
+
+    # The range of tiles covered by every element
+    lower = numpy.floor((centers - radii[:, None] - padding) / tile_extent).astype(numpy.int64)
+    upper = numpy.floor((centers + radii[:, None] + padding) / tile_extent).astype(numpy.int64)
+    extents = upper - lower + 1
+    counts = extents.prod(axis=1)
+
+    # Expand the (element, tile) pairs
+    element_ids = numpy.repeat(numpy.arange(len(radii)), counts)
+    local = numpy.arange(counts.sum()) - numpy.repeat(numpy.cumsum(counts) - counts, counts)
+    pair_extents = extents[element_ids]
+    offsets = numpy.stack((local % pair_extents[:, 0],
+                           (local // pair_extents[:, 0]) % pair_extents[:, 1],
+                           local // (pair_extents[:, 0] * pair_extents[:, 1])), axis=1)
+    pair_tiles = lower[element_ids] + offsets
+
+    # Group the elements by tile
+    tiles, inverse = numpy.unique(pair_tiles, axis=0, return_inverse=True)
+    inverse = inverse.ravel()
+    order = numpy.argsort(inverse, kind='stable')
+    splits = numpy.cumsum(numpy.bincount(inverse, minlength=len(tiles)))[:-1]
+    elements = numpy.split(element_ids[order], splits)
+
+    # Return the tiles
+    return tiles, elements
+
+
+####################################################################################################
+# @polygonize_meta_tile
+####################################################################################################
+def polygonize_meta_tile(task):
+    """Polygonizes a single tile of the sparse grid.
+
+    :param task:
+        A tuple (tile, level, cells, voxel_size, centers, radii, threshold, stiffness), where tile
+        is the integer coordinate of the tile, level is its resolution level, cells is the number
+        of cells along every axis of the tile and voxel_size is the size of the cells at this level.
+    :return:
+        A tuple (keys, vertices, quads), where keys is a (V, 4) array of the global keys of the
+        vertices (level and global cell index), vertices are their positions in world units and
+        quads are the local indices of the vertices of every quad.
+    """
+
+    tile, level, cells, voxel_size, centers, radii, threshold, stiffness = task
+
+    # The tile is sampled with one extra layer of samples on each side, such that the vertices of
+    # the cells along its borders are identical to the ones computed by the neighbouring tiles
+    first_sample = numpy.asarray(tile, dtype=numpy.int64) * cells - 1
+    origin = first_sample * voxel_size
+    field = evaluate_meta_field(origin=origin, voxel_size=voxel_size,
+                                dimensions=(cells + 3, cells + 3, cells + 3),
+                                centers=centers, radii=radii, stiffness=stiffness)
+
+    # Extract the surface of the tile
+    local_cells, vertices, quads = extract_surface_nets(field=field, threshold=threshold)
+
+    # Global keys and world positions of the vertices
+    keys = numpy.empty((len(local_cells), 4), dtype=numpy.int64)
+    keys[:, 0] = level
+    keys[:, 1:] = local_cells + first_sample
+    vertices = origin + vertices * voxel_size
+
+    # Return the surface of the tile
+    return keys, vertices, quads
+
+
+####################################################################################################
+# @polygonize_meta_elements
+####################################################################################################
+def polygonize_meta_elements(centers,
+                             radii,
+                             voxel_size,
+                             threshold=0.6,
+                             stiffness=2.0,
+                             tile_size=32,
+                             adaptive=False,
+                             maximum_level=3,
+                             processes=1):
+    """Creates a mesh of the iso-surface of a list of meta elements without Blender.
+
+    The domain is divided into tiles of a sparse grid, where only the tiles that intersect the
+    influence spheres of the elements are allocated, and every tile is polygonized independently,
+    optionally in parallel. The memory therefore scales with the surface of the neuron and not the
+    volume of its bounding box.
+
+    If the adaptive resolution is used, every tile gets a resolution level based on the smallest
+    element in it, where the voxel size at level L is voxel_size * 2^L. The vertices along the
+    borders of the tiles of different levels are not shared, and therefore the adaptive meshes are
+    intended for visualization rather than for simulations that require watertight meshes.
+
+    :param centers:
+        An (E, 3) array of the centers of the elements.
+    :param radii:
+        An (E,) array of the radii of the elements.
+    :param voxel_size:
+        The size of the voxels at the finest level.
+    :param threshold:
+        The iso-value of the surface, by default 0.6 similar to Blender.
+    :param stiffness:
+        The stiffness of the elements, by default 2.0 similar to Blender.
+    :param tile_size:
+        The number of the cells along every axis of a tile at the finest level, a power of two.
+    :param adaptive:
+        Use an adaptive resolution based on the local radius.
+    :param maximum_level:
+        The coarsest allowed level if the adaptive resolution is used.
+    :param processes:
+        The number of the processes used to polygonize the tiles.
+    :return:
+        A tuple of two arrays (vertices, faces) of shape (V, 3) and (F, 4) respectively.
+    """
+
+    centers = numpy.asarray(centers, dtype=numpy.float64).reshape(-1, 3)
+    radii = numpy.asarray(radii, dtype=numpy.float64).ravel()
+    if len(radii) == 0:
+        return numpy.zeros((0, 3)), numpy.zeros((0, 4), dtype=numpy.int64)
+
+    # The levels must keep at least four cells per tile
+    if adaptive:
+        maximum_level = max(0, min(maximum_level, int(numpy.log2(tile_size)) - 2))
+    else:
+        maximum_level = 0
+
+    # The tiles have a fixed extent in world units for all the levels
+    tile_extent = tile_size * voxel_size
+    padding = 2 * voxel_size * (2 ** maximum_level)
+    tiles, tiles_elements = get_meta_tiles(centers, radii, tile_extent, padding)
+
+    # The resolution level of every element, the smallest element in a tile decides its level
+    elements_levels = numpy.clip(
+        numpy.floor(numpy.log2(radii / radii.min())), 0, maximum_level).astype(numpy.int64)
+
+    # Build the tasks
+    tasks = list()
+    for tile, elements in zip(tiles, tiles_elements):
+        level = int(elements_levels[elements].min())
+        tasks.append((tile, level, tile_size >> level, voxel_size * (2 ** level),
+                      centers[elements], radii[elements], threshold, stiffness))
+
+    # Polygonize the tiles
+    if processes > 1:
+        with multiprocessing.Pool(processes) as pool:
+            results = pool.map(polygonize_meta_tile, tasks, chunksize=4)
+    else:
+        results = [polygonize_meta_tile(task) for task in tasks]
+
+    # Merge the tiles, the vertices with the same keys are shared between neighbouring tiles
+    keys = list()
+    vertices = list()
+    faces = list()
+    offset = 0
+    for tile_keys, tile_vertices, tile_quads in results:
+        keys.append(tile_keys)
+        vertices.append(tile_vertices)
+        faces.append(tile_quads + offset)
+        offset += len(tile_keys)
+    keys = numpy.concatenate(keys)
+    vertices = numpy.concatenate(vertices)
+    faces = numpy.concatenate(faces)
+    if len(faces) == 0:
+        return numpy.zeros((0, 3)), numpy.zeros((0, 4), dtype=numpy.int64)
+
+    _, first, inverse = numpy.unique(keys, axis=0, return_index=True, return_inverse=True)
+
+    # Return the mesh
+    return vertices[first], inverse.ravel()[faces]
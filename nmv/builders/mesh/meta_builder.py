@@ -16,11 +16,12 @@
 ####################################################################################################
 
 # System imports
-import copy
 import random
+import time
 
 # Blender importsget_n_nearest_vertices_to_point
 import bpy, mathutils
+import numpy
 from mathutils import Vector, Matrix
 
 # Internal modules
@@ -61,7 +62,7 @@ class MetaBuilder:
         """
 
         # Morphology
-        self.morphology = copy.deepcopy(morphology)
+        self.morphology = morphology.clone()
 
         # Loaded options from NeuroMorphoVis
         self.options = options
@@ -109,6 +110,29 @@ class MetaBuilder:
         # A temporary label for the mesh
         self.label = 'meta_mesh'
 
+        # The centers and radii of the planned meta elements, collected until they are written
+        self.planned_centers = list()
+        self.planned_radii = list()
+
+        # The centers and radii of all the meta elements of the meta object
+        self.meta_centers = numpy.zeros((0, 3), dtype=numpy.float32)
+        self.meta_radii = numpy.zeros(0, dtype=numpy.float32)
+
+        # The number of the meta elements that were planned before merging the redundant ones
+        self.number_planned_elements = 0
+
+        # The number of the meta elements that were created in the meta object
+        self.number_created_elements = 0
+
+        # Total time to plan the meta elements
+        self.planning_time = 0
+
+        # Total time to create the meta elements
+        self.elements_creation_time = 0
+
+        # Time to polygonize the meta object
+        self.finalize_time = 0
+
     ################################################################################################
     # @update_morphology_skeleton
     ################################################################################################
@@ -132,122 +156,81 @@ class MetaBuilder:
               nmv.skeleton.ops.label_primary_and_secondary_sections_based_on_angles])
 
     ################################################################################################
-    # @create_meta_segment
+    # @create_meta_elements
     ################################################################################################
-    def create_meta_segment(self, p1, p2, r1, r2):
-        """Constructs a segment that is composed of two points with a meta object.
-
-        :param p1:
-            First point coordinate.
-        :param p2:
-            Second point coordinate.
-        :param r1:
-            First point radius.
-        :param r2:
-            Second point radius.
+    def create_meta_elements(self,
+                             centers,
+                             radii):
+        """Adds a list of planned meta elements to the meta skeleton. The elements are only
+        collected here, and they are all written to the meta skeleton at once later by
+        flush_meta_elements().
+
+        :param centers:
+            An (E, 3) array of the centers of the elements.
+        :param radii:
+            An (E,) array of the radii of the elements.
         """
 
-        # Segment vector
-        segment = p2 - p1
-        segment_length = segment.length
-
-        # Make sure that the segment length is not zero
-        if segment_length < 0.001:
-            return
-
-        # Verify the radii, or fix them
-        if r1 < 0.001 * segment_length:
-            r1 = 0.001 * segment_length
-        if r2 < 0.001 * segment_length:
-            r2 = 0.001 * segment_length
-
-        # Compute the deltas between the first and last points along the segments
-        dr = r2 - r1
-        dx = p2[0] - p1[0]
-        dy = p2[1] - p1[1]
-        dz = p2[2] - p1[2]
-
-        # Keep track on the distance traveled along the segment while building, initially 0
-        travelled_distance = 0.0
-
-        # Local points, initially at the first point
-        r = r1
-        x = p1[0]
-        y = p1[1]
-        z = p1[2]
-
-        # Construct the meta elements along the segment
-        i = 0
-        while travelled_distance < segment_length:
-
-            # Make a meta ball (or sphere) at this point
-            meta_element = self.meta_skeleton.elements.new()
-
-            # Set its radius
-            if i == 0:
-                meta_element.radius = r * 0.90
-            else:
-                meta_element.radius = r
-
-            # Update its coordinates
-            meta_element.co = (x, y, z)
-
-            # Proceed to the next point
-            travelled_distance += 0.5 * r
-
-            r = r1 + (travelled_distance * dr / segment_length)
-
-            # Get the next point
-            x = p1[0] + (travelled_distance * dx / segment_length)
-            y = p1[1] + (travelled_distance * dy / segment_length)
-            z = p1[2] + (travelled_distance * dz / segment_length)
-
-            i += 1
+        # Collect the elements
+        self.planned_centers.append(numpy.asarray(centers, dtype=numpy.float32).reshape(-1, 3))
+        self.planned_radii.append(numpy.asarray(radii, dtype=numpy.float32).ravel())
 
     ################################################################################################
-    # @create_meta_section
+    # @flush_meta_elements
     ################################################################################################
-    def create_meta_section(self,
-                            section):
-        """Create a section with meta objects.
+    def flush_meta_elements(self):
+        """Writes all the collected meta elements of the soma and the arbors at once.
 
-        :param section:
-            A given section to extrude a mesh around it.
+        The elements are written to the meta skeleton only if it is polygonized by Blender, the
+        implicit-surface mesher uses the arrays directly.
         """
 
-        # Get the list of samples
-        samples = section.samples
+        creation_time = time.time()
 
-        # Ensure that the section has at least two samples, otherwise it will give an error
-        if len(samples) < 2:
-            return
+        # Concatenate the elements collected from the soma and the arbors
+        if len(self.planned_radii) > 0:
+            self.meta_centers = numpy.concatenate(self.planned_centers)
+            self.meta_radii = numpy.concatenate(self.planned_radii)
+        self.planned_centers = list()
+        self.planned_radii = list()
+        self.number_created_elements = len(self.meta_radii)
 
-        # Proceed segment by segment
-        for i in range(len(samples) - 1):
+        # Allocate the elements of the meta skeleton, Blender can only create them one by one,
+        # then write their positions and radii at once
+        if self.options.mesh.meta_polygonizer != nmv.enums.Meshing.MetaPolygonizer.IMPLICIT:
+            elements = self.meta_skeleton.elements
+            for _ in range(self.number_created_elements):
+                elements.new()
+            elements.foreach_set('co', self.meta_centers.ravel())
+            elements.foreach_set('radius', self.meta_radii)
 
-            # Get the radii
-            radius_0 = samples[i].radius
-            radius_1 = samples[i + 1].radius
+        self.elements_creation_time += time.time() - creation_time
 
-            # Limit the radii to 100 nano-meters
-            if radius_0 < 0.1:
-                self.radii_error.append(1.0 - radius_0)
-                radius_0 = 0.1
-            if radius_1 < 0.1:
-                radius_1 = 0.1
+    ################################################################################################
+    # @create_meta_segment
+    ################################################################################################
+    def create_meta_segment(self, p1, p2, r1, r2):
+        """Constructs a segment that is composed of two points with a meta object.
 
-            if radius_0 < self.smallest_radius:
-                self.smallest_radius = radius_0
+        :param p1:
+            First point coordinate.
+        :param p2:
+            Second point coordinate.
+        :param r1:
+            First point radius.
+        :param r2:
+            Second point radius.
+        """
 
-            if radius_1 < self.smallest_radius:
-                self.smallest_radius = radius_1
+        # Plan the elements along the segment
+        planning_time = time.time()
+        centers, radii = nmv.builders.plan_meta_elements(
+            p1=[tuple(p1)], p2=[tuple(p2)], r1=[r1], r2=[r2])
+        self.number_planned_elements += len(radii)
+        self.planning_time += time.time() - planning_time
 
-            # Create the meta segment
-            self.create_meta_segment(
-                p1=samples[i].point,
-                p2=samples[i + 1].point,
-                r1=radius_0 * self.magic_scale_factor,
-                r2=radius_1 * self.magic_scale_factor)
+        # Create the elements
+        self.create_meta_elements(centers=centers, radii=radii)
 
     ################################################################################################
     # @create_meta_arbor
@@ -255,24 +238,43 @@ class MetaBuilder:
     def create_meta_arbor(self,
                           root,
                           max_branching_order):
-        """Extrude the given arbor section by section recursively using meta objects.
+        """Creates the meta elements of the given arbor.
+
+        The elements of the entire arbor are planned at once, the redundant ones are merged
+        using a spatial hash, and the remaining ones are created in bulk.
 
         :param root:
             The root of a given section.
         :param max_branching_order:
-            The maximum branching order set by the user to terminate the recursive call.
+            The maximum branching order set by the user.
         """
 
-        # Do not proceed if the branching order limit is hit
-        if root.branching_order > max_branching_order:
+        planning_time = time.time()
+
+        # Collect the segments of the arbor, the radii are limited to 100 nano-meters
+        p1, p2, r1, r2, cosines, raw_radii = nmv.builders.get_arbor_meta_segments(
+            arbor=root, max_branching_order=max_branching_order,
+            minimum_radius=0.1, radius_scale=self.magic_scale_factor)
+
+        # Nothing to create
+        if len(raw_radii) == 0:
+            self.planning_time += time.time() - planning_time
             return
 
-        # Create the section
-        self.create_meta_section(root)
+        # Keep track on the radii error and the smallest radius for the meta resolution
+        clamped_radii = raw_radii[raw_radii < 0.1]
+        self.radii_error.extend((1.0 - clamped_radii).tolist())
+        self.smallest_radius = min(self.smallest_radius, max(float(raw_radii.min()), 0.1))
 
-        # Create the children sections recursively
-        for child in root.children:
-            self.create_meta_arbor(child, max_branching_order)
+        # Plan the elements of all the segments, then merge the redundant ones
+        centers, radii = nmv.builders.plan_meta_elements(
+            p1=p1, p2=p2, r1=r1, r2=r2, cosines=cosines)
+        self.number_planned_elements += len(radii)
+        centers, radii = nmv.builders.merge_redundant_meta_elements(centers=centers, radii=radii)
+        self.planning_time += time.time() - planning_time
+
+        # Create the elements
+        self.create_meta_elements(centers=centers, radii=radii)
 
     ################################################################################################
     # @build_arbors
@@ -422,6 +424,39 @@ class MetaBuilder:
                     nmv.logger.detail(arbor.label)
                     self.emanate_soma_towards_arbor(arbor=arbor)
 
+    ################################################################################################
+    # @polygonize_meta_object_implicitly
+    ################################################################################################
+    def polygonize_meta_object_implicitly(self):
+        """Converts the meta object to a mesh using the implicit-surface mesher of NeuroMorphoVis
+        instead of the Blender polygonizer.
+
+        The same sum-of-spheres field is evaluated on a sparse tiled grid around the elements.
+        """
+
+        # Polygonize the elements of the meta object
+        finalize_time = time.time()
+        vertices, faces = nmv.builders.polygonize_meta_elements(
+            centers=self.meta_centers, radii=self.meta_radii,
+            voxel_size=self.smallest_radius,
+            threshold=self.meta_skeleton.threshold,
+            adaptive=self.options.mesh.meta_adaptive_resolution,
+            processes=self.options.mesh.meta_polygonizer_processes)
+        self.finalize_time = time.time() - finalize_time
+
+        # Remove the meta object, it is no longer needed
+        nmv.scene.delete_object_in_scene(self.meta_mesh)
+
+        # Create the mesh object
+        self.meta_mesh = nmv.mesh.create_mesh_object_from_arrays(
+            vertices=vertices, faces=faces, name=self.morphology.label)
+
+        # Re-select it again to be able to perform post-processing operations in it
+        nmv.scene.select_object(self.meta_mesh)
+
+        # Set the mesh to be the active one
+        nmv.scene.set_active_object(self.meta_mesh)
+
     ################################################################################################
     # @finalize_meta_object
     ################################################################################################
@@ -432,6 +467,13 @@ class MetaBuilder:
         # Header
         nmv.logger.header('Meshing the Meta Object')
 
+        # Use the implicit-surface mesher, if requested
+        if self.options.mesh.meta_polygonizer == nmv.enums.Meshing.MetaPolygonizer.IMPLICIT:
+            self.meta_skeleton.resolution = self.smallest_radius
+            nmv.logger.info('Implicit Polygonizer Resolution [%f]' % self.smallest_radius)
+            self.polygonize_meta_object_implicitly()
+            return
+
         # Deselect all objects
         nmv.scene.ops.deselect_all()
 
@@ -446,7 +488,9 @@ class MetaBuilder:
         nmv.scene.set_active_object(self.meta_mesh)
 
         # Convert it to a mesh from meta-balls
+        finalize_time = time.time()
         bpy.ops.object.convert(target='MESH')
+        self.finalize_time = time.time() - finalize_time
 
         self.meta_mesh = bpy.context.scene.objects[0]
         self.meta_mesh.name = self.morphology.label
@@ -530,10 +574,24 @@ class MetaBuilder:
         result, stats = nmv.utilities.profile_function(self.build_arbors)
         self.profiling_statistics += stats
 
+        # Write all the meta elements of the soma and the arbors at once
+        result, stats = nmv.utilities.profile_function(self.flush_meta_elements)
+        self.profiling_statistics += stats
+
         # Finalize the meta object and construct a solid object
         result, stats = nmv.utilities.profile_function(self.finalize_meta_object)
         self.profiling_statistics += stats
 
+        # Details about the meta elements
+        self.profiling_statistics += '\t* Stats. @%s: [%.3f]\n' % ('planning',
+                                                                   self.planning_time)
+        self.profiling_statistics += '\t* Stats. @%s: [%.3f]\n' % ('elements_creation',
+                                                                   self.elements_creation_time)
+        self.profiling_statistics += '\t* Stats. @%s: [%.3f]\n' % ('polygonization',
+                                                                   self.finalize_time)
+        self.profiling_statistics += '\t* Meta Elements: Planned [%d], Created [%d]\n' % (
+            self.number_planned_elements, self.number_created_elements)
+
         # Surface roughness
         result, stats = nmv.utilities.profile_function(self.add_surface_roughness)
         self.profiling_statistics += stats
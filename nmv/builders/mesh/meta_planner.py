@@ -0,0 +1,253 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import numpy
+
+
+####################################################################################################
+# @get_arbor_meta_segments
+####################################################################################################
+def get_arbor_meta_segments(arbor,
+                            max_branching_order,
+                            minimum_radius=0.1,
+                            radius_scale=1.0):
+    """Collects all the segments of a given arbor into contiguous arrays that can be processed by
+    the meta elements planner at once.
+
+    :param arbor:
+        The root section of a given arbor.
+    :param max_branching_order:
+        The maximum branching order of the arbor requested by the user.
+    :param minimum_radius:
+        The radii of the samples are clamped to this value, by default 100 nano-meters.
+    :param radius_scale:
+        A scale factor applied to the clamped radii.
+    :return:
+        A tuple of (p1, p2, r1, r2, cosines, raw_radii), where p1 and p2 are (S, 3) arrays of
+        the end points of the segments, r1 and r2 are (S,) arrays of the scaled radii, cosines
+        is an (S,) array of the smallest cosine of the turning angles at both ends of each
+        segment and raw_radii is an array of the radii of all the samples before clamping.
+    """
+
+    # Collect the points and radii of the samples section by section
+    points = list()
+    radii = list()
+    segments_sections = list()
+
+    # Use an explicit stack to avoid the recursion overhead
+    stack = [arbor]
+    while stack:
+        section = stack.pop()
+
+        # Do not proceed if the branching order limit is hit
+        if section.branching_order > max_branching_order:
+            continue
+
+        # The section must have at least two samples to make a segment
+        if len(section.samples) > 1:
+            segments_sections.append((len(points), len(section.samples)))
+            for sample in section.samples:
+                points.append(tuple(sample.point))
+                radii.append(sample.radius)
+
+        # Visit the children
+        stack.extend(reversed(section.children))
+
+    # Empty arbor
+    if len(points) == 0:
+        empty = numpy.zeros(0)
+        return numpy.zeros((0, 3)), numpy.zeros((0, 3)), empty, empty, empty, empty
+
+    points = numpy.array(points, dtype=numpy.float64)
+    raw_radii = numpy.array(radii, dtype=numpy.float64)
+    radii = numpy.maximum(raw_radii, minimum_radius) * radius_scale
+
+    # The indices of the first sample of every segment, the segments never cross the sections
+    first = numpy.concatenate([numpy.arange(start, start + count - 1)
+                               for start, count in segments_sections])
+
+    # Per-segment unit directions
+    directions = points[first + 1] - points[first]
+    lengths = numpy.linalg.norm(directions, axis=1)
+    directions /= numpy.maximum(lengths, 1e-12)[:, None]
+
+    # The cosine of the turning angle between every segment and the previous one along the same
+    # section, the first segment of the section does not turn
+    cosines_previous = numpy.ones(len(first))
+    cosines_previous[1:] = numpy.einsum('ij,ij->i', directions[1:], directions[:-1])
+    section_starts = numpy.cumsum([0] + [count - 1 for _, count in segments_sections[:-1]])
+    cosines_previous[section_starts] = 1.0
+
+    # The same for the next segment, the last segment of the section does not turn
+    cosines_next = numpy.ones(len(first))
+    cosines_next[:-1] = cosines_previous[1:]
+    cosines_next[section_starts[1:] - 1] = 1.0
+
+    # Return the arrays
+    return points[first], points[first + 1], radii[first], radii[first + 1], \
+        numpy.minimum(cosines_previous, cosines_next), raw_radii
+
+
+####################################################################################################
+# @plan_meta_elements
+####################################################################################################
+def plan_meta_elements(p1,
+                       p2,
+                       r1,
+                       r2,
+                       cosines=None,
+                       minimum_step_factor=0.5,
+                       maximum_step_factor=0.75):
+    """Computes the centers and radii of the meta elements of a list of segments at once.
+
+    Along every segment, the elements are placed with a step that is proportional to the local
+    radius, and the radius is interpolated linearly from r1 to r2. The step factor is the minimum
+    one at bends, and grows linearly with the straightness of the segment until the maximum one
+    for segments that do not turn. Similar to the original planner, the first element of every
+    segment is shrunk to 90% of its radius.
+
+    :param p1:
+        An (S, 3) array of the first points of the segments.
+    :param p2:
+        An (S, 3) array of the second points of the segments.
+    :param r1:
+        An (S,) array of the radii at the first points.
+    :param r2:
+        An (S,) array of the radii at the second points.
+    :param cosines:
+        An (S,) array of the cosines of the turning angles at the segments, or None to use the
+        minimum step factor everywhere.
+    :param minimum_step_factor:
+        The step factor (relative to the radius) used at sharp bends, by default 0.5.
+    :param maximum_step_factor:
+        The step factor (relative to the radius) used along straight segments, by default 0.75.
+    :return:
+        A tuple of two arrays (centers, radii) of shape (E, 3) and (E,) respectively.
+    """
+
+    p1 = numpy.asarray(p1, dtype=numpy.float64).reshape(-1, 3)
+    p2 = numpy.asarray(p2, dtype=numpy.float64).reshape(-1, 3)
+    r1 = numpy.asarray(r1, dtype=numpy.float64).ravel()
+    r2 = numpy.asarray(r2, dtype=numpy.float64).ravel()
+
+    # Segments lengths, ignore the degenerate segments
+    lengths = numpy.linalg.norm(p2 - p1, axis=1)
+    valid = lengths >= 0.001
+    p1, p2, r1, r2, lengths = p1[valid], p2[valid], r1[valid], r2[valid], lengths[valid]
+    if len(lengths) == 0:
+        return numpy.zeros((0, 3)), numpy.zeros(0)
+
+    # Verify the radii, or fix them
+    r1 = numpy.maximum(r1, 0.001 * lengths)
+    r2 = numpy.maximum(r2, 0.001 * lengths)
+
+    # The step factor per segment
+    if cosines is None:
+        factors = numpy.full(len(lengths), minimum_step_factor)
+    else:
+        straightness = numpy.clip(numpy.asarray(cosines, dtype=numpy.float64)[valid], 0.0, 1.0)
+        factors = minimum_step_factor + \
+            (maximum_step_factor - minimum_step_factor) * straightness ** 4
+
+    # With a step of (factor * r), the radius grows geometrically along the segment, i.e.
+    # r_k = r1 * q^k with q = 1 + factor * dr / L, and the travelled distance is
+    # t_k = (r_k - r1) * L / dr, or t_k = k * factor * r1 for constant radii
+    slopes = (r2 - r1) / lengths
+    q = 1.0 + factors * slopes
+    constant = numpy.abs(factors * slopes) < 1e-6
+
+    # The number of elements per segment, the first index k where t_k >= L
+    counts = numpy.empty(len(lengths), dtype=numpy.int64)
+    counts[constant] = numpy.ceil(lengths[constant] / (factors[constant] * r1[constant]))
+    tapered = ~constant & (q > 0)
+    counts[tapered] = numpy.ceil(numpy.log(r2[tapered] / r1[tapered]) / numpy.log(q[tapered]))
+    counts[~constant & (q <= 0)] = 1
+    counts = numpy.maximum(counts, 1)
+
+    # The element index along its segment
+    segment_ids = numpy.repeat(numpy.arange(len(lengths)), counts)
+    starts = numpy.cumsum(counts) - counts
+    k = numpy.arange(counts.sum()) - starts[segment_ids]
+
+    # Travelled distances and radii
+    distances = numpy.where(
+        constant[segment_ids],
+        k * factors[segment_ids] * r1[segment_ids],
+        r1[segment_ids] * (numpy.power(numpy.abs(q[segment_ids]), k) - 1.0) /
+        numpy.where(constant, 1.0, slopes)[segment_ids])
+
+    # Drop the elements that overshoot the segment due to the rounding
+    inside = (distances < lengths[segment_ids]) | (k == 0)
+    segment_ids, k, distances = segment_ids[inside], k[inside], distances[inside]
+
+    # Compute the elements
+    fractions = (distances / lengths[segment_ids])[:, None]
+    centers = p1[segment_ids] + fractions * (p2[segment_ids] - p1[segment_ids])
+    radii = r1[segment_ids] + distances * slopes[segment_ids]
+    radii[k == 0] *= 0.90
+
+    # Return the elements
+    return centers, radii
+
+
+####################################################################################################
+# @merge_redundant_meta_elements
+####################################################################################################
+def merge_redundant_meta_elements(centers,
+                                  radii,
+                                  tolerance=0.25,
+                                  radius_bins_per_octave=4):
+    """Removes the redundant meta elements using a spatial hash.
+
+    The elements are hashed by their radius (in logarithmic bins) and their position quantized
+    to a cell whose size is a fraction of the radius. The elements that fall in the same cell and
+    radius bin are almost coincident and only the largest one of them is kept. This mainly merges
+    the duplicate elements at the branching points and along very short segments.
+
+    :param centers:
+        An (E, 3) array of the centers of the elements.
+    :param radii:
+        An (E,) array of the radii of the elements.
+    :param tolerance:
+        The size of the hash cell relative to the radius of the bin, by default 0.25.
+    :param radius_bins_per_octave:
+        The number of the radius bins per doubling of the radius, by default 4.
+    :return:
+        A tuple of two arrays (centers, radii) of the unique elements in their original order.
+    """
+
+    if len(radii) == 0:
+        return centers, radii
+
+    # Radius bins
+    bins = numpy.floor(numpy.log2(radii) * radius_bins_per_octave).astype(numpy.int64)
+
+    # Cell sizes per bin
+    cell_sizes = tolerance * numpy.power(2.0, bins / radius_bins_per_octave)
+
+    # Hash keys
+    cells = numpy.floor(centers / cell_sizes[:, None]).astype(numpy.int64)
+    keys = numpy.column_stack((bins, cells))
+
+    # Keep the largest element per key, sorting by the radius in a descending order first
+    order = numpy.argsort(-radii, kind='stable')
+    _, unique_indices = numpy.unique(keys[order], axis=0, return_index=True)
+    kept = numpy.sort(order[unique_indices])
+
+    # Return the unique elements
+    return centers[kept], radii[kept]
@@ -16,15 +16,14 @@
 ####################################################################################################
 
 # System imports
-import copy
 import time
 
 # Blender imports
 import bpy
+import numpy
 
 # Internal modules
 import nmv.builders
-import nmv.bmeshi
 import nmv.consts
 import nmv.enums
 import nmv.geometry
@@ -57,7 +56,7 @@ class SkinningBuilder:
         """
 
         # Morphology
-        self.morphology = copy.deepcopy(morphology)
+        self.morphology = morphology.clone()
 
         # Loaded options from NeuroMorphoVis
         self.options = options
@@ -107,9 +106,6 @@ class SkinningBuilder:
         # Total time to update the radii
         self.update_radii_time = 0
 
-        # Conversion from bmesh to mesh time
-        self.mesh_conversion_time = 0
-
         # Smooth shade the surface
         self.smooth_shading_time = 0
 
@@ -136,116 +132,28 @@ class SkinningBuilder:
         # Verify and repair the morphology, if required
         nmv.builders.mesh.update_morphology_skeleton(builder=self)
 
-    ################################################################################################
-    # @update_section_samples_radii
-    ################################################################################################
-    @staticmethod
-    def update_section_samples_radii(arbor_mesh,
-                                     section):
-        """Update the radii of the samples along a given section.
-
-        :param arbor_mesh:
-            The mesh of the arbor.
-        :param section:
-            A given section to update the radii of its samples.
-        """
-
-        # Make sure to include the first sample of the root section
-        if section.is_root():
-            starting_index = 0
-        else:
-            starting_index = 1
-
-        # Sample by sample along the section
-        for i in range(starting_index, len(section.samples)):
-
-            # Get the sample radius
-            radius = section.samples[i].radius
-
-            # Get a reference to the vertex
-            vertex = arbor_mesh.data.skin_vertices[0].data[section.samples[i].arbor_idx]
-
-            # Update the radius of the vertex
-            vertex.radius = radius, radius
-
     ################################################################################################
     # @update_arbor_samples_radii
     ################################################################################################
-    def update_arbor_samples_radii(self,
-                                   arbor_mesh,
-                                   root,
-                                   max_branching_order):
-        """Updates the radii of the samples of the entire arbor to match reality from the
+    @staticmethod
+    def update_arbor_samples_radii(arbor_mesh,
+                                   radii):
+        """Updates the radii of the skin vertices of the entire arbor to match reality from the
         temporary ones that were given before.
 
+        The radii are written in bulk with a single foreach_set call on the skin layer.
+
         :param arbor_mesh:
             The mesh of the arbor that will be updated.
-        :param root:
-            The root section of the arbor.
-        :param max_branching_order:
-            The maximum branching order set by the user to terminate the recursive call.
+        :param radii:
+            A NumPy array of the radii of the samples indexed by their arbor index.
         """
 
-        # Do not proceed if the branching order limit is hit
-        if root.branching_order > max_branching_order:
-            return
-
-        # Set the radius of a given section
-        self.update_section_samples_radii(arbor_mesh, root)
+        # Each skin vertex has two radii (x and y), duplicate the radius of each sample
+        skin_radii = numpy.repeat(radii, 2)
 
-        # Update the radii of the samples of the children recursively
-        for child in root.children:
-            self.update_arbor_samples_radii(arbor_mesh, child, max_branching_order)
-
-    ################################################################################################
-    # @extrude_section
-    ################################################################################################
-    @staticmethod
-    def extrude_section(arbor_bmesh_object,
-                        section):
-        """Extrudes the section along its samples starting from the first one to the last one.
-
-        Note that the mesh to be extruded is already selected and there is no need to pass it.
-
-        :param arbor_bmesh_object:
-            The bmesh object of the given arbor.
-        :param section:
-            A given section to extrude a mesh around it.
-        """
-
-        # Extrude segment by segment
-        for i in range(len(section.samples) - 1):
-
-            nmv.bmeshi.ops.extrude_vertex_towards_point(
-                arbor_bmesh_object, section.samples[i].arbor_idx, section.samples[i + 1].point)
-
-    ################################################################################################
-    # @create_root_point_mesh
-    ################################################################################################
-    def extrude_arbor(self,
-                      arbor_bmesh_object,
-                      root,
-                      max_branching_order):
-        """Extrude the given arbor section by section recursively.
-
-        :param arbor_bmesh_object:
-            The bmesh object of the arbor.
-        :param root:
-            The root of a given section.
-        :param max_branching_order:
-            The maximum branching order set by the user to terminate the recursive call.
-        """
-
-        # Do not proceed if the branching order limit is hit
-        if root.branching_order > max_branching_order:
-            return
-
-        # Extrude the section
-        self.extrude_section(arbor_bmesh_object, root)
-
-        # Extrude the children sections recursively
-        for child in root.children:
-            self.extrude_arbor(arbor_bmesh_object, child, max_branching_order)
+        # Update the skin layer at once
+        arbor_mesh.data.skin_vertices[0].data.foreach_set('radius', skin_radii)
 
     ################################################################################################
     # @create_arbor_mesh
@@ -256,7 +164,7 @@ class SkinningBuilder:
                           arbor_name,
                           arbor_material,
                           connected_to_soma=False):
-        """Creates a mesh of the given arbor recursively.
+        """Creates a mesh of the given arbor by skinning its skeleton graph.
 
         :param arbor:
             A given arbor.
@@ -272,70 +180,53 @@ class SkinningBuilder:
             A reference to the created mesh object.
         """
 
-        # If the arbor is connected to soma, then start at the initial segment of the arbor
-        if connected_to_soma:
-
-            # Initially, this index is set to TWO and incremented later, sample zero is reserved to
-            # the auxiliary sample that is added at the soma, and the first sample to the point that
-            # is added right before the arbor starts
-            samples_global_arbor_index = [1]
-            nmv.builders.update_samples_indices_per_arbor(
-                arbor, samples_global_arbor_index, max_branching_order)
+        # Initially, this index is set to TWO and incremented later, sample zero is reserved to the
+        # auxiliary sample that is added at the soma, and the first sample to the point that is
+        # added right before the arbor starts. If the arbor is connected to the soma, only the
+        # first auxiliary sample is needed.
+        starting_index = 1 if connected_to_soma else 2
 
-            # Add an auxiliary sample just before the arbor starts
-            auxiliary_point = arbor.samples[0].point - 0.01 * arbor.samples[0].point.normalized()
+        # Index the samples and collect their positions, radii and edges in a single traversal
+        reindexing_time = time.time()
+        positions, radii, edges = nmv.builders.compute_arbor_samples_arrays(
+            arbor, starting_index, max_branching_order)
+        self.reindexing_time += time.time() - reindexing_time
 
-            # Create the initial vertex of the arbor skeleton at the auxiliary point
-            arbor_bmesh_object = nmv.bmeshi.create_vertex(location=auxiliary_point)
+        # The auxiliary samples have the same radius of the first sample of the arbor
+        radii[:starting_index] = arbor.samples[0].radius
 
-            # Extrude towards the first sample from the auxiliary point
-            nmv.bmeshi.ops.extrude_vertex_towards_point(
-                arbor_bmesh_object, 0, arbor.samples[0].point)
+        # If the arbor is connected to soma, then start at an auxiliary point just before the
+        # initial segment of the arbor
+        if connected_to_soma:
+            positions[0] = arbor.samples[0].point - 0.01 * arbor.samples[0].point.normalized()
 
         # Otherwise, add a little auxiliary sample and start from it
         else:
 
-            # Initially, this index is set to TWO and incremented later, sample zero is reserved to
-            # the auxiliary sample that is added at the soma, and the first sample to the point that
-            # is added right before the arbor starts
-            reindexing_time = time.time()
-            samples_global_arbor_index = [2]
-            nmv.builders.update_samples_indices_per_arbor(
-                arbor, samples_global_arbor_index, max_branching_order)
-            self.reindexing_time += time.time() - reindexing_time
-
-            # If the arbor is not far from soma, then connect it to the origin
+            # If the arbor is not far from soma, then connect it to the origin and add an
+            # auxiliary sample just before the arbor starts
             if not arbor.far_from_soma:
-                arbor_bmesh_object = nmv.bmeshi.create_vertex()
-
-                # Add an auxiliary sample just before the arbor starts
-                auxiliary_point = arbor.samples[0].point - 0.01 * arbor.samples[
+                positions[0] = (0, 0, 0)
+                positions[1] = arbor.samples[0].point - 0.01 * arbor.samples[
                     0].point.normalized()
 
+            # Otherwise, start at the first sample and add an auxiliary sample just after it
             else:
-                arbor_bmesh_object = nmv.bmeshi.create_vertex(location=arbor.samples[0].point)
-
-                # Add an auxiliary sample just after the arbor starts
-                auxiliary_point = arbor.samples[0].point + 0.01 * arbor.samples[
+                positions[0] = arbor.samples[0].point
+                positions[1] = arbor.samples[0].point + 0.01 * arbor.samples[
                     0].point.normalized()
 
-            # Extrude to the auxiliary sample
-            nmv.bmeshi.ops.extrude_vertex_towards_point(arbor_bmesh_object, 0, auxiliary_point)
-
-            # Extrude towards the first sample
-            nmv.bmeshi.ops.extrude_vertex_towards_point(
-                arbor_bmesh_object, 1, arbor.samples[0].point)
+        # Link the auxiliary samples to the first sample of the arbor
+        auxiliary_edges = numpy.array(
+            [(i, i + 1) for i in range(starting_index)], dtype=numpy.int32).reshape(-1, 2)
+        edges = numpy.concatenate((auxiliary_edges, edges))
 
-        # Extrude arbor mesh using the skinning method using a temporary radius with a bmesh
+        # Create the skeleton graph of the arbor at once from the arrays
         extrusion_time = time.time()
-        self.extrude_arbor(arbor_bmesh_object, arbor, max_branching_order)
+        arbor_mesh = nmv.mesh.create_graph_mesh_object(
+            vertices=positions, edges=edges, name=arbor_name)
         self.extrusion_time += time.time() - extrusion_time
 
-        # Convert the bmesh to a mesh object
-        mesh_conversion_time = time.time()
-        arbor_mesh = nmv.bmeshi.convert_bmesh_to_mesh(arbor_bmesh_object, arbor_name)
-        self.mesh_conversion_time += time.time() - mesh_conversion_time
-
         # Apply a skin modifier create the membrane of the skeleton
         creating_modifier_time = time.time()
         arbor_mesh.modifiers.new(name="Skin", type='SKIN')
@@ -344,22 +235,9 @@ class SkinningBuilder:
         # Activate the arbor mesh
         nmv.scene.set_active_object(arbor_mesh)
 
-        # Get a reference to the vertex
-        vertex = arbor_mesh.data.skin_vertices[0].data[0]
-
-        # Update the radius of the vertex
-        vertex.radius = arbor.samples[0].radius, arbor.samples[0].radius
-
-        # Get a reference to the vertex
-        vertex = arbor_mesh.data.skin_vertices[0].data[1]
-
-        # Update the radius of the vertex
-        vertex.radius = arbor.samples[0].radius, arbor.samples[0].radius
-
-        # Update the radii of the arbor using the fast method before applying the skinning modifier
+        # Update the radii of the arbor in bulk before applying the skinning modifier
         update_radii_time = time.time()
-        self.update_arbor_samples_radii(
-            arbor_mesh=arbor_mesh, root=arbor, max_branching_order=max_branching_order)
+        self.update_arbor_samples_radii(arbor_mesh=arbor_mesh, radii=radii)
         self.update_radii_time += time.time() - update_radii_time
 
         # Apply the modifier
@@ -529,10 +407,6 @@ class SkinningBuilder:
         self.profiling_statistics += '\t* Stats. @%s: [%.3f]\n' % ('update_radii',
                                                                    self.update_radii_time)
 
-        # Details about the arbors building
-        self.profiling_statistics += '\t* Stats. @%s: [%.3f]\n' % ('mesh_conversion',
-                                                                   self.mesh_conversion_time)
-
         # Details about the arbors building
         self.profiling_statistics += '\t* Stats. @%s: [%.3f]\n' % ('reindexing',
                                                                    self.reindexing_time)
@@ -15,9 +15,6 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-# System imports
-import copy
-
 # Internal imports
 import nmv.builders
 import nmv.consts
@@ -51,7 +48,7 @@ class UnionBuilder:
         """
 
         # Morphology
-        self.morphology = copy.deepcopy(morphology)
+        self.morphology = morphology.clone()
 
         # Loaded options from NeuroMorphoVis
         self.options = options
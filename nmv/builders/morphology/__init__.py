@@ -15,10 +15,13 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .common import *
-from .dendrogram_builder import *
-from .disconnected_sections_builder import *
-from .disconnected_segments_builder import *
-from .samples_builder import *
-from .connected_sections_builder import *
-from .progressive_builder import *
+# Import the modules on the first access to their names, see nmv.load_package_lazily
+import nmv
+nmv.load_package_lazily(__name__, globals(), [
+    '.common',
+    '.dendrogram_builder',
+    '.disconnected_sections_builder',
+    '.disconnected_segments_builder',
+    '.samples_builder',
+    '.connected_sections_builder',
+    '.progressive_builder'])
@@ -83,6 +83,62 @@ def create_skeleton_materials_and_illumination(builder):
     nmv.shading.create_material_specific_illumination(builder.options.shading.morphology_material)
 
 
+####################################################################################################
+# @get_skeleton_materials
+####################################################################################################
+def get_skeleton_materials(builder):
+    """Gets a list of all the materials that the given builder can assign to the skeleton.
+
+    :param builder:
+        A given skeleton builder.
+    :return:
+        A list of the materials, in the order of the material indices of the builder.
+    """
+
+    # The aggregate list and the articulations, if any
+    materials = list(builder.skeleton_materials)
+    if builder.articulations_materials is not None:
+        materials.extend(builder.articulations_materials)
+
+    # Return the list
+    return materials
+
+
+####################################################################################################
+# @update_skeleton_materials
+####################################################################################################
+def update_skeleton_materials(builder):
+    """Re-creates the materials of a skeleton that is already drawn by the given builder, following
+    a change in the shading options, and assigns them to the drawn objects without drawing the
+    skeleton again.
+
+    :param builder:
+        A given skeleton builder that has drawn the skeleton.
+    :return:
+        True if the materials are updated, or False if some of the drawn objects have materials that
+        are created on the fly, and therefore the skeleton must be drawn again.
+    """
+
+    # Find the materials of the drawn objects before they are removed with the old materials
+    materials_indices = nmv.shading.get_materials_indices(
+        builder.morphology_objects, get_skeleton_materials(builder=builder))
+    if materials_indices is None:
+        return False
+
+    # Remove the lights of the old materials, without deleting the selected skeleton objects
+    nmv.scene.ops.deselect_all()
+    nmv.scene.ops.clear_lights()
+
+    # Create the new materials in the same order
+    builder.skeleton_materials = list()
+    builder.create_single_skeleton_materials_list()
+
+    # Assign them to the drawn objects
+    nmv.shading.set_materials_from_indices(
+        builder.morphology_objects, materials_indices, get_skeleton_materials(builder=builder))
+    return True
+
+
 ####################################################################################################
 # @update_sections_branching
 ####################################################################################################
@@ -146,6 +202,50 @@ def resample_skeleton_sections(builder):
         pass
 
 
+####################################################################################################
+# @select_skeleton_level_of_detail
+####################################################################################################
+def select_skeleton_level_of_detail(builder):
+    """Simplifies the sections of the morphology skeleton to the level of detail that fits the
+    sample budget or the screen-space error given in the options, if any. This function must be
+    called after resampling the skeleton, since the simplification errors are computed from the
+    resampled sections.
+
+    NOTE: The full samples are kept in the sections and can be restored with
+    nmv.skeleton.ops.restore_morphology_full_detail.
+
+    :param builder:
+        A given skeleton builder.
+    """
+
+    # Full detail
+    sample_budget = builder.options.morphology.lod_sample_budget
+    pixel_error = builder.options.morphology.lod_screen_space_error
+    if sample_budget <= 0 and pixel_error <= 0.0:
+        return
+
+    nmv.logger.info('Selecting skeleton level of detail')
+
+    # The errors are recomputed, since the skeleton may have been resampled
+    nmv.skeleton.ops.compute_morphology_level_of_detail(builder.morphology, force=True)
+
+    # The largest tolerance that satisfies both criteria
+    tolerance = 0.0
+    if sample_budget > 0:
+        tolerance = nmv.skeleton.ops.get_level_of_detail_tolerance_for_sample_budget(
+            builder.morphology, sample_budget)
+    if pixel_error > 0.0:
+        screen_space_tolerance = \
+            nmv.skeleton.ops.get_level_of_detail_tolerance_for_screen_space_error(
+                builder.morphology, pixel_error, builder.options.rendering.frame_resolution)
+        tolerance = max(tolerance, screen_space_tolerance)
+
+    # Select the samples
+    number_samples = nmv.skeleton.ops.select_morphology_level_of_detail(
+        builder.morphology, tolerance)
+    nmv.logger.detail('Tolerance [%f] um, [%d] samples' % (tolerance, number_samples))
+
+
 ####################################################################################################
 # @draw_soma_sphere
 ####################################################################################################
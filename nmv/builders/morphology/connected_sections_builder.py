@@ -49,7 +49,7 @@ class ConnectedSectionsBuilder:
         """
 
         # Morphology
-        self.morphology = copy.deepcopy(morphology)
+        self.morphology = morphology.clone()
 
         # System options
         self.options = copy.deepcopy(options)
@@ -650,6 +650,9 @@ class ConnectedSectionsBuilder:
         # Resample the sections of the morphology skeleton
         nmv.builders.morphology.resample_skeleton_sections(builder=self)
 
+        # Simplify the sections to the requested level of detail, if any
+        nmv.builders.morphology.select_skeleton_level_of_detail(builder=self)
+
         # Create each arbor as a separate component
         self.create_each_arbor_as_separate_component(bevel_object=bevel_object)
 
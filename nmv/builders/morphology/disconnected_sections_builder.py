@@ -55,7 +55,7 @@ class DisconnectedSectionsBuilder:
         """
 
         # Morphology
-        self.morphology = copy.deepcopy(morphology)
+        self.morphology = morphology.clone()
 
         # System options
         self.options = copy.deepcopy(options)
@@ -514,6 +514,9 @@ class DisconnectedSectionsBuilder:
         # Resample the sections of the morphology skeleton
         nmv.builders.morphology.resample_skeleton_sections(builder=self)
 
+        # Simplify the sections to the requested level of detail, if any
+        nmv.builders.morphology.select_skeleton_level_of_detail(builder=self)
+
         # Draw each arbor as a single object
         self.draw_each_arbor_as_single_object(bevel_object=bevel_object)
 
@@ -572,6 +575,9 @@ class DisconnectedSectionsBuilder:
         # Resample the sections of the morphology skeleton
         nmv.builders.morphology.resample_skeleton_sections(builder=self)
 
+        # Simplify the sections to the requested level of detail, if any
+        nmv.builders.morphology.select_skeleton_level_of_detail(builder=self)
+
         # Apical dendrites
         nmv.logger.info('Reconstructing arbors')
         if not self.options.morphology.ignore_apical_dendrites:
@@ -705,6 +711,9 @@ class DisconnectedSectionsBuilder:
         # Resample the sections of the morphology skeleton
         nmv.builders.morphology.resample_skeleton_sections(builder=self)
 
+        # Simplify the sections to the requested level of detail, if any
+        nmv.builders.morphology.select_skeleton_level_of_detail(builder=self)
+
         # Apical dendrites
         nmv.logger.info('Reconstructing arbors')
         if not self.options.morphology.ignore_apical_dendrites:
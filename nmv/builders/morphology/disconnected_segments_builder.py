@@ -48,7 +48,7 @@ class DisconnectedSegmentsBuilder:
         """
 
         # Morphology
-        self.morphology = copy.deepcopy(morphology)
+        self.morphology = morphology.clone()
 
         # System options
         self.options = copy.deepcopy(options)
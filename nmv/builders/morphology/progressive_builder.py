@@ -55,7 +55,7 @@ class ProgressiveBuilder:
         """
 
         # Morphology
-        self.morphology = copy.deepcopy(morphology)
+        self.morphology = morphology.clone()
 
         # System options
         self.options = copy.deepcopy(options)
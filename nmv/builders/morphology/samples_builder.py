@@ -53,7 +53,7 @@ class SamplesBuilder:
         """
 
         # Morphology
-        self.morphology = copy.deepcopy(morphology)
+        self.morphology = morphology.clone()
 
         # System options
         self.options = copy.deepcopy(options)
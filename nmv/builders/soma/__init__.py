@@ -15,5 +15,8 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .soma_softbody_builder import *
-from .soma_meta_builder import *
\ No newline at end of file
+# Import the modules on the first access to their names, see nmv.load_package_lazily
+import nmv
+nmv.load_package_lazily(__name__, globals(), [
+    '.soma_softbody_builder',
+    '.soma_meta_builder'])
@@ -20,6 +20,7 @@ import random
 
 # Blender imports
 import bpy
+import numpy
 
 # Internal imports
 import nmv.bmeshi
@@ -552,29 +553,22 @@ class SomaSoftBodyBuilder:
         nmv.bmeshi.ops.subdivide_faces(soma_bmesh_sphere, faces_indices, cuts=2)
 
     ################################################################################################
-    # @build_soma_soft_body
+    # @create_soma_extrusion_sphere
     ################################################################################################
-    def build_soma_soft_body(self,
-                             use_profile_points=False,
-                             apply_shader=True):
-        """Build the soma based on soft-body simulation and Hooke's law.
+    def create_soma_extrusion_sphere(self,
+                                     use_profile_points=False):
+        """Creates the initial ico-sphere of the soma with the extrusion faces of the arbors, and
+        optionally the profile points, and links it to the scene.
 
         The building process ASSUMES non-overlapping and too faraway branches.
 
         :param use_profile_points:
             Integrate the effect of extruding towards the profile points as well.
-        :param apply_shader:
-            Apply the given soma shader in the configuration. This flag will be set to False when
-            the soma is created in another builder such as the skeleton builder or the piecewise
-            mesh builder.
-        :return
-            The soft body object after the deformation. This object will be used later to build
-            the soma mesh.
+        :return:
+            A tuple (soma_sphere_object, roots_and_faces_centroids, valid_profile_points), where
+            roots_and_faces_centroids is a list of [arbor, extrusion_face_centroid] pairs.
         """
 
-        # Log
-        nmv.logger.header('Soma reconstruction with SoftBody')
-
         # Get a list of valid arbors where we can pull the sphere towards without being intersecting
         valid_arbors = nmv.skeleton.get_connected_arbors_to_soma_after_verification(
             morphology=self.morphology, soma_radius=self.initial_soma_radius)
@@ -737,11 +731,65 @@ class SomaSoftBodyBuilder:
                 # Append the face to the list
                 faces_centers.append(face_center)
 
-        """ Physics """
         # Link the soma sphere to the scene
         soma_sphere_object = nmv.bmeshi.ops.link_to_new_object_in_scene(
             soma_bmesh_sphere, nmv.consts.Skeleton.SOMA_PREFIX)
 
+        # Return the sphere and the extrusion targets
+        return soma_sphere_object, roots_and_faces_centroids, valid_profile_points
+
+    ################################################################################################
+    # @apply_soma_material
+    ################################################################################################
+    def apply_soma_material(self,
+                            soma_object):
+        """Creates the soma material and assigns it to the given soma object.
+
+        :param soma_object:
+            A given soma object.
+        """
+
+        # Create the soma material and assign it to the ico-sphere
+        soma_material = nmv.shading.create_material(
+            name=nmv.consts.Skeleton.SOMA_PREFIX, color=self.options.shading.soma_color,
+            material_type=self.options.shading.soma_material)
+
+        # Apply the shader to the ico-sphere
+        nmv.shading.set_material_to_object(
+            mesh_object=soma_object, material_reference=soma_material)
+
+        # Create an illumination specific for the given material
+        nmv.shading.create_material_specific_illumination(self.options.shading.soma_material)
+
+    ################################################################################################
+    # @build_soma_soft_body
+    ################################################################################################
+    def build_soma_soft_body(self,
+                             use_profile_points=False,
+                             apply_shader=True):
+        """Build the soma based on soft-body simulation and Hooke's law.
+
+        The building process ASSUMES non-overlapping and too faraway branches.
+
+        :param use_profile_points:
+            Integrate the effect of extruding towards the profile points as well.
+        :param apply_shader:
+            Apply the given soma shader in the configuration. This flag will be set to False when
+            the soma is created in another builder such as the skeleton builder or the piecewise
+            mesh builder.
+        :return
+            The soft body object after the deformation. This object will be used later to build
+            the soma mesh.
+        """
+
+        # Log
+        nmv.logger.header('Soma reconstruction with SoftBody')
+
+        # Create the initial sphere with the extrusion faces
+        soma_sphere_object, roots_and_faces_centroids, valid_profile_points = \
+            self.create_soma_extrusion_sphere(use_profile_points=use_profile_points)
+
+        """ Physics """
         # Create a vertex group to link all the vertices of the extrusion faces to it
         self.vertex_group = nmv.mesh.ops.create_vertex_group(soma_sphere_object)
 
@@ -800,18 +848,130 @@ class SomaSoftBodyBuilder:
         # Apply the soma shader directly to the soft body object, otherwise create the soma here
         # and apply the material later.
         if apply_shader:
-            # Create the soma material and assign it to the ico-sphere
-            soma_material = nmv.shading.create_material(
-                name=nmv.consts.Skeleton.SOMA_PREFIX, color=self.options.shading.soma_color,
-                material_type=self.options.shading.soma_material)
+            self.apply_soma_material(soma_sphere_object)
 
-            # Apply the shader to the ico-sphere
-            nmv.shading.set_material_to_object(
-                mesh_object=soma_sphere_object, material_reference=soma_material)
+        # Return a reference to the reconstructed soma
+        return soma_sphere_object
 
-            # Create an illumination specific for the given material
-            nmv.shading.create_material_specific_illumination(
-                self.options.shading.soma_material)
+    ################################################################################################
+    # @get_mass_spring_anchors
+    ################################################################################################
+    def get_mass_spring_anchors(self,
+                                soma_sphere_object,
+                                roots_and_faces_centroids,
+                                valid_profile_points):
+        """Computes the anchored vertices of the mass-spring network of the soma and their goal
+        positions, which replace the hooks of the soft body simulation.
+
+        Like the hooks, the vertices of every extrusion face are moved to the initial sample of
+        the arbor and then scaled to its radius.
+
+        :param soma_sphere_object:
+            The initial sphere of the soma, with the extrusion faces.
+        :param roots_and_faces_centroids:
+            A list of [arbor, extrusion_face_centroid] pairs.
+        :param valid_profile_points:
+            A list of the profile points where the sphere is pulled as well.
+        :return:
+            A tuple (anchors, targets) of NumPy arrays.
+        """
+
+        # The positions of the vertices of the sphere
+        vertices = nmv.mesh.ops.get_vertices_positions(soma_sphere_object)
+
+        # The extrusion faces, their targets and scales
+        extrusions = list()
+        for arbor, face_centroid in roots_and_faces_centroids:
+
+            # The target is the initial sample of the arbor
+            target = arbor.samples[0].point
+
+            # Start with a little bit of offset for bridging the arbor with the soma directly
+            if self.options.mesh.soma_connection == nmv.enums.Meshing.SomaConnection.CONNECTED:
+                target = target - target.normalized() * nmv.consts.Skeleton.SOMA_EXTRUSION_DELTA
+
+            extrusions.append([face_centroid, target, self.get_branch_extrusion_scale(arbor)])
+
+        for profile_point in valid_profile_points:
+            extrusions.append([profile_point, profile_point, 1.0])
+
+        anchors = list()
+        targets = list()
+        anchored = set()
+        for point, target, scale in extrusions:
+
+            # Get the extrusion face and its vertices, that were not anchored before
+            face_index = nmv.mesh.ops.get_index_of_nearest_face_to_point(soma_sphere_object, point)
+            face = soma_sphere_object.data.polygons[face_index]
+            vertices_indices = [i for i in face.vertices[:] if i not in anchored]
+            if len(vertices_indices) == 0:
+                continue
+            anchored.update(vertices_indices)
+
+            # Compute the goal positions of the vertices
+            anchors.extend(vertices_indices)
+            targets.append(nmv.physics.get_extrusion_anchors(
+                vertices, vertices_indices, face.center[:], target[:], scale))
+
+        if len(anchors) == 0:
+            return numpy.zeros(0, dtype=int), numpy.zeros((0, 3))
+        return numpy.array(anchors, dtype=int), numpy.vstack(targets)
+
+    ################################################################################################
+    # @build_soma_mass_spring
+    ################################################################################################
+    def build_soma_mass_spring(self,
+                               use_profile_points=False,
+                               apply_shader=True):
+        """Build the soma by deforming the initial sphere with a NumPy mass-spring network instead
+        of the soft body physics of Blender.
+
+        The simulation terminates as soon as the network converges, rather than after a fixed
+        number of frames, and the mesh is updated only once at the end.
+
+        :param use_profile_points:
+            Integrate the effect of extruding towards the profile points as well.
+        :param apply_shader:
+            Apply the given soma shader in the configuration.
+        :return
+            A reference to the deformed soma object.
+        """
+
+        # Log
+        nmv.logger.header('Soma reconstruction with a mass-spring network')
+
+        # Create the initial sphere with the extrusion faces
+        soma_sphere_object, roots_and_faces_centroids, valid_profile_points = \
+            self.create_soma_extrusion_sphere(use_profile_points=use_profile_points)
+
+        # The springs are the edges of the sphere
+        mesh = soma_sphere_object.data
+        edges = numpy.zeros(len(mesh.edges) * 2, dtype=numpy.int32)
+        mesh.edges.foreach_get('vertices', edges)
+
+        # The anchors replace the hooks
+        anchors, targets = self.get_mass_spring_anchors(
+            soma_sphere_object, roots_and_faces_centroids, valid_profile_points)
+
+        # Simulate
+        positions, steps, converged = nmv.physics.simulate_mass_spring_network(
+            vertices=nmv.mesh.ops.get_vertices_positions(soma_sphere_object),
+            edges=edges.reshape(-1, 2), anchors=anchors, targets=targets,
+            stiffness=self.options.soma.stiffness,
+            goal=nmv.consts.SoftBody.MASS_SPRING_GOAL,
+            damping=nmv.consts.SoftBody.MASS_SPRING_DAMPING,
+            ramp_steps=nmv.consts.SoftBody.MASS_SPRING_RAMP_STEPS,
+            tolerance=self.options.soma.simulation_tolerance,
+            maximum_steps=nmv.consts.SoftBody.MASS_SPRING_MAXIMUM_STEPS)
+        nmv.logger.info('Simulation steps [%d], converged [%s]' % (steps, str(converged)))
+
+        # Update the sphere in a single call
+        mesh.vertices.foreach_set('co', positions.astype(numpy.float32).reshape(-1))
+        mesh.update()
+
+        # Apply the soma shader
+        if apply_shader:
+            self.apply_soma_material(soma_sphere_object)
 
         # Return a reference to the reconstructed soma
         return soma_sphere_object
@@ -866,6 +1026,21 @@ class SomaSoftBodyBuilder:
             A reference to the reconstructed mesh of the soma.
         """
 
+        # Use the mass-spring network, without the physics of Blender
+        if self.options.soma.simulator == nmv.enums.Soma.Simulator.MASS_SPRING:
+
+            # Build the soma and deform it until convergence
+            reconstructed_soma_mesh = self.build_soma_mass_spring(apply_shader=apply_shader)
+
+            # Smoothing the soma via shade smoothing
+            nmv.mesh.ops.shade_smooth_object(reconstructed_soma_mesh)
+
+            # Add noise to the soma surface to make it more realistic
+            self.add_noise_to_soma_surface(reconstructed_soma_mesh)
+
+            # Return a reference to the reconstructed soma
+            return reconstructed_soma_mesh
+
         # Build the soft body of the soma
         soma_soft_body = self.build_soma_soft_body(apply_shader=apply_shader)
 
@@ -16,6 +16,9 @@
 # MA 02110-1301 USA.
 ####################################################################################################
 
-from .spine_builder import *
-from .random_spine_builder import *
-from .circuit_spine_builder import *
+# Import the modules on the first access to their names, see nmv.load_package_lazily
+import nmv
+nmv.load_package_lazily(__name__, globals(), [
+    '.spine_builder',
+    '.random_spine_builder',
+    '.circuit_spine_builder'])
@@ -155,9 +155,12 @@ def build_circuit_spines(morphology,
     # Keep a list of all the spines objects
     spines_objects = []
 
-    # Loading a circuit
-    from bluepy.v2 import Circuit
-    circuit = Circuit(blue_config)
+    # Get the cached circuit handle, the connectome is only available in BBP circuits
+    circuit_provider = nmv.file.get_circuit_provider(blue_config)
+    circuit = circuit_provider.get_circuit()
+    if circuit is None:
+        raise ValueError('The circuit [%s] has no connectome to build the spines from, a BBP '
+                         'circuit and BluePy are required' % blue_config)
 
     # Get the IDs of the afferent (or incoming) synapses
     synapse_ids = circuit.connectome.afferent_synapses(int(gid))
@@ -168,40 +171,8 @@ def build_circuit_spines(morphology,
     # The pre-synaptic position
     pre_pos = circuit.connectome.synapse_positions(synapse_ids, 'pre', 'contour')
 
-    # Get the neuron
-    neuron = circuit.cells.get(int(gid))
-
-    # Translation
-    translation = Vector((neuron['x'], neuron['y'], neuron['z']))
-
-    # Orientation
-    o = neuron['orientation']
-    o0 = Vector((o[0][0], o[0][1], o[0][2]))
-    o1 = Vector((o[1][0], o[1][1], o[1][2]))
-    o2 = Vector((o[2][0], o[2][1], o[2][2]))
-
-    # Initialize the transformation matrix to I
-    transformation_matrix = Matrix()
-
-    transformation_matrix[0][0] = o0[0]
-    transformation_matrix[0][1] = o0[1]
-    transformation_matrix[0][2] = o0[2]
-    transformation_matrix[0][3] = translation[0]
-
-    transformation_matrix[1][0] = o1[0]
-    transformation_matrix[1][1] = o1[1]
-    transformation_matrix[1][2] = o1[2]
-    transformation_matrix[1][3] = translation[1]
-
-    transformation_matrix[2][0] = o2[0]
-    transformation_matrix[2][1] = o2[1]
-    transformation_matrix[2][2] = o2[2]
-    transformation_matrix[2][3] = translation[2]
-
-    transformation_matrix[3][0] = 0.0
-    transformation_matrix[3][1] = 0.0
-    transformation_matrix[3][2] = 0.0
-    transformation_matrix[3][3] = 1.0
+    # Get the transformation matrix of the neuron from the cached cell
+    transformation_matrix = Matrix(circuit_provider.get_transformation_matrix(gid).tolist())
 
     # Load all the template spines and ignore the verbose messages of loading
     templates_spines_list = load_spines(nmv.consts.Paths.SPINES_MESHES_LQ_DIRECTORY)
@@ -0,0 +1,57 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+####################################################################################################
+# @Circuit
+####################################################################################################
+class Circuit:
+    """Circuit constants
+    """
+
+    ################################################################################################
+    # @__init__
+    ################################################################################################
+    def __init__(self):
+        pass
+
+    # The extension of the local cells tables in CSV format
+    CELLS_TABLE_CSV_EXTENSION = '.csv'
+
+    # The extensions of the local cells tables in HDF5 format
+    CELLS_TABLE_H5_EXTENSIONS = ['.h5', '.hdf5']
+
+    # The separator of the names of the targets of a cell in a local cells table
+    CELLS_TABLE_TARGETS_SEPARATOR = ';'
+
+    # The target that refers to all the cells of a local cells table
+    ALL_CELLS_TARGET = 'All'
+
+    # The columns of the GIDs and the positions of the cells in a local cells table
+    GID_COLUMN = 'gid'
+    POSITION_COLUMNS = ['x', 'y', 'z']
+
+    # The columns of the orientations of the cells, as quaternions, in a local cells table
+    ORIENTATION_COLUMNS = ['orientation_w', 'orientation_x', 'orientation_y', 'orientation_z']
+
+    # The columns of the properties of the cells in a local cells table
+    MTYPE_COLUMN = 'mtype'
+    MORPHOLOGY_COLUMN = 'morphology'
+    MORPHOLOGY_PATH_COLUMN = 'morphology_path'
+    TARGETS_COLUMN = 'targets'
+
+    # The properties of the cells that are prefetched from a BBP circuit in a single query
+    CELLS_PROPERTIES = ['x', 'y', 'z', 'orientation', 'mtype', 'morphology']
@@ -53,3 +53,15 @@ class Meshing:
     # BLEND extension
     BLEND_EXTENSION = '.blend'
 
+    # NMV binary mesh extension
+    NMV_MESH_EXTENSION = '.nmvmesh'
+
+    # The magic bytes at the beginning of every NMV binary mesh file
+    NMV_MESH_MAGIC = b'NMVMESH\x00'
+
+    # The version of the NMV binary mesh format
+    NMV_MESH_VERSION = 1
+
+    # The alignment of the arrays in the NMV binary mesh files, in bytes
+    NMV_MESH_ALIGNMENT = 16
+
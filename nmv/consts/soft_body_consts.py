@@ -52,3 +52,18 @@ class SoftBody:
 
     # Initial soma radius scale factor
     SOMA_SCALE_FACTOR = 0.5
+
+    # Goal strength that pulls the free vertices of the mass-spring network to the sphere
+    MASS_SPRING_GOAL = 0.01
+
+    # Velocity damping factor of the mass-spring simulation
+    MASS_SPRING_DAMPING = 0.1
+
+    # Number of steps to move the anchors of the mass-spring network to their targets
+    MASS_SPRING_RAMP_STEPS = 50
+
+    # Default convergence tolerance of the mass-spring simulation, relative to the soma radius
+    MASS_SPRING_TOLERANCE_DEFAULT = 1e-4
+
+    # Maximum number of steps of the mass-spring simulation
+    MASS_SPRING_MAXIMUM_STEPS = 1000
@@ -287,6 +287,9 @@ class MorphologyEditor:
             section.samples[i].point = copy.deepcopy(nmv.mesh.ops.get_vertex_position(
                 mesh_object=self.skeleton_mesh, vertex_index=section.samples[i].morphology_idx))
 
+        # Invalidate the cached geometry of the section
+        section.invalidate_geometry()
+
     ################################################################################################
     # @update_arbor_coordinates
     ################################################################################################
@@ -330,3 +333,9 @@ class MorphologyEditor:
             for arbor in self.morphology.axons:
                 nmv.logger.info(arbor.label)
                 self.update_arbor_coordinates(root=arbor)
+
+        # The samples have been moved, the bounding box must be recomputed
+        self.morphology.invalidate_bounding_box()
+
+        # The morphology has been edited
+        self.morphology.revision += 1
@@ -15,14 +15,17 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .analysis_enums import *
-from .camera_enums import *
-from .color_enums import *
-from .dendrogram_enums import *
-from .image_enums import *
-from .input_enums import *
-from .meshing_enums import *
-from .rendering_enums import *
-from .shading_enums import *
-from .skeleton_enums import *
-from .soma_enums import *
+# Import the modules on the first access to their names, see nmv.load_package_lazily
+import nmv
+nmv.load_package_lazily(__name__, globals(), [
+    '.analysis_enums',
+    '.camera_enums',
+    '.color_enums',
+    '.dendrogram_enums',
+    '.image_enums',
+    '.input_enums',
+    '.meshing_enums',
+    '.rendering_enums',
+    '.shading_enums',
+    '.skeleton_enums',
+    '.soma_enums'])
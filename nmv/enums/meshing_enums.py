@@ -228,6 +228,43 @@ class Meshing:
             else:
                 return Meshing.Edges.HARD
 
+    ################################################################################################
+    # @MetaPolygonizer
+    ################################################################################################
+    class MetaPolygonizer:
+        """The polygonizer that is used to convert the meta objects into meshes
+        """
+
+        # Blender metaball polygonizer, with a single global resolution
+        BLENDER = 'META_POLYGONIZER_BLENDER'
+
+        # NeuroMorphoVis implicit-surface mesher, with a sparse tiled grid
+        IMPLICIT = 'META_POLYGONIZER_IMPLICIT'
+
+        ############################################################################################
+        # @__init__
+        ############################################################################################
+        def __init__(self):
+            pass
+
+        ############################################################################################
+        # @get_enum
+        ############################################################################################
+        @staticmethod
+        def get_enum(argument):
+
+            # Implicit-surface mesher
+            if argument == 'implicit':
+                return Meshing.MetaPolygonizer.IMPLICIT
+
+            # Blender polygonizer
+            elif argument == 'blender':
+                return Meshing.MetaPolygonizer.BLENDER
+
+            # By default use the Blender polygonizer
+            else:
+                return Meshing.MetaPolygonizer.BLENDER
+
     ################################################################################################
     # @Model
     ################################################################################################
@@ -444,6 +481,9 @@ class Meshing:
         # .blend
         BLEND = 'EXPORT_FORMAT_BLEND'
 
+        # .nmvmesh
+        NMV = 'EXPORT_FORMAT_NMV'
+
         ############################################################################################
         # @__init__
         ############################################################################################
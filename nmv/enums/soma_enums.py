@@ -136,3 +136,47 @@ class Soma:
             # Arbors only by default
             else:
                 return Soma.Profile.ARBORS_ONLY
+
+    ################################################################################################
+    # @Simulator
+    ################################################################################################
+    class Simulator:
+        """Soft body simulator enumerators
+        """
+
+        # Use the soft body physics engine of Blender, with a fixed number of frames
+        BLENDER = 'SOMA_SIMULATOR_BLENDER'
+
+        # Use the NumPy mass-spring network, that terminates on convergence
+        MASS_SPRING = 'SOMA_SIMULATOR_MASS_SPRING'
+
+        ############################################################################################
+        # @__init__
+        ############################################################################################
+        def __init__(self):
+            pass
+
+        ############################################################################################
+        # @get_enum
+        ############################################################################################
+        @staticmethod
+        def get_enum(argument):
+            """Gets the enumerator from the argument directly.
+
+            :param argument:
+                Soma simulator argument.
+            :return:
+                Soma simulator enumerator.
+            """
+
+            # Mass-spring network
+            if argument == 'mass-spring':
+                return Soma.Simulator.MASS_SPRING
+
+            # Blender
+            elif argument == 'blender':
+                return Soma.Simulator.BLENDER
+
+            # Blender by default
+            else:
+                return Soma.Simulator.BLENDER
@@ -15,7 +15,10 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .ops import *
-from .readers import *
-from .writers import *
-from .logger import *
+# Import the modules on the first access to their names, see nmv.load_package_lazily
+import nmv
+nmv.load_package_lazily(__name__, globals(), [
+    '.ops',
+    '.readers',
+    '.writers',
+    '.logger'])
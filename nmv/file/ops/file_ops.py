@@ -95,6 +95,37 @@ def get_files_in_directory(directory,
     return files
 
 
+####################################################################################################
+# @get_morphology_files
+####################################################################################################
+def get_morphology_files(morphology_directory=None,
+                         morphology_list=None):
+    """Gets the paths of the morphology files (.h5 or .swc) in a directory, or the paths listed
+    in a text file, one path per line. The relative paths in the list are relative to the list.
+
+    :param morphology_directory:
+        A directory containing the morphology files.
+    :param morphology_list:
+        A text file listing the morphology files, used instead of the directory if given.
+    :return:
+        A sorted list of the paths of the morphology files.
+    """
+
+    # The listed files
+    if morphology_list is not None:
+        list_directory = os.path.dirname(os.path.abspath(morphology_list))
+        with open(morphology_list, 'r') as list_file:
+            paths = [line.strip() for line in list_file]
+        return [os.path.join(list_directory, path) for path in paths
+                if path and not path.startswith('#')]
+
+    # The files in the directory
+    morphology_files = get_files_in_directory(morphology_directory, '.h5')
+    morphology_files.extend(get_files_in_directory(morphology_directory, '.swc'))
+    return ['%s/%s' % (morphology_directory, morphology_file)
+            for morphology_file in sorted(morphology_files)]
+
+
 ####################################################################################################
 # @write_batch_job_string_to_file
 ####################################################################################################
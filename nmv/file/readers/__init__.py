@@ -15,8 +15,12 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .mesh import *
-from .morphology import *
-from .nuclei import *
-from .spines import *
-from .configs import *
\ No newline at end of file
+# Import the modules on the first access to their names, see nmv.load_package_lazily
+import nmv
+nmv.load_package_lazily(__name__, globals(), [
+    '.mesh',
+    '.circuit',
+    '.morphology',
+    '.nuclei',
+    '.spines',
+    '.configs'])
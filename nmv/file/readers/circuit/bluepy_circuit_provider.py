@@ -0,0 +1,130 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# Internal imports
+import nmv.consts
+from .circuit_provider import CircuitCell, CircuitProvider
+
+
+####################################################################################################
+# @BluePyCircuitProvider
+####################################################################################################
+class BluePyCircuitProvider(CircuitProvider):
+    """A circuit data provider for BBP circuits that are loaded with BluePy."""
+
+    ################################################################################################
+    # @__init__
+    ################################################################################################
+    def __init__(self,
+                 blue_config):
+        """Constructor
+
+        :param blue_config:
+            A given BBP circuit configuration file.
+        """
+
+        CircuitProvider.__init__(self)
+
+        # The circuit configuration
+        self.blue_config = blue_config
+
+        # The circuit handle, opened once on demand
+        self.circuit = None
+
+    ################################################################################################
+    # @get_circuit
+    ################################################################################################
+    def get_circuit(self):
+        """Gets the circuit handle, the circuit is opened only the first time.
+
+        :return:
+            A reference to the BluePy circuit, or None if BluePy is not installed.
+        """
+
+        if self.circuit is None:
+
+            # Import BluePy
+            try:
+                import bluepy.v2
+            except ImportError:
+                print('ERROR: Cannot import [BluePy], please install it')
+                return None
+
+            # Loading a circuit
+            from bluepy.v2 import Circuit
+            self.circuit = Circuit(self.blue_config)
+
+        return self.circuit
+
+    ################################################################################################
+    # @get_loaded_circuit
+    ################################################################################################
+    def get_loaded_circuit(self):
+        """Gets the circuit handle for a query, and fails if the circuit cannot be loaded.
+
+        :return:
+            A reference to the BluePy circuit.
+        """
+
+        circuit = self.get_circuit()
+        if circuit is None:
+            raise ImportError('Cannot load the circuit [%s] without BluePy' % self.blue_config)
+        return circuit
+
+    ################################################################################################
+    # @query_target_gids
+    ################################################################################################
+    def query_target_gids(self,
+                          target):
+        """Queries the GIDs of a target from the circuit.
+
+        :param target:
+            The name of a given target.
+        :return:
+            A list of GIDs.
+        """
+
+        return list(self.get_loaded_circuit().cells.ids(target))
+
+    ################################################################################################
+    # @query_cells
+    ################################################################################################
+    def query_cells(self,
+                    gids):
+        """Queries the properties of a group of cells from the cells table in a single query.
+
+        :param gids:
+            A list of GIDs.
+        :return:
+            A list of CircuitCell, in the same order of the GIDs.
+        """
+
+        # A single query for all the cells
+        circuit = self.get_loaded_circuit()
+        table = circuit.cells.get(gids, properties=nmv.consts.Circuit.CELLS_PROPERTIES)
+
+        # The morphology paths are resolved from the morphology labels, without querying the cells
+        cells = list()
+        for gid in gids:
+            row = table.loc[gid]
+            cells.append(CircuitCell(
+                gid=gid, position=(row['x'], row['y'], row['z']), orientation=row['orientation'],
+                mtype=row['mtype'], morphology=row['morphology'],
+                morphology_path=circuit.morph.get_filepath(int(gid))))
+
+        # Return the cells
+        return cells
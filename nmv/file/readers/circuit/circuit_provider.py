@@ -0,0 +1,335 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import numpy
+
+# Internal imports
+import nmv
+
+
+####################################################################################################
+# @CircuitCell
+####################################################################################################
+class CircuitCell:
+    """The properties of a single cell in a circuit."""
+
+    ################################################################################################
+    # @__init__
+    ################################################################################################
+    def __init__(self,
+                 gid,
+                 position,
+                 orientation,
+                 mtype=None,
+                 morphology=None,
+                 morphology_path=None):
+        """Constructor
+
+        :param gid:
+            Cell GID.
+        :param position:
+            The position of the soma of the cell in the circuit, a NumPy array of 3 values.
+        :param orientation:
+            The rotation of the cell in the circuit, a 3x3 NumPy array.
+        :param mtype:
+            The morphological type of the cell.
+        :param morphology:
+            The label of the morphology of the cell.
+        :param morphology_path:
+            The path to the morphology file of the cell, if known.
+        """
+
+        self.gid = int(gid)
+        self.position = numpy.asarray(position, dtype=numpy.float64).reshape(3)
+        self.orientation = numpy.asarray(orientation, dtype=numpy.float64).reshape(3, 3)
+        self.mtype = mtype
+        self.morphology = morphology
+        self.morphology_path = morphology_path
+
+    ################################################################################################
+    # @get_transformation_matrix
+    ################################################################################################
+    def get_transformation_matrix(self):
+        """Gets the matrix that transforms the cell from its local coordinates to the circuit.
+
+        :return:
+            A 4x4 NumPy array.
+        """
+
+        matrix = numpy.identity(4)
+        matrix[:3, :3] = self.orientation
+        matrix[:3, 3] = self.position
+        return matrix
+
+
+####################################################################################################
+# @CircuitProvider
+####################################################################################################
+class CircuitProvider:
+    """The base of the circuit data providers.
+
+    A provider keeps a single handle to its circuit, and caches the cells and targets it has
+    already queried. Prefetching a group of cells retrieves all their properties in one query, so
+    the following per-GID lookups do not touch the circuit again. The subclasses only implement
+    @query_target_gids and @query_cells.
+    """
+
+    ################################################################################################
+    # @__init__
+    ################################################################################################
+    def __init__(self):
+        """Constructor
+        """
+
+        # The cached cells, keyed by their GIDs
+        self.cells = dict()
+
+        # The cached GIDs of the targets, keyed by the names of the targets
+        self.targets = dict()
+
+    ################################################################################################
+    # @get_circuit
+    ################################################################################################
+    def get_circuit(self):
+        """Gets the handle of the underlying circuit, if the provider has one.
+
+        :return:
+            A reference to the circuit, or None.
+        """
+
+        return None
+
+    ################################################################################################
+    # @query_target_gids
+    ################################################################################################
+    def query_target_gids(self,
+                          target):
+        """Queries the GIDs of a target from the circuit.
+
+        :param target:
+            The name of a given target.
+        :return:
+            A list of GIDs.
+        """
+
+        raise NotImplementedError
+
+    ################################################################################################
+    # @query_cells
+    ################################################################################################
+    def query_cells(self,
+                    gids):
+        """Queries the properties of a group of cells from the circuit at once.
+
+        :param gids:
+            A list of GIDs.
+        :return:
+            A list of CircuitCell, in the same order of the GIDs.
+        """
+
+        raise NotImplementedError
+
+    ################################################################################################
+    # @get_gids
+    ################################################################################################
+    def get_gids(self,
+                 target):
+        """Gets the GIDs of a target, queried only once.
+
+        :param target:
+            The name of a given target.
+        :return:
+            A list of GIDs.
+        """
+
+        if target not in self.targets:
+            self.targets[target] = [int(gid) for gid in self.query_target_gids(target)]
+        return self.targets[target]
+
+    ################################################################################################
+    # @prefetch
+    ################################################################################################
+    def prefetch(self,
+                 gids=None,
+                 target=None):
+        """Retrieves the properties of a group of cells in a single query and caches them. The
+        cells that are already cached are not queried again.
+
+        :param gids:
+            A list of GIDs.
+        :param target:
+            The name of a target, used if the GIDs are not given.
+        :return:
+            A list of the CircuitCell of the group, in the same order of the GIDs.
+        """
+
+        # Resolve the target
+        if gids is None:
+            gids = self.get_gids(target)
+        gids = [int(gid) for gid in gids]
+
+        # Query the missing cells only
+        missing_gids = list(dict.fromkeys(gid for gid in gids if gid not in self.cells))
+        if len(missing_gids) > 0:
+            with nmv.profiler.span('query_circuit_cells', 'reading') as span:
+                span.add_count('cells', len(missing_gids))
+                for cell in self.query_cells(missing_gids):
+                    self.cells[cell.gid] = cell
+
+        # Return the cells
+        return [self.cells[gid] for gid in gids]
+
+    ################################################################################################
+    # @get_cell
+    ################################################################################################
+    def get_cell(self,
+                 gid):
+        """Gets a cell, it is queried if it was not prefetched.
+
+        :param gid:
+            Cell GID.
+        :return:
+            A CircuitCell.
+        """
+
+        gid = int(gid)
+        if gid not in self.cells:
+            self.prefetch(gids=[gid])
+        return self.cells[gid]
+
+    ################################################################################################
+    # @get_position
+    ################################################################################################
+    def get_position(self,
+                     gid):
+        """Gets the position of a cell.
+
+        :param gid:
+            Cell GID.
+        :return:
+            The position of the soma of the cell, a NumPy array of 3 values.
+        """
+
+        return self.get_cell(gid).position
+
+    ################################################################################################
+    # @get_orientation
+    ################################################################################################
+    def get_orientation(self,
+                        gid):
+        """Gets the orientation of a cell.
+
+        :param gid:
+            Cell GID.
+        :return:
+            The rotation of the cell, a 3x3 NumPy array.
+        """
+
+        return self.get_cell(gid).orientation
+
+    ################################################################################################
+    # @get_mtype
+    ################################################################################################
+    def get_mtype(self,
+                  gid):
+        """Gets the morphological type of a cell.
+
+        :param gid:
+            Cell GID.
+        :return:
+            The mtype of the cell.
+        """
+
+        return self.get_cell(gid).mtype
+
+    ################################################################################################
+    # @get_morphology_label
+    ################################################################################################
+    def get_morphology_label(self,
+                             gid):
+        """Gets the label of the morphology of a cell.
+
+        :param gid:
+            Cell GID.
+        :return:
+            The label of the morphology of the cell.
+        """
+
+        return self.get_cell(gid).morphology
+
+    ################################################################################################
+    # @get_morphology_path
+    ################################################################################################
+    def get_morphology_path(self,
+                            gid):
+        """Gets the path to the morphology file of a cell.
+
+        :param gid:
+            Cell GID.
+        :return:
+            The path to the morphology file of the cell.
+        """
+
+        return self.get_cell(gid).morphology_path
+
+    ################################################################################################
+    # @get_transformation_matrix
+    ################################################################################################
+    def get_transformation_matrix(self,
+                                  gid):
+        """Gets the matrix that transforms a cell from its local coordinates to the circuit.
+
+        :param gid:
+            Cell GID.
+        :return:
+            A 4x4 NumPy array.
+        """
+
+        return self.get_cell(gid).get_transformation_matrix()
+
+    ################################################################################################
+    # @get_positions
+    ################################################################################################
+    def get_positions(self,
+                      gids):
+        """Gets the positions of a group of cells, prefetched at once.
+
+        :param gids:
+            A list of GIDs.
+        :return:
+            A NumPy array of shape (N, 3).
+        """
+
+        cells = self.prefetch(gids=gids)
+        return numpy.array([cell.position for cell in cells]).reshape(-1, 3)
+
+    ################################################################################################
+    # @get_orientations
+    ################################################################################################
+    def get_orientations(self,
+                         gids):
+        """Gets the orientations of a group of cells, prefetched at once.
+
+        :param gids:
+            A list of GIDs.
+        :return:
+            A NumPy array of shape (N, 3, 3).
+        """
+
+        cells = self.prefetch(gids=gids)
+        return numpy.array([cell.orientation for cell in cells]).reshape(-1, 3, 3)
@@ -0,0 +1,55 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# Internal imports
+from .bluepy_circuit_provider import BluePyCircuitProvider
+from .local_circuit_provider import LocalCircuitProvider, is_local_cells_table
+
+
+# The providers that were created in this session, keyed by their circuit configurations
+cached_circuit_providers = dict()
+
+
+####################################################################################################
+# @get_circuit_provider
+####################################################################################################
+def get_circuit_provider(blue_config):
+    """Gets the data provider of a circuit. A provider is created only once per circuit, so the
+    circuit is opened once and its cached cells are shared by all the callers.
+
+    :param blue_config:
+        A BBP circuit configuration file, or a local cells table (.csv, .h5).
+    :return:
+        A CircuitProvider.
+    """
+
+    if blue_config not in cached_circuit_providers:
+        if is_local_cells_table(blue_config):
+            cached_circuit_providers[blue_config] = LocalCircuitProvider(blue_config)
+        else:
+            cached_circuit_providers[blue_config] = BluePyCircuitProvider(blue_config)
+    return cached_circuit_providers[blue_config]
+
+
+####################################################################################################
+# @clear_circuit_providers
+####################################################################################################
+def clear_circuit_providers():
+    """Releases all the circuit providers and their cached cells.
+    """
+
+    cached_circuit_providers.clear()
@@ -0,0 +1,256 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import csv
+import os
+import numpy
+
+# Internal imports
+import nmv.consts
+import nmv.utilities
+from .circuit_provider import CircuitCell, CircuitProvider
+
+
+####################################################################################################
+# @is_local_cells_table
+####################################################################################################
+def is_local_cells_table(file_path):
+    """Checks if the given file is a local cells table rather than a BBP circuit configuration.
+
+    :param file_path:
+        A given file path.
+    :return:
+        True if the file is a CSV or an HDF5 cells table, otherwise False.
+    """
+
+    extension = os.path.splitext(str(file_path))[1].lower()
+    return extension == nmv.consts.Circuit.CELLS_TABLE_CSV_EXTENSION or \
+        extension in nmv.consts.Circuit.CELLS_TABLE_H5_EXTENSIONS
+
+
+####################################################################################################
+# @compute_rotation_matrices_from_quaternions
+####################################################################################################
+def compute_rotation_matrices_from_quaternions(quaternions):
+    """Computes the rotation matrices of a group of quaternions at once.
+
+    :param quaternions:
+        A NumPy array of shape (N, 4) of (w, x, y, z) quaternions.
+    :return:
+        A NumPy array of shape (N, 3, 3).
+    """
+
+    # Normalize the quaternions
+    quaternions = numpy.asarray(quaternions, dtype=numpy.float64).reshape(-1, 4)
+    quaternions = quaternions / numpy.linalg.norm(quaternions, axis=1)[:, None]
+    w, x, y, z = quaternions.T
+
+    # Build the matrices
+    matrices = numpy.empty((len(quaternions), 3, 3), dtype=numpy.float64)
+    matrices[:, 0, 0] = 1.0 - 2.0 * (y * y + z * z)
+    matrices[:, 0, 1] = 2.0 * (x * y - z * w)
+    matrices[:, 0, 2] = 2.0 * (x * z + y * w)
+    matrices[:, 1, 0] = 2.0 * (x * y + z * w)
+    matrices[:, 1, 1] = 1.0 - 2.0 * (x * x + z * z)
+    matrices[:, 1, 2] = 2.0 * (y * z - x * w)
+    matrices[:, 2, 0] = 2.0 * (x * z - y * w)
+    matrices[:, 2, 1] = 2.0 * (y * z + x * w)
+    matrices[:, 2, 2] = 1.0 - 2.0 * (x * x + y * y)
+    return matrices
+
+
+####################################################################################################
+# @LocalCircuitProvider
+####################################################################################################
+class LocalCircuitProvider(CircuitProvider):
+    """A circuit data provider that reads the cells from a local table instead of a BBP circuit,
+    for example to use the GID and target inputs without the circuit software stack.
+
+    The table is either a CSV file with a header, or an HDF5 file with a dataset per column. The
+    columns are the GIDs (gid), the positions (x, y, z), and optionally the orientations as
+    quaternions (orientation_w, orientation_x, orientation_y, orientation_z), the mtypes (mtype),
+    the morphology labels (morphology), the paths to the morphology files relative to the table
+    (morphology_path), and the names of the targets of each cell separated by semicolons (targets).
+    """
+
+    ################################################################################################
+    # @__init__
+    ################################################################################################
+    def __init__(self,
+                 cells_table):
+        """Constructor
+
+        :param cells_table:
+            The path to the local cells table.
+        """
+
+        CircuitProvider.__init__(self)
+
+        # The path to the table
+        self.cells_table = cells_table
+
+        # The columns of the table, read once on demand
+        self.columns = None
+
+        # The rows of the GIDs in the table
+        self.rows = None
+
+    ################################################################################################
+    # @read_csv_columns
+    ################################################################################################
+    def read_csv_columns(self):
+        """Reads the columns of a CSV cells table.
+
+        :return:
+            A dictionary of the columns of the table, as lists of strings.
+        """
+
+        with open(self.cells_table, 'r', newline='') as table_file:
+            reader = csv.reader(table_file)
+            header = [column.strip() for column in next(reader)]
+            values = [row for row in reader if len(row) > 0]
+        return {column: [row[i].strip() for row in values] for i, column in enumerate(header)}
+
+    ################################################################################################
+    # @read_h5_columns
+    ################################################################################################
+    def read_h5_columns(self):
+        """Reads the columns of an HDF5 cells table.
+
+        :return:
+            A dictionary of the columns of the table.
+        """
+
+        # Import h5py and install it if it does not exist
+        h5py = nmv.utilities.import_package('h5py')
+
+        # Read all the datasets, the strings are decoded
+        columns = dict()
+        with h5py.File(self.cells_table, 'r') as table_file:
+            for column in table_file.keys():
+                data = table_file[column][()]
+                if data.dtype.kind in ('S', 'O'):
+                    data = [value.decode() if isinstance(value, bytes) else str(value)
+                            for value in data]
+                columns[column] = data
+        return columns
+
+    ################################################################################################
+    # @get_columns
+    ################################################################################################
+    def get_columns(self):
+        """Gets the columns of the table, the table is read only the first time.
+
+        :return:
+            A dictionary of the columns of the table.
+        """
+
+        if self.columns is None:
+
+            # Read the table
+            extension = os.path.splitext(self.cells_table)[1].lower()
+            if extension == nmv.consts.Circuit.CELLS_TABLE_CSV_EXTENSION:
+                self.columns = self.read_csv_columns()
+            else:
+                self.columns = self.read_h5_columns()
+
+            # Index the rows by the GIDs
+            gids = numpy.asarray(self.columns[nmv.consts.Circuit.GID_COLUMN]).astype(numpy.int64)
+            self.rows = {gid: i for i, gid in enumerate(gids.tolist())}
+
+        return self.columns
+
+    ################################################################################################
+    # @query_target_gids
+    ################################################################################################
+    def query_target_gids(self,
+                          target):
+        """Gets the GIDs of the cells that list the given target.
+
+        :param target:
+            The name of a given target.
+        :return:
+            A list of GIDs.
+        """
+
+        columns = self.get_columns()
+        gids = numpy.asarray(columns[nmv.consts.Circuit.GID_COLUMN]).astype(numpy.int64).tolist()
+
+        # All the cells
+        if target == nmv.consts.Circuit.ALL_CELLS_TARGET or \
+                nmv.consts.Circuit.TARGETS_COLUMN not in columns:
+            return gids
+
+        # The cells of the target only
+        separator = nmv.consts.Circuit.CELLS_TABLE_TARGETS_SEPARATOR
+        return [gid for gid, targets in zip(gids, columns[nmv.consts.Circuit.TARGETS_COLUMN])
+                if target in [name.strip() for name in str(targets).split(separator)]]
+
+    ################################################################################################
+    # @query_cells
+    ################################################################################################
+    def query_cells(self,
+                    gids):
+        """Gets the properties of a group of cells from the table at once.
+
+        :param gids:
+            A list of GIDs.
+        :return:
+            A list of CircuitCell, in the same order of the GIDs.
+        """
+
+        columns = self.get_columns()
+
+        # The rows of the cells
+        missing_gids = [gid for gid in gids if int(gid) not in self.rows]
+        if len(missing_gids) > 0:
+            raise KeyError('GIDs %s are not in the cells table [%s]' %
+                           (str(missing_gids), self.cells_table))
+        rows = numpy.array([self.rows[int(gid)] for gid in gids], dtype=numpy.int64)
+
+        # The positions
+        positions = numpy.stack([numpy.asarray(columns[column], dtype=numpy.float64)[rows]
+                                 for column in nmv.consts.Circuit.POSITION_COLUMNS], axis=1)
+
+        # The orientations, the cells are not rotated if the table has no orientations
+        if all(column in columns for column in nmv.consts.Circuit.ORIENTATION_COLUMNS):
+            orientations = compute_rotation_matrices_from_quaternions(numpy.stack(
+                [numpy.asarray(columns[column], dtype=numpy.float64)[rows]
+                 for column in nmv.consts.Circuit.ORIENTATION_COLUMNS], axis=1))
+        else:
+            orientations = numpy.repeat(numpy.identity(3)[None], len(rows), axis=0)
+
+        # The optional properties
+        def get_property(column):
+            if column not in columns:
+                return [None] * len(rows)
+            return [columns[column][row] for row in rows.tolist()]
+        mtypes = get_property(nmv.consts.Circuit.MTYPE_COLUMN)
+        morphologies = get_property(nmv.consts.Circuit.MORPHOLOGY_COLUMN)
+
+        # The paths of the morphologies are relative to the table
+        table_directory = os.path.dirname(os.path.abspath(self.cells_table))
+        morphologies_paths = [
+            None if path is None or path == '' else os.path.join(table_directory, path)
+            for path in get_property(nmv.consts.Circuit.MORPHOLOGY_PATH_COLUMN)]
+
+        # Return the cells
+        return [CircuitCell(gid=gid, position=positions[i], orientation=orientations[i],
+                            mtype=mtypes[i], morphology=morphologies[i],
+                            morphology_path=morphologies_paths[i])
+                for i, gid in enumerate(gids)]
@@ -179,3 +179,52 @@ def import_object_from_blend_file(input_directory,
 
     # Return reference to the objects loaded
     return data_dst.objects
+
+
+####################################################################################################
+# @import_nmv_mesh_file
+####################################################################################################
+def import_nmv_mesh_file(input_directory,
+                         input_file_name,
+                         separate_partitions=False):
+    """Import an NMV binary mesh file into the scene without the import operators, and return a
+    list of references to the created objects.
+
+    :param input_directory:
+        The directory that is supposed to have the mesh.
+    :param input_file_name:
+        The name of the mesh file.
+    :param separate_partitions:
+        Create an object for every partition of the mesh, for example for every arbor, instead of a
+        single object.
+    :return:
+        A list of references to the loaded meshes in Blender.
+    """
+
+    # File path
+    file_path = "%s/%s" % (input_directory, input_file_name)
+
+    # Issue an error message if failing
+    if not os.path.isfile(file_path):
+        nmv.logger.log('LOADING ERROR: cannot load [%s]' % file_path)
+        return list()
+
+    # Map the file into memory, the arrays are read by Blender directly
+    nmv.logger.log('Loading [%s]' % file_path)
+    nmv_mesh = nmv.file.read_nmv_mesh_file(file_path)
+
+    # The object will be named based on the file name
+    object_name = input_file_name.split('.')[0]
+
+    # A single object
+    if not separate_partitions or len(nmv_mesh.partitions) == 0:
+        return [nmv.mesh.create_mesh_object_from_arrays(
+            object_name, nmv_mesh.vertices, nmv_mesh.triangles)]
+
+    # An object per partition
+    mesh_objects = list()
+    for partition in nmv_mesh.partitions:
+        vertices, normals, triangles = nmv_mesh.get_partition_arrays(partition)
+        mesh_objects.append(nmv.mesh.create_mesh_object_from_arrays(
+            '%s_%s' % (object_name, partition['name']), vertices, triangles))
+    return mesh_objects
@@ -0,0 +1,181 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import json
+import zlib
+import numpy
+
+# Internal imports
+import nmv.consts
+
+
+####################################################################################################
+# @NMVMesh
+####################################################################################################
+class NMVMesh:
+    """The arrays, partitions and metadata of a mesh loaded from an NMV binary mesh file.
+    """
+
+    ################################################################################################
+    # @__init__
+    ################################################################################################
+    def __init__(self,
+                 vertices,
+                 normals,
+                 triangles,
+                 partitions,
+                 metadata):
+        """Constructor
+
+        :param vertices:
+            An array of shape (N, 3) of the positions of the vertices.
+        :param normals:
+            An array of shape (N, 3) of the normals of the vertices.
+        :param triangles:
+            An array of shape (T, 3) of the indices of the vertices of the triangles.
+        :param partitions:
+            A list of dictionaries with the name, the first vertex, the number of vertices, the
+            first triangle and the number of triangles of every part of the mesh.
+        :param metadata:
+            A dictionary of the metadata of the mesh.
+        """
+
+        self.vertices = vertices
+        self.normals = normals
+        self.triangles = triangles
+        self.partitions = partitions
+        self.metadata = metadata
+
+    ################################################################################################
+    # @get_partition_arrays
+    ################################################################################################
+    def get_partition_arrays(self,
+                             partition):
+        """Returns the vertices, normals and triangles of a single partition, the triangles are
+        indexed relatively to the first vertex of the partition.
+
+        :param partition:
+            A partition of the mesh, see self.partitions.
+        :return:
+            A tuple (vertices, normals, triangles).
+        """
+
+        vertex_start = partition['vertex_start']
+        vertex_end = vertex_start + partition['vertex_count']
+        triangle_start = partition['triangle_start']
+        triangle_end = triangle_start + partition['triangle_count']
+        return self.vertices[vertex_start:vertex_end], self.normals[vertex_start:vertex_end], \
+            self.triangles[triangle_start:triangle_end] - vertex_start
+
+
+####################################################################################################
+# @read_nmv_mesh_header
+####################################################################################################
+def read_nmv_mesh_header(file_path):
+    """Reads the header of an NMV binary mesh file.
+
+    :param file_path:
+        The path to the file.
+    :return:
+        A tuple (header, data offset), where the header is the decoded JSON header and the data
+        offset is the position of the first array in the file.
+    """
+
+    with open(file_path, 'rb') as nmv_file:
+        magic = nmv_file.read(len(nmv.consts.Meshing.NMV_MESH_MAGIC))
+        if magic != nmv.consts.Meshing.NMV_MESH_MAGIC:
+            raise ValueError('[%s] is not an NMV binary mesh file' % file_path)
+        version, header_size = numpy.frombuffer(nmv_file.read(8), dtype='<u4')
+        if version > nmv.consts.Meshing.NMV_MESH_VERSION:
+            raise ValueError('[%s] has an unsupported version [%d]' % (file_path, version))
+        header = json.loads(nmv_file.read(int(header_size)).decode('utf-8'))
+
+    return header, len(nmv.consts.Meshing.NMV_MESH_MAGIC) + 8 + int(header_size)
+
+
+####################################################################################################
+# @read_nmv_mesh_array
+####################################################################################################
+def read_nmv_mesh_array(file_path,
+                        description,
+                        data_offset,
+                        memory_map=True):
+    """Reads an array of an NMV binary mesh file and decodes it.
+
+    :param file_path:
+        The path to the file.
+    :param description:
+        The description of the array in the header.
+    :param data_offset:
+        The position of the first array in the file.
+    :param memory_map:
+        Map the uncompressed arrays into memory instead of reading them.
+    :return:
+        The decoded array, quantized arrays are converted back to 32-bit floats.
+    """
+
+    dtype = numpy.dtype(description['dtype'])
+    shape = tuple(description['shape'])
+    offset = data_offset + description['offset']
+
+    if description['compression'] == 'zlib':
+        with open(file_path, 'rb') as nmv_file:
+            nmv_file.seek(offset)
+            data = zlib.decompress(nmv_file.read(description['size']))
+        array = numpy.frombuffer(data, dtype=dtype).reshape(shape)
+    elif memory_map and numpy.prod(shape) > 0:
+        array = numpy.memmap(file_path, dtype=dtype, mode='r', offset=offset, shape=shape)
+    else:
+        with open(file_path, 'rb') as nmv_file:
+            nmv_file.seek(offset)
+            array = numpy.frombuffer(nmv_file.read(description['size']), dtype=dtype)
+        array = array.reshape(shape)
+
+    # Recover the quantized values
+    quantization = description.get('quantization')
+    if quantization is not None:
+        array = (array.astype(numpy.float32) * numpy.array(quantization['scale'], numpy.float32) +
+                 numpy.array(quantization['origin'], numpy.float32))
+
+    return array
+
+
+####################################################################################################
+# @read_nmv_mesh_file
+####################################################################################################
+def read_nmv_mesh_file(file_path,
+                       memory_map=True):
+    """Reads an NMV binary mesh file.
+
+    :param file_path:
+        The path to the file.
+    :param memory_map:
+        Map the uncompressed arrays into memory instead of reading them, the file is then only read
+        when the arrays are accessed.
+    :return:
+        An NMVMesh.
+    """
+
+    header, data_offset = read_nmv_mesh_header(file_path)
+    arrays = {name: read_nmv_mesh_array(file_path, description, data_offset, memory_map)
+              for name, description in header['arrays'].items()}
+    return NMVMesh(vertices=arrays['vertices'],
+                   normals=arrays['normals'],
+                   triangles=arrays['triangles'],
+                   partitions=header['partitions'],
+                   metadata=header['metadata'])
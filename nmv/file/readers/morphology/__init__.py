@@ -15,7 +15,10 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .h5_reader import *
-from .swc_reader import *
-from .bbp_reader import *
-from .morphology_reader import *
\ No newline at end of file
+# Import the modules on the first access to their names, see nmv.load_package_lazily
+import nmv
+nmv.load_package_lazily(__name__, globals(), [
+    '.h5_reader',
+    '.swc_reader',
+    '.bbp_reader',
+    '.morphology_reader'])
@@ -56,22 +56,8 @@ class BBPReader:
             A list of GIDs composing the target.
         """
 
-        # Import BluePy
-        try:
-            import bluepy.v2
-        except ImportError:
-            print('ERROR: Cannot import [BluePy], please install it')
-            return None
-
-        # Loading a circuit
-        from bluepy.v2 import Circuit
-        circuit = Circuit(blue_config)
-
-        # Loading the GIDs of the sample target within the circuit
-        gids = circuit.cells.ids(target)
-
-        # Return a list of all the GIDs
-        return gids
+        # Loading the GIDs of the sample target within the circuit, queried once per target
+        return nmv.file.get_circuit_provider(blue_config).get_gids(target)
 
     ################################################################################################
     # @load_bbp_morphology_from_gid
@@ -89,17 +75,11 @@ class BBPReader:
             A reference to a BBP morphology structure
         """
 
-        # Import BluePy
-        try:
-            import bluepy.v2
-        except ImportError:
-            print('ERROR: Cannot import [BluePy], please install it')
+        # Get the cached circuit handle, the local cells tables have no BBP morphologies
+        circuit = nmv.file.get_circuit_provider(blue_config).get_circuit()
+        if circuit is None:
             return None
 
-        # Loading a circuit
-        from bluepy.v2 import Circuit
-        circuit = Circuit(blue_config)
-
         # Get the morphology from its GID
         bbp_morphology = circuit.morph.get(int(gid), True)
 
@@ -122,25 +102,24 @@ class BBPReader:
             A reference to a BBP morphology structure
         """
 
-        # Import BluePy
-        try:
-            import bluepy.v2
-        except ImportError:
-            print('ERROR: Cannot import [BluePy], please install it')
+        # Get the morphology file path from its GID, the cell is cached by the circuit provider
+        morphology_path = nmv.file.get_circuit_provider(blue_config).get_morphology_path(gid)
+        if morphology_path is None:
             return None
 
-        # Loading a circuit
-        from bluepy.v2 import Circuit
-        circuit = Circuit(blue_config)
-
-        # Get the morphology file path from its GID
-        # We must ensure that the GID is integer, that's why the cast is there
-        h5_morphology_path = circuit.morph.get_filepath(int(gid))
+        # The local cells tables may refer to .SWC morphologies
+        if morphology_path.lower().endswith('.swc'):
+            morphology_file = nmv.file.read_swc_morphology(morphology_path)
 
         # Use the H5 morphology loader to load this file
         # Don't center the morphology, as it is assumed to be cleared and reviewed by the team
-        h5_reader = nmv.file.H5Reader(h5_file=h5_morphology_path, center_morphology=False)
-        morphology_file = h5_reader.read_file()
+        else:
+            h5_reader = nmv.file.H5Reader(h5_file=morphology_path, center_morphology=False)
+            morphology_file = h5_reader.read_file()
+
+        # The morphology could not be read
+        if morphology_file is None:
+            return None
 
         # Adjust the label to be set according to the GID not the morphology label
         morphology_file.label = str(gid)
@@ -161,25 +140,11 @@ class BBPReader:
         :param gid:
             Input neuron GID.
         :return:
-            A reference to the BBP neuron
+            A reference to the neuron, a nmv.file.CircuitCell.
         """
 
-        # Import BluePy
-        try:
-            import bluepy.v2
-        except ImportError:
-            print('ERROR: Cannot import [BluePy], please install it')
-            return None
-
-        # Loading a circuit
-        from bluepy.v2 import Circuit
-        circuit = Circuit(blue_config)
-
-        # Get a reference to the neuron where you can access its data later
-        bbp_neuron = circuit.cells.get(gid)
-
-        # Return a reference to the BBP neuron
-        return bbp_neuron
+        # Get the neuron from the cached circuit provider, it is queried only once
+        return nmv.file.get_circuit_provider(blue_config).get_cell(gid)
 
     ################################################################################################
     # @get_neuron_position_from_gid
@@ -197,11 +162,9 @@ class BBPReader:
             Cartesian coordinates of the position of the neuron (soma position)
         """
 
-        # Load the neuron from the BBP-SDK
-        neuron = BBPReader.get_neuron_from_gid(blue_config, gid)
-
         # Return the position of the neuron
-        return Vector((neuron['x'], neuron['y'], neuron['z']))
+        position = nmv.file.get_circuit_provider(blue_config).get_position(gid)
+        return Vector(position.tolist())
 
     ################################################################################################
     # @get_neuron_orientation_from_gid
@@ -219,15 +182,9 @@ class BBPReader:
             The orientation of the neuron.
         """
 
-        # Load the neuron from the BBP-SDK
-        neuron = BBPReader.get_neuron_from_gid(blue_config, gid)
-
-        # Return the orientation of he neuron
-        o = neuron['orientation']
-        o0 = Vector((o[0][0], o[0][1], o[0][2]))
-        o1 = Vector((o[1][0], o[1][1], o[1][2]))
-        o2 = Vector((o[2][0], o[2][1], o[2][2]))
-        return Matrix(o0, o1, o2)
+        # Return the orientation of the neuron
+        orientation = nmv.file.get_circuit_provider(blue_config).get_orientation(gid)
+        return Matrix(orientation.tolist())
 
     ################################################################################################
     # @get_neuron_mtype_name_from_gid
@@ -245,11 +202,8 @@ class BBPReader:
             Neuron morphological type name.
         """
 
-        # Load the neuron from the BBP-SDK
-        neuron = BBPReader.get_neuron_from_gid(blue_config, gid)
-
         # Return the mtype name
-        return neuron['mtype']
+        return nmv.file.get_circuit_provider(blue_config).get_mtype(gid)
 
     ################################################################################################
     # @get_neuron_morphology_label_from_gid
@@ -267,11 +221,30 @@ class BBPReader:
             Neuron morphology label.
         """
 
-        # Load the neuron from the BBP-SDK
-        neuron = BBPReader.get_neuron_from_gid(blue_config, gid)
-
         # Return morphology label
-        return neuron['morphology']
+        return nmv.file.get_circuit_provider(blue_config).get_morphology_label(gid)
+
+    ################################################################################################
+    # @prefetch_neurons
+    ################################################################################################
+    @staticmethod
+    def prefetch_neurons(blue_config,
+                         gids=None,
+                         target=None):
+        """Retrieves the positions, orientations, mtypes and morphology paths of a group of neurons
+        in a single query, so that the following per-GID calls do not query the circuit again.
+
+        :param blue_config:
+            BBP circuit configuration file.
+        :param gids:
+            A list of GIDs.
+        :param target:
+            The name of a target, used if the GIDs are not given.
+        :return:
+            A list of nmv.file.CircuitCell.
+        """
+
+        return nmv.file.get_circuit_provider(blue_config).prefetch(gids=gids, target=target)
 
     ################################################################################################
     # @get_section_from_id
@@ -350,8 +323,9 @@ class BBPReader:
         # Load the BBP morphology object using the H5 file reader
         # NOTE: This approach is quite straight forward, but we should make it extensible in
         # the future for SONATA circuits.
-        morphology_object = BBPReader.load_bbp_morphology_from_gid_using_h5_file(
-            blue_config=blue_config, gid=gid)
+        with nmv.profiler.span('load_morphology_from_circuit', 'reading'):
+            morphology_object = BBPReader.load_bbp_morphology_from_gid_using_h5_file(
+                blue_config=blue_config, gid=gid)
 
         if morphology_object is not None:
 
@@ -252,14 +252,7 @@ class H5Reader:
         data = None
 
         # Import h5py and install it if it does not exist
-        try:
-            import h5py
-        except ImportError:
-            print('Package *h5py* is not installed. Installing it.')
-            nmv.utilities.pip_install_wheel(package_name='h5py')
-
-        # Import the h5py module
-        import h5py
+        h5py = nmv.utilities.import_package('h5py')
 
         # Read the h5 file using the python module into a data array
         data = h5py.File(self.morphology_file, 'r')
@@ -325,7 +318,7 @@ class H5Reader:
                 section_first_point_index = self.structure_list[i_section][0]
 
                 # Get the index of the last point of the section
-                section_last_point_index = len(self.points_list) - 1
+                section_last_point_index = len(self.points_list)
 
             # Section index
             section_index = i_section
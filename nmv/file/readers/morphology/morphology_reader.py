@@ -106,12 +106,14 @@ def read_morphology_from_file(options):
     if '.h5' in morphology_extension:
 
         # Load the .h5 file
-        morphology_object = read_h5_morphology(morphology_file_path)
+        with nmv.profiler.span('read_h5_morphology', 'reading'):
+            morphology_object = read_h5_morphology(morphology_file_path)
 
     elif '.swc' in morphology_extension:
 
         # Load the .swc file
-        morphology_object = read_swc_morphology(morphology_file_path)
+        with nmv.profiler.span('read_swc_morphology', 'reading'):
+            morphology_object = read_swc_morphology(morphology_file_path)
 
     else:
 
@@ -16,4 +16,7 @@
 # MA 02110-1301 USA.
 ####################################################################################################
 
-from .spines_reader import *
\ No newline at end of file
+# Import the modules on the first access to their names, see nmv.load_package_lazily
+import nmv
+nmv.load_package_lazily(__name__, globals(), [
+    '.spines_reader'])
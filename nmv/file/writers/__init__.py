@@ -15,7 +15,9 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .morphology import *
-from .mesh import *
-from .strings import *
-
+# Import the modules on the first access to their names, see nmv.load_package_lazily
+import nmv
+nmv.load_package_lazily(__name__, globals(), [
+    '.morphology',
+    '.mesh',
+    '.strings'])
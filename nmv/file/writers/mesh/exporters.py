@@ -50,7 +50,58 @@ def export_scene_to_blend_file(output_directory,
     export_timer = nmv.utilities.Timer()
     export_timer.start()
 
-    bpy.ops.wm.save_as_mainfile(filepath=output_file_path, check_existing=False)
+    with nmv.profiler.span('export_scene_to_blend_file', 'export'):
+        bpy.ops.wm.save_as_mainfile(filepath=output_file_path, check_existing=False)
+
+    export_timer.end()
+    nmv.logger.log('Exporting done in [%f] seconds' % export_timer.duration())
+
+
+####################################################################################################
+# @export_mesh_objects_arrays_to_files
+####################################################################################################
+def export_mesh_objects_arrays_to_files(mesh_objects,
+                                        output_directory,
+                                        output_file_name,
+                                        file_formats,
+                                        metadata=None,
+                                        quantize=False,
+                                        compress=False):
+    """Exports a list of mesh objects as a single mesh into one or several file formats. The
+    vertices and faces of the objects are extracted once and written directly, without the export
+    operators, so the selection in the scene is not changed and the objects are not duplicated.
+
+    :param mesh_objects:
+        A list of mesh objects in the scene to be exported.
+    :param output_directory:
+        The output directory where the mesh will be saved.
+    :param output_file_name:
+        The name of the output mesh.
+    :param file_formats:
+        A list of the file formats of the mesh, PLY, OBJ, STL or NMV.
+    :param metadata:
+        A dictionary of metadata stored in the NMV binary mesh files.
+    :param quantize:
+        Quantize the vertices and the normals in the NMV binary mesh files.
+    :param compress:
+        Compress the arrays in the NMV binary mesh files.
+    """
+
+    nmv.logger.log('Exporting [%s/%s]' % (output_directory, str(output_file_name)))
+    export_timer = nmv.utilities.Timer()
+    export_timer.start()
+
+    with nmv.profiler.span('export_mesh_object_to_file', 'export') as span:
+        span.add_mesh_counts(mesh_objects)
+
+        # Extract the arrays once for all the formats
+        vertices, normals, triangles, partitions = nmv.mesh.get_mesh_objects_arrays(mesh_objects)
+
+        # Write the files
+        nmv.file.write_mesh_arrays_to_files(vertices, normals, triangles,
+                                            output_directory, output_file_name, file_formats,
+                                            partitions=partitions, metadata=metadata,
+                                            quantize=quantize, compress=compress)
 
     export_timer.end()
     nmv.logger.log('Exporting done in [%f] seconds' % export_timer.duration())
@@ -75,53 +126,80 @@ def export_mesh_object_to_file(mesh_object,
         The file format of the mesh.
     """
 
-    # Deselect all the other objects in the scene
-    nmv.scene.ops.deselect_all()
+    if file_format not in [nmv.enums.Meshing.ExportFormat.PLY,
+                           nmv.enums.Meshing.ExportFormat.OBJ,
+                           nmv.enums.Meshing.ExportFormat.STL,
+                           nmv.enums.Meshing.ExportFormat.NMV]:
+        nmv.logger.log('Error: Unknown mesh format')
+        return
 
-    # Select the target mesh and set it to be the only active object
-    nmv.scene.ops.set_active_object(mesh_object)
+    export_mesh_objects_arrays_to_files(
+        [mesh_object], output_directory, output_file_name, [file_format])
 
-    if file_format == nmv.enums.Meshing.ExportFormat.PLY:
-        output_file_path = "%s/%s%s" % (
-            output_directory, str(output_file_name), nmv.consts.Meshing.PLY_EXTENSION)
 
-    elif file_format == nmv.enums.Meshing.ExportFormat.OBJ:
-        output_file_path = "%s/%s%s" % (
-            output_directory, str(output_file_name), nmv.consts.Meshing.OBJ_EXTENSION)
+####################################################################################################
+# @export_mesh_objects_to_files
+####################################################################################################
+def export_mesh_objects_to_files(mesh_objects,
+                                 output_directory,
+                                 output_file_name,
+                                 file_formats,
+                                 export_individual_meshes=False,
+                                 metadata=None,
+                                 quantize=False,
+                                 compress=False):
+    """Exports a list of mesh objects as an individual mesh or separate objects into one or
+    several file formats. The mesh data are extracted once per mesh for all the formats.
 
-    elif file_format == nmv.enums.Meshing.ExportFormat.STL:
-        output_file_path = "%s/%s%s" % (
-            output_directory, str(output_file_name), nmv.consts.Meshing.STL_EXTENSION)
+    :param mesh_objects:
+        A list of mesh objects in the scene to be exported.
+    :param output_directory:
+        The output directory where the mesh(es) will be saved.
+    :param output_file_name:
+        The name of the output mesh.
+    :param file_formats:
+        A list of the file formats of the exported mesh.
+    :param export_individual_meshes:
+        Export the individual meshes in the list.
+    :param metadata:
+        A dictionary of metadata stored in the NMV binary mesh files.
+    :param quantize:
+        Quantize the vertices and the normals in the NMV binary mesh files.
+    :param compress:
+        Compress the arrays in the NMV binary mesh files.
+    """
 
-    else:
-        nmv.logger.log('Error: Unknown mesh format')
-        return
+    # Blend files are exported once whatever the selection is
+    if nmv.enums.Meshing.ExportFormat.BLEND in file_formats:
 
-    # Export the mesh object to an OBJ file
-    nmv.logger.log('Exporting [%s]' % output_file_path)
-    export_timer = nmv.utilities.Timer()
-    export_timer.start()
+        # Export the scene
+        export_scene_to_blend_file(output_directory, output_file_name)
 
-    if file_format == nmv.enums.Meshing.ExportFormat.PLY:
-        bpy.ops.export_mesh.ply(filepath=output_file_path, check_existing=True,
-                                axis_forward='Y', axis_up='Z')
+    # Other file formats have the same approach
+    file_formats = [file_format for file_format in file_formats
+                    if file_format != nmv.enums.Meshing.ExportFormat.BLEND]
+    if len(file_formats) == 0:
+        return
 
-    elif file_format == nmv.enums.Meshing.ExportFormat.OBJ:
-        bpy.ops.export_scene.obj(
-            filepath=output_file_path, check_existing=True, axis_forward='Y', axis_up='Z',
-            use_selection=True, use_smooth_groups=True, use_smooth_groups_bitflags=False,
-            use_normals=True, use_triangles=True, path_mode='AUTO')
+    # Export each component in the mesh
+    if export_individual_meshes:
 
-    elif file_format == nmv.enums.Meshing.ExportFormat.STL:
-        bpy.ops.export_mesh.stl(
-            filepath=output_file_path, use_selection=True, check_existing=True, axis_forward='Y',
-            axis_up='Z', ascii=False)
+        # Create a directory with the name of the mesh
+        mesh_directory = '%s/%s' % (output_directory, output_file_name)
+        nmv.file.ops.clean_and_create_directory(mesh_directory)
 
+        # Export each mesh in the given list
+        for mesh_object in mesh_objects:
+            name = mesh_object.name
+            name = name.replace(' ', '_')
+            export_mesh_objects_arrays_to_files(
+                [mesh_object], mesh_directory, name, file_formats, metadata, quantize, compress)
     else:
-        nmv.logger.log('Error: Unknown mesh format')
 
-    export_timer.end()
-    nmv.logger.log('Exporting done in [%f] seconds' % export_timer.duration())
+        # Export all the meshes as a single one
+        export_mesh_objects_arrays_to_files(
+            mesh_objects, output_directory, output_file_name, file_formats, metadata, quantize,
+            compress)
 
 
 ####################################################################################################
@@ -146,39 +224,8 @@ def export_mesh_objects_to_file(mesh_objects,
         Export the individual meshes in the list.
     """
 
-    # Blend files are exported once whatever the selection is
-    if file_format == nmv.enums.Meshing.ExportFormat.BLEND:
-
-        # Export the cloned file
-        export_scene_to_blend_file(output_directory, output_file_name)
-
-    # Other file formats have the same approach
-    else:
-
-        # Export each component in the mesh
-        if export_individual_meshes:
-
-            # Create a directory with the name of the mesh
-            mesh_directory = '%s/%s' % (output_directory, output_file_name)
-            nmv.file.ops.clean_and_create_directory(mesh_directory)
-
-            # Export each mesh in the given list
-            for mesh_object in mesh_objects:
-                name = mesh_object.name
-                name = name.replace(' ', '_')
-                export_mesh_object_to_file(
-                    mesh_object, mesh_directory, name, file_format)
-        else:
-
-            # Clone all the mesh objects
-            joint_mesh_object = nmv.scene.ops.clone_mesh_objects_into_joint_mesh(mesh_objects)
-
-            # Export the cloned file
-            export_mesh_object_to_file(
-                joint_mesh_object, output_directory, output_file_name, file_format)
-
-            # Delete the cloned object
-            nmv.scene.ops.delete_list_objects([joint_mesh_object])
+    export_mesh_objects_to_files(mesh_objects, output_directory, output_file_name,
+                                 [file_format], export_individual_meshes)
 
 
 ####################################################################################################
@@ -206,20 +253,17 @@ def export_mesh_object(mesh_object,
         Flag to export to .blend format.
     """
 
-    # To .obj format
+    # Collect the mesh formats to export them from a single extraction
+    file_formats = list()
     if obj:
-        export_mesh_object_to_file(
-            mesh_object, output_directory, file_name, nmv.enums.Meshing.ExportFormat.OBJ)
-
-    # To .ply format
+        file_formats.append(nmv.enums.Meshing.ExportFormat.OBJ)
     if ply:
-        export_mesh_object_to_file(
-            mesh_object, output_directory, file_name, nmv.enums.Meshing.ExportFormat.PLY)
-
-    # .To stl format
+        file_formats.append(nmv.enums.Meshing.ExportFormat.PLY)
     if stl:
-        export_mesh_object_to_file(
-            mesh_object, output_directory, file_name, nmv.enums.Meshing.ExportFormat.STL)
+        file_formats.append(nmv.enums.Meshing.ExportFormat.STL)
+    if len(file_formats) > 0:
+        export_mesh_objects_arrays_to_files(
+            [mesh_object], output_directory, file_name, file_formats)
 
     # To .blend format
     if blend:
@@ -0,0 +1,230 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import numpy
+
+# Internal modules
+import nmv.consts
+import nmv.enums
+
+
+####################################################################################################
+# @get_faces_normals
+####################################################################################################
+def get_faces_normals(vertices,
+                      triangles):
+    """Computes the unit normals of a list of triangles in bulk.
+
+    :param vertices:
+        A NumPy array of shape (N, 3) of the positions of the vertices.
+    :param triangles:
+        A NumPy array of shape (T, 3) of the indices of the vertices of the triangles.
+    :return:
+        A NumPy array of shape (T, 3) of the normals of the triangles.
+    """
+
+    corners = vertices[triangles].astype(numpy.float64)
+    normals = numpy.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    lengths = numpy.linalg.norm(normals, axis=1)
+    return normals / numpy.where(lengths > 0.0, lengths, 1.0)[:, None]
+
+
+####################################################################################################
+# @write_ply_file
+####################################################################################################
+def write_ply_file(output_file_path,
+                   vertices,
+                   normals,
+                   triangles):
+    """Writes a mesh into a binary little-endian PLY file with per-vertex normals.
+
+    :param output_file_path:
+        The path to the output file.
+    :param vertices:
+        A NumPy array of shape (N, 3) of the positions of the vertices.
+    :param normals:
+        A NumPy array of shape (N, 3) of the normals of the vertices.
+    :param triangles:
+        A NumPy array of shape (T, 3) of the indices of the vertices of the triangles.
+    """
+
+    header = 'ply\n' \
+             'format binary_little_endian 1.0\n' \
+             'comment Created by NeuroMorphoVis\n' \
+             'element vertex %d\n' \
+             'property float x\n' \
+             'property float y\n' \
+             'property float z\n' \
+             'property float nx\n' \
+             'property float ny\n' \
+             'property float nz\n' \
+             'element face %d\n' \
+             'property list uchar uint vertex_indices\n' \
+             'end_header\n' % (len(vertices), len(triangles))
+
+    # Interleave the positions and the normals of the vertices
+    vertices_data = numpy.empty((len(vertices), 6), dtype='<f4')
+    vertices_data[:, 0:3] = vertices
+    vertices_data[:, 3:6] = normals
+
+    # Every face is a count followed by three indices
+    faces_data = numpy.empty(len(triangles), dtype=[('count', 'u1'), ('indices', '<u4', (3,))])
+    faces_data['count'] = 3
+    faces_data['indices'] = triangles
+
+    with open(output_file_path, 'wb') as ply_file:
+        ply_file.write(b''.join([header.encode('ascii'), vertices_data.tobytes(),
+                                 faces_data.tobytes()]))
+
+
+####################################################################################################
+# @write_stl_file
+####################################################################################################
+def write_stl_file(output_file_path,
+                   vertices,
+                   triangles):
+    """Writes a mesh into a binary STL file.
+
+    :param output_file_path:
+        The path to the output file.
+    :param vertices:
+        A NumPy array of shape (N, 3) of the positions of the vertices.
+    :param triangles:
+        A NumPy array of shape (T, 3) of the indices of the vertices of the triangles.
+    """
+
+    # Every facet is a normal, three corners and a two-bytes attribute
+    facets_data = numpy.zeros(len(triangles), dtype=[('normal', '<f4', (3,)),
+                                                     ('corners', '<f4', (3, 3)),
+                                                     ('attribute', '<u2')])
+    facets_data['normal'] = get_faces_normals(vertices, triangles)
+    facets_data['corners'] = vertices[triangles]
+
+    header = b'Exported from NeuroMorphoVis'.ljust(80, b' ')
+    with open(output_file_path, 'wb') as stl_file:
+        stl_file.write(b''.join([header, numpy.uint32(len(triangles)).astype('<u4').tobytes(),
+                                 facets_data.tobytes()]))
+
+
+####################################################################################################
+# @write_obj_file
+####################################################################################################
+def write_obj_file(output_file_path,
+                   vertices,
+                   normals,
+                   triangles,
+                   object_name='mesh'):
+    """Writes a mesh into an ASCII OBJ file with per-vertex normals.
+
+    :param output_file_path:
+        The path to the output file.
+    :param vertices:
+        A NumPy array of shape (N, 3) of the positions of the vertices.
+    :param normals:
+        A NumPy array of shape (N, 3) of the normals of the vertices.
+    :param triangles:
+        A NumPy array of shape (T, 3) of the indices of the vertices of the triangles.
+    :param object_name:
+        The name of the object in the file.
+    """
+
+    # OBJ indices start at one, the vertex and the normal of every corner have the same index
+    indices = numpy.repeat(triangles.astype(numpy.int64) + 1, 2, axis=1)
+
+    # Format all the lines at once
+    lines = ['# Created by NeuroMorphoVis\n', 'o %s\n' % object_name,
+             ('v %.6f %.6f %.6f\n' * len(vertices)) % tuple(vertices.ravel().tolist()),
+             ('vn %.4f %.4f %.4f\n' * len(normals)) % tuple(normals.ravel().tolist()),
+             's 1\n',
+             ('f %d//%d %d//%d %d//%d\n' * len(triangles)) % tuple(indices.ravel().tolist())]
+
+    with open(output_file_path, 'w') as obj_file:
+        obj_file.write(''.join(lines))
+
+
+####################################################################################################
+# @write_mesh_arrays_to_files
+####################################################################################################
+def write_mesh_arrays_to_files(vertices,
+                               normals,
+                               triangles,
+                               output_directory,
+                               output_file_name,
+                               file_formats,
+                               partitions=None,
+                               metadata=None,
+                               quantize=False,
+                               compress=False):
+    """Writes a mesh into one or several file formats from the same arrays.
+
+    :param vertices:
+        A NumPy array of shape (N, 3) of the positions of the vertices.
+    :param normals:
+        A NumPy array of shape (N, 3) of the normals of the vertices.
+    :param triangles:
+        A NumPy array of shape (T, 3) of the indices of the vertices of the triangles.
+    :param output_directory:
+        The output directory where the mesh will be saved.
+    :param output_file_name:
+        The name of the output mesh, without extension.
+    :param file_formats:
+        A list of nmv.enums.Meshing.ExportFormat, the unsupported formats are ignored.
+    :param partitions:
+        The partitions of the mesh, only stored in the NMV binary mesh format.
+    :param metadata:
+        The metadata of the mesh, only stored in the NMV binary mesh format.
+    :param quantize:
+        Quantize the vertices and the normals in the NMV binary mesh format.
+    :param compress:
+        Compress the arrays in the NMV binary mesh format.
+    :return:
+        A list of the paths of the written files.
+    """
+
+    output_file_paths = list()
+    for file_format in file_formats:
+
+        if file_format == nmv.enums.Meshing.ExportFormat.PLY:
+            output_file_path = '%s/%s%s' % (
+                output_directory, str(output_file_name), nmv.consts.Meshing.PLY_EXTENSION)
+            write_ply_file(output_file_path, vertices, normals, triangles)
+
+        elif file_format == nmv.enums.Meshing.ExportFormat.STL:
+            output_file_path = '%s/%s%s' % (
+                output_directory, str(output_file_name), nmv.consts.Meshing.STL_EXTENSION)
+            write_stl_file(output_file_path, vertices, triangles)
+
+        elif file_format == nmv.enums.Meshing.ExportFormat.OBJ:
+            output_file_path = '%s/%s%s' % (
+                output_directory, str(output_file_name), nmv.consts.Meshing.OBJ_EXTENSION)
+            write_obj_file(output_file_path, vertices, normals, triangles,
+                           object_name=str(output_file_name))
+
+        elif file_format == nmv.enums.Meshing.ExportFormat.NMV:
+            output_file_path = '%s/%s%s' % (
+                output_directory, str(output_file_name), nmv.consts.Meshing.NMV_MESH_EXTENSION)
+            nmv.file.write_nmv_mesh_file(output_file_path, vertices, normals, triangles,
+                                         partitions=partitions, metadata=metadata,
+                                         quantize=quantize, compress=compress)
+
+        else:
+            continue
+
+        output_file_paths.append(output_file_path)
+
+    return output_file_paths
@@ -0,0 +1,143 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import json
+import zlib
+import numpy
+
+# Internal modules
+import nmv.consts
+
+
+####################################################################################################
+# @quantize_vertices
+####################################################################################################
+def quantize_vertices(vertices):
+    """Quantizes the positions of the vertices to 16-bit integers within their bounding box.
+
+    :param vertices:
+        A NumPy array of shape (N, 3) of the positions of the vertices.
+    :return:
+        A tuple (quantized vertices, origin, scale), where the positions are recovered as
+        quantized * scale + origin.
+    """
+
+    vertices = numpy.asarray(vertices, dtype=numpy.float64)
+    if len(vertices) == 0:
+        return numpy.zeros((0, 3), dtype='<u2'), [0.0, 0.0, 0.0], [1.0, 1.0, 1.0]
+
+    origin = vertices.min(axis=0)
+    extent = vertices.max(axis=0) - origin
+    scale = numpy.where(extent > 0.0, extent / 65535.0, 1.0)
+    quantized = numpy.rint((vertices - origin) / scale).astype('<u2')
+    return quantized, origin.tolist(), scale.tolist()
+
+
+####################################################################################################
+# @quantize_normals
+####################################################################################################
+def quantize_normals(normals):
+    """Quantizes unit normals to 8-bit signed integers.
+
+    :param normals:
+        A NumPy array of shape (N, 3) of unit normals.
+    :return:
+        A NumPy array of shape (N, 3) of the quantized normals, recovered as quantized / 127.
+    """
+
+    return numpy.rint(numpy.clip(normals, -1.0, 1.0) * 127.0).astype('i1')
+
+
+####################################################################################################
+# @write_nmv_mesh_file
+####################################################################################################
+def write_nmv_mesh_file(output_file_path,
+                        vertices,
+                        normals,
+                        triangles,
+                        partitions=None,
+                        metadata=None,
+                        quantize=False,
+                        compress=False):
+    """Writes a mesh into an NMV binary mesh file.
+
+    The file starts with the magic bytes, the version and the size of a JSON header that describes
+    the arrays, the partitions and the metadata of the mesh. The arrays follow the header, each
+    one aligned to NMV_MESH_ALIGNMENT bytes, so the uncompressed arrays can be memory-mapped.
+
+    :param output_file_path:
+        The path to the output file.
+    :param vertices:
+        A NumPy array of shape (N, 3) of the positions of the vertices.
+    :param normals:
+        A NumPy array of shape (N, 3) of the normals of the vertices.
+    :param triangles:
+        A NumPy array of shape (T, 3) of the indices of the vertices of the triangles.
+    :param partitions:
+        A list of dictionaries with the name, the first vertex, the number of vertices, the first
+        triangle and the number of triangles of every part of the mesh, for example the arbors.
+    :param metadata:
+        A dictionary of metadata that can be serialized to JSON, for example the label.
+    :param quantize:
+        Store the vertices as 16-bit integers and the normals as 8-bit integers.
+    :param compress:
+        Compress the arrays with zlib, the compressed arrays cannot be memory-mapped.
+    """
+
+    # The streams of the mesh
+    streams = list()
+    if quantize:
+        quantized_vertices, origin, scale = quantize_vertices(vertices)
+        streams.append(('vertices', quantized_vertices,
+                        {'quantization': {'origin': origin, 'scale': scale}}))
+        streams.append(('normals', quantize_normals(normals),
+                        {'quantization': {'origin': [0.0, 0.0, 0.0],
+                                          'scale': [1.0 / 127.0] * 3}}))
+    else:
+        streams.append(('vertices', numpy.ascontiguousarray(vertices, dtype='<f4'), dict()))
+        streams.append(('normals', numpy.ascontiguousarray(normals, dtype='<f4'), dict()))
+    streams.append(('triangles', numpy.ascontiguousarray(triangles, dtype='<i4'), dict()))
+
+    # Lay the arrays out one after the other, aligned
+    alignment = nmv.consts.Meshing.NMV_MESH_ALIGNMENT
+    arrays = dict()
+    blocks = list()
+    offset = 0
+    for name, array, description in streams:
+        data = array.tobytes()
+        if compress:
+            data = zlib.compress(data)
+        padding = (-len(data)) % alignment
+        description.update({'dtype': array.dtype.str, 'shape': list(array.shape),
+                            'offset': offset, 'size': len(data),
+                            'compression': 'zlib' if compress else None})
+        arrays[name] = description
+        blocks.append(data + b'\0' * padding)
+        offset += len(data) + padding
+
+    # The header, padded to keep the arrays aligned
+    header = json.dumps({'arrays': arrays,
+                         'partitions': partitions if partitions is not None else list(),
+                         'metadata': metadata if metadata is not None else dict()}).encode('utf-8')
+    header += b' ' * ((-(len(header) + 16)) % alignment)
+
+    with open(output_file_path, 'wb') as nmv_file:
+        nmv_file.write(b''.join([nmv.consts.Meshing.NMV_MESH_MAGIC,
+                                 numpy.array([nmv.consts.Meshing.NMV_MESH_VERSION, len(header)],
+                                             dtype='<u4').tobytes(),
+                                 header] + blocks))
@@ -15,5 +15,10 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .swc_writer import *
-from .segments_writer import *
+# Import the modules on the first access to their names, see nmv.load_package_lazily
+import nmv
+nmv.load_package_lazily(__name__, globals(), [
+    '.morphology_arrays',
+    '.swc_writer',
+    '.h5_writer',
+    '.segments_writer'])
@@ -0,0 +1,121 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import math
+import numpy
+
+# Internal imports
+import nmv.consts
+import nmv.utilities
+from .morphology_arrays import get_morphology_samples_arrays
+
+
+####################################################################################################
+# @get_h5_soma_points
+####################################################################################################
+def get_h5_soma_points(soma,
+                       number_points=8):
+    """Gets the contour of the soma as it is stored in the H5 files. If the soma has no profile
+    points, a circle of the mean radius of the soma around its centroid is used instead.
+
+    :param soma:
+        The soma of a given morphology.
+    :param number_points:
+        The number of the points along the circle, if the soma has no profile points.
+    :return:
+        A NumPy array of shape (N, 3) of the points of the soma contour.
+    """
+
+    # Use the profile points if they exist
+    if len(soma.profile_points) > 0:
+        return numpy.array([point[:] for point in soma.profile_points], dtype=numpy.float64)
+
+    # Otherwise, build a circle in the XY plane
+    angles = numpy.linspace(0.0, 2.0 * math.pi, number_points, endpoint=False)
+    points = numpy.zeros((number_points, 3), dtype=numpy.float64)
+    points[:, 0] = numpy.cos(angles) * soma.mean_radius
+    points[:, 1] = numpy.sin(angles) * soma.mean_radius
+    return points + numpy.array(soma.centroid[:], dtype=numpy.float64)
+
+
+####################################################################################################
+# @get_h5_arrays
+####################################################################################################
+def get_h5_arrays(morphology_object):
+    """Gets the points and structure datasets of the given morphology in the H5 (version 1) layout.
+
+    The points are rows of [x, y, z, diameter], and the structure rows are [offset of the first
+    point, type, parent]. The first structure row is the soma, and the roots are connected to it.
+    Unlike the SWC files, every non-root section keeps its first sample, i.e. the branching point.
+
+    :param morphology_object:
+        A given morphology object.
+    :return:
+        The points and the structure arrays.
+    """
+
+    # The soma contour, if any
+    if morphology_object.soma is not None:
+        soma_points = get_h5_soma_points(morphology_object.soma)
+    else:
+        soma_points = numpy.zeros((0, 3), dtype=numpy.float64)
+    number_soma_points = len(soma_points)
+
+    # Flatten the arbors once
+    samples_arrays = get_morphology_samples_arrays(morphology_object)
+
+    # Points, the diameters are stored instead of the radii
+    points = numpy.zeros((number_soma_points + len(samples_arrays.radii), 4), dtype=numpy.float32)
+    points[:number_soma_points, :3] = soma_points
+    points[number_soma_points:, :3] = samples_arrays.points
+    points[number_soma_points:, 3] = samples_arrays.radii * 2.0
+
+    # Structure, the sections are shifted by one row for the soma
+    structure = numpy.empty((samples_arrays.get_number_sections() + 1, 3), dtype=numpy.int32)
+    structure[0] = (0, nmv.consts.Skeleton.SWC_SOMA_SAMPLE_TYPE, -1)
+    structure[1:, 0] = samples_arrays.sections_offsets[:-1] + number_soma_points
+    structure[1:, 1] = samples_arrays.sections_types
+    structure[1:, 2] = samples_arrays.sections_parents + 1
+
+    # Return the datasets
+    return points, structure
+
+
+####################################################################################################
+# @write_morphology_to_h5_file
+####################################################################################################
+def write_morphology_to_h5_file(morphology_object,
+                                file_path):
+    """Write the morphology skeleton to an H5 file.
+
+    :param morphology_object:
+        A given morphology object to be written to H5 file.
+    :param file_path:
+        The path where to write the file to.
+    """
+
+    # Import h5py and install it if it does not exist
+    h5py = nmv.utilities.import_package('h5py')
+
+    # Get the datasets
+    points, structure = get_h5_arrays(morphology_object)
+
+    # Write the datasets to a file labeled with the same name of the morphology
+    with h5py.File('%s/%s.h5' % (file_path, morphology_object.label), 'w') as h5_file:
+        h5_file.create_dataset(nmv.consts.Skeleton.H5_POINTS_DIRECTORY, data=points)
+        h5_file.create_dataset(nmv.consts.Skeleton.H5_STRUCTURE_DIRECTORY, data=structure)
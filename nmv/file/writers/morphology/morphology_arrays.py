@@ -0,0 +1,173 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import numpy
+
+# Internal imports
+import nmv.skeleton
+
+
+####################################################################################################
+# @MorphologySamplesArrays
+####################################################################################################
+class MorphologySamplesArrays:
+    """The samples of all the sections of a morphology flattened into contiguous arrays, section by
+    section, with the parents before their children.
+    """
+
+    ################################################################################################
+    # @__init__
+    ################################################################################################
+    def __init__(self,
+                 samples,
+                 points,
+                 radii,
+                 types,
+                 sections_offsets,
+                 sections_parents,
+                 sections_types):
+        """Constructor
+
+        :param samples:
+            A list of all the samples of the sections, in the order of the arrays.
+        :param points:
+            A NumPy array of shape (N, 3) of the points of the samples.
+        :param radii:
+            A NumPy array of the radii of the samples.
+        :param types:
+            A NumPy array of the SWC types of the samples.
+        :param sections_offsets:
+            A NumPy array of S + 1 offsets, the samples of the section i are in the range
+            [sections_offsets[i], sections_offsets[i + 1]).
+        :param sections_parents:
+            A NumPy array of the indices of the parents of the sections, or -1 for the roots.
+        :param sections_types:
+            A NumPy array of the types of the sections, 2 for axons, 3 for basal dendrites and 4
+            for apical dendrites.
+        """
+
+        self.samples = samples
+        self.points = points
+        self.radii = radii
+        self.types = types
+        self.sections_offsets = sections_offsets
+        self.sections_parents = sections_parents
+        self.sections_types = sections_types
+
+    ################################################################################################
+    # @get_number_sections
+    ################################################################################################
+    def get_number_sections(self):
+        """Returns the number of the sections.
+
+        :return:
+            The number of the sections.
+        """
+
+        return len(self.sections_parents)
+
+
+####################################################################################################
+# @get_morphology_samples_arrays
+####################################################################################################
+def get_morphology_samples_arrays(morphology):
+    """Flattens the samples of all the arbors of a morphology into arrays in a single pass. The
+    arbors are ordered as in the SWC files, the apical dendrites, the basal dendrites and then the
+    axons, and every arbor is listed in pre-order.
+
+    :param morphology:
+        A given morphology.
+    :return:
+        A MorphologySamplesArrays.
+    """
+
+    # Walk the sections once
+    traversal = nmv.skeleton.compute_morphology_traversal(morphology)
+    sections = traversal.sections
+
+    # The samples, section by section
+    samples = [sample for section in sections for sample in section.samples]
+    counts = numpy.array([len(section.samples) for section in sections], dtype=numpy.int64)
+
+    return MorphologySamplesArrays(
+        samples=samples,
+        points=numpy.array([sample.point[:] for sample in samples],
+                           dtype=numpy.float64).reshape(-1, 3),
+        radii=numpy.array([sample.radius for sample in samples], dtype=numpy.float64),
+        types=numpy.array([sample.type for sample in samples], dtype=numpy.int64),
+        sections_offsets=numpy.concatenate(([0], numpy.cumsum(counts))).astype(numpy.int64),
+        sections_parents=numpy.array(traversal.parent_indices, dtype=numpy.int64),
+        sections_types=numpy.array([int(section.type) for section in sections], dtype=numpy.int64))
+
+
+####################################################################################################
+# @compute_swc_samples_indices
+####################################################################################################
+def compute_swc_samples_indices(samples_arrays,
+                                starting_index):
+    """Computes the global SWC indices of the flattened samples and the indices of their parents.
+
+    The first sample of a non-root section duplicates the last sample of its parent section, so
+    it shares the index of that sample and is not written to the file. The first sample of a root
+    section is connected to the soma, whose index is 1. The indices are also assigned to the
+    samples themselves (morphology_idx), as nmv.skeleton.ops.update_samples_indices_per_morphology
+    does.
+
+    :param samples_arrays:
+        A MorphologySamplesArrays of a given morphology.
+    :param starting_index:
+        The index of the first sample along the arbors, based on how many samples belong to the
+        soma.
+    :return:
+        The indices of the samples, the indices of their parents and a mask of the samples that
+        are written to the SWC file.
+    """
+
+    # Each section starts with a sample that is dropped unless the section is a root
+    offsets = samples_arrays.sections_offsets
+    parents = samples_arrays.sections_parents
+    number_samples = offsets[-1]
+    sections_starts = offsets[:-1][offsets[:-1] < offsets[1:]]
+    starts_parents = parents[offsets[:-1] < offsets[1:]]
+    written = numpy.ones(number_samples, dtype=bool)
+    written[sections_starts[starts_parents >= 0]] = False
+
+    # Number the written samples consecutively
+    indices = numpy.full(number_samples, -1, dtype=numpy.int64)
+    indices[written] = numpy.arange(starting_index, starting_index + numpy.count_nonzero(written))
+
+    # The branching samples take the indices of the last samples of their parents, the parents
+    # always precede their children and a single loop over the sections resolves chains of
+    # single-sample sections
+    for i in range(samples_arrays.get_number_sections()):
+        if parents[i] >= 0 and offsets[i] < offsets[i + 1]:
+            parent_last = offsets[parents[i] + 1] - 1
+            if parent_last >= offsets[parents[i]]:
+                indices[offsets[i]] = indices[parent_last]
+
+    # Every sample is connected to its predecessor, and the roots to the soma
+    parents_indices = numpy.empty(number_samples, dtype=numpy.int64)
+    parents_indices[1:] = indices[:-1]
+    parents_indices[sections_starts] = 1
+
+    # Keep the indices on the samples as well
+    for sample, index in zip(samples_arrays.samples, indices.tolist()):
+        sample.morphology_idx = index
+
+    # Return the indices, the parents and the mask
+    return indices, parents_indices, written
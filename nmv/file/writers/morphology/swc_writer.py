@@ -15,171 +15,89 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-# Internal imports
-import nmv.skeleton
-
-
-####################################################################################################
-# @construct_swc_samples_list_from_section
-####################################################################################################
-def construct_swc_samples_list_from_section(section,
-                                            samples_list):
-    """Constructs a list of samples retrieved from the given section compliant with SWC format.
-
-    # A list of all the samples parsed from the morphology file, to be used as a lookup table
-    # to construct the morphology skeleton directly
-    # http://www.neuronland.org/NLMorphologyConverter/MorphologyFormats/SWC/Spec.html
-    # Each sample in this list has the following structure:
-    #       [0] The index of the sample or sample number
-    #       [1] The type of the sample or structure identifier
-    #       [2] Sample x-coordinates
-    #       [3] Sample y-coordinates
-    #       [4] Sample z-coordinates
-    #       [5] Sample radius
-    #       [6] The index of the parent sample
-
-    :param section:
-        A given morphological section.
-    :param samples_list:
-        The container where the samples will get appended to.
-    """
+# System imports
+import itertools
+import numpy
 
-    # Root sections are always connected to the soma, i.e. parent index is 1
-    if section.is_root():
-
-        # Add the first sample along the root
-        sample_string = '%d %d %f %f %f %f 1' % (section.samples[0].morphology_idx,
-                                                 section.samples[0].type,
-                                                 section.samples[0].point[0],
-                                                 section.samples[0].point[1],
-                                                 section.samples[0].point[2],
-                                                 section.samples[0].radius)
-        samples_list.append(sample_string)
-
-        # Update the indices of the rest of the samples along the section
-        for i in range(1, len(section.samples)):
-            sample_string = '%d %d %f %f %f %f %d' % (section.samples[i].morphology_idx,
-                                                      section.samples[i].type,
-                                                      section.samples[i].point[0],
-                                                      section.samples[i].point[1],
-                                                      section.samples[i].point[2],
-                                                      section.samples[i].radius,
-                                                      section.samples[i].morphology_idx - 1)
-            samples_list.append(sample_string)
-
-    # Non root sections start from the samples of the branching points
-    else:
-
-        # Add the first sample along the branching point
-        sample_string = '%d %d %f %f %f %f %d' % (section.samples[1].morphology_idx,
-                                                  section.samples[1].type,
-                                                  section.samples[1].point[0],
-                                                  section.samples[1].point[1],
-                                                  section.samples[1].point[2],
-                                                  section.samples[1].radius,
-                                                  section.parent.samples[-1].morphology_idx)
-        samples_list.append(sample_string)
-
-        # Update the indices of the rest of the samples along the section
-        for i in range(2, len(section.samples)):
-            sample_string = '%d %d %f %f %f %f %d' % (section.samples[i].morphology_idx,
-                                                      section.samples[i].type,
-                                                      section.samples[i].point[0],
-                                                      section.samples[i].point[1],
-                                                      section.samples[i].point[2],
-                                                      section.samples[i].radius,
-                                                      section.samples[i].morphology_idx - 1)
-            samples_list.append(sample_string)
+# Internal imports
+from .morphology_arrays import get_morphology_samples_arrays
+from .morphology_arrays import compute_swc_samples_indices
 
 
 ####################################################################################################
-# @construct_swc_samples_list_from_arbor
+# @SWC_SAMPLE_FORMAT
 ####################################################################################################
-def construct_swc_samples_list_from_arbor(arbor,
-                                          samples_list):
-    """Constructs a list of samples retrieved from the given arbor compliant with SWC format.
-
-    :param arbor:
-        A given morphological arbor.
-    :param samples_list:
-        The container where the samples will get appended to.
-    """
-
-    # Construct the root section
-    construct_swc_samples_list_from_section(arbor, samples_list)
-
-    # Update the children sections recursively
-    for child in arbor.children:
-        construct_swc_samples_list_from_arbor(child, samples_list)
+# Each sample in an SWC file has the following structure, see
+# http://www.neuronland.org/NLMorphologyConverter/MorphologyFormats/SWC/Spec.html
+#       [0] The index of the sample or sample number
+#       [1] The type of the sample or structure identifier
+#       [2] Sample x-coordinates
+#       [3] Sample y-coordinates
+#       [4] Sample z-coordinates
+#       [5] Sample radius
+#       [6] The index of the parent sample
+SWC_SAMPLE_FORMAT = '%d %d %f %f %f %f %d\n'
 
 
 ####################################################################################################
-# @construct_swc_samples_list_from_soma
+# @get_swc_soma_arrays
 ####################################################################################################
-def construct_swc_samples_list_from_soma(soma,
-                                         samples_list):
-    """Constructs a list of samples retrieved from the soma, compliant with SWC format.
+def get_swc_soma_arrays(soma):
+    """Gets the SWC samples of the soma as arrays, the centroid followed by the profile points.
 
     :param soma:
         The soma of a given morphology.
-    :param samples_list:
-        The container where the samples will get appended to.
+    :return:
+        The indices, types, points, radii and parents indices of the soma samples.
     """
 
-    # Soma centroid and radius
-    sample_string = '1 1 %f %f %f %f -1' % (soma.centroid[0],
-                                            soma.centroid[1],
-                                            soma.centroid[2],
-                                            soma.smallest_radius)
-    samples_list.append(sample_string)
+    # The profile points are connected to the centroid
+    number_profile_points = len(soma.profile_points)
+    points = numpy.empty((number_profile_points + 1, 3), dtype=numpy.float64)
+    points[0] = soma.centroid[:]
+    if number_profile_points > 0:
+        points[1:] = [profile_point[:] for profile_point in soma.profile_points]
+
+    # The radius of the centroid is the smallest radius of the soma
+    radii = numpy.ones(number_profile_points + 1, dtype=numpy.float64)
+    radii[0] = soma.smallest_radius
+    parents = numpy.ones(number_profile_points + 1, dtype=numpy.int64)
+    parents[0] = -1
 
-    # Soma profile points
-    for i, profile_point in enumerate(soma.profile_points):
-        sample_string = '%d 1 %f %f %f %f 1' % (i + 2,
-                                                profile_point[0],
-                                                profile_point[1],
-                                                profile_point[2],
-                                                1.0)
-        samples_list.append(sample_string)
+    return numpy.arange(1, number_profile_points + 2), \
+        numpy.ones(number_profile_points + 1, dtype=numpy.int64), points, radii, parents
 
 
 ####################################################################################################
-# @construct_swc_samples_list_from_morphology_tree
+# @get_swc_arrays
 ####################################################################################################
-def construct_swc_samples_list_from_morphology_tree(morphology_object):
-    """Constructs a list of samples retrieved from the given morphology skeleton compliant with
-    SWC format.
+def get_swc_arrays(morphology_object):
+    """Gets all the SWC samples of the given morphology as arrays.
+
+    The morphology is flattened once, and the global indices of the samples are updated along the
+    way, as they were by nmv.skeleton.ops.update_samples_indices_per_morphology.
 
     :param morphology_object:
         A given morphology object.
     :return:
-        A list of samples compliant with the SWC format.
+        The indices, types, points, radii and parents indices of all the samples.
     """
 
-    # A list that contains all the samples in the morphology file
-    swc_samples_list = list()
-
-    # Soma
+    # The soma samples come first
+    arrays = list()
     if morphology_object.soma is not None:
-        construct_swc_samples_list_from_soma(morphology_object.soma, swc_samples_list)
-
-    # Apical dendrite
-    if morphology_object.apical_dendrites is not None:
-        for arbor in morphology_object.apical_dendrites:
-            construct_swc_samples_list_from_arbor(arbor, swc_samples_list)
+        arrays.append(get_swc_soma_arrays(morphology_object.soma))
+    starting_index = len(arrays[0][0]) + 1 if arrays else 1
 
-    # basal dendrites
-    if morphology_object.basal_dendrites is not None:
-        for arbor in morphology_object.basal_dendrites:
-            construct_swc_samples_list_from_arbor(arbor, swc_samples_list)
+    # Then the samples of the arbors, without the duplicated branching points
+    samples_arrays = get_morphology_samples_arrays(morphology_object)
+    indices, parents, written = compute_swc_samples_indices(samples_arrays, starting_index)
+    arrays.append((indices[written], samples_arrays.types[written],
+                   samples_arrays.points[written], samples_arrays.radii[written],
+                   parents[written]))
 
-    # Axon
-    if morphology_object.axons is not None:
-        for arbor in morphology_object.axons:
-            construct_swc_samples_list_from_arbor(arbor, swc_samples_list)
-
-    # Return the SWC-complaint  list of samples
-    return swc_samples_list
+    # Concatenate the columns
+    return tuple(numpy.concatenate(column) for column in zip(*arrays))
 
 
 ####################################################################################################
@@ -195,23 +113,14 @@ def write_morphology_to_swc_file(morphology_object,
         The path where to write the file to.
     """
 
-    # Before writing, we must update the indices of the samples along the entire morphology
-    number_soma_samples = 0
-
-    # The soma counts as a single sample
-    if morphology_object.soma is not None:
-        number_soma_samples += 1
-
-        # The profile points along the soma count as well as samples
-        number_soma_samples += len(morphology_object.soma.profile_points)
-
-    # Update the global indices of the samples of the arbors then
-    nmv.skeleton.ops.update_samples_indices_per_morphology(
-        morphology_object, number_soma_samples + 1)
+    # Get the samples as arrays
+    indices, types, points, radii, parents = get_swc_arrays(morphology_object)
 
-    # Build the samples list
-    swc_samples_list = construct_swc_samples_list_from_morphology_tree(morphology_object)
+    # Format all the samples at once
+    rows = zip(indices.tolist(), types.tolist(), points[:, 0].tolist(), points[:, 1].tolist(),
+               points[:, 2].tolist(), radii.tolist(), parents.tolist())
+    swc_string = (SWC_SAMPLE_FORMAT * len(indices)) % tuple(itertools.chain.from_iterable(rows))
 
-    # Write the list to a file labeled with the same name of the morphology
-    nmv.file.write_list_string_to_file(
-        swc_samples_list, '%s/%s.swc' % (file_path, morphology_object.label))
+    # Write the samples to a file labeled with the same name of the morphology
+    with open('%s/%s.swc' % (file_path, morphology_object.label), 'w') as swc_file:
+        swc_file.write(swc_string)
@@ -15,8 +15,11 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .curve import *
-from .line import *
-from .sphere import *
-from .vertex import *
-from .poly_line import *
+# Import the modules on the first access to their names, see nmv.load_package_lazily
+import nmv
+nmv.load_package_lazily(__name__, globals(), [
+    '.curve',
+    '.line',
+    '.sphere',
+    '.vertex',
+    '.poly_line'])
@@ -16,7 +16,11 @@
 # MA 02110-1301 USA.
 ####################################################################################################
 
-from .intersection import *
-from .line_ops import *
-from .sphere_ops import *
-from .poly_line_ops import *
+# Import the modules on the first access to their names, see nmv.load_package_lazily
+import nmv
+nmv.load_package_lazily(__name__, globals(), [
+    '.intersection',
+    '.line_ops',
+    '.sphere_ops',
+    '.poly_line_ops',
+    '.transform_ops'])
@@ -0,0 +1,73 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import numpy
+
+
+####################################################################################################
+# @get_matrix_array
+####################################################################################################
+def get_matrix_array(matrix):
+    """Converts a 4x4 transformation matrix to a NumPy array.
+
+    :param matrix:
+        A 4x4 matrix, a mathutils.Matrix, a nested list or a NumPy array.
+    :return:
+        A NumPy array of shape (4, 4).
+    """
+
+    return numpy.array([list(row) for row in matrix], dtype=numpy.float64).reshape(4, 4)
+
+
+####################################################################################################
+# @multiply_matrices
+####################################################################################################
+def multiply_matrices(matrix_1,
+                      matrix_2):
+    """Multiplies two 4x4 transformation matrices, independently from the Blender version.
+
+    :param matrix_1:
+        The left 4x4 matrix.
+    :param matrix_2:
+        The right 4x4 matrix.
+    :return:
+        The product as a list of four rows, that can be assigned to a matrix_world directly.
+    """
+
+    return (get_matrix_array(matrix_1) @ get_matrix_array(matrix_2)).tolist()
+
+
+####################################################################################################
+# @transform_points
+####################################################################################################
+def transform_points(points,
+                     matrix):
+    """Applies an affine 4x4 transformation matrix to a list of points in a single call.
+
+    :param points:
+        A NumPy array of shape (N, 3) of points.
+    :param matrix:
+        A 4x4 transformation matrix.
+    :return:
+        A NumPy array of shape (N, 3) of the transformed points, with the type of the input.
+    """
+
+    matrix = get_matrix_array(matrix)
+    points = numpy.asarray(points)
+    transformed = points.reshape(-1, 3) @ matrix[:3, :3].T + matrix[:3, 3]
+    return transformed.astype(points.dtype if points.dtype.kind == 'f' else numpy.float64)
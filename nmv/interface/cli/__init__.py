@@ -15,11 +15,14 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .args_strings import *
-from .arguments_parser import *
-from .common import *
-from .morphology_analysis import *
-from .neuron_mesh_reconstruction import *
-from .neuron_morphology_reconstruction import *
-from .soma_reconstruction import *
-from .options_parser import *
+# Import the modules on the first access to their names, see nmv.load_package_lazily
+import nmv
+nmv.load_package_lazily(__name__, globals(), [
+    '.args_strings',
+    '.arguments_parser',
+    '.common',
+    '.morphology_analysis',
+    '.neuron_mesh_reconstruction',
+    '.neuron_morphology_reconstruction',
+    '.soma_reconstruction',
+    '.options_parser'])
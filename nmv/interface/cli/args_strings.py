@@ -47,6 +47,9 @@ class Args:
     # A directory containing a group of morphology files
     MORPHOLOGY_DIRECTORY = '--morphology-directory'
 
+    # A text file listing a group of morphology files
+    MORPHOLOGY_LIST = '--morphology-list'
+
     # A single GID
     GID = '--gid'
 
@@ -67,6 +70,9 @@ class Args:
     ################################################################################################
     # Analyze morphology
     ANALYZE_MORPHOLOGY = '--analyze-morphology'
+
+    # Number of processes used to analyze a directory of morphologies
+    ANALYSIS_PROCESSES = '--analysis-processes'
     
     ################################################################################################
     # Soma reconstruction arguments
@@ -77,6 +83,12 @@ class Args:
     # Soma subdivision level
     SOMA_SUBDIVISION_LEVEL = '--soma-subdivision-level'
 
+    # Soma soft body simulator
+    SOMA_SIMULATOR = '--soma-simulator'
+
+    # Soma simulation tolerance
+    SOMA_SIMULATION_TOLERANCE = '--soma-simulation-tolerance'
+
     ################################################################################################
     # Morphology arguments
     ################################################################################################
@@ -129,6 +141,10 @@ class Args:
     # Morphology bevel object sides
     MORPHOLOGY_BEVEL_SIDES = '--bevel-sides'
 
+    # Level of detail
+    LOD_SAMPLE_BUDGET = '--lod-sample-budget'
+    LOD_SCREEN_SPACE_ERROR = '--lod-screen-space-error'
+
     # Branching method
     BRANCHING_METHOD = '--branching'
 
@@ -198,6 +214,15 @@ class Args:
     # Connect the soma to the arbors
     CONNECT_SOMA_ARBORS = '--connect-soma-arbors'
 
+    # The polygonizer of the meta objects (blender or implicit)
+    META_POLYGONIZER = '--meta-polygonizer'
+
+    # Adaptive resolution for the implicit meta polygonizer
+    META_ADAPTIVE_RESOLUTION = '--meta-adaptive-resolution'
+
+    # Number of processes used by the implicit meta polygonizer
+    META_POLYGONIZER_PROCESSES = '--meta-polygonizer-processes'
+
     ################################################################################################
     # Geometry export arguments
     ################################################################################################
@@ -205,6 +230,9 @@ class Args:
     EXPORT_SWC_MORPHOLOGY = '--export-morphology-swc'
 
     # Export .H5 morphology
+    EXPORT_H5_MORPHOLOGY = '--export-morphology-h5'
+
+    # Export .SEGMENTS morphology
     EXPORT_SEGMENTS_MORPHOLOGY = '--export-morphology-segments'
 
     # Export .BLEND morphology
@@ -234,6 +262,15 @@ class Args:
     # Export the neuron mesh as .BLEND
     EXPORT_BLEND_NEURON = '--export-neuron-mesh-blend'
 
+    # Export the neuron mesh as an NMV binary mesh (.NMVMESH)
+    EXPORT_NMV_NEURON = '--export-neuron-mesh-nmv'
+
+    # Quantize the vertices and the normals of the NMV binary meshes
+    NMV_MESH_QUANTIZE = '--nmv-mesh-quantize'
+
+    # Compress the arrays of the NMV binary meshes
+    NMV_MESH_COMPRESS = '--nmv-mesh-compress'
+
     # Export each part of the neuron mesh as a separate file for tagging
     EXPORT_INDIVIDUALS = '--export-individuals'
 
@@ -286,8 +323,20 @@ class Args:
     # Image file format or extensions
     IMAGE_FILE_FORMAT = '--image-file-format'
 
+    # Number of processes used to render the sequences
+    SEQUENCE_PROCESSES = '--sequence-processes'
+
+    # Resume the rendering of partially rendered sequences
+    RESUME_SEQUENCES = '--resume-sequences'
+
     ################################################################################################
     # Execution arguments
     ################################################################################################
     # Execution node
     EXECUTION_NODE = '--execution-node'
+
+    # Profile the stages of the pipeline
+    PROFILE = '--profile'
+
+    # The format of the profiling reports
+    PROFILE_FORMAT = '--profile-format'
@@ -85,6 +85,14 @@ def parse_command_line_arguments():
         action='store', default=None,
         help=arg_help)
 
+    # A list of morphology files
+    arg_help = 'A text file listing the morphology files (.H5 or .SWC), one per line, \n' \
+               'used instead of the morphology directory with --input=directory'
+    input_args.add_argument(
+        Args.MORPHOLOGY_LIST,
+        action='store', default=None,
+        help=arg_help)
+
     # Cell GID, requires a circuit configuration
     arg_help = 'Cell GID (requires BBP circuit).'
     input_args.add_argument(
@@ -100,7 +108,9 @@ def parse_command_line_arguments():
         help=arg_help)
 
     # Circuit configuration
-    arg_help = 'BBP circuit configuration'
+    arg_help = 'BBP circuit configuration, or a local cells table (.csv, .h5) with the \n' \
+               'columns gid, x, y, z, orientation_w, orientation_x, orientation_y, \n' \
+               'orientation_z, mtype, morphology, morphology_path and targets.'
     input_args.add_argument(
         Args.BLUE_CONFIG,
         action='store', default=None,
@@ -129,6 +139,17 @@ def parse_command_line_arguments():
         action='store_true', default=False,
         help=arg_help)
 
+    # Analysis processes
+    arg_help = 'Number of processes used to analyze the morphologies with --input=directory. \n' \
+               'All the morphologies are analyzed in a single Blender instance and the \n' \
+               'results are aggregated into a single table. The analysis results are only \n' \
+               'plotted if a single process is used in Blender. \n' \
+               'Default 1.'
+    analysis_args.add_argument(
+        Args.ANALYSIS_PROCESSES,
+        action='store', type=int, default=1,
+        help=arg_help)
+
     ################################################################################################
     # Soma arguments
     ################################################################################################
@@ -149,6 +170,24 @@ def parse_command_line_arguments():
         Args.SOMA_SUBDIVISION_LEVEL,
         action='store', type=int, default=5,
         help=arg_help)
+
+    # Soma simulator
+    arg_options = ['(blender)', 'mass-spring']
+    arg_help = 'The simulator that deforms the soma sphere. \n' \
+               'Options: %s' % arg_options
+    soma_args.add_argument(
+        Args.SOMA_SIMULATOR,
+        action='store', default='blender',
+        help=arg_help)
+
+    # Soma simulation tolerance
+    arg_help = 'Convergence tolerance of the mass-spring soma simulator, relative to the soma ' \
+               'radius. \n' \
+               'Default 0.0001.'
+    soma_args.add_argument(
+        Args.SOMA_SIMULATION_TOLERANCE,
+        action='store', type=float, default=0.0001,
+        help=arg_help)
     
     ################################################################################################
     # Morphology arguments
@@ -311,6 +350,23 @@ def parse_command_line_arguments():
         action='store', type=int, default=16,
         help=arg_help)
 
+    # Level of detail of the skeleton based on a sample budget
+    arg_help = 'The maximum number of samples drawn in the skeleton. The sections are \n' \
+               'simplified with bounded position and radius errors to fit the budget. \n' \
+               'Default 0 (draw all the samples)'
+    skeletonization_args.add_argument(
+        Args.LOD_SAMPLE_BUDGET,
+        action='store', type=int, default=0,
+        help=arg_help)
+
+    # Level of detail of the skeleton based on a screen-space error
+    arg_help = 'The maximum error of the drawn skeleton in pixels of the full view image. \n' \
+               'Default 0 (draw all the samples)'
+    skeletonization_args.add_argument(
+        Args.LOD_SCREEN_SPACE_ERROR,
+        action='store', type=float, default=0.0,
+        help=arg_help)
+
     ################################################################################################
     # Structures (like spines and nucleus) arguments
     ################################################################################################
@@ -494,6 +550,32 @@ def parse_command_line_arguments():
         action='store_true', default=False,
         help=arg_help)
 
+    # The polygonizer of the meta objects
+    arg_options = ['(blender)', 'implicit']
+    arg_help = 'The polygonizer of the meta objects. \n' \
+               'Valid only for the meta-balls meshing algorithm. \n' \
+               'Options: %s' % arg_options
+    meshing_args.add_argument(
+        Args.META_POLYGONIZER,
+        action='store', default='blender',
+        help=arg_help)
+
+    # Adaptive resolution for the implicit polygonizer
+    arg_help = 'Use an adaptive resolution based on the local radius. \n' \
+               'Valid only for the implicit meta polygonizer.'
+    meshing_args.add_argument(
+        Args.META_ADAPTIVE_RESOLUTION,
+        action='store_true', default=False,
+        help=arg_help)
+
+    # Number of processes used by the implicit polygonizer
+    arg_help = 'Number of processes used by the implicit meta polygonizer. \n' \
+               'Default 1.'
+    meshing_args.add_argument(
+        Args.META_POLYGONIZER_PROCESSES,
+        action='store', type=int, default=1,
+        help=arg_help)
+
     ################################################################################################
     # Geometry export arguments
     ################################################################################################
@@ -509,6 +591,13 @@ def parse_command_line_arguments():
         action='store_true', default=False,
         help=arg_help)
 
+    # Export the morphologies in .H5 format
+    arg_help = 'Exports the morphology to (.H5) file. \n'
+    export_args.add_argument(
+        Args.EXPORT_H5_MORPHOLOGY,
+        action='store_true', default=False,
+        help=arg_help)
+
     # Export the morphologies in .SEGMENTS format (after fixing the artifacts)
     arg_help = 'Exports the morphology to (SEGMENTS) file. \n'
     export_args.add_argument(
@@ -551,6 +640,29 @@ def parse_command_line_arguments():
         action='store_true', default=False,
         help=arg_help)
 
+    # Export the neuron mesh in the NMV binary mesh format
+    arg_help = 'Exports the neuron mesh to an NMV binary mesh file (.NMVMESH), which can be ' \
+               'memory-mapped and loaded without the Blender importers.'
+    export_args.add_argument(
+        Args.EXPORT_NMV_NEURON,
+        action='store_true', default=False,
+        help=arg_help)
+
+    # Quantize the NMV binary meshes
+    arg_help = 'Stores the vertices of the NMV binary meshes as 16-bit integers and their ' \
+               'normals as 8-bit integers.'
+    export_args.add_argument(
+        Args.NMV_MESH_QUANTIZE,
+        action='store_true', default=False,
+        help=arg_help)
+
+    # Compress the NMV binary meshes
+    arg_help = 'Compresses the arrays of the NMV binary meshes, which are then not memory-mapped.'
+    export_args.add_argument(
+        Args.NMV_MESH_COMPRESS,
+        action='store_true', default=False,
+        help=arg_help)
+
     # Export the neuron mesh in .BLEND format
     arg_help = 'Exports each part (or component) of the neuron mesh as separate mesh.'
     export_args.add_argument(
@@ -707,6 +819,22 @@ def parse_command_line_arguments():
         action='store', default='png',
         help=arg_help)
 
+    # Number of processes used to render the sequences
+    arg_help = 'Number of Blender processes used to render the frames of the sequences, \n' \
+               'each process renders a contiguous range of frames. \n' \
+               'Default 1.'
+    rendering_args.add_argument(
+        Args.SEQUENCE_PROCESSES,
+        action='store', type=int, default=1,
+        help=arg_help)
+
+    # Resume the sequences
+    arg_help = 'Resume the rendering of the sequences, only the missing frames are rendered.'
+    rendering_args.add_argument(
+        Args.RESUME_SEQUENCES,
+        action='store_true', default=False,
+        help=arg_help)
+
     ################################################################################################
     # Execution arguments
     ################################################################################################
@@ -721,6 +849,23 @@ def parse_command_line_arguments():
         action='store', default='local',
         help=arg_help)
 
+    # Profiling
+    arg_help = 'Profile the stages of the pipeline, wall time, CPU time, peak memory and \n' \
+               'counts, and write a report per neuron into the stats directory.'
+    execution_args.add_argument(
+        Args.PROFILE,
+        action='store_true', default=False,
+        help=arg_help)
+
+    # Profiling report format
+    arg_options = ['(json)', 'chrome-trace']
+    arg_help = 'The format of the profiling reports. \n' \
+               'Options: %s' % arg_options
+    execution_args.add_argument(
+        Args.PROFILE_FORMAT,
+        action='store', default='json',
+        help=arg_help)
+
     # Parse the arguments, and return a list of them
     return parser.parse_args()
 
@@ -750,8 +895,8 @@ def get_arguments_string_as_list(arguments):
         # Get the argument value
         arg_value = getattr(arguments, arg)
 
-        # Ignore the unset flags
-        if arg_value is False:
+        # Ignore the unset flags and options, they get their default values
+        if arg_value is False or arg_value is None:
             continue
 
         elif arg_value is True:
@@ -802,7 +947,7 @@ def get_arguments_string_for_individual_file(arguments,
     :param arguments:
         Parsed arguments
     :param morphology_file:
-        Input morphology file.
+        Input morphology file, either relative to the morphology directory or a full path.
     :return:
         A string of the updated arguments.
     """
@@ -815,9 +960,9 @@ def get_arguments_string_for_individual_file(arguments,
         if '--input=' in argument:
             arguments_string_list[i] = '--input=file '
 
-    # Add the absolute path of the file
-    arguments_string_list.append('--morphology-file=%s/%s' % (
-        arguments.morphology_directory, morphology_file))
+    # Add the path of the file, the files of a morphology list have full paths
+    arguments_string_list.append('--morphology-file=%s' % os.path.join(
+        arguments.morphology_directory or '', morphology_file))
 
     # Compose the arguments string
     arguments_string = ''
@@ -901,6 +1046,7 @@ def create_shell_commands(arguments,
        arguments.render_neuron_morphology_360 or            \
        arguments.render_neuron_morphology_progressive or    \
        arguments.export_morphology_swc or                   \
+       arguments.export_morphology_h5 or                    \
        arguments.export_morphology_segments or              \
        arguments.export_morphology_blend:
 
@@ -927,7 +1073,8 @@ def create_shell_commands(arguments,
        arguments.export_neuron_mesh_ply or                  \
        arguments.export_neuron_mesh_obj or                  \
        arguments.export_neuron_mesh_stl or                  \
-       arguments.export_neuron_mesh_blend:
+       arguments.export_neuron_mesh_blend or                \
+       arguments.export_neuron_mesh_nmv:
 
         # Add this command to the list
         shell_commands.append('%s -b --verbose 0 --python %s -- %s' %
@@ -16,6 +16,7 @@
 ####################################################################################################
 
 # Internal imports
+import nmv
 import nmv.enums
 import nmv.consts
 
@@ -129,3 +130,41 @@ def get_soma_image_suffixes_from_view(camera_view):
     # By default render the front view
     else:
         return [nmv.consts.Suffix.SOMA_FRONT]
+
+
+####################################################################################################
+# @start_profiling
+####################################################################################################
+def start_profiling(cli_options,
+                    tool):
+    """Enables the profiler if the profiling is requested from the command line interface.
+
+    :param cli_options:
+        System options parsed from the command line interface (CLI).
+    :param tool:
+        The name of the CLI tool, used to distinguish the reports of the same neuron.
+    """
+
+    if cli_options.io.profile:
+        nmv.profiler.enable(label='%s_%s' % (cli_options.morphology.label, tool))
+
+
+####################################################################################################
+# @write_profiling_report
+####################################################################################################
+def write_profiling_report(cli_options):
+    """Writes the profiling report of the run into the statistics directory, if the profiling is
+    enabled.
+
+    :param cli_options:
+        System options parsed from the command line interface (CLI).
+    """
+
+    # Write the report
+    report_file_path = nmv.profiler.write_report(
+        output_directory=cli_options.io.statistics_directory,
+        file_name=nmv.profiler.label,
+        report_format=cli_options.io.profile_format)
+
+    if report_file_path is not None:
+        nmv.logger.log('Profiling report [%s]' % report_file_path)
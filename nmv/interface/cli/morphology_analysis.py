@@ -34,6 +34,7 @@ import nmv.interface
 import nmv.options
 import nmv.rendering
 import nmv.scene
+import nmv.utilities
 
 
 ####################################################################################################
@@ -67,6 +68,59 @@ def analyze_morphology_skeleton(cli_morphology,
                        cli_options.morphology.label)
 
 
+####################################################################################################
+# @analyze_morphology_files
+####################################################################################################
+def analyze_morphology_files(arguments,
+                             cli_options):
+    """Analyzes all the morphologies of a directory, or a list, in this process and aggregates
+    the results into a single table in the analysis directory. The analysis items are shared by
+    all the morphologies. If a single process is used in Blender, the results of every morphology
+    are also plotted, otherwise the morphologies are analyzed in a pool of worker processes.
+
+    :param arguments:
+        Command line arguments.
+    :param cli_options:
+        System options parsed from the command line interface (CLI).
+    """
+
+    # Get the morphology files
+    morphology_files = nmv.file.ops.get_morphology_files(
+        morphology_directory=arguments.morphology_directory,
+        morphology_list=arguments.morphology_list)
+    if len(morphology_files) == 0:
+        nmv.logger.log('ERROR: No morphology files are found')
+        return
+
+    # Create the analysis directory if it does not exist
+    if not nmv.file.ops.path_exists(cli_options.io.analysis_directory):
+        nmv.file.ops.clean_and_create_directory(cli_options.io.analysis_directory)
+
+    # The table is named after the directory or the list
+    if arguments.morphology_list is not None:
+        batch_label = os.path.splitext(os.path.basename(arguments.morphology_list))[0]
+    else:
+        batch_label = os.path.basename(os.path.normpath(arguments.morphology_directory))
+    output_file = '%s/%s-analysis.csv' % (cli_options.io.analysis_directory, batch_label)
+
+    # Plot the results of every morphology, only in a single process in Blender
+    callback = None
+    if arguments.analysis_processes <= 1 and nmv.utilities.is_blender_available():
+        def callback(morphology):
+            cli_options.morphology.label = morphology.label
+            nmv.analysis.plot_analysis_results(morphology=morphology, options=cli_options)
+    else:
+        nmv.logger.log('The analysis results of the individual morphologies are not plotted')
+
+    # Analyze the morphologies
+    nmv.logger.log('Analyzing [%d] morphologies' % len(morphology_files))
+    number_analyzed_morphologies = nmv.analysis.analyze_morphology_files(
+        morphology_files=morphology_files, output_file=output_file,
+        processes=arguments.analysis_processes, callback=callback)
+    nmv.logger.log('[%d/%d] morphologies are analyzed, results [%s]' % (
+        number_analyzed_morphologies, len(morphology_files), output_file))
+
+
 ####################################################################################################
 # @ Run the main function if invoked from the command line.
 ####################################################################################################
@@ -92,11 +146,26 @@ if __name__ == "__main__":
     # Convert the CLI arguments to system options
     input_options.consume_arguments(arguments=arguments)
 
+    # Start the profiling, if requested
+    nmv.interface.start_profiling(cli_options=input_options, tool='analysis')
+
     # Read the morphology
     input_morphology = None
 
+    # Analyze all the morphologies of a directory, or a list, in this process
+    if arguments.input == 'directory':
+
+        # Morphology analysis
+        with nmv.profiler.span('analyze_morphology_files', 'analysis'):
+            analyze_morphology_files(arguments=arguments, cli_options=input_options)
+
+        # Write the profiling report, if requested
+        nmv.interface.write_profiling_report(cli_options=input_options)
+        nmv.logger.log('Analysis done')
+        sys.exit(0)
+
     # If the input is a GID, then open the circuit and read it
-    if arguments.input == 'gid':
+    elif arguments.input == 'gid':
 
         # Load the morphology from the file
         loading_flag, input_morphology = nmv.file.BBPReader.load_morphology_from_circuit(
@@ -124,7 +193,11 @@ if __name__ == "__main__":
         exit(0)
 
     # Morphology analysis
-    analyze_morphology_skeleton(cli_morphology=input_morphology, cli_options=input_options)
+    with nmv.profiler.span('analyze_morphology_skeleton', 'analysis'):
+        analyze_morphology_skeleton(cli_morphology=input_morphology, cli_options=input_options)
+
+    # Write the profiling report, if requested
+    nmv.interface.write_profiling_report(cli_options=input_options)
     nmv.logger.log('Analysis done')
 
 
@@ -113,37 +113,35 @@ def export_neuron_mesh(cli_morphology,
     # Get a list of all the meshes in the scene
     mesh_objects = nmv.scene.get_list_of_meshes_in_scene()
 
-    # OBJ
+    # Collect the requested formats to extract the meshes once for all of them
+    file_formats = list()
     if cli_options.mesh.export_obj:
-        nmv.file.export_mesh_objects_to_file(mesh_objects,
-                                             cli_options.io.meshes_directory,
-                                             cli_morphology.label,
-                                             nmv.enums.Meshing.ExportFormat.OBJ,
-                                             cli_options.mesh.export_individuals)
-
-    # PLY
+        file_formats.append(nmv.enums.Meshing.ExportFormat.OBJ)
     if cli_options.mesh.export_ply:
-        nmv.file.export_mesh_objects_to_file(mesh_objects,
-                                             cli_options.io.meshes_directory,
-                                             cli_morphology.label,
-                                             nmv.enums.Meshing.ExportFormat.PLY,
-                                             cli_options.mesh.export_individuals)
-
-    # STL
+        file_formats.append(nmv.enums.Meshing.ExportFormat.PLY)
     if cli_options.mesh.export_stl:
-        nmv.file.export_mesh_objects_to_file(mesh_objects,
-                                             cli_options.io.meshes_directory,
-                                             cli_morphology.label,
-                                             nmv.enums.Meshing.ExportFormat.STL,
-                                             cli_options.mesh.export_individuals)
-
-    # BLEND
+        file_formats.append(nmv.enums.Meshing.ExportFormat.STL)
     if cli_options.mesh.export_blend:
-        nmv.file.export_mesh_objects_to_file(mesh_objects,
-                                             cli_options.io.meshes_directory,
-                                             cli_morphology.label,
-                                             nmv.enums.Meshing.ExportFormat.BLEND,
-                                             cli_options.mesh.export_individuals)
+        file_formats.append(nmv.enums.Meshing.ExportFormat.BLEND)
+    if cli_options.mesh.export_nmv:
+        file_formats.append(nmv.enums.Meshing.ExportFormat.NMV)
+
+    # The metadata stored in the NMV binary meshes
+    metadata = {'label': cli_morphology.label,
+                'gid': cli_options.morphology.gid,
+                'meshing_technique': cli_options.mesh.meshing_technique,
+                'surface': cli_options.mesh.surface,
+                'global_coordinates': cli_options.mesh.global_coordinates}
+
+    # Export the meshes
+    nmv.file.export_mesh_objects_to_files(mesh_objects,
+                                          cli_options.io.meshes_directory,
+                                          cli_morphology.label,
+                                          file_formats,
+                                          cli_options.mesh.export_individuals,
+                                          metadata=metadata,
+                                          quantize=cli_options.mesh.nmv_quantize,
+                                          compress=cli_options.mesh.nmv_compress)
 
 
 ####################################################################################################
@@ -273,44 +271,30 @@ def render_neuron_mesh_360(cli_options,
         # Stretch the bounding box by few microns
         bounding_box_360.extend_bbox_uniformly(delta=nmv.consts.Image.GAP_DELTA)
 
-        # Create a specific directory for this mesh
+        # Create a specific directory for this mesh, keep the rendered frames if resuming
         output_directory = '%s/%s_mesh_360' % (
             cli_options.io.sequences_directory, cli_options.morphology.label)
-        nmv.file.ops.clean_and_create_directory(output_directory)
-
-        # Get a list of all the meshes in the scene
-        scene_meshes = nmv.scene.get_list_of_meshes_in_scene()
-
-        # Render 360
-        for i in range(360):
-
-            # Set the frame name
-            image_name = '%s/%s' % (output_directory, '{0:05d}'.format(i))
-
-            # Render at a specific resolution
-            if cli_options.rendering.resolution_basis == \
-                    nmv.enums.Rendering.Resolution.FIXED:
-
-                # Render the image
-                nmv.rendering.renderer.render_at_angle(
-                    scene_objects=scene_meshes,
-                    angle=i,
-                    bounding_box=bounding_box_360,
-                    camera_view=nmv.enums.Camera.View.FRONT_360,
-                    image_resolution=cli_options.rendering.full_view_resolution,
-                    image_name=image_name)
-
-            # Render at a specific scale factor
-            else:
-
-                # Render the image
-                nmv.rendering.renderer.render_at_angle_to_scale(
-                    scene_objects=scene_meshes,
-                    angle=i,
-                    bounding_box=bounding_box_360,
-                    camera_view=nmv.enums.Camera.View.FRONT_360,
-                    image_scale_factor=cli_options.rendering.resolution_scale_facto,
-                    image_name=image_name)
+        if cli_options.rendering.resume_sequences:
+            nmv.file.ops.create_directory(output_directory)
+        else:
+            nmv.file.ops.clean_and_create_directory(output_directory)
+
+        # Render at a specific resolution, or at a specific scale factor
+        image_scale_factor = None
+        if cli_options.rendering.resolution_basis != nmv.enums.Rendering.Resolution.FIXED:
+            image_scale_factor = cli_options.rendering.resolution_scale_factor
+
+        # Render the 360 sequence of all the meshes in the scene in a single animation job
+        nmv.rendering.render_360(
+            scene_objects=nmv.scene.get_list_of_meshes_in_scene(),
+            bounding_box=bounding_box_360,
+            output_directory=output_directory,
+            camera_view=nmv.enums.Camera.View.FRONT_360,
+            image_resolution=cli_options.rendering.full_view_resolution,
+            image_scale_factor=image_scale_factor,
+            image_format=cli_options.rendering.image_format,
+            processes=cli_options.rendering.sequence_processes,
+            resume=cli_options.rendering.resume_sequences)
 
 
 ####################################################################################################
@@ -338,6 +322,9 @@ if __name__ == "__main__":
     # Convert the CLI arguments to system options
     cli_options.consume_arguments(arguments=arguments)
 
+    # Start the profiling, if requested
+    nmv.interface.start_profiling(cli_options=cli_options, tool='mesh')
+
     # Read the morphology
     cli_morphology = None
 
@@ -370,22 +357,33 @@ if __name__ == "__main__":
         exit(0)
 
     # Soma mesh reconstruction and visualization
-    neuron_mesh = reconstruct_neuron_mesh(cli_morphology=cli_morphology, cli_options=cli_options)
+    with nmv.profiler.span('reconstruct_neuron_mesh', 'building') as span:
+        neuron_mesh = reconstruct_neuron_mesh(
+            cli_morphology=cli_morphology, cli_options=cli_options)
+        span.add_mesh_counts(nmv.scene.get_list_of_meshes_in_scene())
 
     # Saving the mesh
     if cli_options.mesh.export_ply or cli_options.mesh.export_obj or \
-       cli_options.mesh.export_stl or cli_options.mesh.export_blend:
+       cli_options.mesh.export_stl or cli_options.mesh.export_blend or \
+       cli_options.mesh.export_nmv:
 
         # Export the neuron mesh
-        export_neuron_mesh(cli_morphology=cli_morphology, cli_options=cli_options)
+        with nmv.profiler.span('export_neuron_mesh', 'export'):
+            export_neuron_mesh(cli_morphology=cli_morphology, cli_options=cli_options)
 
     # Render the mesh
     if cli_options.rendering.render_mesh_static_frame:
-        render_neuron_mesh_to_static_frame(cli_options=cli_options, cli_morphology=cli_morphology)
+        with nmv.profiler.span('render_neuron_mesh_to_static_frame', 'rendering'):
+            render_neuron_mesh_to_static_frame(
+                cli_options=cli_options, cli_morphology=cli_morphology)
 
     # Render 360 of the mesh
     if cli_options.rendering.render_mesh_360:
-        render_neuron_mesh_360(cli_options=cli_options, cli_morphology=cli_morphology)
+        with nmv.profiler.span('render_neuron_mesh_360', 'rendering'):
+            render_neuron_mesh_360(cli_options=cli_options, cli_morphology=cli_morphology)
+
+    # Write the profiling report, if requested
+    nmv.interface.write_profiling_report(cli_options=cli_options)
 
     # Rendering the mesh
     nmv.logger.log('NMV Done')
@@ -91,7 +91,9 @@ def reconstruct_neuron_morphology(cli_morphology,
             morphology=cli_morphology, options=cli_options)
 
     # Draw the morphology skeleton and return a list of all the reconstructed objects
-    morphology_skeleton_objects = morphology_builder.draw_morphology_skeleton()
+    with nmv.profiler.span('draw_morphology_skeleton', 'arbors-building') as span:
+        morphology_skeleton_objects = morphology_builder.draw_morphology_skeleton()
+        span.add_count('objects', len(morphology_skeleton_objects))
 
     # Export to .BLEND file
     if cli_options.morphology.export_blend:
@@ -101,6 +103,33 @@ def reconstruct_neuron_morphology(cli_morphology,
             None, cli_options.io.morphologies_directory, cli_morphology.label,
             blend=cli_options.morphology.export_blend)
 
+    # Export the morphology skeleton to .SWC, .H5 and .SEGMENTS files, the arbors are flattened
+    # into arrays once per file rather than walked sample by sample
+    if cli_options.morphology.export_swc or cli_options.morphology.export_h5 or \
+            cli_options.morphology.export_segments:
+
+        # Create the morphologies directory if it does not exist
+        if not nmv.file.ops.path_exists(cli_options.io.morphologies_directory):
+            nmv.file.ops.clean_and_create_directory(cli_options.io.morphologies_directory)
+
+        # Export to .SWC file
+        if cli_options.morphology.export_swc:
+            with nmv.profiler.span('write_morphology_swc', 'export'):
+                nmv.file.write_morphology_to_swc_file(
+                    cli_morphology, cli_options.io.morphologies_directory)
+
+        # Export to .H5 file
+        if cli_options.morphology.export_h5:
+            with nmv.profiler.span('write_morphology_h5', 'export'):
+                nmv.file.write_morphology_to_h5_file(
+                    cli_morphology, cli_options.io.morphologies_directory)
+
+        # Export to .SEGMENTS file
+        if cli_options.morphology.export_segments:
+            with nmv.profiler.span('write_morphology_segments', 'export'):
+                nmv.file.write_morphology_to_segments_file(
+                    cli_morphology, cli_options.io.morphologies_directory)
+
     # Render a static image of the reconstructed morphology skeleton
     if cli_options.rendering.render_morphology_static_frame:
 
@@ -192,20 +221,24 @@ def reconstruct_neuron_morphology(cli_morphology,
         # Stretch the bounding box by few microns
         bounding_box_360.extend_bbox_uniformly(delta=nmv.consts.Image.GAP_DELTA)
 
-        for i in range(0, 360):
-
-            # Set the frame name
-            image_name = '%s/%s/frame_%s' % (
-                cli_options.io.sequences_directory, cli_morphology.label, '{0:05d}'.format(i))
-
-            # Render a frame
-            nmv.rendering.renderer.render_at_angle(
-                scene_objects=nmv.scene.get_list_of_objects_in_scene(),
-                angle=i,
-                bounding_box=bounding_box_360,
-                camera_view=nmv.enums.Camera.View.FRONT,
-                image_resolution=cli_options.rendering.full_view_resolution,
-                image_name=image_name)
+        # Create a specific directory for this morphology, keep the rendered frames if resuming
+        output_directory = '%s/%s' % (cli_options.io.sequences_directory, cli_morphology.label)
+        if cli_options.rendering.resume_sequences:
+            nmv.file.ops.create_directory(output_directory)
+        else:
+            nmv.file.ops.clean_and_create_directory(output_directory)
+
+        # Render the 360 sequence in a single animation job
+        nmv.rendering.render_360(
+            scene_objects=nmv.scene.get_list_of_objects_in_scene(),
+            bounding_box=bounding_box_360,
+            output_directory=output_directory,
+            camera_view=nmv.enums.Camera.View.FRONT,
+            image_resolution=cli_options.rendering.full_view_resolution,
+            image_prefix='frame_',
+            image_format=cli_options.rendering.image_format,
+            processes=cli_options.rendering.sequence_processes,
+            resume=cli_options.rendering.resume_sequences)
 
     # Render a sequence of the progressive reconstruction of the morphology skeleton
     if cli_options.rendering.render_morphology_progressive:
@@ -238,24 +271,27 @@ def reconstruct_neuron_morphology(cli_morphology,
             rendering_bbox = nmv.skeleton.compute_full_morphology_bounding_box(
                 morphology=cli_morphology)
 
-        # Move to the last frame to get the bounding box of all the drawn objects
-        import bpy
-        bpy.context.scene.frame_set(0)
-
-        for i in range(0, 100):
-            bpy.context.scene.frame_set(i)
-
-            # Set the frame name
-            image_name = '%s/%s/%s' % (
-                cli_options.io.sequences_directory, cli_morphology.label, '{0:05d}'.format(i))
-
-            # Render a frame
-            nmv.rendering.renderer.render(
-                bounding_box=rendering_bbox,
-                camera_view=nmv.enums.Camera.View.FRONT,
-                image_resolution=cli_options.rendering.full_view_resolution,
-                image_name=image_name,
-                image_directory=None)
+        # Create a specific directory for this morphology, keep the rendered frames if resuming
+        output_directory = '%s/%s' % (cli_options.io.sequences_directory, cli_morphology.label)
+        if cli_options.rendering.resume_sequences:
+            nmv.file.ops.create_directory(output_directory)
+        else:
+            nmv.file.ops.clean_and_create_directory(output_directory)
+
+        # The progressive reconstruction is keyframed by the builder, then render all the frames
+        # with a single camera in a single animation job
+        camera = nmv.rendering.setup_sequence_camera(
+            bounding_box=rendering_bbox,
+            camera_view=nmv.enums.Camera.View.FRONT,
+            image_resolution=cli_options.rendering.full_view_resolution)
+        nmv.rendering.render_sequence(
+            output_directory=output_directory,
+            frame_start=0,
+            frame_end=99,
+            image_format=cli_options.rendering.image_format,
+            processes=cli_options.rendering.sequence_processes,
+            resume=cli_options.rendering.resume_sequences)
+        nmv.scene.ops.delete_object_in_scene(camera.camera)
 
 
 ####################################################################################################
@@ -283,6 +319,9 @@ if __name__ == "__main__":
     # Convert the CLI arguments to system options
     input_options.consume_arguments(arguments=arguments)
 
+    # Start the profiling, if requested
+    nmv.interface.start_profiling(cli_options=input_options, tool='morphology')
+
     # Read the morphology
     input_morphology = None
 
@@ -316,6 +355,9 @@ if __name__ == "__main__":
 
     # Neuron morphology reconstruction and visualization
     reconstruct_neuron_morphology(cli_morphology=input_morphology, cli_options=input_options)
+
+    # Write the profiling report, if requested
+    nmv.interface.write_profiling_report(cli_options=input_options)
     nmv.logger.log('NMV Done')
 
 
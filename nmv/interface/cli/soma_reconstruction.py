@@ -28,6 +28,7 @@ for import_path in import_paths:
     sys.path.append(('%s/../../..' % (os.path.dirname(os.path.realpath(__file__)))))
 
 # Internal imports
+import nmv.bbox
 import nmv.builders
 import nmv.consts
 import nmv.enums
@@ -80,7 +81,9 @@ def reconstruct_soma_three_dimensional_profile_mesh(cli_morphology,
     soma_builder = nmv.builders.SomaSoftBodyBuilder(cli_morphology, cli_options)
 
     # Reconstruct the three-dimensional profile of the soma mesh
-    soma_mesh = soma_builder.reconstruct_soma_mesh()
+    with nmv.profiler.span('reconstruct_soma_mesh', 'soma-building') as span:
+        soma_mesh = soma_builder.reconstruct_soma_mesh()
+        span.add_mesh_counts([soma_mesh])
 
     # Soma mesh file prefix
     soma_mesh_file_name = 'SOMA_MESH_%s' % cli_options.morphology.label
@@ -116,25 +119,25 @@ def reconstruct_soma_three_dimensional_profile_mesh(cli_morphology,
         if not nmv.file.ops.path_exists(cli_options.io.sequences_directory):
             nmv.file.ops.clean_and_create_directory(cli_options.io.sequences_directory)
 
-        # Create a specific directory for this mesh
+        # Create a specific directory for this mesh, keep the rendered frames if resuming
         output_directory = '%s/SOMA_MESH_360_%s' % (cli_options.io.sequences_directory,
                                                     cli_options.morphology.label)
-        nmv.file.ops.clean_and_create_directory(output_directory)
-
-        # Render the frames
-        for i in range(360):
-
-            # Set the frame name
-            image_name = '%s/%s' % (output_directory, '{0:05d}'.format(i))
-
-            # Render a frame
-            nmv.rendering.SomaRenderer.render_at_angle(
-                soma_mesh=soma_mesh,
-                angle=i,
-                view_extent=cli_options.soma.rendering_extent,
-                camera_view=nmv.enums.Camera.View.FRONT,
-                image_resolution=cli_options.soma.rendering_resolution,
-                image_name=image_name)
+        if cli_options.rendering.resume_sequences:
+            nmv.file.ops.create_directory(output_directory)
+        else:
+            nmv.file.ops.clean_and_create_directory(output_directory)
+
+        # Render the frames in a single animation job
+        nmv.rendering.render_360(
+            scene_objects=[soma_mesh],
+            bounding_box=nmv.bbox.compute_unified_extent_bounding_box(
+                extent=cli_options.soma.rendering_extent),
+            output_directory=output_directory,
+            camera_view=nmv.enums.Camera.View.FRONT,
+            image_resolution=cli_options.soma.rendering_resolution,
+            image_format=cli_options.rendering.image_format,
+            processes=cli_options.rendering.sequence_processes,
+            resume=cli_options.rendering.resume_sequences)
 
     # Render a progressive reconstruction of the soma
     if cli_options.soma.render_soma_mesh_progressive:
@@ -150,23 +153,33 @@ def reconstruct_soma_three_dimensional_profile_mesh(cli_morphology,
                                                             cli_options.morphology.label)
         nmv.file.ops.clean_and_create_directory(output_directory)
 
-        # Simulation
-        for i in range(nmv.consts.Simulation.MIN_FRAME, nmv.consts.Simulation.MAX_FRAME):
-
-            # Update the frame based on the soft body simulation
-            bpy.context.scene.frame_set(i)
+        # Render the simulation frames in a single animation job. The soft body simulation must
+        # be evaluated frame by frame from the first frame, therefore the sequence is rendered by a
+        # single process and is not resumed
+        camera = nmv.rendering.setup_sequence_camera(
+            bounding_box=nmv.bbox.compute_unified_extent_bounding_box(
+                extent=cli_options.soma.rendering_extent),
+            camera_view=nmv.enums.Camera.View.FRONT,
+            image_resolution=cli_options.soma.rendering_resolution)
+
+        # The soma is viewed at a rotation of one degree per frame. Rotating the soft body would
+        # drag it away from its hooks, therefore the camera orbits around the soma in the opposite
+        # direction instead
+        camera_pivot = bpy.data.objects.new('SequenceCameraPivot', None)
+        nmv.scene.ops.link_object_to_scene(camera_pivot)
+        camera.camera.parent = camera_pivot
+        nmv.rendering.keyframe_rotation_360([camera_pivot], number_frames=360, rotation=-2 * 3.14)
 
-            # Set the frame name
-            image_name = '%s/%s' % (output_directory, '{0:05d}'.format(i))
+        # Render the frames
+        nmv.rendering.render_sequence(
+            output_directory=output_directory,
+            frame_start=nmv.consts.Simulation.MIN_FRAME,
+            frame_end=nmv.consts.Simulation.MAX_FRAME - 1,
+            image_format=cli_options.rendering.image_format)
 
-            # Render a frame
-            nmv.rendering.SomaRenderer.render_at_angle(
-                soma_mesh=soma_mesh,
-                angle=i,
-                view_extent=cli_options.soma.rendering_extent,
-                camera_view=nmv.enums.Camera.View.FRONT,
-                image_resolution=cli_options.soma.rendering_resolution,
-                image_name=image_name)
+        # Delete the camera and its pivot
+        nmv.scene.ops.delete_object_in_scene(camera.camera)
+        nmv.scene.ops.delete_object_in_scene(camera_pivot)
 
         # Clear the scene again
         nmv.scene.ops.clear_scene()
@@ -197,6 +210,9 @@ if __name__ == "__main__":
     # Convert the CLI arguments to system options
     cli_options.consume_arguments(arguments=arguments)
 
+    # Start the profiling, if requested
+    nmv.interface.start_profiling(cli_options=cli_options, tool='soma')
+
     # Read the morphology
     cli_morphology = None
 
@@ -234,6 +250,9 @@ if __name__ == "__main__":
     # Soma mesh reconstruction and visualization
     # reconstruct_soma_three_dimensional_profile_mesh(cli_morphology=cli_morphology,
     #                                                cli_options=cli_options)
+
+    # Write the profiling report, if requested
+    nmv.interface.write_profiling_report(cli_options=cli_options)
     nmv.logger.log('NMV Done')
 
 
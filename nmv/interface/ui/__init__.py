@@ -15,12 +15,16 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .common import *
-from .data import *
-from .about import *
-from .edit import *
-from .io import *
-from .soma import *
-from .analysis import *
-from .mesh import *
-from .morphology import *
+# Import the modules on the first access to their names, see nmv.load_package_lazily
+import nmv
+nmv.load_package_lazily(__name__, globals(), [
+    '.common',
+    '.data',
+    '.reconstruction_stages',
+    '.about',
+    '.edit',
+    '.io',
+    '.soma',
+    '.analysis',
+    '.mesh',
+    '.morphology'])
@@ -15,6 +15,9 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .analysis_panel import *
-from .analysis_panel_ops import *
-from .analysis_panel_options import *
+# Import the modules on the first access to their names, see nmv.load_package_lazily
+import nmv
+nmv.load_package_lazily(__name__, globals(), [
+    '.analysis_panel',
+    '.analysis_panel_ops',
+    '.analysis_panel_options'])
@@ -15,7 +15,9 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .mesh_panel import *
-from .mesh_panel_options import *
-from .mesh_panel_ops import *
-
+# Import the modules on the first access to their names, see nmv.load_package_lazily
+import nmv
+nmv.load_package_lazily(__name__, globals(), [
+    '.mesh_panel',
+    '.mesh_panel_options',
+    '.mesh_panel_ops'])
@@ -37,6 +37,7 @@ import nmv.utilities
 
 from .mesh_panel_options import *
 from .mesh_panel_ops import *
+from ..reconstruction_stages import *
 
 # Is the mesh reconstructed or not
 is_mesh_reconstructed = False
@@ -44,6 +45,54 @@ is_mesh_reconstructed = False
 # Is the mesh rendered or not
 is_mesh_rendered = False
 
+# The builder that has reconstructed the mesh
+mesh_builder = None
+
+# The mesh objects of the reconstructed neuron
+mesh_objects = list()
+
+# The stages of the mesh reconstruction, only the stages whose inputs have changed since the last
+# reconstruction are executed again
+mesh_stages = create_reconstruction_stages(
+    geometry_inputs=get_mesh_geometry_inputs, shading_prefix='mesh_')
+
+
+####################################################################################################
+# @create_mesh_builder
+####################################################################################################
+def create_mesh_builder():
+    """Creates a mesh builder object for the selected meshing technique.
+
+    :return:
+        A mesh builder object, or None if the meshing technique is invalid.
+    """
+
+    # Meshing technique
+    meshing_technique = nmv.interface.ui_options.mesh.meshing_technique
+
+    # Piece-wise watertight meshing
+    if meshing_technique == nmv.enums.Meshing.Technique.PIECEWISE_WATERTIGHT:
+        return nmv.builders.PiecewiseBuilder(
+            morphology=nmv.interface.ui_morphology, options=nmv.interface.ui_options)
+
+    # Union
+    elif meshing_technique == nmv.enums.Meshing.Technique.UNION:
+        return nmv.builders.UnionBuilder(
+            morphology=nmv.interface.ui_morphology, options=nmv.interface.ui_options)
+
+    # Skinning
+    elif meshing_technique == nmv.enums.Meshing.Technique.SKINNING:
+        return nmv.builders.SkinningBuilder(
+            morphology=nmv.interface.ui_morphology, options=nmv.interface.ui_options)
+
+    # Meta Balls
+    elif meshing_technique == nmv.enums.Meshing.Technique.META_OBJECTS:
+        return nmv.builders.MetaBuilder(
+            morphology=nmv.interface.ui_morphology, options=nmv.interface.ui_options)
+
+    # Invalid method
+    return None
+
 
 ####################################################################################################
 # @MeshPanel
@@ -148,10 +197,7 @@ class ReconstructNeuronMesh(bpy.types.Operator):
 
         import time
 
-        # Clear the scene
-        nmv.scene.ops.clear_scene()
-
-        # Load the morphology file
+        # Load the morphology file, if it is not loaded
         loading_result = nmv.interface.ui.load_morphology(self, context.scene)
 
         # If the result is None, report the issue
@@ -159,41 +205,44 @@ class ReconstructNeuronMesh(bpy.types.Operator):
             self.report({'ERROR'}, 'Please select a morphology file')
             return {'FINISHED'}
 
-        # Meshing technique
-        meshing_technique = nmv.interface.ui_options.mesh.meshing_technique
+        global mesh_builder
+        global mesh_objects
+
+        # Execute all the stages for a new morphology, or if the mesh has been deleted from the
+        # scene since it was reconstructed, for example by another panel
+        if loading_result == 'NEW_MORPHOLOGY_LOADED' or not mesh_objects or \
+                not nmv.scene.ops.are_objects_in_scene(mesh_objects):
+            mesh_stages.invalidate()
+
+        # Otherwise, only the stages whose inputs have changed
+        stages = mesh_stages.get_stages_to_execute(nmv.interface.ui_options)
 
         # Start reconstruction
         start_time = time.time()
 
-        # Piece-wise watertight meshing
-        if meshing_technique == nmv.enums.Meshing.Technique.PIECEWISE_WATERTIGHT:
-            mesh_builder = nmv.builders.PiecewiseBuilder(
-                morphology=nmv.interface.ui_morphology, options=nmv.interface.ui_options)
-            nmv.interface.ui_reconstructed_mesh = mesh_builder.reconstruct_mesh()
+        # If only the shading has changed, update the materials of the reconstructed mesh
+        reconstruct_mesh = 'geometry' in stages
+        if not reconstruct_mesh and 'materials' in stages:
+            nmv.logger.info('Updating the materials of the reconstructed mesh')
+            reconstruct_mesh = not nmv.builders.mesh.update_mesh_materials(builder=mesh_builder)
 
-        # Union
-        elif meshing_technique == nmv.enums.Meshing.Technique.UNION:
-            mesh_builder = nmv.builders.UnionBuilder(
-                morphology=nmv.interface.ui_morphology, options=nmv.interface.ui_options)
-            nmv.interface.ui_reconstructed_mesh = mesh_builder.reconstruct_mesh()
+        # Otherwise, clear the scene and reconstruct the mesh again
+        if reconstruct_mesh:
+            mesh_builder = create_mesh_builder()
 
-        # Skinning
-        elif meshing_technique == nmv.enums.Meshing.Technique.SKINNING:
-            mesh_builder = nmv.builders.SkinningBuilder(
-                morphology=nmv.interface.ui_morphology, options=nmv.interface.ui_options)
-            nmv.interface.ui_reconstructed_mesh = mesh_builder.reconstruct_mesh()
+            # Invalid method
+            if mesh_builder is None:
+                mesh_objects = list()
+                self.report({'ERROR'}, 'Invalid Meshing Technique')
+                return {'FINISHED'}
 
-        # Meta Balls
-        elif meshing_technique == nmv.enums.Meshing.Technique.META_OBJECTS:
-            mesh_builder = nmv.builders.MetaBuilder(
-                morphology=nmv.interface.ui_morphology, options=nmv.interface.ui_options)
+            # Clear the scene, reconstruct the mesh and keep track on its objects
+            nmv.scene.ops.clear_scene()
             nmv.interface.ui_reconstructed_mesh = mesh_builder.reconstruct_mesh()
+            mesh_objects = nmv.builders.mesh.get_neuron_mesh_objects(builder=mesh_builder)
 
-        else:
-
-            # Invalid method
-            self.report({'ERROR'}, 'Invalid Meshing Technique')
-            return {'FINISHED'}
+        # Record the inputs of the executed stages
+        mesh_stages.set_stages_executed(stages, nmv.interface.ui_options)
 
         # Mesh reconstructed
         reconstruction_time = time.time()
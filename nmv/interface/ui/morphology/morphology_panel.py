@@ -35,6 +35,7 @@ import nmv.skeleton
 import nmv.rendering
 import nmv.utilities
 from .morphology_panel_options import *
+from ..reconstruction_stages import *
 
 # Is the morphology reconstructed or not
 is_morphology_reconstructed = False
@@ -45,6 +46,56 @@ is_morphology_rendered = False
 # What is the selected morphology builder
 morphology_builder = None
 
+# The stages of the morphology reconstruction, only the stages whose inputs have changed since the
+# last reconstruction are executed again
+morphology_stages = create_reconstruction_stages(
+    geometry_inputs=get_skeleton_geometry_inputs, shading_prefix='morphology_')
+
+
+####################################################################################################
+# @create_morphology_builder
+####################################################################################################
+def create_morphology_builder():
+    """Creates a skeleton builder object for the selected reconstruction method.
+
+    :return:
+        A skeleton builder object.
+    """
+
+    # Create a skeleton builder object to build the morphology skeleton
+    method = nmv.interface.ui_options.morphology.reconstruction_method
+    if method == nmv.enums.Skeleton.Method.DISCONNECTED_SEGMENTS:
+        return nmv.builders.DisconnectedSegmentsBuilder(
+            morphology=nmv.interface.ui_morphology, options=nmv.interface.ui_options)
+
+    # Draw the morphology as a set of disconnected tubes, where each SECTION is a tube
+    elif method == nmv.enums.Skeleton.Method.DISCONNECTED_SECTIONS or \
+            method == nmv.enums.Skeleton.Method.ARTICULATED_SECTIONS:
+        return nmv.builders.DisconnectedSectionsBuilder(
+            morphology=nmv.interface.ui_morphology, options=nmv.interface.ui_options)
+
+    # Draw the morphology as a set of spheres, where each SPHERE represents a sample
+    elif method == nmv.enums.Skeleton.Method.SAMPLES:
+        return nmv.builders.SamplesBuilder(
+            morphology=nmv.interface.ui_morphology, options=nmv.interface.ui_options)
+
+    elif method == nmv.enums.Skeleton.Method.CONNECTED_SECTIONS:
+        return nmv.builders.ConnectedSectionsBuilder(
+            morphology=nmv.interface.ui_morphology, options=nmv.interface.ui_options)
+
+    elif method == nmv.enums.Skeleton.Method.PROGRESSIVE:
+        return nmv.builders.ProgressiveBuilder(
+            morphology=nmv.interface.ui_morphology, options=nmv.interface.ui_options)
+
+    elif method == nmv.enums.Skeleton.Method.DENDROGRAM:
+        return nmv.builders.DendrogramBuilder(
+            morphology=nmv.interface.ui_morphology, options=nmv.interface.ui_options)
+
+    # Default: DisconnectedSectionsBuilder
+    else:
+        return nmv.builders.DisconnectedSectionsBuilder(
+            morphology=nmv.interface.ui_morphology, options=nmv.interface.ui_options)
+
 
 ####################################################################################################
 # @MorphologyPanel
@@ -155,10 +206,7 @@ class ReconstructMorphologyOperator(bpy.types.Operator):
             'FINISHED'
         """
 
-        # Clear the scene
-        nmv.scene.ops.clear_scene()
-
-        # Load the morphology file
+        # Load the morphology file, if it is not loaded
         loading_result = nmv.interface.ui.load_morphology(self, context.scene)
 
         # If the result is None, report the issue
@@ -166,47 +214,36 @@ class ReconstructMorphologyOperator(bpy.types.Operator):
             self.report({'ERROR'}, 'Please select a valid morphology file')
             return {'FINISHED'}
 
-        # Start reconstruction
-        start_time = time.time()
-
+        # Execute all the stages for a new morphology, or if the skeleton has been deleted from
+        # the scene since it was drawn, for example by another panel
         global morphology_builder
+        if loading_result == 'NEW_MORPHOLOGY_LOADED' or morphology_builder is None or \
+                not nmv.scene.ops.are_objects_in_scene(morphology_builder.morphology_objects):
+            morphology_stages.invalidate()
 
-        # Create a skeleton builder object to build the morphology skeleton
-        method = nmv.interface.ui_options.morphology.reconstruction_method
-        if method == nmv.enums.Skeleton.Method.DISCONNECTED_SEGMENTS:
-            morphology_builder = nmv.builders.DisconnectedSegmentsBuilder(
-                morphology=nmv.interface.ui_morphology, options=nmv.interface.ui_options)
-
-        # Draw the morphology as a set of disconnected tubes, where each SECTION is a tube
-        elif method == nmv.enums.Skeleton.Method.DISCONNECTED_SECTIONS or \
-                method == nmv.enums.Skeleton.Method.ARTICULATED_SECTIONS:
-            morphology_builder = nmv.builders.DisconnectedSectionsBuilder(
-                morphology=nmv.interface.ui_morphology, options=nmv.interface.ui_options)
-
-        # Draw the morphology as a set of spheres, where each SPHERE represents a sample
-        elif method == nmv.enums.Skeleton.Method.SAMPLES:
-            morphology_builder = nmv.builders.SamplesBuilder(
-                morphology=nmv.interface.ui_morphology, options=nmv.interface.ui_options)
+        # Otherwise, only the stages whose inputs have changed
+        stages = morphology_stages.get_stages_to_execute(nmv.interface.ui_options)
 
-        elif method == nmv.enums.Skeleton.Method.CONNECTED_SECTIONS:
-            morphology_builder = nmv.builders.ConnectedSectionsBuilder(
-                morphology=nmv.interface.ui_morphology, options=nmv.interface.ui_options)
+        # Start reconstruction
+        start_time = time.time()
 
-        elif method == nmv.enums.Skeleton.Method.PROGRESSIVE:
-            morphology_builder = nmv.builders.ProgressiveBuilder(
-                morphology=nmv.interface.ui_morphology, options=nmv.interface.ui_options)
+        # If only the shading has changed, update the materials of the drawn skeleton
+        draw_skeleton = 'geometry' in stages
+        if not draw_skeleton and 'materials' in stages:
+            nmv.logger.info('Updating the materials of the reconstructed morphology')
+            draw_skeleton = not nmv.builders.morphology.update_skeleton_materials(
+                builder=morphology_builder)
 
-        elif method == nmv.enums.Skeleton.Method.DENDROGRAM:
-            morphology_builder = nmv.builders.DendrogramBuilder(
-                morphology=nmv.interface.ui_morphology, options=nmv.interface.ui_options)
+        # Otherwise, clear the scene and draw the skeleton again
+        if draw_skeleton:
+            nmv.scene.ops.clear_scene()
+            morphology_builder = create_morphology_builder()
 
-        # Default: DisconnectedSectionsBuilder
-        else:
-            morphology_builder = nmv.builders.DisconnectedSectionsBuilder(
-                morphology=nmv.interface.ui_morphology, options=nmv.interface.ui_options)
+            # Draw the morphology skeleton and return a list of all the reconstructed objects
+            nmv.interface.ui_reconstructed_skeleton = morphology_builder.draw_morphology_skeleton()
 
-        # Draw the morphology skeleton and return a list of all the reconstructed objects
-        nmv.interface.ui_reconstructed_skeleton = morphology_builder.draw_morphology_skeleton()
+        # Record the inputs of the executed stages
+        morphology_stages.set_stages_executed(stages, nmv.interface.ui_options)
 
         # Morphology reconstructed
         reconstruction_time = time.time()
@@ -233,6 +233,12 @@ def set_reconstruction_options(layout,
         resampling_step_row.prop(scene, 'NMV_MorphologyResamplingStep')
         options.morphology.resampling_step = scene.NMV_MorphologyResamplingStep
 
+    # Level of detail, to keep the viewport interactive with huge morphologies
+    lod_sample_budget_row = layout.row()
+    lod_sample_budget_row.label(text='Sample Budget:')
+    lod_sample_budget_row.prop(scene, 'NMV_MorphologyLODSampleBudget')
+    options.morphology.lod_sample_budget = scene.NMV_MorphologyLODSampleBudget
+
     if not scene.NMV_MorphologyReconstructionTechnique == nmv.enums.Skeleton.Method.DENDROGRAM:
 
         # Sections diameters option
@@ -314,6 +314,14 @@ bpy.types.Scene.NMV_MorphologyResamplingStep = bpy.props.FloatProperty(
     description='The resampling step in case the Fixed Step method is selected',
     default=1.0, min=0.05, max=10.0)
 
+# Level of detail sample budget
+bpy.types.Scene.NMV_MorphologyLODSampleBudget = bpy.props.IntProperty(
+    name='Samples',
+    description='The maximum number of samples drawn in the skeleton, the sections are simplified '
+                'with bounded position and radius errors to fit the budget. Zero draws all the '
+                'samples',
+    default=0, min=0, max=100000000)
+
 # Skeleton style
 bpy.types.Scene.SkeletonizationTechnique = bpy.props.EnumProperty(
     items=[(nmv.enums.Skeleton.Style.ORIGINAL,
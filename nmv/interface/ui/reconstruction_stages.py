@@ -0,0 +1,248 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import copy
+
+# Internal imports
+import nmv.interface
+
+
+####################################################################################################
+# @get_options_values
+####################################################################################################
+def get_options_values(options,
+                       prefix='',
+                       excluded_prefixes=()):
+    """Gets the values of the options in a given group of options, for example the morphology
+    options, to be used as the inputs of a reconstruction stage.
+
+    :param options:
+        A given group of options.
+    :param prefix:
+        Only the options whose names start with this prefix are returned.
+    :param excluded_prefixes:
+        A tuple of prefixes, the options whose names start with any of them are not returned.
+    :return:
+        A dictionary of the values of the options, keyed by their names.
+    """
+
+    # Return the dictionary
+    return {name: value for name, value in vars(options).items()
+            if name.startswith(prefix) and not name.startswith(excluded_prefixes)}
+
+
+####################################################################################################
+# @get_loading_inputs
+####################################################################################################
+def get_loading_inputs(options):
+    """Gets the inputs of the loading stage, i.e. the options that identify the loaded morphology,
+    and the revision of the loaded morphology to account for its in-place edits.
+
+    :param options:
+        The system options.
+    :return:
+        A dictionary of the inputs.
+    """
+
+    # Return the dictionary
+    return {'label': options.morphology.label,
+            'morphology_file_path': options.morphology.morphology_file_path,
+            'blue_config': options.morphology.blue_config,
+            'gid': options.morphology.gid,
+            'revision': None if nmv.interface.ui_morphology is None else
+            nmv.interface.ui_morphology.revision}
+
+
+####################################################################################################
+# @get_skeleton_geometry_inputs
+####################################################################################################
+def get_skeleton_geometry_inputs(options):
+    """Gets the inputs of the geometry stage of the morphology skeleton. The skeleton builders
+    pre-process the morphology, i.e. update the radii, resample and select the level of detail,
+    while drawing it, therefore the pre-processing options are inputs of the geometry stage.
+
+    :param options:
+        The system options.
+    :return:
+        A dictionary of the inputs.
+    """
+
+    # Return the dictionary
+    return {'morphology': get_options_values(options.morphology, excluded_prefixes=('export_',)),
+            'soma': get_options_values(options.soma, excluded_prefixes=('export_',)),
+            'frame_resolution': options.rendering.frame_resolution}
+
+
+####################################################################################################
+# @get_mesh_geometry_inputs
+####################################################################################################
+def get_mesh_geometry_inputs(options):
+    """Gets the inputs of the geometry stage of the neuron mesh, including the pre-processing
+    options of the morphology skeleton.
+
+    :param options:
+        The system options.
+    :return:
+        A dictionary of the inputs.
+    """
+
+    # Return the dictionary
+    return {'morphology': get_options_values(options.morphology, excluded_prefixes=('export_',)),
+            'soma': get_options_values(options.soma, excluded_prefixes=('export_',)),
+            'mesh': get_options_values(options.mesh, excluded_prefixes=('export_', 'nmv_'))}
+
+
+####################################################################################################
+# @ReconstructionStages
+####################################################################################################
+class ReconstructionStages:
+    """A dependency graph of the stages of a reconstruction in the GUI, for example
+    load -> geometry -> materials. A stage records the values of its inputs whenever it is executed,
+    and it must be executed again only if any of its inputs has changed since, or if any of the
+    stages it depends on must be executed again.
+    """
+
+    ################################################################################################
+    # @__init__
+    ################################################################################################
+    def __init__(self):
+        """Constructor
+        """
+
+        # The names of the stages in the order of their execution
+        self.stages = list()
+
+        # The names of the stages that each stage depends on
+        self.dependencies = dict()
+
+        # The functions that return the inputs of each stage from the system options
+        self.inputs = dict()
+
+        # The inputs of each stage when it was last executed
+        self.executed_inputs = dict()
+
+    ################################################################################################
+    # @add_stage
+    ################################################################################################
+    def add_stage(self,
+                  name,
+                  inputs,
+                  dependencies=()):
+        """Adds a stage to the graph. The stages it depends on must be added before it.
+
+        :param name:
+            The name of the stage.
+        :param inputs:
+            A function that takes the system options and returns a dictionary of the inputs of the
+            stage.
+        :param dependencies:
+            A list of the names of the stages that this stage depends on.
+        """
+
+        # Verify the dependencies
+        for dependency in dependencies:
+            if dependency not in self.stages:
+                raise ValueError('The stage [%s] depends on the unknown stage [%s]' %
+                                 (name, dependency))
+
+        # Add the stage
+        self.stages.append(name)
+        self.dependencies[name] = list(dependencies)
+        self.inputs[name] = inputs
+
+    ################################################################################################
+    # @get_stages_to_execute
+    ################################################################################################
+    def get_stages_to_execute(self,
+                              options):
+        """Gets the stages that must be executed to reconstruct with the given options.
+
+        :param options:
+            The system options.
+        :return:
+            A list of the names of the stages that must be executed, in their execution order.
+        """
+
+        # A stage is executed if it has never been executed, if its inputs have changed, or if any
+        # of its dependencies is executed
+        stages_to_execute = list()
+        for stage in self.stages:
+            if stage not in self.executed_inputs or \
+                    self.executed_inputs[stage] != self.inputs[stage](options) or \
+                    any(dependency in stages_to_execute for dependency in self.dependencies[stage]):
+                stages_to_execute.append(stage)
+
+        # Return the list
+        return stages_to_execute
+
+    ################################################################################################
+    # @set_stages_executed
+    ################################################################################################
+    def set_stages_executed(self,
+                            stages,
+                            options):
+        """Records the inputs of the given stages after they are executed with the given options.
+
+        :param stages:
+            A list of the names of the executed stages.
+        :param options:
+            The system options.
+        """
+
+        # Copy the inputs, the options are updated in place by the GUI
+        for stage in stages:
+            self.executed_inputs[stage] = copy.deepcopy(self.inputs[stage](options))
+
+    ################################################################################################
+    # @invalidate
+    ################################################################################################
+    def invalidate(self):
+        """Invalidates all the stages, for example if the scene is cleared, to execute them all
+        in the next reconstruction.
+        """
+
+        # Forget the inputs
+        self.executed_inputs.clear()
+
+
+####################################################################################################
+# @create_reconstruction_stages
+####################################################################################################
+def create_reconstruction_stages(geometry_inputs,
+                                 shading_prefix):
+    """Creates the stages of a reconstruction in the GUI: load -> geometry -> materials. The
+    rendering is executed separately by the rendering operators on the reconstructed objects.
+
+    :param geometry_inputs:
+        A function that returns the inputs of the geometry stage from the system options.
+    :param shading_prefix:
+        The prefix of the shading options that are used as the inputs of the materials stage,
+        for example 'morphology_' or 'mesh_'.
+    :return:
+        A ReconstructionStages object.
+    """
+
+    # The stages, each depends on the previous one
+    stages = ReconstructionStages()
+    stages.add_stage('load', inputs=get_loading_inputs)
+    stages.add_stage('geometry', inputs=geometry_inputs, dependencies=['load'])
+    stages.add_stage('materials', dependencies=['geometry'],
+                     inputs=lambda options: get_options_values(options.shading, shading_prefix))
+
+    # Return the stages
+    return stages
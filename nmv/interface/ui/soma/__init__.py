@@ -15,6 +15,9 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .soma_panel import *
-from .soma_panel_options import *
-from .soma_panel_ops import *
+# Import the modules on the first access to their names, see nmv.load_package_lazily
+import nmv
+nmv.load_package_lazily(__name__, globals(), [
+    '.soma_panel',
+    '.soma_panel_options',
+    '.soma_panel_ops'])
@@ -17,6 +17,7 @@
 
 # Blender modules
 import bpy
+import numpy
 
 # Internal modules
 import nmv.scene
@@ -295,3 +296,97 @@ def create_mesh_from_raw_data(verts,
 
     # Return a reference to the mesh
     return mesh
+
+
+####################################################################################################
+# @create_graph_mesh_object
+####################################################################################################
+def create_graph_mesh_object(vertices,
+                             edges,
+                             name='Graph'):
+    """Creates a mesh object that has only vertices and edges (a graph) from NumPy arrays and links
+    it to the scene.
+
+    The data is written in bulk with foreach_set, which avoids creating the graph vertex by vertex
+    with bmesh operators.
+
+    :param vertices:
+        A NumPy array of shape (N, 3) of the positions of the vertices.
+    :param edges:
+        A NumPy array of shape (M, 2) of the indices of the vertices of every edge.
+    :param name:
+        The name of the created object.
+    :return:
+        A reference to the created mesh object.
+    """
+
+    # Create a new mesh
+    mesh = bpy.data.meshes.new(name)
+
+    # Add the vertices
+    mesh.vertices.add(len(vertices))
+    mesh.vertices.foreach_set('co', vertices.ravel())
+
+    # Add the edges
+    mesh.edges.add(len(edges))
+    mesh.edges.foreach_set('vertices', edges.ravel())
+
+    # Validate the mesh
+    mesh.update()
+
+    # Create a blender object, link it to the scene
+    mesh_object = bpy.data.objects.new(name, mesh)
+    nmv.scene.link_object_to_scene(mesh_object)
+
+    # Return a reference to the mesh object
+    return mesh_object
+
+
+####################################################################################################
+# @create_mesh_object_from_arrays
+####################################################################################################
+def create_mesh_object_from_arrays(vertices,
+                                   faces,
+                                   name='Mesh'):
+    """Creates a mesh object from NumPy arrays of vertices and faces and links it to the scene.
+
+    All the faces must have the same number of vertices, for example triangles or quads. The data
+    is written in bulk with foreach_set.
+
+    :param vertices:
+        A NumPy array of shape (N, 3) of the positions of the vertices.
+    :param faces:
+        A NumPy array of shape (F, K) of the indices of the vertices of every face.
+    :param name:
+        The name of the created object.
+    :return:
+        A reference to the created mesh object.
+    """
+
+    # Create a new mesh
+    mesh = bpy.data.meshes.new(name)
+
+    # Add the vertices
+    mesh.vertices.add(len(vertices))
+    mesh.vertices.foreach_set('co', numpy.asarray(vertices, dtype=numpy.float32).ravel())
+
+    # Add the loops and the polygons
+    number_faces, face_size = faces.shape
+    mesh.loops.add(number_faces * face_size)
+    mesh.loops.foreach_set('vertex_index', numpy.asarray(faces, dtype=numpy.int32).ravel())
+    mesh.polygons.add(number_faces)
+    mesh.polygons.foreach_set(
+        'loop_start', numpy.arange(0, number_faces * face_size, face_size, dtype=numpy.int32))
+    mesh.polygons.foreach_set(
+        'loop_total', numpy.full(number_faces, face_size, dtype=numpy.int32))
+
+    # Compute the edges and validate the mesh
+    mesh.update(calc_edges=True)
+    mesh.validate()
+
+    # Create a blender object, link it to the scene
+    mesh_object = bpy.data.objects.new(name, mesh)
+    nmv.scene.link_object_to_scene(mesh_object)
+
+    # Return a reference to the mesh object
+    return mesh_object
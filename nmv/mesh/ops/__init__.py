@@ -15,6 +15,10 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .mesh_face_ops import *
-from .mesh_object_ops import *
-from .mesh_vertex_ops import *
\ No newline at end of file
+# Import the modules on the first access to their names, see nmv.load_package_lazily
+import nmv
+nmv.load_package_lazily(__name__, globals(), [
+    '.mesh_face_ops',
+    '.mesh_object_ops',
+    '.mesh_vertex_ops',
+    '.mesh_arrays_ops'])
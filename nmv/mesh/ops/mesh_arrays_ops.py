@@ -0,0 +1,363 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import numpy
+
+# Blender imports
+import bpy
+from mathutils import Matrix
+
+# Internal modules
+import nmv.geometry
+import nmv.scene
+import nmv.utilities
+
+
+####################################################################################################
+# @get_evaluated_mesh_data
+####################################################################################################
+def get_evaluated_mesh_data(mesh_object):
+    """Gets the mesh data of a given mesh object with its modifiers applied, as the export
+    operators do, without changing the object in the scene.
+
+    :param mesh_object:
+        A given mesh object.
+    :return:
+        A tuple (mesh data, release function). The release function must be called once the data
+        is consumed to free the temporary mesh, if any.
+    """
+
+    # Without modifiers, the data of the object is used directly
+    if len(mesh_object.modifiers) == 0:
+        return mesh_object.data, lambda: None
+
+    # Blender 2.8 and later evaluates the object in the dependency graph
+    if nmv.utilities.is_blender_280():
+        evaluated_object = mesh_object.evaluated_get(bpy.context.evaluated_depsgraph_get())
+        return evaluated_object.to_mesh(), evaluated_object.to_mesh_clear
+
+    # Blender 2.79 creates a temporary mesh data-block
+    mesh_data = mesh_object.to_mesh(bpy.context.scene, True, 'PREVIEW')
+    return mesh_data, lambda: bpy.data.meshes.remove(mesh_data)
+
+
+####################################################################################################
+# @triangulate_polygons
+####################################################################################################
+def triangulate_polygons(loops_vertices,
+                         loops_starts,
+                         loops_totals):
+    """Triangulates the polygons of a mesh as fans around their first vertices, in bulk.
+
+    :param loops_vertices:
+        A NumPy array of the indices of the vertices of all the loops of the mesh.
+    :param loops_starts:
+        A NumPy array of the index of the first loop of every polygon.
+    :param loops_totals:
+        A NumPy array of the number of the loops of every polygon.
+    :return:
+        A NumPy array of shape (T, 3) of the indices of the vertices of the triangles.
+    """
+
+    # Every polygon with N vertices gives N - 2 triangles
+    triangles_per_polygon = numpy.maximum(loops_totals - 2, 0)
+    polygons = numpy.repeat(numpy.arange(len(loops_starts)), triangles_per_polygon)
+
+    # The index of every triangle within its polygon
+    first_triangles = numpy.cumsum(triangles_per_polygon) - triangles_per_polygon
+    corners = numpy.arange(len(polygons)) - numpy.repeat(first_triangles, triangles_per_polygon)
+
+    # The loops of the triangles (first, k + 1, k + 2)
+    first_loops = loops_starts[polygons]
+    triangles_loops = numpy.stack(
+        (first_loops, first_loops + corners + 1, first_loops + corners + 2), axis=1)
+
+    return loops_vertices[triangles_loops]
+
+
+####################################################################################################
+# @get_mesh_object_arrays
+####################################################################################################
+def get_mesh_object_arrays(mesh_object):
+    """Gets the vertices, normals and triangles of a given mesh object at once, in the world
+    coordinates.
+
+    :param mesh_object:
+        A given mesh object.
+    :return:
+        A tuple (vertices, normals, triangles) of NumPy arrays of shapes (N, 3), (N, 3) and (T, 3).
+    """
+
+    mesh_data, release = get_evaluated_mesh_data(mesh_object)
+
+    try:
+
+        # Vertices and their normals
+        number_vertices = len(mesh_data.vertices)
+        vertices = numpy.zeros(number_vertices * 3, dtype=numpy.float32)
+        normals = numpy.zeros(number_vertices * 3, dtype=numpy.float32)
+        mesh_data.vertices.foreach_get('co', vertices)
+        mesh_data.vertices.foreach_get('normal', normals)
+
+        # Polygons
+        loops_vertices = numpy.zeros(len(mesh_data.loops), dtype=numpy.int64)
+        loops_starts = numpy.zeros(len(mesh_data.polygons), dtype=numpy.int64)
+        loops_totals = numpy.zeros(len(mesh_data.polygons), dtype=numpy.int64)
+        mesh_data.loops.foreach_get('vertex_index', loops_vertices)
+        mesh_data.polygons.foreach_get('loop_start', loops_starts)
+        mesh_data.polygons.foreach_get('loop_total', loops_totals)
+
+    finally:
+        release()
+
+    # Transform the vertices and the normals to the world coordinates
+    matrix = numpy.array(mesh_object.matrix_world, dtype=numpy.float64)
+    vertices = vertices.reshape(-1, 3) @ matrix[:3, :3].T + matrix[:3, 3]
+    normals = normals.reshape(-1, 3) @ numpy.linalg.inv(matrix[:3, :3])
+    lengths = numpy.linalg.norm(normals, axis=1)
+    normals /= numpy.where(lengths > 0.0, lengths, 1.0)[:, None]
+
+    triangles = triangulate_polygons(loops_vertices, loops_starts, loops_totals)
+    return vertices.astype(numpy.float32), normals.astype(numpy.float32), triangles
+
+
+####################################################################################################
+# @get_mesh_objects_arrays
+####################################################################################################
+def get_mesh_objects_arrays(mesh_objects):
+    """Gets the vertices, normals and triangles of a list of mesh objects joint together, without
+    duplicating or joining the objects in the scene. Objects that are not meshes are ignored.
+
+    :param mesh_objects:
+        A list of mesh objects.
+    :return:
+        A tuple (vertices, normals, triangles, partitions), where the first three are NumPy arrays
+        of shapes (N, 3), (N, 3) and (T, 3), and the partitions are a list of dictionaries with
+        the name, the first vertex, the number of vertices, the first triangle and the number of
+        triangles of every object.
+    """
+
+    vertices = list()
+    normals = list()
+    triangles = list()
+    partitions = list()
+    vertex_offset = 0
+    triangle_offset = 0
+    for mesh_object in mesh_objects:
+
+        if mesh_object.type != 'MESH':
+            nmv.logger.log('WARNING: [%s] is not a mesh and is not exported' % mesh_object.name)
+            continue
+
+        object_vertices, object_normals, object_triangles = get_mesh_object_arrays(mesh_object)
+        vertices.append(object_vertices)
+        normals.append(object_normals)
+        triangles.append(object_triangles + vertex_offset)
+        partitions.append({'name': mesh_object.name,
+                           'vertex_start': vertex_offset,
+                           'vertex_count': len(object_vertices),
+                           'triangle_start': triangle_offset,
+                           'triangle_count': len(object_triangles)})
+        vertex_offset += len(object_vertices)
+        triangle_offset += len(object_triangles)
+
+    if len(vertices) == 0:
+        return numpy.zeros((0, 3), dtype=numpy.float32), \
+               numpy.zeros((0, 3), dtype=numpy.float32), \
+               numpy.zeros((0, 3), dtype=numpy.int64), partitions
+
+    return numpy.concatenate(vertices), numpy.concatenate(normals), \
+        numpy.concatenate(triangles), partitions
+
+
+####################################################################################################
+# @create_mesh_object_from_arrays
+####################################################################################################
+def create_mesh_object_from_arrays(name,
+                                   vertices,
+                                   triangles,
+                                   smooth_shading=True):
+    """Creates a mesh object in the scene from arrays of vertices and triangles in bulk.
+
+    :param name:
+        The name of the mesh object.
+    :param vertices:
+        An array of shape (N, 3) of the positions of the vertices, a memory-mapped array can be
+        given directly.
+    :param triangles:
+        An array of shape (T, 3) of the indices of the vertices of the triangles.
+    :param smooth_shading:
+        Shade the faces smoothly.
+    :return:
+        A reference to the created mesh object.
+    """
+
+    # Blender reads the buffers directly if they have the expected types
+    vertices = numpy.ascontiguousarray(vertices, dtype=numpy.float32).reshape(-1)
+    triangles = numpy.ascontiguousarray(triangles, dtype=numpy.int32).reshape(-1)
+    number_triangles = len(triangles) // 3
+
+    # Create the mesh data
+    mesh_data = bpy.data.meshes.new(name)
+    mesh_data.vertices.add(len(vertices) // 3)
+    mesh_data.vertices.foreach_set('co', vertices)
+    mesh_data.loops.add(len(triangles))
+    mesh_data.loops.foreach_set('vertex_index', triangles)
+    mesh_data.polygons.add(number_triangles)
+    mesh_data.polygons.foreach_set(
+        'loop_start', numpy.arange(0, len(triangles), 3, dtype=numpy.int32))
+    mesh_data.polygons.foreach_set('loop_total', numpy.full(number_triangles, 3, dtype=numpy.int32))
+    mesh_data.polygons.foreach_set('use_smooth', numpy.full(number_triangles, smooth_shading,
+                                                            dtype=bool))
+    mesh_data.update(calc_edges=True)
+
+    # Create the object and link it to the scene
+    mesh_object = bpy.data.objects.new(name, mesh_data)
+    nmv.scene.link_object_to_scene(mesh_object)
+
+    return mesh_object
+
+
+####################################################################################################
+# @transform_mesh_object_vertices
+####################################################################################################
+def transform_mesh_object_vertices(mesh_object,
+                                   matrix):
+    """Bakes a 4x4 transformation matrix into the vertices of a mesh object in bulk.
+
+    :param mesh_object:
+        A given mesh object.
+    :param matrix:
+        A 4x4 transformation matrix.
+    """
+
+    vertices = numpy.zeros(len(mesh_object.data.vertices) * 3, dtype=numpy.float32)
+    mesh_object.data.vertices.foreach_get('co', vertices)
+    vertices = nmv.geometry.transform_points(vertices.reshape(-1, 3), matrix)
+    mesh_object.data.vertices.foreach_set('co', vertices.reshape(-1))
+    mesh_object.data.update()
+
+
+####################################################################################################
+# @transform_mesh_objects
+####################################################################################################
+def transform_mesh_objects(mesh_objects,
+                           matrix,
+                           bake=True):
+    """Applies a 4x4 transformation matrix to a list of mesh objects.
+
+    :param mesh_objects:
+        A list of mesh objects.
+    :param matrix:
+        A 4x4 transformation matrix.
+    :param bake:
+        If True, the vertices are transformed in the mesh data, otherwise only the matrices of the
+        objects are updated, which is instantaneous but keeps the data in the local coordinates.
+    """
+
+    # The mesh data shared between several objects is transformed once
+    transformed_data = set()
+    for mesh_object in mesh_objects:
+        if bake:
+            if mesh_object.data.name in transformed_data:
+                continue
+            transform_mesh_object_vertices(mesh_object, matrix)
+            transformed_data.add(mesh_object.data.name)
+        else:
+            mesh_object.matrix_world = Matrix(nmv.geometry.multiply_matrices(
+                matrix, mesh_object.matrix_world))
+
+
+####################################################################################################
+# @get_instanced_mesh_arrays
+####################################################################################################
+def get_instanced_mesh_arrays(template_vertices,
+                              template_triangles,
+                              positions,
+                              scales=1.0):
+    """Replicates a template mesh at many positions at once, for example to draw a cloud of
+    synapses as a single mesh instead of an object per synapse.
+
+    :param template_vertices:
+        An array of shape (V, 3) of the vertices of the template, centered at the origin.
+    :param template_triangles:
+        An array of shape (T, 3) of the triangles of the template.
+    :param positions:
+        An array of shape (N, 3) of the positions of the instances.
+    :param scales:
+        The scale of all the instances, or an array of N scales.
+    :return:
+        A tuple (vertices, triangles) of NumPy arrays of shapes (N * V, 3) and (N * T, 3), the
+        vertices and the triangles of every instance are contiguous.
+    """
+
+    template_vertices = numpy.asarray(template_vertices, dtype=numpy.float64).reshape(-1, 3)
+    template_triangles = numpy.asarray(template_triangles, dtype=numpy.int64).reshape(-1, 3)
+    positions = numpy.asarray(positions, dtype=numpy.float64).reshape(-1, 3)
+    scales = numpy.broadcast_to(numpy.asarray(scales, dtype=numpy.float64).reshape(-1),
+                                (len(positions),))
+
+    # Scale and translate the template for every instance
+    vertices = template_vertices[None, :, :] * scales[:, None, None] + positions[:, None, :]
+
+    # Offset the triangles of every instance by the vertices of the previous ones
+    offsets = numpy.arange(len(positions), dtype=numpy.int64) * len(template_vertices)
+    triangles = template_triangles[None, :, :] + offsets[:, None, None]
+
+    return vertices.reshape(-1, 3), triangles.reshape(-1, 3)
+
+
+####################################################################################################
+# @set_mesh_object_faces_colors
+####################################################################################################
+def set_mesh_object_faces_colors(mesh_object,
+                                 colors,
+                                 attribute_name='color'):
+    """Stores a color per face of a mesh object in a face-corner color attribute in bulk, so that
+    a single material can shade all the faces with their own colors.
+
+    :param mesh_object:
+        A given mesh object.
+    :param colors:
+        An array of shape (F, 3) or (F, 4) of the colors of the faces, in the range [0, 1].
+    :param attribute_name:
+        The name of the color attribute, to be read by the material.
+    :return:
+        The name of the color attribute.
+    """
+
+    mesh_data = mesh_object.data
+
+    # RGBA colors
+    colors = numpy.asarray(colors, dtype=numpy.float32).reshape(len(mesh_data.polygons), -1)
+    if colors.shape[1] == 3:
+        colors = numpy.hstack((colors, numpy.ones((len(colors), 1), dtype=numpy.float32)))
+
+    # Every corner of a face takes the color of the face
+    loops_totals = numpy.zeros(len(mesh_data.polygons), dtype=numpy.int64)
+    mesh_data.polygons.foreach_get('loop_total', loops_totals)
+    loops_colors = numpy.repeat(colors, loops_totals, axis=0)
+
+    # Blender 3.2 replaced the vertex colors with the color attributes
+    if hasattr(mesh_data, 'color_attributes'):
+        color_layer = mesh_data.color_attributes.new(attribute_name, 'BYTE_COLOR', 'CORNER')
+    else:
+        color_layer = mesh_data.vertex_colors.new(name=attribute_name)
+    color_layer.data.foreach_set('color', loops_colors.reshape(-1))
+
+    return attribute_name
@@ -17,6 +17,7 @@
 
 # Blender imports
 import bpy
+import numpy
 from mathutils import Vector, Matrix
 
 # Internal imports
@@ -305,6 +306,93 @@ def get_index_of_nearest_face_to_point_in_faces(mesh_object,
     return nearest_face_index
 
 
+####################################################################################################
+# @get_faces_centers
+####################################################################################################
+def get_faces_centers(mesh_object):
+    """Gets the centers of all the faces of a given mesh object at once.
+
+    :param mesh_object:
+        A given mesh object.
+    :return:
+        A NumPy array of shape (F, 3) of the centers of the faces.
+    """
+
+    faces_centers = numpy.zeros(len(mesh_object.data.polygons) * 3, dtype=numpy.float32)
+    mesh_object.data.polygons.foreach_get('center', faces_centers)
+    return faces_centers.reshape(-1, 3)
+
+
+####################################################################################################
+# @get_indices_of_nearest_faces_to_points
+####################################################################################################
+def get_indices_of_nearest_faces_to_points(faces_centers,
+                                           points,
+                                           chunk_size=4096):
+    """Gets the indices of the nearest faces to a list of points in a single batched query.
+
+    :param faces_centers:
+        A NumPy array of shape (F, 3) of the centers of the faces, see get_faces_centers.
+    :param points:
+        A list of points in the three-dimensional space.
+    :param chunk_size:
+        The number of faces processed at once to limit the memory of the distance matrix.
+    :return:
+        A NumPy array of the indices of the nearest face to every point.
+    """
+
+    points = numpy.asarray([tuple(point) for point in points], dtype=numpy.float64).reshape(-1, 3)
+    nearest_distances = numpy.full(len(points), numpy.inf)
+    nearest_indices = numpy.full(len(points), -1, dtype=numpy.int64)
+
+    # Process the faces chunk by chunk
+    for start in range(0, len(faces_centers), chunk_size):
+        chunk = faces_centers[start:start + chunk_size]
+        distances = ((points[:, None, :] - chunk[None, :, :]) ** 2).sum(axis=2)
+        chunk_indices = distances.argmin(axis=1)
+        chunk_distances = distances[numpy.arange(len(points)), chunk_indices]
+        closer = chunk_distances < nearest_distances
+        nearest_distances[closer] = chunk_distances[closer]
+        nearest_indices[closer] = chunk_indices[closer] + start
+
+    # Return the indices
+    return nearest_indices
+
+
+####################################################################################################
+# @get_indices_of_nearest_unique_faces_to_points
+####################################################################################################
+def get_indices_of_nearest_unique_faces_to_points(faces_centers,
+                                                  points):
+    """Gets the indices of the nearest faces to a list of points, where every face is given to a
+    single point. The faces are given greedily in the order of the points, i.e. every point gets
+    its nearest face that is not already taken by any of the points before it.
+
+    :param faces_centers:
+        A NumPy array of shape (F, 3) of the centers of the faces, see get_faces_centers.
+    :param points:
+        A list of points in the three-dimensional space.
+    :return:
+        A NumPy array of the indices of the nearest face to every point, or -1 if all the faces
+        are already taken.
+    """
+
+    taken_faces = numpy.zeros(len(faces_centers), dtype=bool)
+    nearest_indices = numpy.full(len(points), -1, dtype=numpy.int64)
+
+    # Give the faces to the points in order
+    for i, point in enumerate(points):
+        if taken_faces.all():
+            break
+        distances = ((faces_centers - numpy.asarray(tuple(point))) ** 2).sum(axis=1)
+        distances[taken_faces] = numpy.inf
+        nearest_indices[i] = distances.argmin()
+        taken_faces[nearest_indices[i]] = True
+
+    # Return the indices
+    return nearest_indices
+
+
 ####################################################################################################
 # @get_index_of_nearest_face_to_point
 ####################################################################################################
@@ -347,12 +347,8 @@ def transform_mesh(mesh_object,
         Transformation matrix.
     """
 
-    # Get all the vertices of the mesh object
-    vertices = mesh_object.data.vertices[:]
-
-    # Apply the transformation vertex by vertex
-    for vertex in vertices:
-        vertex.co = transformation_matrix * vertex.co
+    # Apply the transformation to all the vertices at once
+    nmv.mesh.transform_mesh_object_vertices(mesh_object, transformation_matrix)
 
 
 ####################################################################################################
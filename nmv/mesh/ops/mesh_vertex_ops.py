@@ -17,6 +17,7 @@
 
 # Blender imports
 import bpy
+import numpy
 from mathutils import Vector, Matrix
 
 # Internal modules
@@ -254,6 +255,75 @@ def select_vertices_within_extent(mesh_object,
             vertex.select = True
 
 
+####################################################################################################
+# @get_vertices_positions
+####################################################################################################
+def get_vertices_positions(mesh_object):
+    """Gets the positions of all the vertices of a given mesh object at once.
+
+    :param mesh_object:
+        A given mesh object.
+    :return:
+        A NumPy array of shape (N, 3) of the positions of the vertices.
+    """
+
+    positions = numpy.zeros(len(mesh_object.data.vertices) * 3, dtype=numpy.float32)
+    mesh_object.data.vertices.foreach_get('co', positions)
+    return positions.reshape(-1, 3)
+
+
+####################################################################################################
+# @get_indices_of_vertices_within_extents
+####################################################################################################
+def get_indices_of_vertices_within_extents(positions,
+                                           points,
+                                           radii):
+    """Gets the indices of the vertices within a list of spherical extents in a single pass.
+
+    :param positions:
+        A NumPy array of shape (N, 3) of the positions of the vertices.
+    :param points:
+        A list of the centers of the extents.
+    :param radii:
+        A list of the radii of the extents.
+    :return:
+        A list of NumPy arrays of the indices of the vertices within every extent.
+    """
+
+    points = numpy.asarray([tuple(point) for point in points], dtype=numpy.float64).reshape(-1, 3)
+    radii = numpy.asarray(radii, dtype=numpy.float64)
+
+    # Discard the vertices outside the bounding box of all the extents first
+    lower = (points - radii[:, None]).min(axis=0)
+    upper = (points + radii[:, None]).max(axis=0)
+    candidates = numpy.flatnonzero(((positions >= lower) & (positions <= upper)).all(axis=1))
+    candidates_positions = positions[candidates]
+
+    # Then test every extent against the candidates
+    return [candidates[((candidates_positions - point) ** 2).sum(axis=1) <= radius * radius]
+            for point, radius in zip(points, radii)]
+
+
+####################################################################################################
+# @select_vertices_by_indices
+####################################################################################################
+def select_vertices_by_indices(mesh_object,
+                               vertices_indices):
+    """Selects a group of vertices in a given mesh object using their indices in bulk. The
+    selection of the other vertices is not changed.
+
+    :param mesh_object:
+        A given mesh object.
+    :param vertices_indices:
+        A list of the indices of the vertices to be selected.
+    """
+
+    selection = numpy.zeros(len(mesh_object.data.vertices), dtype=bool)
+    mesh_object.data.vertices.foreach_get('select', selection)
+    selection[numpy.asarray(vertices_indices, dtype=numpy.int64)] = True
+    mesh_object.data.vertices.foreach_set('select', selection)
+
+
 ####################################################################################################
 # @get_vertices_in_object
 ####################################################################################################
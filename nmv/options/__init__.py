@@ -15,10 +15,13 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .io_options import *
-from .mesh_options import *
-from .morphology_options import *
-from .soma_options import *
-from .rendering_options import *
-from .shading_options import *
-from .neuromorphovis_options import *
+# Import the modules on the first access to their names, see nmv.load_package_lazily
+import nmv
+nmv.load_package_lazily(__name__, globals(), [
+    '.io_options',
+    '.mesh_options',
+    '.morphology_options',
+    '.soma_options',
+    '.rendering_options',
+    '.shading_options',
+    '.neuromorphovis_options'])
@@ -51,4 +51,10 @@ class IOOptions:
         # Statistics directory, where the stats. will be saved
         self.statistics_directory = None
 
+        # Profile the stages of the pipeline and write the reports into the statistics directory
+        self.profile = False
+
+        # The format of the profiling reports, 'json' or 'chrome-trace'
+        self.profile_format = 'json'
+
 
@@ -68,6 +68,15 @@ class MeshOptions:
         # The shape of the skeleton that is used in the union meshing algorithm
         self.skeleton_shape = nmv.enums.Meshing.UnionMeshing.QUAD_SKELETON
 
+        # The polygonizer of the meta objects, used in the meta-balls meshing algorithm
+        self.meta_polygonizer = nmv.enums.Meshing.MetaPolygonizer.BLENDER
+
+        # Use an adaptive resolution based on the local radius with the implicit polygonizer
+        self.meta_adaptive_resolution = False
+
+        # The number of the processes used by the implicit polygonizer
+        self.meta_polygonizer_processes = 1
+
         # SPINES OPTIONS ###########################################################################
         # The source where the spines will be loaded from, by default ignore the spines
         self.spines = nmv.enums.Meshing.Spines.Source.IGNORE
@@ -98,5 +107,14 @@ class MeshOptions:
         # Save the reconstructed mesh as a .blend file to the output directory
         self.export_blend = False
 
+        # Save the reconstructed mesh as an NMV binary mesh file to the output directory
+        self.export_nmv = False
+
+        # Quantize the vertices and the normals of the NMV binary meshes
+        self.nmv_quantize = False
+
+        # Compress the arrays of the NMV binary meshes
+        self.nmv_compress = False
+
         # Export individual objects of the neurons to separate meshes
         self.export_individuals = False
@@ -90,6 +90,12 @@ class MorphologyOptions:
         # Resampling step
         self.resampling_step = 1.0
 
+        # The maximum number of samples drawn in the skeleton, zero draws all the samples
+        self.lod_sample_budget = 0
+
+        # The maximum error of the drawn skeleton in pixels, zero draws all the samples
+        self.lod_screen_space_error = 0.0
+
         # The radii of the samples defined per section
         self.arbors_radii = nmv.enums.Skeleton.Radii.ORIGINAL
 
@@ -134,6 +140,9 @@ class MorphologyOptions:
         # Export the morphology to .swc file
         self.export_swc = False
 
+        # Export the morphology to .h5 file
+        self.export_h5 = False
+
         # Export the morphology skeleton to .blend file for rendering using tubes
         self.export_blend = False
 
@@ -101,6 +101,10 @@ class NeuroMorphoVisOptions:
         self.io.statistics_directory = '%s/%s' % (arguments.output_directory,
                                                   nmv.consts.Paths.STATS_FOLDER)
 
+        # Profiling
+        self.io.profile = arguments.profile
+        self.io.profile_format = arguments.profile_format
+
         ############################################################################################
         # Morphology options
         ############################################################################################
@@ -165,6 +169,10 @@ class NeuroMorphoVisOptions:
         # Bevel object sides used for the branches reconstruction
         self.morphology.bevel_object_sides = arguments.bevel_sides
 
+        # Level of detail of the skeleton
+        self.morphology.lod_sample_budget = arguments.lod_sample_budget
+        self.morphology.lod_screen_space_error = arguments.lod_screen_space_error
+
         # Sections radii
         self.morphology.arbors_radii = nmv.enums.Skeleton.Radii.get_enum(
             arguments.samples_radii)
@@ -200,6 +208,9 @@ class NeuroMorphoVisOptions:
         # Export the morphology to .swc file
         self.morphology.export_swc = arguments.export_morphology_swc
 
+        # Export the morphology to .h5 file
+        self.morphology.export_h5 = arguments.export_morphology_h5
+
         # Export the morphology skeleton to .blend file for rendering using tubes
         self.morphology.export_blend = arguments.export_morphology_blend
 
@@ -212,6 +223,12 @@ class NeuroMorphoVisOptions:
         # Subdivision level of the sphere
         self.soma.subdivision_level = arguments.soma_subdivision_level
 
+        # The simulator that deforms the soma sphere
+        self.soma.simulator = nmv.enums.Soma.Simulator.get_enum(arguments.soma_simulator)
+
+        # The convergence tolerance of the mass-spring simulator
+        self.soma.simulation_tolerance = arguments.soma_simulation_tolerance
+
         # Soma color
         self.soma.soma_color = nmv.utilities.parse_color_from_argument(arguments.soma_color)
 
@@ -284,6 +301,13 @@ class NeuroMorphoVisOptions:
         # Save the reconstructed mesh as a .BLEND file to the meshes directory
         self.mesh.export_blend = arguments.export_neuron_mesh_blend
 
+        # Save the reconstructed mesh as an NMV binary mesh file to the meshes directory
+        self.mesh.export_nmv = arguments.export_neuron_mesh_nmv
+
+        # Quantize and compress the NMV binary meshes
+        self.mesh.nmv_quantize = arguments.nmv_mesh_quantize
+        self.mesh.nmv_compress = arguments.nmv_mesh_compress
+
         # Export each part of the neuron as a separate mesh if possible
         self.mesh.export_individuals = arguments.export_individuals
 
@@ -294,6 +318,16 @@ class NeuroMorphoVisOptions:
         self.mesh.soma_connection = nmv.enums.Meshing.SomaConnection.CONNECTED if \
             arguments.connect_soma_arbors else nmv.enums.Meshing.SomaConnection.DISCONNECTED
 
+        # The polygonizer of the meta objects
+        self.mesh.meta_polygonizer = nmv.enums.Meshing.MetaPolygonizer.get_enum(
+            arguments.meta_polygonizer)
+
+        # Adaptive resolution for the implicit polygonizer
+        self.mesh.meta_adaptive_resolution = arguments.meta_adaptive_resolution
+
+        # Number of processes used by the implicit polygonizer
+        self.mesh.meta_polygonizer_processes = arguments.meta_polygonizer_processes
+
         ############################################################################################
         # Shading options
         ############################################################################################
@@ -381,4 +415,10 @@ class NeuroMorphoVisOptions:
 
         # The file format of the image
         self.rendering.image_format = nmv.enums.Image.Extension.get_enum(
-            arguments.image_file_format)
\ No newline at end of file
+            arguments.image_file_format)
+
+        # Number of processes used to render the sequences
+        self.rendering.sequence_processes = arguments.sequence_processes
+
+        # Resume the rendering of the sequences
+        self.rendering.resume_sequences = arguments.resume_sequences
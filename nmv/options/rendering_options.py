@@ -82,4 +82,10 @@ class RenderingOptions:
         # Image extension
         self.image_format = nmv.enums.Image.Extension.PNG
 
+        # Number of the Blender processes used to render the frames of the sequences
+        self.sequence_processes = 1
+
+        # Resume the rendering of the sequences from the missing frames
+        self.resume_sequences = False
+
 
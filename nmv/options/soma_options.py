@@ -56,6 +56,12 @@ class SomaOptions:
         # Simulation steps
         self.simulation_steps = nmv.consts.SoftBody.SIMULATION_STEPS_DEFAULT
 
+        # The simulator that deforms the soma sphere
+        self.simulator = nmv.enums.Soma.Simulator.BLENDER
+
+        # The convergence tolerance of the mass-spring simulator, relative to the soma radius
+        self.simulation_tolerance = nmv.consts.SoftBody.MASS_SPRING_TOLERANCE_DEFAULT
+
         # MESH EXPORT OPTIONS ######################################################################
         # Export soma mesh in .ply format
         self.export_ply = False
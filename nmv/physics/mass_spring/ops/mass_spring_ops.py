@@ -0,0 +1,482 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import numpy
+
+
+####################################################################################################
+# @create_ico_sphere_arrays
+####################################################################################################
+def create_ico_sphere_arrays(radius=1.0,
+                             subdivisions=1):
+    """Creates an ico-sphere as NumPy arrays, without Blender.
+
+    The subdivisions follow the convention of bmesh.ops.create_icosphere, where a single
+    subdivision corresponds to the icosahedron itself.
+
+    :param radius:
+        The radius of the sphere.
+    :param subdivisions:
+        The subdivision level of the sphere.
+    :return:
+        A tuple (vertices, triangles), where the vertices are an (N, 3) float array and the
+        triangles are an (M, 3) integer array with counter-clockwise (outward) winding.
+    """
+
+    # The icosahedron
+    t = (1.0 + 5.0 ** 0.5) / 2.0
+    vertices = numpy.array([[-1, t, 0], [1, t, 0], [-1, -t, 0], [1, -t, 0],
+                            [0, -1, t], [0, 1, t], [0, -1, -t], [0, 1, -t],
+                            [t, 0, -1], [t, 0, 1], [-t, 0, -1], [-t, 0, 1]], dtype=float)
+    triangles = numpy.array([[0, 11, 5], [0, 5, 1], [0, 1, 7], [0, 7, 10], [0, 10, 11],
+                             [1, 5, 9], [5, 11, 4], [11, 10, 2], [10, 7, 6], [7, 1, 8],
+                             [3, 9, 4], [3, 4, 2], [3, 2, 6], [3, 6, 8], [3, 8, 9],
+                             [4, 9, 5], [2, 4, 11], [6, 2, 10], [8, 6, 7], [9, 8, 1]])
+    vertices /= numpy.linalg.norm(vertices, axis=1)[:, None]
+
+    # Split every triangle into four, sharing the mid-points of the edges between the triangles
+    for i in range(max(subdivisions, 1) - 1):
+        edges = numpy.sort(triangles[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2), axis=1)
+        unique_edges, inverse = numpy.unique(edges, axis=0, return_inverse=True)
+        mid_points = vertices[unique_edges].mean(axis=1)
+        mid_points /= numpy.linalg.norm(mid_points, axis=1)[:, None]
+        mid_indices = (inverse.reshape(-1) + len(vertices)).reshape(-1, 3)
+        vertices = numpy.vstack((vertices, mid_points))
+        a, b, c = triangles[:, 0], triangles[:, 1], triangles[:, 2]
+        ab, bc, ca = mid_indices[:, 0], mid_indices[:, 1], mid_indices[:, 2]
+        triangles = numpy.vstack((numpy.column_stack((a, ab, ca)),
+                                  numpy.column_stack((b, bc, ab)),
+                                  numpy.column_stack((c, ca, bc)),
+                                  numpy.column_stack((ab, bc, ca))))
+
+    # Return the sphere
+    return vertices * radius, triangles
+
+
+####################################################################################################
+# @get_edges_from_triangles
+####################################################################################################
+def get_edges_from_triangles(triangles):
+    """Returns the unique edges of a triangular mesh, which are used as the springs.
+
+    :param triangles:
+        An (M, 3) integer array of triangles.
+    :return:
+        An (E, 2) integer array of the unique edges.
+    """
+
+    edges = numpy.sort(numpy.asarray(triangles)[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2), axis=1)
+    return numpy.unique(edges, axis=0)
+
+
+####################################################################################################
+# @get_extrusion_anchors
+####################################################################################################
+def get_extrusion_anchors(vertices,
+                          anchors,
+                          center,
+                          target,
+                          scale=1.0):
+    """Computes the goal positions of a group of anchored vertices that are pulled from a center
+    on the sphere to a target point, and scaled around it, exactly like a Blender hook that is
+    moved and then scaled.
+
+    :param vertices:
+        An (N, 3) array of the positions of the vertices of the sphere.
+    :param anchors:
+        The indices of the anchored vertices.
+    :param center:
+        The center of the anchored vertices, i.e. the extrusion face, on the sphere.
+    :param target:
+        The point where the center is pulled to, i.e. the initial sample of the arbor.
+    :param scale:
+        The scale of the anchored vertices around the target point.
+    :return:
+        An (K, 3) array of the goal positions of the anchored vertices.
+    """
+
+    center = numpy.asarray(center, dtype=float)
+    return numpy.asarray(target, dtype=float) + \
+        (numpy.asarray(vertices, dtype=float)[anchors] - center) * scale
+
+
+####################################################################################################
+# @concatenate_mass_spring_networks
+####################################################################################################
+def concatenate_mass_spring_networks(edges_list,
+                                     anchors_list,
+                                     numbers_vertices):
+    """Concatenates the springs and the anchors of a group of networks into a single network,
+    where the indices of every network are offset by the number of vertices of the networks
+    before it.
+
+    :param edges_list:
+        A list of the (E, 2) integer arrays of the springs of every network.
+    :param anchors_list:
+        A list of the (K, ) integer arrays of the anchored vertices of every network.
+    :param numbers_vertices:
+        A list of the number of vertices of every network.
+    :return:
+        A tuple (edges, anchors, offsets), where offsets is an array of the index of the first
+        vertex of every network.
+    """
+
+    offsets = numpy.concatenate([[0], numpy.cumsum(numbers_vertices)[:-1]]).astype(int)
+    edges = numpy.vstack([edges + offset for edges, offset in zip(edges_list, offsets)])
+    anchors = numpy.concatenate(
+        [anchors + offset for anchors, offset in zip(anchors_list, offsets)]).astype(int)
+    return edges, anchors, offsets
+
+
+####################################################################################################
+# @simulate_mass_spring_network
+####################################################################################################
+def simulate_mass_spring_network(vertices,
+                                 edges,
+                                 anchors,
+                                 targets,
+                                 stiffness=0.25,
+                                 goal=0.01,
+                                 damping=0.1,
+                                 ramp_steps=50,
+                                 tolerance=1e-4,
+                                 maximum_steps=1000):
+    """Deforms a spring network where a group of anchored vertices are pulled to their targets.
+
+    The anchored vertices are moved linearly to their targets within ramp_steps steps (the
+    equivalent of the hooks keyframes), and the rest of the vertices follow them through the
+    springs. Every step is a damped Verlet integration followed by a Jacobi relaxation of all the
+    springs towards their rest lengths, which is stable for any stiffness in [0, 1]. The
+    simulation terminates once the anchors reach their targets and the largest displacement of a
+    vertex in a single step, relative to the radius of the network around its centroid, falls
+    below the tolerance.
+
+    :param vertices:
+        An (N, 3) array of the initial positions of the vertices.
+    :param edges:
+        An (E, 2) integer array of the springs. The rest lengths are the initial lengths.
+    :param anchors:
+        A (K, ) integer array of the indices of the anchored vertices.
+    :param targets:
+        A (K, 3) array of the goal positions of the anchored vertices.
+    :param stiffness:
+        The stiffness of the springs, between 0 and 1.
+    :param goal:
+        The stiffness of the springs that pull the free vertices to their initial positions.
+    :param damping:
+        The velocity damping factor, between 0 and 1.
+    :param ramp_steps:
+        The number of steps required to move the anchors to their targets.
+    :param tolerance:
+        The convergence tolerance, relative to the scale of the network.
+    :param maximum_steps:
+        The maximum number of steps if the simulation does not converge.
+    :return:
+        A tuple (vertices, steps, converged) with the final positions of the vertices, the number
+        of steps of the simulation and a flag indicating if it has converged.
+    """
+
+    # A batch of a single network
+    vertices_list, steps, converged = simulate_mass_spring_networks(
+        [(vertices, edges, anchors, targets)], stiffness=stiffness, goal=goal, damping=damping,
+        ramp_steps=ramp_steps, tolerance=tolerance, maximum_steps=maximum_steps)
+
+    # Return the final positions
+    return vertices_list[0], steps, converged
+
+
+####################################################################################################
+# @simulate_mass_spring_networks
+####################################################################################################
+def simulate_mass_spring_networks(networks,
+                                  stiffness=0.25,
+                                  goal=0.01,
+                                  damping=0.1,
+                                  ramp_steps=50,
+                                  tolerance=1e-4,
+                                  maximum_steps=1000,
+                                  maximum_batch_vertices=4096):
+    """Simulates a batch of independent spring networks, e.g. the somata of a population, see
+    simulate_mass_spring_network for the simulation of every network.
+
+    The networks are simulated in groups of a bounded number of vertices. The networks of a group
+    that have not converged yet are concatenated into one network, so every step is a single set
+    of vectorized operations for all of them. The displacements of every network are normalized
+    by its own scale and every network stops at its own convergence, where it is taken out of its
+    group, therefore its result and its number of steps are the same as if it were simulated
+    alone.
+
+    Grouping only saves the fixed cost of the NumPy calls of every step, which dominates for small
+    networks, e.g. somata at subdivision levels 2 or 3. A large network, e.g. a soma at the
+    subdivision level 5, fills a group on its own, because the cost of a step grows with the
+    number of vertices and larger arrays do not fit in the cache, and it is simulated as fast as
+    with simulate_mass_spring_network.
+
+    :param networks:
+        A list of tuples (vertices, edges, anchors, targets), see simulate_mass_spring_network.
+    :param stiffness:
+        The stiffness of the springs, between 0 and 1.
+    :param goal:
+        The stiffness of the springs that pull the free vertices to their initial positions.
+    :param damping:
+        The velocity damping factor, between 0 and 1.
+    :param ramp_steps:
+        The number of steps required to move the anchors to their targets.
+    :param tolerance:
+        The convergence tolerance, relative to the scale of every network.
+    :param maximum_steps:
+        The maximum number of steps if the simulation does not converge.
+    :param maximum_batch_vertices:
+        The maximum number of vertices of a group of networks that are simulated together.
+    :return:
+        A tuple (vertices_list, steps, converged), with the final positions of the vertices of
+        every network, the number of steps of the slowest network and a flag indicating if all
+        the networks have converged.
+    """
+
+    if len(networks) == 0:
+        return list(), 0, True
+
+    # The initial positions, the springs, the anchors and the scale of every network
+    vertices_list, edges_list, anchors_list, targets_list, scales_list = [], [], [], [], []
+    for vertices, edges, anchors, targets in networks:
+        vertices = numpy.array(vertices, dtype=float).reshape(-1, 3)
+        vertices_list.append(vertices)
+        edges_list.append(numpy.asarray(edges, dtype=int).reshape(-1, 2))
+        anchors_list.append(numpy.asarray(anchors, dtype=int).reshape(-1))
+        targets_list.append(numpy.asarray(targets, dtype=float).reshape(-1, 3))
+        scale = numpy.linalg.norm(vertices - vertices.mean(axis=0), axis=1).max() \
+            if len(vertices) > 0 else 0.0
+        scales_list.append(max(scale, 1e-12))
+
+    # The current and the previous positions of every network, and the results
+    positions_list = [vertices.copy() for vertices in vertices_list]
+    previous_positions_list = [vertices.copy() for vertices in vertices_list]
+    networks_steps = [0] * len(networks)
+    networks_converged = [len(vertices) == 0 for vertices in vertices_list]
+
+    # Group the networks, the vertices of a group are bounded to keep the arrays in the cache
+    groups = list()
+    group_vertices = 0
+    for i, vertices in enumerate(vertices_list):
+        if len(vertices) == 0:
+            continue
+        if len(groups) == 0 or group_vertices + len(vertices) > maximum_batch_vertices:
+            groups.append(list())
+            group_vertices = 0
+        groups[-1].append(i)
+        group_vertices += len(vertices)
+
+    # Simulate the groups one after the other
+    ramp_steps = max(int(ramp_steps), 1)
+    for active in groups:
+        step = 0
+        while len(active) > 0:
+
+            # Concatenate the active networks
+            numbers_vertices = [len(vertices_list[i]) for i in active]
+            edges, anchors, offsets = concatenate_mass_spring_networks(
+                [edges_list[i] for i in active], [anchors_list[i] for i in active],
+                numbers_vertices)
+            origins = numpy.vstack([vertices_list[i] for i in active])
+            targets = numpy.vstack([targets_list[i] for i in active])
+            positions = numpy.vstack([positions_list[i] for i in active])
+            previous_positions = numpy.vstack([previous_positions_list[i] for i in active])
+            number_vertices = len(positions)
+            number_edges = len(edges)
+
+            # The rest lengths of the springs and the inverse number of springs per vertex
+            rest_lengths = numpy.linalg.norm(origins[edges[:, 0]] - origins[edges[:, 1]], axis=1)
+            degrees = numpy.bincount(edges.reshape(-1), minlength=number_vertices).astype(float)
+            degrees[degrees == 0] = 1.0
+            inverse_degrees = (1.0 / degrees)[:, None]
+
+            # The indices of the coordinates of the two ends of every spring, to scatter the
+            # corrections of all the springs in a single call
+            axes = numpy.arange(3)
+            scatter_indices = numpy.concatenate(
+                [edges[:, 0, None] * 3 + axes, edges[:, 1, None] * 3 + axes]).reshape(-1)
+            corrections = numpy.empty((2 * number_edges, 3))
+
+            # The squared inverse scales of the vertices to normalize their displacements
+            inverse_scales = numpy.repeat(
+                [1.0 / scales_list[i] ** 2 for i in active], numbers_vertices)
+
+            # The anchors are moved from their initial positions
+            anchors_origins = origins[anchors]
+
+            # Step until any of the active networks converges
+            converged = numpy.zeros(len(active), dtype=bool)
+            while step < maximum_steps:
+                step += 1
+                last_positions = positions.copy()
+
+                # Damped Verlet integration, the network is not subject to any external forces
+                positions += (positions - previous_positions) * (1.0 - damping)
+                previous_positions = last_positions
+
+                # Move the anchors towards their targets
+                ramp = min(1.0, step / ramp_steps)
+                anchors_positions = anchors_origins + (targets - anchors_origins) * ramp
+                positions[anchors] = anchors_positions
+
+                # Relax the springs towards their rest lengths
+                deltas = positions[edges[:, 1]] - positions[edges[:, 0]]
+                lengths = numpy.sqrt(numpy.einsum('ij,ij->i', deltas, deltas))
+                lengths[lengths == 0] = 1.0
+                numpy.multiply(deltas, (0.5 * stiffness * (1.0 - rest_lengths / lengths))[:, None],
+                               out=corrections[:number_edges])
+                numpy.negative(corrections[:number_edges], out=corrections[number_edges:])
+                positions += numpy.bincount(
+                    scatter_indices, corrections.reshape(-1),
+                    minlength=3 * number_vertices).reshape(-1, 3) * inverse_degrees
+
+                # Pull the free vertices towards their initial positions (goal springs)
+                positions += (origins - positions) * goal
+
+                # The anchors are not updated by the springs
+                positions[anchors] = anchors_positions
+
+                # Convergence, only after the anchors have reached their targets
+                if ramp >= 1.0:
+                    movements = positions - last_positions
+                    movements = numpy.einsum('ij,ij->i', movements, movements) * inverse_scales
+                    converged = numpy.maximum.reduceat(movements, offsets) < tolerance ** 2
+                    if converged.any():
+                        break
+
+            # Store the positions of the active networks, and take out the finished ones
+            positions_list_active = numpy.split(positions, offsets[1:])
+            previous_positions_list_active = numpy.split(previous_positions, offsets[1:])
+            remaining = list()
+            for k, i in enumerate(active):
+                positions_list[i] = positions_list_active[k]
+                previous_positions_list[i] = previous_positions_list_active[k]
+                if converged[k] or step >= maximum_steps:
+                    networks_steps[i] = step
+                    networks_converged[i] = bool(converged[k])
+                else:
+                    remaining.append(i)
+            active = remaining
+
+    # Return the final positions
+    return positions_list, max(networks_steps), all(networks_converged)
+
+
+####################################################################################################
+# @create_soma_mass_spring_network
+####################################################################################################
+def create_soma_mass_spring_network(soma_radius,
+                                    roots,
+                                    subdivisions=5,
+                                    extrusion_delta=0.0):
+    """Creates the spring network of a soma that is pulled towards the initial samples of its
+    arbors, without Blender.
+
+    For every root, the vertices of the sphere that are located within the projection of the
+    root sample on the sphere are anchored, moved to the root sample and scaled to its radius.
+
+    :param soma_radius:
+        The radius of the initial sphere.
+    :param roots:
+        A list of tuples (point, radius) of the initial samples of the arbors.
+    :param subdivisions:
+        The subdivision level of the sphere.
+    :param extrusion_delta:
+        An offset that keeps the anchored vertices behind the root samples.
+    :return:
+        A tuple (vertices, triangles, edges, anchors, targets).
+    """
+
+    vertices, triangles = create_ico_sphere_arrays(radius=soma_radius, subdivisions=subdivisions)
+    edges = get_edges_from_triangles(triangles)
+
+    anchors, targets = [], []
+    taken = numpy.zeros(len(vertices), dtype=bool)
+    for point, radius in roots:
+        point = numpy.asarray(point, dtype=float)
+        distance = numpy.linalg.norm(point)
+        if distance <= soma_radius:
+            continue
+        direction = point / distance
+
+        # The projection of the root on the sphere and its radius
+        center = direction * soma_radius
+        extrusion_radius = radius * soma_radius / distance
+
+        # The anchored vertices, at least the nearest vertex to the projection
+        distances = numpy.linalg.norm(vertices - center, axis=1)
+        indices = numpy.where((distances < extrusion_radius) & ~taken)[0]
+        if len(indices) == 0:
+            nearest = int(numpy.argmin(distances))
+            if taken[nearest]:
+                continue
+            indices = numpy.array([nearest])
+        taken[indices] = True
+
+        target = point - direction * extrusion_delta
+        anchors.append(indices)
+        targets.append(get_extrusion_anchors(
+            vertices, indices, vertices[indices].mean(axis=0), target,
+            scale=distance / soma_radius))
+
+    if len(anchors) == 0:
+        return vertices, triangles, edges, numpy.zeros(0, dtype=int), numpy.zeros((0, 3))
+    return vertices, triangles, edges, numpy.concatenate(anchors), numpy.vstack(targets)
+
+
+####################################################################################################
+# @create_somata_mass_spring_meshes
+####################################################################################################
+def create_somata_mass_spring_meshes(somata,
+                                     subdivisions=5,
+                                     stiffness=0.25,
+                                     tolerance=1e-4,
+                                     maximum_steps=1000,
+                                     extrusion_delta=0.0):
+    """Reconstructs the meshes of a batch of somata with a batch mass-spring simulation, see
+    simulate_mass_spring_networks, without Blender.
+
+    :param somata:
+        A list of tuples (soma_radius, roots), where the roots are a list of tuples
+        (point, radius) of the initial samples of the arbors relative to the soma center.
+    :param subdivisions:
+        The subdivision level of the initial spheres.
+    :param stiffness:
+        The stiffness of the springs, between 0 and 1.
+    :param tolerance:
+        The convergence tolerance, relative to the radius of every soma.
+    :param maximum_steps:
+        The maximum number of steps if the simulation does not converge.
+    :param extrusion_delta:
+        An offset that keeps the anchored vertices behind the root samples.
+    :return:
+        A list of tuples (vertices, triangles), one for every soma.
+    """
+
+    networks, triangles_list = [], []
+    for soma_radius, roots in somata:
+        vertices, triangles, edges, anchors, targets = create_soma_mass_spring_network(
+            soma_radius, roots, subdivisions=subdivisions, extrusion_delta=extrusion_delta)
+        networks.append((vertices, edges, anchors, targets))
+        triangles_list.append(triangles)
+
+    vertices_list, steps, converged = simulate_mass_spring_networks(
+        networks, stiffness=stiffness, tolerance=tolerance, maximum_steps=maximum_steps)
+
+    return list(zip(vertices_list, triangles_list))
@@ -172,7 +172,8 @@ class Camera:
 
         # Render the image and ignore Blender verbosity
         nmv.utilities.disable_std_output()
-        bpy.ops.render.render(write_still=True)
+        with nmv.profiler.span('render_frame', 'rendering'):
+            bpy.ops.render.render(write_still=True)
         nmv.utilities.enable_std_output()
 
     ################################################################################################
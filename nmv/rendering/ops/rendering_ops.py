@@ -21,6 +21,9 @@ from mathutils import Vector
 
 # Internal imports
 import nmv.bbox
+import nmv.enums
+import nmv.file
+import nmv.rendering
 import nmv.scene
 import nmv.camera
 
@@ -96,7 +99,8 @@ def render_scene_at_resolution(file_name='image',
     bpy.data.scenes['Scene'].render.filepath = '%s.png' % file_name
 
     # Render the image
-    bpy.ops.render.render(write_still=True)
+    with nmv.profiler.span('render_frame', 'rendering'):
+        bpy.ops.render.render(write_still=True)
 
 
 ####################################################################################################
@@ -170,7 +174,8 @@ def render_scene_to_scale(file_name='image',
     bpy.data.scenes['Scene'].render.filepath = '%s.png' % file_name
 
     # Render the image
-    bpy.ops.render.render(write_still=True)
+    with nmv.profiler.span('render_frame', 'rendering'):
+        bpy.ops.render.render(write_still=True)
 
 
 
@@ -285,33 +290,17 @@ def render_full_view_360(objects_list,
     nmv.scene.ops.deselect_all()
 
     # Compute the 360 bounding box
-    bounding_box_360 = bounding_box.compute_360_bounding_box(view_bounding_box, soma_center)
-
-    # Create scene camera
-    camera = camera_ops.create_camera(
-        view_bounding_box=bounding_box_360, image_base_resolution=image_base_resolution)
+    bounding_box_360 = nmv.bbox.compute_360_bounding_box(view_bounding_box, soma_center)
 
     # Create a directory where the sequence frames will be generated
     frames_directory = '%s/%s_360' % (sequence_output_directory, sequence_name)
-    file_ops.clean_and_create_directory(frames_directory)
-
-    # 360
-    for i in range(0, 360):
-
-        # Rotate each object in the skeleton object around the y axis
-        for scene_object in objects_list:
-
-            # Rotate the soma object around the y axis
-            scene_object.rotation_euler[1] = i * 2 * 3.14 / 360.0
-
-        # Set the frame name
-        frame_name = '%s/%s' % (frames_directory, '{0:05d}'.format(i))
+    nmv.file.ops.clean_and_create_directory(frames_directory)
 
-        # Render the image to film
-        camera_ops.render_scene_to_image(camera, frame_name)
-
-    # Delete the camera and any accompanying objects such as light
-    nmv.scene.ops.delete_list_objects([camera])
+    # Render the 360 sequence in a single animation job
+    nmv.rendering.render_360(scene_objects=objects_list,
+                             bounding_box=bounding_box_360,
+                             output_directory=frames_directory,
+                             image_resolution=image_base_resolution)
 
 
 ####################################################################################################
@@ -379,33 +368,22 @@ def render_close_up_360(scene_object,
     p_max = Vector((close_up_dimension, close_up_dimension, close_up_dimension))
 
     # Create a symmetric bounding box that fits certain unified bounds for all the somas.
-    unified_scale_bounding_box = bounding_box.BoundingBox(p_min=p_min, p_max=p_max)
+    unified_scale_bounding_box = nmv.bbox.BoundingBox(p_min=p_min, p_max=p_max)
 
     # Deselect all the object in the scene
     nmv.scene.ops.deselect_all()
 
-    # Create scene camera
-    camera = camera_ops.create_camera(view_bounding_box=unified_scale_bounding_box,
-        image_base_resolution=frame_base_resolution)
-
     # Create a directory where the sequence frames will be generated
     frames_directory = '%s/%s_close_up_360' % (sequence_output_directory, sequence_name)
-    file_ops.clean_and_create_directory(frames_directory)
+    nmv.file.ops.clean_and_create_directory(frames_directory)
 
-    # 360
-    for i in range(0, 360):
-
-        # Rotate the soma object around the y axis
-        scene_object.rotation_euler[1] = i * 3.14 / 360.0
-
-        # Set the frame name
-        frame_name = '%s/%s_%s' % (frames_directory, 'frame', '{0:05d}'.format(i))
-
-        # Render the image to film
-        camera_ops.render_scene_to_image(camera, frame_name)
-
-    # Delete the camera and any accompanying objects such as light
-    nmv.scene.ops.delete_list_objects([camera])
+    # Render the sequence in a single animation job, the object is rotated by 3.14 / 360 per frame
+    nmv.rendering.render_360(scene_objects=[scene_object],
+                             bounding_box=unified_scale_bounding_box,
+                             output_directory=frames_directory,
+                             image_resolution=frame_base_resolution,
+                             image_prefix='frame_',
+                             rotation=3.14)
 
 
 ####################################################################################################
@@ -608,41 +586,19 @@ def render_soma_close_up_360(soma_object,
     p_max = Vector((close_up_dimension, close_up_dimension, close_up_dimension))
 
     # Create a symmetric bounding box that fits certain unified bounds for all the somas.
-    unified_scale_bounding_box = bounding_box.BoundingBox(p_min=p_min, p_max=p_max)
+    unified_scale_bounding_box = nmv.bbox.BoundingBox(p_min=p_min, p_max=p_max)
 
     # Deselect all the object in the scene
     nmv.scene.ops.deselect_all()
 
-    # Set camera location and target based on the selected view to render the images
-    center = unified_scale_bounding_box.center
-    camera_z = unified_scale_bounding_box.p_max[2] + unified_scale_bounding_box.bounds[2]
-    camera_location_z = Vector((center.x, center.y, camera_z))
-
-    # Add a camera along the z-axis
-    camera = camera_ops.add_camera(location=camera_location_z)
-
-    # Rotate the camera
-    camera_ops.rotate_camera_for_front_view(camera=camera)
-
-    # Update the camera resolution. This must be the same for all the view, because we have a
-    # unified bounding box
-    camera_ops.set_camera_resolution(
-        camera, film_base_resolution, bounds=unified_scale_bounding_box.bounds)
-
-    # 360
-    for i in range(0, 360):
-
-        # Set the frame name
-        frame_name = '%s/%s_%d' % (sequence_output_directory, file_name, i)
-
-        # Rotate the soma object around the y axis
-        soma_object.rotation_euler[1] = i * 3.14 / 360.0
-
-        # Render the image to film
-        camera_ops.render_scene_to_image(camera, frame_name)
-
-    # Delete the camera and any accompanying objects such as light
-    nmv.scene.ops.delete_list_objects([camera])
+    # Render the sequence in a single animation job, the soma is rotated by 3.14 / 360 per frame
+    nmv.rendering.render_360(scene_objects=[soma_object],
+                             bounding_box=unified_scale_bounding_box,
+                             output_directory=sequence_output_directory,
+                             camera_view=nmv.enums.Camera.View.FRONT,
+                             image_resolution=film_base_resolution,
+                             image_prefix='%s_' % file_name,
+                             rotation=3.14)
 
 
 
@@ -15,7 +15,11 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .renderer import *
-from .soma_renderer import *
-from .skeleton_renderer import *
-from .mesh_renderer import *
+# Import the modules on the first access to their names, see nmv.load_package_lazily
+import nmv
+nmv.load_package_lazily(__name__, globals(), [
+    '.renderer',
+    '.soma_renderer',
+    '.skeleton_renderer',
+    '.mesh_renderer',
+    '.sequence_renderer'])
@@ -0,0 +1,374 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import os
+import subprocess
+
+# Blender imports
+import bpy
+
+# Internal imports
+import nmv.consts
+import nmv.enums
+import nmv.rendering
+import nmv.scene
+import nmv.utilities
+
+
+####################################################################################################
+# @get_sequence_frame_ranges
+####################################################################################################
+def get_sequence_frame_ranges(frame_start,
+                              frame_end,
+                              processes=1):
+    """Splits the frames of a sequence into contiguous ranges, one range per process.
+
+    :param frame_start:
+        The first frame of the sequence.
+    :param frame_end:
+        The last frame of the sequence, inclusive.
+    :param processes:
+        The number of processes.
+    :return:
+        A list of [start, end] ranges, where the end is inclusive.
+    """
+
+    number_frames = frame_end - frame_start + 1
+    processes = max(1, min(processes, number_frames))
+    ranges = list()
+    for i in range(processes):
+        start = frame_start + (number_frames * i) // processes
+        end = frame_start + (number_frames * (i + 1)) // processes - 1
+        ranges.append([start, end])
+    return ranges
+
+
+####################################################################################################
+# @get_missing_sequence_frames
+####################################################################################################
+def get_missing_sequence_frames(output_directory,
+                                frame_start,
+                                frame_end,
+                                image_prefix=''):
+    """Gets the frames of a sequence that are not rendered yet, to be able to resume the rendering
+    of a sequence that was partially rendered.
+
+    NOTE: The frames are named with the Blender convention, i.e. the prefix followed by the frame
+    number padded to five digits and the extension of the image format.
+
+    :param output_directory:
+        The directory where the frames of the sequence are rendered.
+    :param frame_start:
+        The first frame of the sequence.
+    :param frame_end:
+        The last frame of the sequence, inclusive.
+    :param image_prefix:
+        The prefix of the frames.
+    :return:
+        A list of the indices of the missing frames.
+    """
+
+    # The names of the rendered frames, without extensions. Empty files are placeholders of
+    # frames that were not completed
+    rendered_frames = set()
+    if os.path.exists(output_directory):
+        for file_name in os.listdir(output_directory):
+            if os.path.getsize('%s/%s' % (output_directory, file_name)) > 0:
+                rendered_frames.add(os.path.splitext(file_name)[0])
+
+    return [i for i in range(frame_start, frame_end + 1)
+            if '%s%s' % (image_prefix, '{0:05d}'.format(i)) not in rendered_frames]
+
+
+####################################################################################################
+# @remove_sequence_placeholders
+####################################################################################################
+def remove_sequence_placeholders(output_directory,
+                                 frames,
+                                 image_prefix=''):
+    """Removes the empty placeholders of the given frames of a sequence. Blender does not
+    overwrite the existing files when a sequence is resumed, including the placeholders of the
+    frames that were interrupted, therefore they must be removed to render these frames again.
+
+    :param output_directory:
+        The directory where the frames of the sequence are rendered.
+    :param frames:
+        A list of the indices of the frames.
+    :param image_prefix:
+        The prefix of the frames.
+    """
+
+    # The names of the frames, without extensions
+    frames_names = set('%s%s' % (image_prefix, '{0:05d}'.format(i)) for i in frames)
+
+    # Remove the empty files of these frames
+    for file_name in os.listdir(output_directory):
+        file_path = '%s/%s' % (output_directory, file_name)
+        if os.path.splitext(file_name)[0] in frames_names and os.path.getsize(file_path) == 0:
+            os.remove(file_path)
+
+
+####################################################################################################
+# @keyframe_rotation_360
+####################################################################################################
+def keyframe_rotation_360(scene_objects,
+                          number_frames=360,
+                          rotation=2 * 3.14):
+    """Rotates the given objects around the y-axis with a linear animation, where the object is
+    rotated by rotation * i / number_frames at frame i, exactly as the 360 loops.
+
+    :param scene_objects:
+        A list of the objects to be rotated.
+    :param number_frames:
+        The number of frames of a full rotation.
+    :param rotation:
+        The rotation angle at the end of the sequence, in radians.
+    """
+
+    for scene_object in scene_objects:
+
+        # Keyframe the two ends of the rotation
+        scene_object.rotation_euler[1] = 0.0
+        scene_object.keyframe_insert(data_path='rotation_euler', index=1, frame=0)
+        scene_object.rotation_euler[1] = rotation
+        scene_object.keyframe_insert(data_path='rotation_euler', index=1, frame=number_frames)
+
+        # Linear interpolation, to have a constant angular step
+        for f_curve in scene_object.animation_data.action.fcurves:
+            for keyframe in f_curve.keyframe_points:
+                keyframe.interpolation = 'LINEAR'
+
+
+####################################################################################################
+# @clear_rotation_keyframes
+####################################################################################################
+def clear_rotation_keyframes(scene_objects):
+    """Removes the animation of the given objects and resets their rotation.
+
+    :param scene_objects:
+        A list of the animated objects.
+    """
+
+    for scene_object in scene_objects:
+        scene_object.animation_data_clear()
+        scene_object.rotation_euler[1] = 0.0
+
+
+####################################################################################################
+# @setup_sequence_camera
+####################################################################################################
+def setup_sequence_camera(bounding_box,
+                          camera_view=nmv.enums.Camera.View.FRONT,
+                          image_resolution=nmv.consts.Image.DEFAULT_RESOLUTION,
+                          image_scale_factor=None):
+    """Creates an orthographic camera that is used to render all the frames of a sequence and sets
+    it as the active camera of the scene.
+
+    :param bounding_box:
+        The bounding box of the view.
+    :param camera_view:
+        The view of the camera, by default FRONT.
+    :param image_resolution:
+        The resolution of the frames, used if the scale factor is not given.
+    :param image_scale_factor:
+        If given, the frames are rendered to scale with this factor.
+    :return:
+        A reference to the created camera.
+    """
+
+    camera = nmv.rendering.Camera('SequenceCamera_%s' % camera_view)
+    camera.setup_camera_for_scene(bounding_box=bounding_box, camera_view=camera_view)
+    if image_scale_factor is None:
+        camera.update_camera_resolution(
+            resolution=image_resolution, camera_view=camera_view, bounds=bounding_box.bounds)
+    else:
+        camera.update_camera_resolution_to_scale(
+            scale_factor=image_scale_factor, camera_view=camera_view, bounds=bounding_box.bounds)
+    camera.camera.data.type = 'ORTHO'
+    camera.set_active()
+
+    # Deselect all the object in the scene
+    nmv.scene.ops.deselect_all()
+
+    # Return a reference to the camera
+    return camera
+
+
+####################################################################################################
+# @render_sequence
+####################################################################################################
+def render_sequence(output_directory,
+                    frame_start,
+                    frame_end,
+                    image_prefix='',
+                    image_format=nmv.enums.Image.Extension.PNG,
+                    processes=1,
+                    resume=False):
+    """Renders the frames of the current scene animation with the active camera in a single
+    animation job, instead of rendering every frame with a separate still render.
+
+    If more than a single process is requested, the scene is saved to a temporary .blend file and
+    the frames are split into contiguous ranges, each rendered by a background Blender instance.
+    A RuntimeError is raised if any of these instances fails.
+
+    :param output_directory:
+        The directory where the frames will be rendered.
+    :param frame_start:
+        The first frame of the sequence.
+    :param frame_end:
+        The last frame of the sequence, inclusive.
+    :param image_prefix:
+        The prefix of the frames.
+    :param image_format:
+        The format of the frames.
+    :param processes:
+        The number of the Blender processes used to render the sequence.
+    :param resume:
+        If set, the frames that already exist in the output directory are not rendered again.
+    """
+
+    # If all the frames are already rendered, then return
+    if resume:
+        missing_frames = get_missing_sequence_frames(
+            output_directory, frame_start, frame_end, image_prefix)
+        if len(missing_frames) == 0:
+            return
+        frame_start, frame_end = missing_frames[0], missing_frames[-1]
+
+        # The interrupted frames left empty placeholders that would be skipped otherwise
+        remove_sequence_placeholders(output_directory, missing_frames, image_prefix)
+
+    # Sequence settings
+    scene = bpy.context.scene
+    scene.frame_start = frame_start
+    scene.frame_end = frame_end
+    scene.render.image_settings.file_format = image_format
+    # The frame number is padded to five digits, see get_missing_sequence_frames()
+    scene.render.filepath = '%s/%s#####' % (os.path.abspath(output_directory), image_prefix)
+    scene.render.use_file_extension = True
+
+    # Existing frames are skipped, and every frame gets a placeholder while it is rendered
+    scene.render.use_overwrite = not resume
+    scene.render.use_placeholder = True
+
+    # Transparent background
+    nmv.scene.set_transparent_background()
+
+    # A single animation job
+    if processes <= 1:
+        nmv.utilities.disable_std_output()
+        try:
+            with nmv.profiler.span('render_sequence', 'rendering'):
+                bpy.ops.render.render(animation=True)
+        finally:
+            nmv.utilities.enable_std_output()
+        return
+
+    # Save the scene to be loaded by the other processes
+    blend_file = '%s/.sequence.blend' % os.path.abspath(output_directory)
+    bpy.ops.wm.save_as_mainfile(filepath=blend_file, copy=True)
+
+    # Render every range in a separate process, the CPU time of the workers is not profiled
+    failed_ranges = list()
+    try:
+        with nmv.profiler.span('render_sequence', 'rendering') as span:
+            workers = list()
+            for start, end in get_sequence_frame_ranges(frame_start, frame_end, processes):
+                workers.append(((start, end), subprocess.Popen(
+                    [bpy.app.binary_path, '-b', blend_file, '-s', str(start), '-e', str(end),
+                     '-a'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)))
+            for frames_range, worker in workers:
+                if worker.wait() != 0:
+                    nmv.logger.log('ERROR: Rendering the frames [%d - %d] failed with code [%d]' %
+                                   (frames_range[0], frames_range[1], worker.returncode))
+                    failed_ranges.append(frames_range)
+            span.add_count('processes', len(workers))
+
+    # Clean
+    finally:
+        os.remove(blend_file)
+
+    # Report the failed ranges, the sequence can be resumed to render their missing frames
+    if len(failed_ranges) > 0:
+        raise RuntimeError('Failed to render the frames %s of the sequence in [%s]' %
+                           (failed_ranges, output_directory))
+
+
+####################################################################################################
+# @render_360
+####################################################################################################
+def render_360(scene_objects,
+               bounding_box,
+               output_directory,
+               camera_view=nmv.enums.Camera.View.FRONT_360,
+               image_resolution=nmv.consts.Image.DEFAULT_RESOLUTION,
+               image_scale_factor=None,
+               image_prefix='',
+               image_format=nmv.enums.Image.Extension.PNG,
+               number_frames=360,
+               rotation=2 * 3.14,
+               processes=1,
+               resume=False):
+    """Renders a 360 sequence of the given objects as a keyframed rotation in a single animation
+    job, with a single camera.
+
+    :param scene_objects:
+        A list of all the objects that will be rotated.
+    :param bounding_box:
+        The bounding box of the view, i.e. the 360 bounding box of the objects.
+    :param output_directory:
+        The directory where the frames will be rendered.
+    :param camera_view:
+        The view of the camera, by default FRONT_360.
+    :param image_resolution:
+        The resolution of the frames, used if the scale factor is not given.
+    :param image_scale_factor:
+        If given, the frames are rendered to scale with this factor.
+    :param image_prefix:
+        The prefix of the frames.
+    :param image_format:
+        The format of the frames.
+    :param number_frames:
+        The number of the frames of the sequence.
+    :param rotation:
+        The rotation angle of the objects at the end of the sequence, in radians.
+    :param processes:
+        The number of the Blender processes used to render the sequence.
+    :param resume:
+        If set, the frames that already exist in the output directory are not rendered again.
+    """
+
+    # Create the camera once for the whole sequence
+    camera = setup_sequence_camera(bounding_box=bounding_box,
+                                   camera_view=camera_view,
+                                   image_resolution=image_resolution,
+                                   image_scale_factor=image_scale_factor)
+
+    # Animate the objects and render all the frames
+    keyframe_rotation_360(scene_objects, number_frames=number_frames, rotation=rotation)
+    render_sequence(output_directory=output_directory,
+                    frame_start=0,
+                    frame_end=number_frames - 1,
+                    image_prefix=image_prefix,
+                    image_format=image_format,
+                    processes=processes,
+                    resume=resume)
+
+    # Restore the objects and delete the camera
+    clear_rotation_keyframes(scene_objects)
+    nmv.scene.ops.delete_object_in_scene(camera.camera)
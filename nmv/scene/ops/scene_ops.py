@@ -1181,6 +1181,33 @@ def is_object_in_scene_by_name(object_name):
     return False
 
 
+####################################################################################################
+# @are_objects_in_scene
+####################################################################################################
+def are_objects_in_scene(scene_objects):
+    """Verify if all the given objects still exist in the scene, i.e. they have not been deleted
+    since they were created, for example by clearing the scene.
+
+    :param scene_objects:
+        A list of objects to be checked if they exist in the scene or not.
+    :return:
+        True or False.
+    """
+
+    # Loop over all the given objects, and check by reference
+    for scene_object in scene_objects:
+
+        # The reference to a deleted object becomes invalid
+        try:
+            if bpy.context.scene.objects.get(scene_object.name) != scene_object:
+                return False
+        except ReferenceError:
+            return False
+
+    # Yes, they all exist
+    return True
+
+
 ####################################################################################################
 # @view_all_scene
 ####################################################################################################
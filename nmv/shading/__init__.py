@@ -16,5 +16,8 @@
 # MA 02110-1301 USA.
 ####################################################################################################
 
-from .illumination import *
-from .materials import *
+# Import the modules on the first access to their names, see nmv.load_package_lazily
+import nmv
+nmv.load_package_lazily(__name__, globals(), [
+    '.illumination',
+    '.materials'])
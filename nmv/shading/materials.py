@@ -771,6 +771,54 @@ def create_glossy_bumpy_material(name,
     return material_reference
 
 
+####################################################################################################
+# @create_color_attribute_material
+####################################################################################################
+def create_color_attribute_material(name,
+                                    attribute_name='color'):
+    """Creates a flat shader that reads the colors of the faces from a color attribute of the mesh,
+    so that a single material shades many objects that were joined into one mesh.
+
+    :param name:
+        Material name
+    :param attribute_name:
+        The name of the color attribute, see nmv.mesh.set_mesh_object_faces_colors.
+    :return:
+        A reference to the material.
+    """
+
+    # Get active scene
+    current_scene = bpy.context.scene
+
+    # Switch the rendering engine to cycles to be able to create the material
+    current_scene.render.engine = 'CYCLES'
+
+    # Create a new material with nodes
+    material_reference = bpy.data.materials.new(str(name))
+    material_reference.use_nodes = True
+    nodes = material_reference.node_tree.nodes
+    links = material_reference.node_tree.links
+    nodes.clear()
+
+    # The color attribute is emitted as is, to shade the faces flatly
+    attribute_node = nodes.new('ShaderNodeAttribute')
+    attribute_node.attribute_name = attribute_name
+    emission_node = nodes.new('ShaderNodeEmission')
+    output_node = nodes.new('ShaderNodeOutputMaterial')
+    links.new(attribute_node.outputs['Color'], emission_node.inputs['Color'])
+    links.new(emission_node.outputs['Emission'], output_node.inputs['Surface'])
+
+    # Use the color attribute in the view port as well
+    if nmv.utilities.is_blender_280():
+        current_scene.display.shading.color_type = 'VERTEX'
+
+    # Switch the view port shading
+    nmv.scene.switch_scene_shading('MATERIAL')
+
+    # Return a reference to the material
+    return material_reference
+
+
 ####################################################################################################
 # @create_material
 ####################################################################################################
@@ -870,6 +918,65 @@ def set_material_to_object(mesh_object,
     mesh_object.data.materials.append(material_reference)
 
 
+####################################################################################################
+# @get_materials_indices
+####################################################################################################
+def get_materials_indices(scene_objects,
+                          materials):
+    """Gets the indices of the materials assigned to the given objects in a list of materials, to
+    be able to assign the corresponding materials of another list to the same objects later.
+
+    :param scene_objects:
+        A list of objects, for example the arbors of a skeleton.
+    :param materials:
+        A list of all the materials that can be assigned to the objects.
+    :return:
+        A list of the indices of the materials of each object, or None if any of the objects has a
+        material that is not in the given list.
+    """
+
+    # A list of the indices of the materials of each object
+    materials_indices = list()
+    for scene_object in scene_objects:
+
+        # Objects without materials, for example the bevel objects
+        object_materials = getattr(scene_object.data, 'materials', list())
+
+        # The index of each material of the object
+        object_materials_indices = list()
+        for material in object_materials:
+            if material not in materials:
+                return None
+            object_materials_indices.append(materials.index(material))
+        materials_indices.append(object_materials_indices)
+
+    # Return the list
+    return materials_indices
+
+
+####################################################################################################
+# @set_materials_from_indices
+####################################################################################################
+def set_materials_from_indices(scene_objects,
+                               materials_indices,
+                               materials):
+    """Assigns the materials of a list to the given objects at the indices returned by
+    get_materials_indices().
+
+    :param scene_objects:
+        A list of objects, for example the arbors of a skeleton.
+    :param materials_indices:
+        A list of the indices of the materials of each object.
+    :param materials:
+        A list of the materials to be assigned to the objects.
+    """
+
+    # Replace the materials of each object, keeping their order
+    for scene_object, object_materials_indices in zip(scene_objects, materials_indices):
+        for i, material_index in enumerate(object_materials_indices):
+            scene_object.data.materials[i] = materials[material_index]
+
+
 ####################################################################################################
 # @adjust_material_uv
 ####################################################################################################
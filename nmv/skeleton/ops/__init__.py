@@ -15,19 +15,23 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .skeleton_analysis_ops import *
-from .skeleton_branching_ops import *
-from .skeleton_coloring_ops import *
-from .skeleton_connection_ops import *
-from .skeleton_construction_ops import *
-from .skeleton_dendrogram_ops import *
-from .skeleton_drawing_ops import *
-from .skeleton_geometry_ops import *
-from .skeleton_intersection_ops import *
-from .skeleton_polylines_ops import *
-from .skeleton_repair_ops import *
-from .skeleton_resampling_ops import *
-from .skeleton_generic_ops import *
-from .skeleton_style_ops import *
-from .skeleton_verification_ops import *
-from .skeleton_soma_ops import *
+# Import the modules on the first access to their names, see nmv.load_package_lazily
+import nmv
+nmv.load_package_lazily(__name__, globals(), [
+    '.skeleton_analysis_ops',
+    '.skeleton_branching_ops',
+    '.skeleton_coloring_ops',
+    '.skeleton_connection_ops',
+    '.skeleton_construction_ops',
+    '.skeleton_dendrogram_ops',
+    '.skeleton_drawing_ops',
+    '.skeleton_geometry_ops',
+    '.skeleton_intersection_ops',
+    '.skeleton_lod_ops',
+    '.skeleton_polylines_ops',
+    '.skeleton_repair_ops',
+    '.skeleton_resampling_ops',
+    '.skeleton_generic_ops',
+    '.skeleton_style_ops',
+    '.skeleton_verification_ops',
+    '.skeleton_soma_ops'])
@@ -36,29 +36,8 @@ def compute_section_volume_from_segments(section):
         Section total volume in cube microns.
     """
 
-    # Section volume
-    section_volume = 0.0
-
-    # If the section has less than two samples, then report the error
-    if len(section.samples) < 2:
-
-        # Return 0
-        return section_volume
-
-    # Integrate the volume between each two successive samples
-    for i in range(len(section.samples) - 1):
-
-        # Retrieve the data of the samples along each segment on the section
-        p0 = section.samples[i].point
-        p1 = section.samples[i + 1].point
-        r0 = section.samples[i].radius
-        r1 = section.samples[i + 1].radius
-
-        # Compute the segment volume and append to the total section volume
-        section_volume += (1.0 / 3.0) * math.pi * (p0 - p1).lenght * (r0 * r0 + r0 * r1 + r1 * r1)
-
-    # Return the section volume
-    return section_volume
+    # Get the volume from the cached geometry of the section
+    return section.get_geometry().volume
 
 
 ####################################################################################################
@@ -75,35 +54,8 @@ def compute_section_surface_area_from_segments(section):
         Section total surface area in square microns.
     """
 
-    # Section surface area
-    section_surface_area = 0.0
-
-    # If the section has less than two samples, then report the error
-    if len(section.samples) < 2:
-
-        # Return 0
-        return section_surface_area
-
-    # Integrate the surface area between each two successive samples
-    for i in range(len(section.samples) - 1):
-
-        # Retrieve the data of the samples along each segment on the section
-        p0 = section.samples[i].point
-        p1 = section.samples[i + 1].point
-        r0 = section.samples[i].radius
-        r1 = section.samples[i + 1].radius
-
-        # Compute the segment lateral area
-        segment_length = (p0 - p1).length
-        r_sum = r0 + r1
-        r_diff = r0 - r1
-        segment_lateral_area = math.pi * r_sum * math.sqrt((r_diff * r_diff) + segment_length)
-
-        # Compute the segment surface area and append it to the total section surface area
-        section_surface_area += segment_lateral_area + math.pi * ((r0 * r0 ) + (r1 * r1))
-
-    # Return the section surface area
-    return section_surface_area
+    # Get the surface area from the cached geometry of the section
+    return section.get_geometry().surface_area
 
 
 ####################################################################################################
@@ -112,6 +64,7 @@ def compute_section_surface_area_from_segments(section):
 def compute_section_length(section):
     """
     Computes the length of a given section.
+
     NOTE: This function returns a meaningful value for the roots sections, ONLY when the negative
     samples are removed from the branch, otherwise, the contribution of the negative samples
     will be integrated. The negative samples are those located closer to the origin of the soma
@@ -123,27 +76,28 @@ def compute_section_length(section):
         Section total length in microns.
     """
 
-    # Section length
-    section_length = 0.0
-
-    # If the section has less than two samples, then report the error
-    if len(section.samples) < 2:
-
-        # Return 0
-        return section_length
+    # Get the length from the cached geometry of the section
+    return section.get_geometry().length
 
-    # Integrate the distance between each two successive samples
-    for i in range(len(section.samples) - 1):
 
-        # Retrieve the points along each segment on the section
-        point_0 = section.samples[i].point
-        point_1 = section.samples[i + 1].point
+####################################################################################################
+# @compute_section_length_until_sample
+####################################################################################################
+def compute_section_length_until_sample(section,
+                                        sample_index):
+    """
+    Computes the length along a given section from its first sample till a given sample.
 
-        # Update the section length
-        section_length += (point_1 - point_0).length
+    :param section:
+        A given section.
+    :param sample_index:
+        The index of the sample along the section.
+    :return:
+        The length along the section till the given sample in microns.
+    """
 
-    # Return the section length
-    return section_length
+    # Get the arc length from the cached geometry of the section
+    return float(section.get_geometry().cumulative_lengths[sample_index])
 
 
 ####################################################################################################
@@ -160,20 +114,8 @@ def compute_average_section_radius(section):
         The average radius of the section.
     """
 
-    # Average section radius
-    average_section_radius = 0.0
-
-    # Sum the radii of all the sample
-    for sample in section.samples:
-
-        # Add the radius
-        average_section_radius += sample.radius
-
-    # Get the average
-    average_section_radius /= len(section.samples)
-
-    # Return the average section radius
-    return average_section_radius
+    # Get the average radius from the cached geometry of the section
+    return section.get_geometry().average_radius
 
 
 ####################################################################################################
@@ -189,17 +131,8 @@ def compute_max_section_radius(section):
         The max radius of the section.
     """
 
-    # Average section radius
-    max_section_radius = 0.0
-
-    # Sum the radii of all the sample
-    for sample in section.samples:
-
-        if sample.radius > max_section_radius:
-            max_section_radius = sample.radius
-
-    # Return the max section radius
-    return max_section_radius
+    # Get the max radius from the cached geometry of the section
+    return section.get_geometry().maximum_radius
 
 
 ####################################################################################################
@@ -215,17 +148,8 @@ def compute_min_section_radius(section):
         The min radius of the section.
     """
 
-    # Average section radius
-    min_section_radius =10000000
-
-    # Sum the radii of all the sample
-    for sample in section.samples:
-
-        if sample.radius < min_section_radius:
-            min_section_radius = sample.radius
-
-    # Return the min section radius
-    return min_section_radius
+    # Get the min radius from the cached geometry of the section
+    return section.get_geometry().minimum_radius
 
 
 ####################################################################################################
@@ -157,6 +157,7 @@ def label_primary_and_secondary_sections_based_on_radii(section):
             # Set the radius of a secondary child to half of the primary branch, for clean branching
             if len (child.samples) > 0:
                 child.samples[0].radius = greatest_radius * 0.5
+                child.invalidate_geometry()
 
             # Append the secondary child to the children list that has the new order
             children_list_with_updated_order.append(child)
@@ -265,6 +266,7 @@ def label_primary_and_secondary_sections_based_on_angles(section):
 
             # Set the radius of the primary child to the greatest
             child.samples[0].radius = greatest_radius
+            child.invalidate_geometry()
 
         # Otherwise, set it to secondary
         else:
@@ -277,6 +279,7 @@ def label_primary_and_secondary_sections_based_on_angles(section):
 
             # Set the radius of a secondary child to half of the primary branch
             child.samples[0].radius = greatest_radius * 0.25
+            child.invalidate_geometry()
 
     # Update the children list in the section
     section.children = children_list_with_updated_order
@@ -285,6 +288,7 @@ def label_primary_and_secondary_sections_based_on_angles(section):
     # match that of the first sample of the primary branch
     if section.samples[-1].radius < greatest_radius:
         section.samples[-1].radius = greatest_radius
+        section.invalidate_geometry()
 
 
 ####################################################################################################
@@ -394,6 +398,7 @@ def label_primary_and_secondary_sections_based_on_angles_with_fixed_radii(sectio
 
             # Set the radius of the primary child to the greatest
             child.samples[0].radius = smallest_radius
+            child.invalidate_geometry()
 
         # Otherwise, set it to secondary
         else:
@@ -406,6 +411,7 @@ def label_primary_and_secondary_sections_based_on_angles_with_fixed_radii(sectio
 
             # Set the radius of a secondary child to half of the primary branch
             child.samples[0].radius = smallest_radius
+            child.invalidate_geometry()
 
     # Update the children list in the section
     section.children = children_list_with_updated_order
@@ -413,6 +419,7 @@ def label_primary_and_secondary_sections_based_on_angles_with_fixed_radii(sectio
     # Update the radius of the last sample of the section according to the @greatest_radius to
     # match that of the first sample of the primary branch
     section.samples[-1].radius = smallest_radius
+    section.invalidate_geometry()
 
 
 ####################################################################################################
@@ -538,6 +545,9 @@ def connect_single_child(section):
             # Append the sample to the parent samples
             section.samples.append(sample)
 
+        # Invalidate the cached geometry of the section
+        section.invalidate_geometry()
+
         # Update the morphology skeleton
         section.children = section.children[0].children
 
@@ -627,18 +637,33 @@ def connect_arbor_to_soft_body_soma(soma_mesh,
     branch_direction = arbor.samples[0].point.normalized()
     intersection_point = branch_starting_point - 0.75 * branch_direction
 
-    # Get the nearest face on the mesh surface to the intersection point
-    soma_mesh_face_index = nmv.mesh.ops.get_index_of_nearest_face_to_point(
-        soma_mesh, intersection_point)
+    # Use the cached soma face, if a unique face was resolved before for all the arbors
+    if arbor.soma_face_vertices is not None:
 
-    # Deselect all the objects in the scene
-    nmv.scene.ops.deselect_all()
+        # Deselect all the vertices, then select the cached face vertices
+        nmv.mesh.ops.deselect_all_vertices(soma_mesh)
+        nmv.mesh.ops.select_vertices_by_indices(soma_mesh, arbor.soma_face_vertices)
+
+        # Deselect all the objects in the scene
+        nmv.scene.ops.deselect_all()
+
+        # Select the soma object
+        nmv.scene.ops.select_object(soma_mesh)
+
+    else:
+
+        # Get the nearest face on the mesh surface to the intersection point
+        soma_mesh_face_index = nmv.mesh.ops.get_index_of_nearest_face_to_point(
+            soma_mesh, intersection_point)
+
+        # Deselect all the objects in the scene
+        nmv.scene.ops.deselect_all()
 
-    # Select the soma object
-    nmv.scene.ops.select_object(soma_mesh)
+        # Select the soma object
+        nmv.scene.ops.select_object(soma_mesh)
 
-    # Select the face using its obtained index
-    nmv.mesh.ops.select_face_vertices(soma_mesh, soma_mesh_face_index)
+        # Select the face using its obtained index
+        nmv.mesh.ops.select_face_vertices(soma_mesh, soma_mesh_face_index)
 
     # Select the section mesh
     nmv.scene.ops.select_object(arbor.mesh)
@@ -650,8 +675,8 @@ def connect_arbor_to_soft_body_soma(soma_mesh,
     # section_face_index = nmv.mesh.ops.get_index_of_nearest_face_to_point(
     # arbor.mesh, intersection_point)
 
-    section_face_index = nmv.mesh.ops.get_index_of_nearest_face_to_point(
-        arbor.mesh, branch_starting_point)
+    section_face_index = nmv.mesh.ops.get_indices_of_nearest_faces_to_points(
+        nmv.mesh.ops.get_faces_centers(arbor.mesh), [branch_starting_point])[0]
 
     # Select the face
     nmv.mesh.ops.select_face_vertices(arbor.mesh, section_face_index)
@@ -15,12 +15,174 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
+# Internal imports
+import nmv.skeleton
+
+
+####################################################################################################
+# @get_morphology_arbors
+####################################################################################################
+def get_morphology_arbors(morphology):
+    """Returns a list of the root sections of all the arbors of a given morphology, the apical
+    dendrites first, then the basal dendrites and finally the axons.
+
+    :param morphology:
+        A given morphology.
+    :return:
+        A list of the root sections of the arbors.
+    """
+
+    arbors = list()
+
+    # Apical dendrites
+    if morphology.has_apical_dendrites():
+        arbors.extend(morphology.apical_dendrites)
+
+    # Basal dendrites
+    if morphology.has_basal_dendrites():
+        arbors.extend(morphology.basal_dendrites)
+
+    # Axons
+    if morphology.has_axons():
+        arbors.extend(morphology.axons)
+
+    # Return the arbors
+    return arbors
+
+
+####################################################################################################
+# @iterate_arbor_sections
+####################################################################################################
+def iterate_arbor_sections(arbor):
+    """Yields the sections of a given arbor in pre-order without recursion.
+
+    The children of each section are read only after the section has been yielded, therefore, an
+    operation that is applied to the yielded section may update its children, exactly like the
+    recursive traversal.
+
+    :param arbor:
+        The root section of the arbor.
+    """
+
+    # Walk the arbor with an explicit stack
+    stack = [arbor] if arbor is not None else list()
+    while stack:
+        section = stack.pop()
+        yield section
+
+        # Push the children in reverse order to visit them in their order
+        if section.children is not None:
+            stack.extend(reversed(section.children))
+
+
+####################################################################################################
+# @compute_arbor_traversal
+####################################################################################################
+def compute_arbor_traversal(arbor,
+                            breadth_first=False):
+    """Computes a flat ordering of the sections of a given arbor, with their depths, branching
+    orders and parent indices.
+
+    :param arbor:
+        The root section of the arbor.
+    :param breadth_first:
+        If set, the sections are listed in breadth-first order, otherwise in pre-order.
+    :return:
+        An ArborTraversal of the arbor.
+    """
+
+    return nmv.skeleton.ArborTraversal([arbor], breadth_first=breadth_first)
+
+
+####################################################################################################
+# @compute_morphology_traversal
+####################################################################################################
+def compute_morphology_traversal(morphology,
+                                 breadth_first=False):
+    """Computes a flat ordering of the sections of all the arbors of a given morphology, with their
+    depths, branching orders, parent indices and arbor indices.
+
+    :param morphology:
+        A given morphology.
+    :param breadth_first:
+        If set, the sections are listed in breadth-first order, otherwise in pre-order.
+    :return:
+        An ArborTraversal of all the arbors, the arbor indices refer to the list returned by
+        @get_morphology_arbors.
+    """
+
+    return nmv.skeleton.ArborTraversal(get_morphology_arbors(morphology),
+                                       breadth_first=breadth_first)
+
+
+####################################################################################################
+# @apply_batch_operation_to_arbor
+####################################################################################################
+def apply_batch_operation_to_arbor(arbor,
+                                   operation,
+                                   *args,
+                                   breadth_first=False):
+    """Applies a batch operation to all the sections of a given arbor at once.
+
+    Unlike the per-section operations of @apply_operation_to_arbor, the operation is called only
+    once with the ArborTraversal of the arbor, followed by the given arguments.
+
+    :param arbor:
+        The root section of the arbor.
+    :param operation:
+        The batch operation.
+    :param args:
+        The arguments that will be passed to the operation after the traversal.
+    :param breadth_first:
+        If set, the sections are listed in breadth-first order, otherwise in pre-order.
+    :return:
+        The result of the operation.
+    """
+
+    return operation(compute_arbor_traversal(arbor, breadth_first=breadth_first), *args)
+
+
+####################################################################################################
+# @apply_batch_operation_to_morphology
+####################################################################################################
+def apply_batch_operation_to_morphology(morphology,
+                                        operation,
+                                        *args,
+                                        breadth_first=False):
+    """Applies a batch operation to all the sections of all the arbors of a given morphology at
+    once.
+
+    The operation is called only once with the ArborTraversal of the morphology, followed by the
+    given arguments.
+
+    :param morphology:
+        A given morphology.
+    :param operation:
+        The batch operation.
+    :param args:
+        The arguments that will be passed to the operation after the traversal.
+    :param breadth_first:
+        If set, the sections are listed in breadth-first order, otherwise in pre-order.
+    :return:
+        The result of the operation.
+    """
+
+    # Apply the operation
+    result = operation(compute_morphology_traversal(morphology, breadth_first=breadth_first),
+                       *args)
+
+    # The operation may have modified the geometry of the morphology
+    morphology.invalidate_bounding_box()
+
+    # Return the result of the operation
+    return result
+
 
 ####################################################################################################
 # @apply_operation_to_arbor
 ####################################################################################################
 def apply_operation_to_arbor(*args):
-    """Apply a given function/filter/operation to a given arbor recursively.
+    """Apply a given function/filter/operation to all the sections of a given arbor in pre-order.
 
     :param args:
         Arguments list, where the first argument is always the root section of the arbor and the
@@ -40,40 +202,27 @@ def apply_operation_to_arbor(*args):
     # The operation is the second argument
     operation = args[1]
 
-    # Construct the root section arguments list, add the section and ignore the operation
-    section_args = [section]
-    for i in range(2, len(args)):
-        section_args.append(args[i])
-
-    # Apply the operation/filter to the first section of the arbor
-    operation(*section_args)
-
-    # Ensure that the section has valid children
-    if section.children is not None:
-
-        # Apply the operation/filter to the children of the arbors
-        for child in section.children:
+    # The rest of the arguments are passed to the operation after the section
+    operation_args = args[2:]
 
-            # Construct the child section arguments list, add the child and add the operation
-            section_args = [child]
-            for i in range(1, len(args)):
-                section_args.append(args[i])
-
-            # Validate the rest of the skeleton of the arbor
-            apply_operation_to_arbor(*section_args)
+    # Apply the operation/filter to every section of the arbor
+    for arbor_section in iterate_arbor_sections(section):
+        operation(arbor_section, *operation_args)
 
 
 ####################################################################################################
 # @apply_operation_to_arbor_conditionally
 ####################################################################################################
 def apply_operation_to_arbor_conditionally(*args):
-    """Apply a given function/filter/operation to a given arbor recursively if the branching order
-    of this arbor is less than the max order requested by the user.
+    """Apply a given function/filter/operation to all the sections of a given arbor in pre-order,
+    passing the current and the max branching orders to the operation that decides whether to
+    process the section or not.
 
     :param args:
-        Arguments list, where the first argument is always the root section of the arbor and the
-        second argument is the function of the operation/filter that will be applied
-        and the rest of the arguments are those that will be passed to the function itself.
+        Arguments list, where the first two arguments are the current branching level and the max
+        branching level, the third is the root section of the arbor and the fourth is the function
+        of the operation/filter that will be applied and the rest of the arguments are those that
+        will be passed to the function itself.
     """
 
     # The current branching level is the first argument
@@ -88,47 +237,12 @@ def apply_operation_to_arbor_conditionally(*args):
     # The operation is the fourth argument
     operation = args[3]
 
-    # Construct the root section arguments list, add the section and ignore the operation
-    section_args = list()
-
-    # Add the branching levels
-    section_args.append(current_branching_level)
-    section_args.append(max_branching_order)
-
-    # Add the section root
-    section_args.append(section)
-
-    # Add the rest of the arguments
-    for i in range(4, len(args)):
-        section_args.append(args[i])
-
-    # Apply the operation/filter to the first section of the arbor
-    operation(*section_args)
-
-    # Ensure that the section has valid children
-    if section.children is not None:
-
-        # Apply the operation/filter to the children of the arbors
-        for child in section.children:
-
-            # Construct the child section arguments list, add the child and add the operation
-            section_args = list()
-
-            # Add the branching levels
-            section_args.append(current_branching_level)
-            section_args.append(max_branching_order)
-
-            # Add the child
-            section_args.append(child)
-
-            # Add the operation
-            section_args.append(operation)
+    # The rest of the arguments are passed to the operation after the section
+    operation_args = args[4:]
 
-            for i in range(4, len(args)):
-                section_args.append(args[i])
-
-            # Validate the rest of the skeleton of the arbor
-            apply_operation_to_arbor_conditionally(*section_args)
+    # Apply the operation/filter to every section of the arbor
+    for arbor_section in iterate_arbor_sections(section):
+        operation(current_branching_level, max_branching_order, arbor_section, *operation_args)
 
 
 ####################################################################################################
@@ -136,7 +250,7 @@ def apply_operation_to_arbor_conditionally(*args):
 ####################################################################################################
 def apply_operation_to_morphology(*args):
     """Apply a given function/filter/operation to a given morphology object including all of its
-    arbors recursively.
+    arbors.
 
     :param args:
         Arguments list, where the first argument is always the morphology and the second argument
@@ -147,47 +261,12 @@ def apply_operation_to_morphology(*args):
     # The morphology is the first argument
     morphology = args[0]
 
-    # Apical dendrite
-    if morphology.has_apical_dendrites():
-
-        # Dendrite by dendrite
-        for arbor in morphology.apical_dendrites:
-
-            # Construct arbor arguments list
-            arbor_args = [arbor]
-            for i in range(1, len(args)):
-                arbor_args.append(args[i])
-
-            # Apply the operation/filter to the arbor
-            apply_operation_to_arbor(*arbor_args)
-
-    # Basal dendrites
-    if morphology.has_basal_dendrites():
-
-        # Dendrite by dendrite
-        for arbor in morphology.basal_dendrites:
-
-            # Construct arbor arguments list
-            arbor_args = [arbor]
-            for i in range(1, len(args)):
-                arbor_args.append(args[i])
+    # Apply the operation/filter to the arbors, apical dendrites, basal dendrites and then axons
+    for arbor in get_morphology_arbors(morphology):
+        apply_operation_to_arbor(arbor, *args[1:])
 
-            # Apply the operation/filter to the arbor
-            apply_operation_to_arbor(*arbor_args)
-
-    # Axon
-    if morphology.has_axons():
-
-        # Dendrite by dendrite
-        for arbor in morphology.axons:
-
-            # Construct arbor arguments list
-            arbor_args = [arbor]
-            for i in range(1, len(args)):
-                arbor_args.append(args[i])
-
-            # Apply the operation/filter to the arbor
-            apply_operation_to_arbor(*arbor_args)
+    # The operation may have modified the geometry of the morphology
+    morphology.invalidate_bounding_box()
 
 
 ####################################################################################################
@@ -195,11 +274,12 @@ def apply_operation_to_morphology(*args):
 ####################################################################################################
 def apply_operation_to_morphology_partially(*args):
     """Apply a given function/filter/operation to a given morphology object including ONLY the
-    arbors that are below certain branching level recursively.
+    arbors that are below certain branching level.
 
     :param args:
-        Arguments list, where the first argument is always the morphology and the second argument
-        is the function of the operation/filter that will be applied and the rest of the arguments
+        Arguments list, where the first argument is always the morphology, the next three are the
+        maximum branching orders of the axons, basal dendrites and apical dendrites, then the
+        function of the operation/filter that will be applied and the rest of the arguments
         are those that will be passed to the function.
     """
 
@@ -215,68 +295,29 @@ def apply_operation_to_morphology_partially(*args):
     # Apical dendrites maximum branching order
     apical_dendrites_branching_order = args[3]
 
-    # Apical dendrite
-    if morphology.has_apical_dendrites():
-        for arbor in morphology.apical_dendrites:
-
-            # Construct arbor arguments list
-            arbor_args = list()
-
-            # Add the branching levels to the arguments
-            current_branching_level = [0]
-            arbor_args.append(current_branching_level)
-            arbor_args.append(apical_dendrites_branching_order)
-
-            # Add the section root
-            arbor_args.append(arbor)
-
-            # Add the other arguments
-            for i in range(4, len(args)):
-                arbor_args.append(args[i])
-
-            # Apply the operation/filter to the arbor
-            apply_operation_to_arbor_conditionally(*arbor_args)
+    # The operation and its arguments
+    operation_args = args[4:]
 
-    # Basal dendrites
+    # Each arbor type with its maximum branching order
+    arbors_branching_orders = list()
+    if morphology.has_apical_dendrites():
+        arbors_branching_orders.append(
+            (morphology.apical_dendrites, apical_dendrites_branching_order))
     if morphology.has_basal_dendrites():
-        for arbor in morphology.basal_dendrites:
-
-            # Construct arbor arguments list
-            arbor_args = list()
-
-            # Add the branching levels to the arguments
-            current_branching_level = [0]
-            arbor_args.append(current_branching_level)
-            arbor_args.append(basal_dendrites_branching_order)
-
-            # Add the section root
-            arbor_args.append(arbor)
-
-            # Add the other arguments
-            for i in range(4, len(args)):
-                arbor_args.append(args[i])
-
-            # Apply the operation/filter to the arbor
-            apply_operation_to_arbor_conditionally(*arbor_args)
-
-    # Axon
+        arbors_branching_orders.append(
+            (morphology.basal_dendrites, basal_dendrites_branching_order))
     if morphology.has_axons():
-        for arbor in morphology.basal_dendrites:
+        arbors_branching_orders.append((morphology.axons, axons_branching_order))
 
-            # Construct arbor arguments list
-            arbor_args = list()
+    for arbors, max_branching_order in arbors_branching_orders:
+        for arbor in arbors:
 
-            # Add the branching levels to the arguments
+            # Each arbor starts with a new branching level
             current_branching_level = [0]
-            arbor_args.append(current_branching_level)
-            arbor_args.append(axons_branching_order)
-
-            # Add the section root
-            arbor_args.append(arbor)
-
-            # Add the other arguments
-            for i in range(4, len(args)):
-                arbor_args.append(args[i])
 
             # Apply the operation/filter to the arbor
-            apply_operation_to_arbor_conditionally(*arbor_args)
+            apply_operation_to_arbor_conditionally(
+                current_branching_level, max_branching_order, arbor, *operation_args)
+
+    # The operation may have modified the geometry of the morphology
+    morphology.invalidate_bounding_box()
@@ -18,14 +18,70 @@
 # System imports
 import random, copy
 
+# External imports
+import numpy
+
 # Blender imports
 from mathutils import Vector, Matrix
 
 # Internal imports
 import nmv.bbox
+import nmv.file
+import nmv.geometry
+import nmv.mesh
 import nmv.skeleton
 
 
+####################################################################################################
+# @get_arbors_points
+####################################################################################################
+def get_arbors_points(arbors):
+    """Collects the points of all the samples of the given arbors into a contiguous array.
+
+    :param arbors:
+        A list of arbors, or root sections.
+    :return:
+        An Nx3 array of the points of the samples.
+    """
+
+    # Walk the sections without recursion and flatten the coordinates of the samples
+    coordinates = list()
+    for section in nmv.skeleton.ArborTraversal(arbors).sections:
+        for sample in section.samples:
+            coordinates.extend(sample.point[:])
+
+    # Return the points as an array
+    return numpy.array(coordinates, dtype=numpy.float64).reshape(-1, 3)
+
+
+####################################################################################################
+# @update_bounding_box_limits
+####################################################################################################
+def update_bounding_box_limits(points,
+                               p_min,
+                               p_max):
+    """Extends the given p_min and p_max in place to include an array of points.
+
+    :param points:
+        An Nx3 array of points.
+    :param p_min:
+        Return value for the p_min
+    :param p_max:
+        Return value for the p_max.
+    """
+
+    # Nothing to add
+    if len(points) == 0:
+        return
+
+    # Compute the limits in one pass and merge them
+    points_min = points.min(axis=0)
+    points_max = points.max(axis=0)
+    for i in range(3):
+        p_min[i] = min(p_min[i], float(points_min[i]))
+        p_max[i] = max(p_max[i], float(points_max[i]))
+
+
 ####################################################################################################
 # @compute_section_bounding_box
 ####################################################################################################
@@ -44,27 +100,10 @@ def compute_section_bounding_box(section,
         Return value for the p_max.
     """
 
-    # Iterate over all the samples of the section and get the min and max ones
-    for sample in section.samples:
-
-        # Get the coordinates of the sample
-        point = sample.point
-
-        # Minimum
-        if point[0] < p_min[0]:
-            p_min[0] = point[0]
-        if point[1] < p_min[1]:
-            p_min[1] = point[1]
-        if point[2] < p_min[2]:
-            p_min[2] = point[2]
-
-        # Maximum
-        if point[0] > p_max[0]:
-            p_max[0] = point[0]
-        if point[1] > p_max[1]:
-            p_max[1] = point[1]
-        if point[2] > p_max[2]:
-            p_max[2] = point[2]
+    # Get the min and max of the samples of the section only
+    points = numpy.array([sample.point[:] for sample in section.samples],
+                         dtype=numpy.float64).reshape(-1, 3)
+    update_bounding_box_limits(points=points, p_min=p_min, p_max=p_max)
 
 
 ####################################################################################################
@@ -84,14 +123,8 @@ def compute_sections_bounding_box(arbor,
         Return value for @p_max.
     """
 
-    # Compute the bounding box for the first section
-    compute_section_bounding_box(section=arbor, p_min=p_min, p_max=p_max)
-
-    # Do it recursively
-    for child_section in arbor.children:
-
-        # Update the bounding box via updating p_min and p_max
-        compute_sections_bounding_box(arbor=child_section, p_min=p_min, p_max=p_max)
+    # Get the min and max of all the samples of the arbor
+    update_bounding_box_limits(points=get_arbors_points([arbor]), p_min=p_min, p_max=p_max)
 
 
 ####################################################################################################
@@ -107,18 +140,35 @@ def compute_arbor_bounding_box(arbor):
         The bounding box of the given arbor.
     """
 
-    # Initialize the min and max points
-    p_min = Vector((1e10, 1e10, 1e10))
-    p_max = Vector((-1e10, -1e10, -1e10))
+    # Compute the arbor bounding box from the array of its samples
+    return nmv.bbox.compute_points_bounding_box(get_arbors_points([arbor]))
 
-    # Compute the arbor bounding box
-    compute_sections_bounding_box(arbor=arbor, p_min=p_min, p_max=p_max)
 
-    # Build bounding box object
-    bounding_box_object = nmv.bbox.BoundingBox(p_min=p_min, p_max=p_max)
+####################################################################################################
+# @compute_morphology_bounding_box
+####################################################################################################
+def compute_morphology_bounding_box(morphology):
+    """
+    Computes the bounding box of all the arbors of a morphology in a single pass over the samples.
+    This function does not use the cached bounding box of the morphology.
 
-    # Return the computed bounding box
-    return bounding_box_object
+    :param morphology:
+        A given morphology to compute the bounding box for.
+    :return:
+        The bounding box of the given morphology.
+    """
+
+    # Collect all the arbors
+    arbors = list()
+    if morphology.has_axons():
+        arbors.extend(morphology.axons)
+    if morphology.has_basal_dendrites():
+        arbors.extend(morphology.basal_dendrites)
+    if morphology.has_apical_dendrites():
+        arbors.extend(morphology.apical_dendrites)
+
+    # Compute the bounding box from the array of all the samples
+    return nmv.bbox.compute_points_bounding_box(get_arbors_points(arbors))
 
 
 ####################################################################################################
@@ -128,36 +178,18 @@ def compute_full_morphology_bounding_box(morphology):
     """
     Computes the bounding box of the entire morphology including all the existing arbors.
 
+    The bounding box is cached in the morphology and only recomputed after its geometry changes,
+    the returned bounding box is a copy that can be modified freely.
+
     :param morphology:
         A given morphology to compute the bounding box for.
     :return:
         The bounding box of the computed morphology.
     """
 
-    # Arbors bounding box
-    arbors_bounding_boxes = list()
-
-    # Compute the axons bounding box
-    if morphology.has_axons():
-        for arbor in morphology.axons:
-            arbors_bounding_boxes.append(compute_arbor_bounding_box(arbor=arbor))
-
-    # Compute basal dendrites bounding boxes
-    if morphology.has_basal_dendrites():
-        for arbor in morphology.basal_dendrites:
-            arbors_bounding_boxes.append(compute_arbor_bounding_box(arbor=arbor))
-
-    # Compute apical dendrite bounding box, if exists
-    if morphology.has_apical_dendrites():
-        for arbor in morphology.apical_dendrites:
-            arbors_bounding_boxes.append(compute_arbor_bounding_box(arbor=arbor))
-
-    # Get the joint bounding box of the entire morphology by collecting the individual ones in a
-    # list and then merging the list into a single bounding box
-    morphology_bounding_box = nmv.bbox.extend_bounding_boxes(arbors_bounding_boxes)
-
-    # Return the morphology bounding box
-    return morphology_bounding_box
+    # Copy the cached bounding box
+    bounding_box = morphology.bounding_box
+    return nmv.bbox.BoundingBox(p_min=bounding_box.p_min.copy(), p_max=bounding_box.p_max.copy())
 
 
 ####################################################################################################
@@ -172,57 +204,73 @@ def get_transformation_matrix(blue_config,
     :param gid:
         Neuron GID.
     :return:
-        Transformation matrix.
+        Transformation matrix, or None if the circuit cannot be loaded without BluePy.
 
     """
 
-    # Import BluePy
+    # Get the neuron from the cached circuit provider, the circuit is not opened again
     try:
-        import bluepy.v2
-    except ImportError:
-        print('ERROR: Cannot import [BluePy], please install it')
+        matrix = nmv.file.get_circuit_provider(blue_config).get_transformation_matrix(gid)
+    except ImportError as e:
+        print('ERROR: %s' % e)
         return None
 
-    # Loading a circuit
-    from bluepy.v2 import Circuit
-    circuit = Circuit(blue_config)
-
-    # Get the neuron
-    neuron = circuit.cells.get(int(gid))
-
-    # Translation
-    translation = Vector((neuron['x'], neuron['y'], neuron['z']))
-
-    # Orientation
-    o = neuron['orientation']
-    o0 = Vector((o[0][0], o[0][1], o[0][2]))
-    o1 = Vector((o[1][0], o[1][1], o[1][2]))
-    o2 = Vector((o[2][0], o[2][1], o[2][2]))
+    # Convert it to a Blender matrix
+    transformation_matrix = Matrix(matrix.tolist())
 
-    # Initialize the transformation matrix to I
-    transformation_matrix = Matrix()
-
-    transformation_matrix[0][0] = o0[0]
-    transformation_matrix[0][1] = o0[1]
-    transformation_matrix[0][2] = o0[2]
-    transformation_matrix[0][3] = translation[0]
+    return transformation_matrix
 
-    transformation_matrix[1][0] = o1[0]
-    transformation_matrix[1][1] = o1[1]
-    transformation_matrix[1][2] = o1[2]
-    transformation_matrix[1][3] = translation[1]
 
-    transformation_matrix[2][0] = o2[0]
-    transformation_matrix[2][1] = o2[1]
-    transformation_matrix[2][2] = o2[2]
-    transformation_matrix[2][3] = translation[2]
+####################################################################################################
+# @transform_morphology
+####################################################################################################
+def transform_morphology(morphology,
+                         matrix):
+    """Applies a 4x4 transformation matrix to all the samples of a morphology, including the soma,
+    with a single NumPy call. The radii are not changed.
 
-    transformation_matrix[2][0] = 0.0
-    transformation_matrix[2][1] = 0.0
-    transformation_matrix[2][2] = 0.0
-    transformation_matrix[2][3] = 1.0
+    :param morphology:
+        A given morphology.
+    :param matrix:
+        A 4x4 transformation matrix.
+    """
 
-    return transformation_matrix
+    # Collect the samples, a sample shared between two sections is transformed once
+    samples = dict()
+    sections = nmv.skeleton.compute_morphology_traversal(morphology).sections
+    for section in sections:
+        for sample in section.samples:
+            samples[id(sample)] = sample
+    samples = list(samples.values())
+
+    # The soma points
+    soma = morphology.soma
+    soma_points = [soma.centroid] if soma is not None else list()
+    if soma is not None:
+        soma_points += list(soma.profile_points or list())
+        soma_points += list(soma.arbors_profile_points or list())
+
+    # Transform all the points at once
+    points = numpy.array([sample.point[:] for sample in samples] +
+                         [point[:] for point in soma_points], dtype=numpy.float64).reshape(-1, 3)
+    points = nmv.geometry.transform_points(points, matrix)
+
+    # Write the points back
+    for sample, point in zip(samples, points[:len(samples)]):
+        sample.point = Vector(point)
+    if soma is not None:
+        soma_points = [Vector(point) for point in points[len(samples):]]
+        soma.centroid = soma_points[0]
+        number_profile_points = len(soma.profile_points or list())
+        if soma.profile_points:
+            soma.profile_points = soma_points[1:1 + number_profile_points]
+        if soma.arbors_profile_points:
+            soma.arbors_profile_points = soma_points[1 + number_profile_points:]
+
+    # Drop the cached geometry
+    for section in sections:
+        section.invalidate_geometry()
+    morphology.invalidate_bounding_box()
 
 
 ####################################################################################################
@@ -243,15 +291,14 @@ def transform_to_local_coordinates(mesh_object,
 
     # Get the transformation matrix
     transformation_matrix = get_transformation_matrix(blue_config=blue_config, gid=gid)
+    if transformation_matrix is None:
+        return
 
     # Invert the transformation matrix
     transformation_matrix = transformation_matrix.inverted()
 
-    # Apply the transformation operation vertex by vertex
-    for vertex in mesh_object.data.vertices:
-
-        # Update the vertex coordinates
-        vertex.co = transformation_matrix * vertex.co
+    # Apply the transformation to all the vertices at once
+    nmv.mesh.transform_mesh_object_vertices(mesh_object, transformation_matrix)
 
 
 ####################################################################################################
@@ -274,12 +321,11 @@ def transform_to_global_coordinates(mesh_object,
 
     # Get the transformation matrix
     transformation_matrix = get_transformation_matrix(blue_config=blue_config, gid=gid)
+    if transformation_matrix is None:
+        return
 
-    # Apply the transformation operation vertex by vertex
-    for vertex in mesh_object.data.vertices:
-
-        # Update the vertex coordinates
-        vertex.co = transformation_matrix * vertex.co
+    # Apply the transformation to all the vertices at once
+    nmv.mesh.transform_mesh_object_vertices(mesh_object, transformation_matrix)
 
 
 ####################################################################################################
@@ -300,12 +346,13 @@ def transform_morphology_to_global_coordinates(morphology_objects,
 
     # Get the transformation matrix
     transformation_matrix = get_transformation_matrix(blue_config=blue_config, gid=gid)
+    if transformation_matrix is None:
+        return
 
-    # Arbors transformation
+    # Update the matrices of the objects, the geometry is not baked
     for morphology_object in morphology_objects:
-
-        # Update the arbors transformation
-        morphology_object.matrix_world = transformation_matrix * morphology_object .matrix_world
+        morphology_object.matrix_world = Matrix(nmv.geometry.multiply_matrices(
+            transformation_matrix, morphology_object.matrix_world))
 
 
 ####################################################################################################
@@ -352,6 +399,9 @@ def taper_section(section):
     if number_samples < 2:
         return
 
+    # The radii of the section are updated, the cached geometry is no more valid
+    section.invalidate_geometry()
+
     # Ignore root sections
     if section.is_root():
         # To avoid any artifacts when the arbor is getting welded to the soma
@@ -405,6 +455,9 @@ def zigzag_section(section,
     # Get the length of the section (in terms of number of samples)
     number_samples = len(section.samples)
 
+    # The samples of the section are displaced, the cached geometry is no more valid
+    section.invalidate_geometry()
+
     # Ignore the first few samples on the root section to have nicer connection with the soma
     if section.is_root():
 
@@ -453,6 +506,9 @@ def project_to_xy_plane(section):
         # Compute the new sample position
         section.samples[i].point[2] = 0
 
+    # Invalidate the cached geometry of the section
+    section.invalidate_geometry()
+
 
 ####################################################################################################
 # @simplify_section_to_straight_line
@@ -471,6 +527,9 @@ def simplify_section_to_straight_line(section):
     # Update the samples list in the section
     section.samples = straight_samples
 
+    # Invalidate the cached geometry of the section
+    section.invalidate_geometry()
+
 
 ####################################################################################################
 # @scale_section_radii
@@ -489,6 +548,9 @@ def scale_section_radii(section,
     for i_sample in section.samples:
         i_sample.radius *= scale_factor
 
+    # Invalidate the cached geometry of the section
+    section.invalidate_geometry()
+
 
 ####################################################################################################
 # @unify_section_radii
@@ -506,6 +568,9 @@ def unify_section_radii(section,
     for i_sample in section.samples:
         i_sample.radius = unified_radius
 
+    # Invalidate the cached geometry of the section
+    section.invalidate_geometry()
+
 
 ####################################################################################################
 # @unify_section_radii_based_on_type
@@ -538,6 +603,9 @@ def unify_section_radii_based_on_type(section,
     else:
         return
 
+    # Invalidate the cached geometry of the section
+    section.invalidate_geometry()
+
 
 ####################################################################################################
 # @filter_section_sub_threshold
@@ -557,6 +625,9 @@ def filter_section_sub_threshold(section,
         if i_sample.radius < threshold:
             i_sample.radius = 0.00001
 
+    # Invalidate the cached geometry of the section
+    section.invalidate_geometry()
+
 
 ####################################################################################################
 # @set_section_radii_between_given_range
@@ -585,6 +656,9 @@ def set_section_radii_between_given_range(section,
         if i_sample.radius > maximum_value:
             i_sample.radius = maximum_value
 
+    # Invalidate the cached geometry of the section
+    section.invalidate_geometry()
+
 
 ####################################################################################################
 # @update_branching_order_section
@@ -641,5 +715,8 @@ def simplify_morphology(section):
             # Do it for the internal samples
             section.samples[i].radius = section_maximum_radius - (i * section_step)
 
+        # Invalidate the cached geometry of the section
+        section.invalidate_geometry()
+
         # Omit the children
         section.children = list()
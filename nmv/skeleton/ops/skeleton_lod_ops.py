@@ -0,0 +1,251 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# External imports
+import numpy
+
+# Internal imports
+import nmv.skeleton
+
+
+####################################################################################################
+# @compute_section_simplification_errors
+####################################################################################################
+def compute_section_simplification_errors(section):
+    """Computes the simplification error of every sample of a section with a Douglas-Peucker
+    hierarchy, using both the positions and the radii of the samples.
+
+    The error of a sample is the largest deviation, in microns, of its position from the chord of
+    the coarser polyline, or of its radius from the radius interpolated along that chord. The errors
+    are clamped to the errors of the samples that split the polyline before them, therefore the
+    samples with errors larger than a tolerance are exactly those kept by a Douglas-Peucker
+    simplification at that tolerance. This encodes all the levels of detail of the section in a
+    single array. The first and last samples are never removed and have infinite errors.
+
+    The errors are computed from the full samples of the section, even if a level of detail is
+    currently selected.
+
+    :param section:
+        A given section.
+    :return:
+        An array of the errors of the samples of the section.
+    """
+
+    # The positions and the radii of the full samples
+    samples = section.samples if section.lod_samples is None else section.lod_samples
+    number_samples = len(samples)
+    points = numpy.array([sample.point[:] for sample in samples],
+                         dtype=numpy.float64).reshape(-1, 3)
+    radii = numpy.array([sample.radius for sample in samples], dtype=numpy.float64)
+
+    # A section without inner samples keeps all its samples
+    if number_samples < 2:
+        return numpy.full(number_samples, numpy.inf)
+
+    # The terminal samples are always kept
+    errors = numpy.zeros(number_samples)
+    errors[[0, -1]] = numpy.inf
+
+    # Split the polyline iteratively, each range is given with the error of the sample that split it
+    stack = [(0, number_samples - 1, numpy.inf)]
+    while stack:
+        first, last, split_error = stack.pop()
+        if last - first < 2:
+            continue
+
+        # Project the inner samples on the chord
+        chord = points[last] - points[first]
+        chord_length_squared = chord.dot(chord)
+        offsets = points[first + 1:last] - points[first]
+        if chord_length_squared > 0.0:
+            t = numpy.clip(offsets.dot(chord) / chord_length_squared, 0.0, 1.0)
+        else:
+            t = numpy.zeros(last - first - 1)
+
+        # Position and radius deviations
+        distances = numpy.linalg.norm(offsets - t[:, None] * chord, axis=1)
+        radii_deviations = numpy.abs(radii[first + 1:last] -
+                                     (radii[first] + t * (radii[last] - radii[first])))
+        deviations = numpy.maximum(distances, radii_deviations)
+
+        # The sample with the largest deviation splits the range
+        i = int(numpy.argmax(deviations))
+        error = min(float(deviations[i]), split_error)
+        errors[first + 1 + i] = error
+        stack.append((first, first + 1 + i, error))
+        stack.append((first + 1 + i, last, error))
+
+    # Return the errors
+    return errors
+
+
+####################################################################################################
+# @get_morphology_sections
+####################################################################################################
+def get_morphology_sections(morphology):
+    """Returns a flat list of all the sections of all the arbors of a morphology.
+
+    :param morphology:
+        A given morphology.
+    :return:
+        A list of sections.
+    """
+
+    return nmv.skeleton.ops.compute_morphology_traversal(morphology).sections
+
+
+####################################################################################################
+# @compute_morphology_level_of_detail
+####################################################################################################
+def compute_morphology_level_of_detail(morphology,
+                                       force=False):
+    """Precomputes the simplification errors of all the sections of the morphology and stores them
+    in the sections, see @compute_section_simplification_errors.
+
+    :param morphology:
+        A given morphology.
+    :param force:
+        Recompute the errors even if they were computed before, for example after resampling.
+    """
+
+    for section in get_morphology_sections(morphology):
+
+        # Full samples
+        samples = section.samples if section.lod_samples is None else section.lod_samples
+
+        # Compute the errors if missing or out of date
+        if force or section.lod_errors is None or len(section.lod_errors) != len(samples):
+            section.lod_errors = compute_section_simplification_errors(section)
+
+
+####################################################################################################
+# @get_level_of_detail_tolerance_for_sample_budget
+####################################################################################################
+def get_level_of_detail_tolerance_for_sample_budget(morphology,
+                                                    sample_budget):
+    """Gets the smallest simplification tolerance that keeps the number of samples of the
+    morphology within a given budget. The terminal samples of the sections are always kept, so the
+    budget cannot go below two samples per section.
+
+    :param morphology:
+        A given morphology with precomputed simplification errors.
+    :param sample_budget:
+        The maximum number of samples to be drawn.
+    :return:
+        The simplification tolerance in microns.
+    """
+
+    # Collect the errors of the inner samples, the terminals are always kept
+    errors = list()
+    number_terminals = 0
+    for section in get_morphology_sections(morphology):
+        errors.append(section.lod_errors[1:-1])
+        number_terminals += min(len(section.lod_errors), 2)
+    errors = numpy.sort(numpy.concatenate(errors))[::-1] if errors else numpy.zeros(0)
+
+    # The number of inner samples that can be kept
+    number_inner_samples = sample_budget - number_terminals
+    if number_inner_samples >= len(errors):
+        return 0.0
+    if number_inner_samples <= 0:
+        return float(errors[0])
+
+    # Only the samples with larger errors than the tolerance are kept
+    return float(errors[number_inner_samples])
+
+
+####################################################################################################
+# @get_level_of_detail_tolerance_for_screen_space_error
+####################################################################################################
+def get_level_of_detail_tolerance_for_screen_space_error(morphology,
+                                                         pixel_error,
+                                                         resolution):
+    """Gets the simplification tolerance that bounds the error of the drawn skeleton to a given
+    number of pixels when the whole morphology fits an image of the given resolution.
+
+    :param morphology:
+        A given morphology.
+    :param pixel_error:
+        The maximum error in pixels.
+    :param resolution:
+        The resolution of the largest dimension of the image.
+    :return:
+        The simplification tolerance in microns.
+    """
+
+    return pixel_error * morphology.bounding_box.get_largest_dimension() / float(resolution)
+
+
+####################################################################################################
+# @select_morphology_level_of_detail
+####################################################################################################
+def select_morphology_level_of_detail(morphology,
+                                      tolerance):
+    """Selects the samples of all the sections of the morphology that are needed to draw it within
+    a given simplification tolerance. The full samples are kept in every section and can be
+    restored with @restore_morphology_full_detail, or another level can be selected.
+
+    :param morphology:
+        A given morphology.
+    :param tolerance:
+        The simplification tolerance in microns, zero keeps all the samples but the collinear ones.
+    :return:
+        The number of the selected samples.
+    """
+
+    # Make sure that the errors are computed
+    compute_morphology_level_of_detail(morphology)
+
+    number_samples = 0
+    for section in get_morphology_sections(morphology):
+
+        # Keep a reference to the full samples
+        if section.lod_samples is None:
+            section.lod_samples = section.samples
+
+        # Select the samples with errors above the tolerance
+        section.samples = [section.lod_samples[i]
+                           for i in numpy.nonzero(section.lod_errors > tolerance)[0]]
+        section.invalidate_geometry()
+        number_samples += len(section.samples)
+
+    # The terminal samples of the sections are never removed, but the bounding box may shrink
+    morphology.invalidate_bounding_box()
+
+    # Return the number of the selected samples
+    return number_samples
+
+
+####################################################################################################
+# @restore_morphology_full_detail
+####################################################################################################
+def restore_morphology_full_detail(morphology):
+    """Restores the full samples of all the sections of the morphology after selecting a level of
+    detail with @select_morphology_level_of_detail.
+
+    :param morphology:
+        A given morphology.
+    """
+
+    for section in get_morphology_sections(morphology):
+        if section.lod_samples is not None:
+            section.samples = section.lod_samples
+            section.lod_samples = None
+            section.invalidate_geometry()
+
+    # The bounding box of the full samples
+    morphology.invalidate_bounding_box()
@@ -74,6 +74,9 @@ def repair_short_sections_by_compression(section,
             # Update the radius value
             sample.radius = average_section_radius
 
+        # Invalidate the cached geometry of the section
+        section.invalidate_geometry()
+
         # Since we have change the radii of the short section, therefore, we must accordingly
         # update the radius of the last sample of the parent section and set the radii of the
         # first samples of the children at the same level to the @average_section_radius to
@@ -82,11 +85,13 @@ def repair_short_sections_by_compression(section,
 
             # Set the radius of the last sample of the parent to @average_section_radius
             section.parent.samples[-1].radius = average_section_radius
+            section.parent.invalidate_geometry()
 
             # Set the radii of the first samples of the children sections at the same level to the
             # @average_section_radius
             for child in section.parent.children:
                 child.samples[0].radius = average_section_radius
+                child.invalidate_geometry()
 
 
 ####################################################################################################
@@ -110,6 +115,9 @@ def repair_short_sections_by_connection_to_child(section):
     for i in range(len(primary_child.samples) - 2):
         section.samples.append(primary_child.samples[i])
 
+    # Invalidate the cached geometry of the section
+    section.invalidate_geometry()
+
     # Update the children list with the rest of the children (given that there are more than two)
     updated_children_list = list()
     for child in section.children:
@@ -182,6 +190,7 @@ def repair_parents_with_smaller_radii(section):
 
         # Set the radius of the last sample of the section to the that largest radius
         section.samples[-1].radius = largest_radius_of_children_sections
+        section.invalidate_geometry()
 
         # Report the repair
         nmv.logger.log('\t\t* REPAIRING: Section [%s: %d], radius [%f]' %
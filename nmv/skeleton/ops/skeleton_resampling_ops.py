@@ -526,6 +526,7 @@ def remove_duplicate_samples(section,
 
             # Then remove the duplicate sample
             section.samples.remove(section.samples[i + 1])
+            section.invalidate_geometry()
 
             # Repeat the process
             remove_duplicate_samples(section=section, threshold=threshold)
@@ -596,6 +597,7 @@ def remove_samples_inside_soma(section):
             # Flip the samples
             section.samples[0] = sample_1
             section.samples[1] = sample_0
+            section.invalidate_geometry()
 
     # The section has more than TWO samples
     else:
@@ -615,6 +617,7 @@ def remove_samples_inside_soma(section):
 
                 # Remove the sample
                 section.samples.remove(sample)
+                section.invalidate_geometry()
 
                 # Report the repair
                 nmv.logger.log('\t\t* REPAIRING: Removing internal sample, section [%s: %d]' %
@@ -697,6 +700,10 @@ def remove_samples_within_extent(section,
             # Increment the counter of the removed samples
             number_of_removed_samples += 1
 
+    # Invalidate the cached geometry of the section if any sample has been removed
+    if number_of_removed_samples > 0:
+        section.invalidate_geometry()
+
     # Return the number of removed samples
     return number_of_removed_samples
 
@@ -880,6 +887,7 @@ def resample_section_stem(section):
 
             # Update the samples list
             section.samples.insert(i + 1, auxiliary_sample)
+            section.invalidate_geometry()
 
             # Reset the index to start from the beginning (the second sample @samples[1])
             i = 1
@@ -888,6 +896,7 @@ def resample_section_stem(section):
         elif distance_ratio < 0.999:
 
             section.samples.remove(section.samples[i + 1])
+            section.invalidate_geometry()
 
             # Reset the index to start from the beginning (the second sample @samples[1])
             i = 1
@@ -15,9 +15,13 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .sample import *
-from .section import *
-from .soma import *
-from .morphology import *
-from .spine import *
-
+# Import the modules on the first access to their names, see nmv.load_package_lazily
+import nmv
+nmv.load_package_lazily(__name__, globals(), [
+    '.sample',
+    '.section_geometry',
+    '.arbor_traversal',
+    '.section',
+    '.soma',
+    '.morphology',
+    '.spine'])
@@ -0,0 +1,158 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# External imports
+import numpy
+
+
+####################################################################################################
+# ArborTraversal
+####################################################################################################
+class ArborTraversal:
+    """A flat ordering of the sections of one or more arbors, computed once without recursion, with
+    the depth, branching order and parent index of each section in contiguous arrays.
+
+    The sections are listed either in pre-order (depth-first, a parent before its children and the
+    children in their order) or in breadth-first order, in both cases a parent always precedes all
+    of its children. Use nmv.skeleton.ops.compute_arbor_traversal() to build it.
+    """
+
+    ################################################################################################
+    # @__init__
+    ################################################################################################
+    def __init__(self,
+                 roots,
+                 breadth_first=False):
+        """Constructor
+
+        :param roots:
+            A list of root sections, one per arbor.
+        :param breadth_first:
+            If set, the sections are listed in breadth-first order, otherwise in pre-order.
+        """
+
+        # The sections in the traversal order
+        self.sections = list()
+
+        # The index of the parent of each section in @sections, or -1 for the root sections
+        parent_indices = list()
+
+        # The depth of each section from the root of its arbor, zero for the roots
+        depths = list()
+
+        # The index of the arbor that each section belongs to in the given roots list
+        arbor_indices = list()
+
+        if breadth_first:
+
+            # Queue the roots and walk the sections level by level
+            queue = [(root, -1, 0, i) for i, root in enumerate(roots) if root is not None]
+            head = 0
+            while head < len(queue):
+                section, parent_index, depth, arbor_index = queue[head]
+                head += 1
+                index = len(self.sections)
+                self.sections.append(section)
+                parent_indices.append(parent_index)
+                depths.append(depth)
+                arbor_indices.append(arbor_index)
+                if section.children is not None:
+                    queue.extend((child, index, depth + 1, arbor_index)
+                                 for child in section.children)
+
+        else:
+
+            # Walk the sections with an explicit stack, push the children in reverse order to
+            # visit them in their order
+            stack = [(root, -1, 0, i) for i, root in reversed(list(enumerate(roots)))
+                     if root is not None]
+            while stack:
+                section, parent_index, depth, arbor_index = stack.pop()
+                index = len(self.sections)
+                self.sections.append(section)
+                parent_indices.append(parent_index)
+                depths.append(depth)
+                arbor_indices.append(arbor_index)
+                if section.children is not None:
+                    stack.extend((child, index, depth + 1, arbor_index)
+                                 for child in reversed(section.children))
+
+        # Convert the lists into arrays
+        self.parent_indices = numpy.array(parent_indices, dtype=numpy.int64)
+        self.depths = numpy.array(depths, dtype=numpy.int64)
+        self.arbor_indices = numpy.array(arbor_indices, dtype=numpy.int64)
+
+        # The branching order of the root sections is 1, similar to the Morphology
+        self.branching_orders = self.depths + 1
+
+    ################################################################################################
+    # @__len__
+    ################################################################################################
+    def __len__(self):
+        """Returns the number of sections in the traversal.
+
+        :return:
+            The number of sections in the traversal.
+        """
+
+        return len(self.sections)
+
+    ################################################################################################
+    # @get_sections_at_depth
+    ################################################################################################
+    def get_sections_at_depth(self,
+                              depth):
+        """Returns the sections at a given depth from the roots.
+
+        :param depth:
+            A given depth, zero for the roots.
+        :return:
+            A list of the sections at the given depth, in the traversal order.
+        """
+
+        return [self.sections[i] for i in numpy.nonzero(self.depths == depth)[0]]
+
+    ################################################################################################
+    # @get_sections_within_branching_order
+    ################################################################################################
+    def get_sections_within_branching_order(self,
+                                            branching_order):
+        """Returns the sections that have a branching order less than or equal to a given order.
+
+        :param branching_order:
+            The maximum branching order.
+        :return:
+            A list of the sections, in the traversal order.
+        """
+
+        return [self.sections[i]
+                for i in numpy.nonzero(self.branching_orders <= branching_order)[0]]
+
+    ################################################################################################
+    # @get_terminal_mask
+    ################################################################################################
+    def get_terminal_mask(self):
+        """Returns a mask of the sections that have no children.
+
+        :return:
+            A boolean array, True for the terminal sections.
+        """
+
+        # A section is terminal if it is not the parent of any other section
+        mask = numpy.ones(len(self.sections), dtype=bool)
+        mask[self.parent_indices[self.parent_indices >= 0]] = False
+        return mask
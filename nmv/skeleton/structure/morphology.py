@@ -79,13 +79,13 @@ class Morphology:
         self.apical_dendrites = apical_dendrites
 
         # A copy of the original axons list, needed for comparison
-        self.original_axons = copy.deepcopy(axons)
+        self.original_axons = self.clone_arbors(axons)
 
         # A copy of the original basal dendrites list, needed for comparison
-        self.original_basal_dendrites = copy.deepcopy(basal_dendrites)
+        self.original_basal_dendrites = self.clone_arbors(basal_dendrites)
 
         # A copy of the original apical dendrites list, needed for comparison
-        self.origin_apical_dendrites = copy.deepcopy(apical_dendrites)
+        self.origin_apical_dendrites = self.clone_arbors(apical_dendrites)
 
         # Morphology GID
         self.gid = gid
@@ -104,8 +104,8 @@ class Morphology:
         if gid is not None:
             self.label = str(gid)
 
-        # Morphology full bounding box
-        self.bounding_box = None
+        # Morphology full bounding box, computed on demand, see @bounding_box
+        self._bounding_box = None
 
         # Relaxed bounding box
         self.relaxed_bounding_box = None
@@ -113,9 +113,6 @@ class Morphology:
         # Morphology unified bounding box
         self.unified_bounding_box = None
 
-        # Update the bounding boxes
-        self.compute_bounding_box()
-
         # Update the branching order
         self.update_branching_order()
 
@@ -134,6 +131,66 @@ class Morphology:
         # The color of the soma, see @create_morphology_color_palette
         self.soma_color = None
 
+        # The revision of the morphology, incremented whenever the morphology is edited in place,
+        # for example by the morphology editor, to let the GUI redraw the skeleton
+        self.revision = 0
+
+    ################################################################################################
+    # @clone_arbors
+    ################################################################################################
+    @staticmethod
+    def clone_arbors(arbors):
+        """Clones a list of arbors using the structural clone of the sections.
+
+        :param arbors:
+            A list of arbors, or None.
+        :return:
+            A list of the cloned arbors, or None if the given list is None.
+        """
+
+        if arbors is None:
+            return None
+        return [arbor.clone() for arbor in arbors]
+
+    ################################################################################################
+    # @clone
+    ################################################################################################
+    def clone(self):
+        """Creates an independent copy of the morphology that can be modified by the builders.
+
+        This function replaces copy.deepcopy(morphology), that walks the entire back-referenced
+        section/sample graph with a memo dictionary. The arbors are cloned structurally in linear
+        time, the soma and the bounding boxes are deep-copied (they are small), and the original
+        arbors lists, which are never modified, are shared with the source morphology.
+
+        :return:
+            A reference to the cloned morphology.
+        """
+
+        morphology = Morphology.__new__(Morphology)
+        morphology.__dict__.update(self.__dict__)
+
+        # Clone the arbors
+        morphology.axons = self.clone_arbors(self.axons)
+        morphology.basal_dendrites = self.clone_arbors(self.basal_dendrites)
+        morphology.apical_dendrites = self.clone_arbors(self.apical_dendrites)
+
+        # The soma and the bounding boxes
+        morphology.soma = copy.deepcopy(self.soma)
+        morphology._bounding_box = copy.deepcopy(self._bounding_box)
+        morphology.relaxed_bounding_box = copy.deepcopy(self.relaxed_bounding_box)
+        morphology.unified_bounding_box = copy.deepcopy(self.unified_bounding_box)
+
+        # The colors
+        for colors in ['apical_dendrites_colors', 'basal_dendrites_colors', 'axons_colors']:
+            if getattr(self, colors) is not None:
+                setattr(morphology, colors, list(getattr(self, colors)))
+        if self.soma_color is not None:
+            morphology.soma_color = self.soma_color.copy()
+
+        # Return a reference to the cloned morphology
+        return morphology
+
     ################################################################################################
     # @build_samples_lists_recursively
     ################################################################################################
@@ -198,57 +255,54 @@ class Morphology:
         return True
 
     ################################################################################################
-    # @compute_bounding_box
+    # @bounding_box
     ################################################################################################
-    def compute_bounding_box(self):
+    @property
+    def bounding_box(self):
+        """The bounding box of the arbors of the morphology.
+
+        The bounding box is computed the first time it is requested and cached until the geometry
+        of the morphology changes, see @invalidate_bounding_box.
+
+        :return:
+            The bounding box of the morphology.
         """
-        Computes the bounding box of the morphology
+
+        if self._bounding_box is None:
+            self.compute_bounding_box()
+        return self._bounding_box
+
+    @bounding_box.setter
+    def bounding_box(self,
+                     bounding_box):
+        """Sets the bounding box of the morphology.
+
+        :param bounding_box:
+            A given bounding box.
         """
 
-        # A list of all the bounding boxed of all the arbors
-        morphology_bounding_boxes = list()
+        self._bounding_box = bounding_box
 
-        # Compute the bounding box of the axons
-        if self.has_axons():
-            for arbor in self.axons:
-                morphology_bounding_boxes.append(nmv.skeleton.ops.compute_arbor_bounding_box(arbor))
+    ################################################################################################
+    # @invalidate_bounding_box
+    ################################################################################################
+    def invalidate_bounding_box(self):
+        """Drops the cached bounding box after the geometry of the morphology is modified, it will
+        be recomputed the next time it is requested.
+        """
 
-        # Compute basal dendrites bounding boxes
-        if self.has_basal_dendrites():
-            for arbor in self.basal_dendrites:
-                morphology_bounding_boxes.append(
-                    nmv.skeleton.ops.compute_arbor_bounding_box(arbor))
+        self._bounding_box = None
 
-        # Compute apical dendrites bounding boxes
-        if self.has_apical_dendrites():
-            for arbor in self.apical_dendrites:
-                morphology_bounding_boxes.append(
-                    nmv.skeleton.ops.compute_arbor_bounding_box(arbor))
-
-        # Get the joint bounding box from the list
-        morphology_bounding_box = nmv.bbox.extend_bounding_boxes(morphology_bounding_boxes)
-
-        # Save the morphology bounding box
-        self.bounding_box = copy.deepcopy(morphology_bounding_box)
-
-        '''
-        # Extend the bounding box a little to verify the results
-        morphology_bounding_box.p_min[0] -= 5
-        morphology_bounding_box.p_min[1] -= 5
-        morphology_bounding_box.p_min[2] -= 5
-        morphology_bounding_box.p_max[0] += 5
-        morphology_bounding_box.p_max[1] += 5
-        morphology_bounding_box.p_max[2] += 5
-        morphology_bounding_box.bounds[0] += 10
-        morphology_bounding_box.bounds[1] += 10
-        morphology_bounding_box.bounds[2] += 10
-
-        # Save the morphology bounding box
-        self.relaxed_bounding_box = copy.deepcopy(morphology_bounding_box)
-
-        # Compute the unified bounding box
-        self.unified_bounding_box = nmv.bbox.compute_unified_bounding_box(self.relaxed_bounding_box)
-        '''
+    ################################################################################################
+    # @compute_bounding_box
+    ################################################################################################
+    def compute_bounding_box(self):
+        """
+        Computes the bounding box of the morphology from the samples of all its arbors.
+        """
+
+        # Compute the bounding box in a single pass over the samples of all the arbors
+        self._bounding_box = nmv.skeleton.ops.compute_morphology_bounding_box(self)
 
     ################################################################################################
     # @set_section_branching_order
@@ -256,7 +310,7 @@ class Morphology:
     def set_section_branching_order(self,
                                     section,
                                     order=1):
-        """Sets the branching order of the section and its children recursively.
+        """Sets the branching order of the section and its children.
 
         :param section:
             A given section.
@@ -264,12 +318,12 @@ class Morphology:
             Section branching order.
         """
 
-        # Set the branching order of the section
-        section.branching_order = order
+        # Walk the sub-tree iteratively to avoid hitting the recursion limit on deep arbors
+        traversal = nmv.skeleton.ArborTraversal([section])
 
-        # Set the branching order of the children
-        for child in section.children:
-            self.set_section_branching_order(section=child, order=order + 1)
+        # Set the branching order of the section and its children
+        for child, depth in zip(traversal.sections, traversal.depths):
+            child.branching_order = order + int(depth)
 
     ################################################################################################
     # @update_branching_order
@@ -84,3 +84,25 @@ class Sample:
 
         # The index of the parent sample, required for the connectivity of SWC files
         self.parent_index = parent_index
+
+    ################################################################################################
+    # @clone
+    ################################################################################################
+    def clone(self,
+              section=None):
+        """Creates a copy of the sample without going through copy.deepcopy.
+
+        All the members are copied by value, except the point that is duplicated explicitly, and
+        the section that is replaced by the given one.
+
+        :param section:
+            The section that the cloned sample belongs to.
+        :return:
+            A reference to the cloned sample.
+        """
+
+        sample = Sample.__new__(Sample)
+        sample.__dict__.update(self.__dict__)
+        sample.point = self.point.copy()
+        sample.section = section
+        return sample
@@ -20,6 +20,7 @@ from mathutils import Vector
 
 # Internal imports
 import nmv.enums
+from .section_geometry import SectionGeometry
 
 
 ####################################################################################################
@@ -123,6 +124,11 @@ class Section:
         # NOTE: This variable is only set to the root sections.
         self.soma_face_centroid = None
 
+        # The indices of the vertices of the soma mesh face that is bridged to the root section,
+        # cached once for all the arbors when connecting the arbors to the soma mesh.
+        # NOTE: This variable is only set to the root sections.
+        self.soma_face_vertices = None
+
         # This parameters defines whether this section is a continuation for a parent section or
         # not. By default it is set to False, however, during the morphology pre-processing, it must
         # be updated if the section is determined to be a continuous one.
@@ -146,6 +152,21 @@ class Section:
         # Arbor color
         self.color = Vector((1.0, 1.0, 1.0))
 
+        # The simplification errors of the samples, used to select a level of detail of the section,
+        # see nmv.skeleton.ops.compute_section_simplification_errors
+        self.lod_errors = None
+
+        # The full list of the samples of the section while a level of detail is selected,
+        # otherwise None
+        self.lod_samples = None
+
+        # A counter that must be incremented whenever the samples of the section change, see
+        # @invalidate_geometry
+        self.geometry_version = 0
+
+        # The cached geometry derived from the samples, see @get_geometry
+        self.geometry = None
+
     ################################################################################################
     # @get_type_string
     ################################################################################################
@@ -337,6 +358,42 @@ class Section:
             # Set the sample index according to its order along the section in the samples list
             section_sample.index = i
 
+        # The samples list has been changed, therefore the cached geometry is no more valid
+        self.invalidate_geometry()
+
+    ################################################################################################
+    # @invalidate_geometry
+    ################################################################################################
+    def invalidate_geometry(self):
+        """Increments the geometry version of the section. This function must be called after
+        adding, removing or moving any of the samples of the section, or changing their radii, to
+        drop the cached geometry.
+        """
+
+        self.geometry_version += 1
+
+    ################################################################################################
+    # @get_geometry
+    ################################################################################################
+    def get_geometry(self):
+        """Gets the geometry derived from the samples of the section, i.e. the segments lengths,
+        the cumulative arc length, the tangents and the radii statistics. The geometry is computed
+        once and cached until the geometry version of the section changes.
+
+        :return:
+            A SectionGeometry object.
+        """
+
+        samples = self.samples if self.samples is not None else list()
+
+        # Recompute if the geometry is missing or out of date
+        if self.geometry is None or self.geometry.version != self.geometry_version or \
+                self.geometry.number_samples != len(samples):
+            self.geometry = SectionGeometry(samples=samples, version=self.geometry_version)
+
+        # Return the cached geometry
+        return self.geometry
+
     ################################################################################################
     # @compute_length
     ################################################################################################
@@ -347,15 +404,8 @@ class Section:
             Returns the length of the section in case this function is called from an object.
         """
 
-        # Re-initialize to zero, in case it is still None
-        self.length = 0
-
-        # Add the length of every segment along the section
-        for i in range(len(self.samples) - 1):
-
-            sample_0 = self.samples[i]
-            sample_1 = self.samples[i + 1]
-            self.length += (sample_1.point - sample_0.point).length
+        # Get the length from the cached geometry
+        self.length = self.get_geometry().length
 
         # Return the result
         return self.length
@@ -410,3 +460,62 @@ class Section:
         # Return the result
         return self.path_length
 
+    ################################################################################################
+    # @clone
+    ################################################################################################
+    def clone(self,
+              parent=None):
+        """Creates a structural copy of the section and all its children sections in linear time.
+
+        Unlike copy.deepcopy, this function does not keep a memo of all the visited objects, it
+        only rebuilds the parent/children and section/sample references of the tree. The members
+        that are not part of the tree structure (e.g. the reference to the mesh) are copied by
+        reference. The tree is traversed iteratively to avoid hitting the recursion limit with
+        deep arbors.
+
+        :param parent:
+            The parent of the cloned section, by default None.
+        :return:
+            A reference to the cloned section.
+        """
+
+        root = None
+        stack = [(self, parent)]
+        while stack:
+            section, parent_clone = stack.pop()
+
+            # Copy all the members of the section
+            section_clone = Section.__new__(Section)
+            section_clone.__dict__.update(section.__dict__)
+            section_clone.children_ids = list(section.children_ids)
+            section_clone.color = section.color.copy()
+            if section.soma_face_centroid is not None:
+                section_clone.soma_face_centroid = section.soma_face_centroid.copy()
+
+            # Clone the samples
+            if section.lod_samples is not None:
+
+                # A level of detail is selected, clone the full samples and select the same ones
+                section_clone.lod_samples = [sample.clone(section=section_clone)
+                                             for sample in section.lod_samples]
+                indices = {id(sample): i for i, sample in enumerate(section.lod_samples)}
+                section_clone.samples = [section_clone.lod_samples[indices[id(sample)]]
+                                         for sample in section.samples]
+            elif section.samples is not None:
+                section_clone.samples = [sample.clone(section=section_clone)
+                                         for sample in section.samples]
+
+            # Update the tree references
+            section_clone.parent = parent_clone
+            section_clone.children = list()
+            if parent_clone is None:
+                root = section_clone
+            else:
+                parent_clone.children.append(section_clone)
+
+            # Clone the children in order
+            for child in reversed(section.children):
+                stack.append((child, section_clone))
+
+        # Return a reference to the cloned section
+        return root
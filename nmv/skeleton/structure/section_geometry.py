@@ -0,0 +1,154 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import math
+
+# External imports
+import numpy
+
+
+####################################################################################################
+# SectionGeometry
+####################################################################################################
+class SectionGeometry:
+    """The geometry derived from the samples of a section, computed once in contiguous arrays and
+    shared by all the operations that need it until the samples of the section change.
+
+    Use Section.get_geometry() to get the cached geometry of a section rather than constructing it.
+    """
+
+    ################################################################################################
+    # @__init__
+    ################################################################################################
+    def __init__(self,
+                 samples,
+                 version=0):
+        """Constructor
+
+        :param samples:
+            The samples of the section.
+        :param version:
+            The geometry version of the section at the time of the computation.
+        """
+
+        # The geometry version of the section this geometry has been computed for
+        self.version = version
+
+        # The number of samples the geometry has been computed from
+        self.number_samples = len(samples)
+
+        # The positions of the samples, Nx3
+        self.points = numpy.array([sample.point[:] for sample in samples],
+                                  dtype=numpy.float64).reshape(-1, 3)
+
+        # The radii of the samples, N
+        self.radii = numpy.array([sample.radius for sample in samples], dtype=numpy.float64)
+
+        # The vectors between each two successive samples, (N-1)x3
+        segments = numpy.diff(self.points, axis=0)
+
+        # The lengths of the segments, N-1
+        self.segments_lengths = numpy.linalg.norm(segments, axis=1)
+
+        # The arc length from the first sample till each sample, N
+        self.cumulative_lengths = numpy.concatenate(([0.0], numpy.cumsum(self.segments_lengths)))
+
+        # The unit tangents of the segments, zero for the degenerate segments, (N-1)x3
+        self.tangents = numpy.zeros_like(segments)
+        valid = self.segments_lengths > 0.0
+        self.tangents[valid] = segments[valid] / self.segments_lengths[valid, None]
+
+        # The length of the section
+        self.length = float(self.cumulative_lengths[-1]) if self.number_samples > 0 else 0.0
+
+        # Radii statistics
+        if self.number_samples > 0:
+            self.minimum_radius = float(self.radii.min())
+            self.maximum_radius = float(self.radii.max())
+            self.average_radius = float(self.radii.mean())
+        else:
+            self.minimum_radius = 0.0
+            self.maximum_radius = 0.0
+            self.average_radius = 0.0
+
+        # The surface areas and volumes of the segments, computed on demand
+        self._segments_surface_areas = None
+        self._segments_volumes = None
+
+    ################################################################################################
+    # @segments_surface_areas
+    ################################################################################################
+    @property
+    def segments_surface_areas(self):
+        """The surface areas of the segments, each approximated by a tapered cylinder, with the
+        same formula used by the analysis kernels.
+
+        :return:
+            An array of the surface areas of the segments in square microns.
+        """
+
+        if self._segments_surface_areas is None:
+            r0 = self.radii[:-1]
+            r1 = self.radii[1:]
+            lateral_areas = math.pi * (r0 + r1) * numpy.sqrt((r0 - r1) ** 2 + self.segments_lengths)
+            self._segments_surface_areas = lateral_areas + math.pi * (r0 * r0 + r1 * r1)
+        return self._segments_surface_areas
+
+    ################################################################################################
+    # @segments_volumes
+    ################################################################################################
+    @property
+    def segments_volumes(self):
+        """The volumes of the segments, each approximated by a tapered cylinder.
+
+        :return:
+            An array of the volumes of the segments in cube microns.
+        """
+
+        if self._segments_volumes is None:
+            r0 = self.radii[:-1]
+            r1 = self.radii[1:]
+            self._segments_volumes = \
+                (1.0 / 3.0) * math.pi * self.segments_lengths * (r0 * r0 + r0 * r1 + r1 * r1)
+        return self._segments_volumes
+
+    ################################################################################################
+    # @surface_area
+    ################################################################################################
+    @property
+    def surface_area(self):
+        """The surface area of the section.
+
+        :return:
+            The surface area of the section in square microns.
+        """
+
+        return float(self.segments_surface_areas.sum())
+
+    ################################################################################################
+    # @volume
+    ################################################################################################
+    @property
+    def volume(self):
+        """The volume of the section.
+
+        :return:
+            The volume of the section in cube microns.
+        """
+
+        return float(self.segments_volumes.sum())
@@ -15,13 +15,15 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-from .colors import *
-from .parser import *
-from .parser import *
-from .installation import *
-from .std_output import *
-from .time_line import *
-from .timer import *
-from .version import *
-from .system import *
-
+# Import the modules on the first access to their names, see nmv.load_package_lazily
+import nmv
+nmv.load_package_lazily(__name__, globals(), [
+    '.colors',
+    '.parser',
+    '.installation',
+    '.std_output',
+    '.time_line',
+    '.timer',
+    '.profiler',
+    '.version',
+    '.system'])
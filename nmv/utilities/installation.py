@@ -19,11 +19,18 @@
 import os
 import sys
 import subprocess
+import importlib
 
 # Internal imports
 import nmv.utilities
 import nmv.consts
 
+# The packages that were imported by @import_package, they are verified only once
+imported_packages = dict()
+
+# The plotting packages and the fonts are verified only once, see @verify_plotting_packages
+plotting_packages_verified = False
+
 
 ####################################################################################################
 # @get_python_executable
@@ -98,36 +105,50 @@ def pip_uninstall_wheel(package_name):
 
 
 ####################################################################################################
-# @verify_plotting_packages
+# @import_package
 ####################################################################################################
-def verify_plotting_packages():
-    """Verifies that all the plotting packages are installed. Otherwise, install the missing one.
+def import_package(package_name):
+    """Imports a package and installs it if it is not installed. The package is verified on the
+    first call only, the next calls return the imported module directly.
+
+    :param package_name:
+        The name of the pip package, which is also the name of the module.
+    :return:
+        The imported module.
     """
 
-    # Installing dependencies
-    try:
-        import numpy
-    except ImportError:
-        print('Package *numpy* is not installed. Installing it.')
-        pip_install_wheel(package_name='numpy')
+    # Already verified
+    if package_name in imported_packages:
+        return imported_packages[package_name]
 
+    # Import the package and install it if it does not exist
     try:
-        import matplotlib
+        module = importlib.import_module(package_name)
     except ImportError:
-        print('Package *matplotlib* is not installed. Installing it.')
-        pip_install_wheel(package_name='matplotlib')
+        print('Package *%s* is not installed. Installing it.' % package_name)
+        pip_install_wheel(package_name=package_name)
+        importlib.invalidate_caches()
+        module = importlib.import_module(package_name)
 
-    try:
-        import seaborn
-    except ImportError:
-        print('Package *seaborn* is not installed. Installing it.')
-        pip_install_wheel(package_name='seaborn')
+    imported_packages[package_name] = module
+    return module
 
-    try:
-        import pandas
-    except ImportError:
-        print('Package *pandas* is not installed. Installing it.')
-        pip_install_wheel(package_name='pandas')
+
+####################################################################################################
+# @verify_plotting_packages
+####################################################################################################
+def verify_plotting_packages():
+    """Verifies that all the plotting packages are installed. Otherwise, install the missing one.
+    The packages and the fonts are verified on the first call only.
+    """
+
+    global plotting_packages_verified
+    if plotting_packages_verified:
+        return
+
+    # Installing dependencies
+    for package_name in ['numpy', 'matplotlib', 'seaborn', 'pandas']:
+        import_package(package_name=package_name)
 
     import matplotlib
     matplotlib.use('agg')  # To resolve the tkinter issue
@@ -143,3 +164,4 @@ def verify_plotting_packages():
         font_list = font_manager.createFontList(font_files)
         font_manager.fontManager.ttflist.extend(font_list)
 
+    plotting_packages_verified = True
@@ -0,0 +1,534 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import os
+import sys
+import json
+import time
+
+# The resource module is not available on Windows, the peak memory is not reported there
+try:
+    import resource
+    RESOURCE_AVAILABLE = True
+except ImportError:
+    RESOURCE_AVAILABLE = False
+
+
+####################################################################################################
+# The categories of the profiled stages of the pipeline, keyed by the names of the functions that
+# are profiled with @profile_function
+####################################################################################################
+SPANS_CATEGORIES = {
+    'update_morphology_skeleton': 'preprocessing',
+    'modify_morphology_skeleton': 'preprocessing',
+    'reconstruct_soma_mesh': 'soma-building',
+    'build_soma_from_meta_objects': 'soma-building',
+    'initialize_meta_object': 'soma-building',
+    'build_arbors': 'arbors-building',
+    'reconstruct_arbors_meshes': 'arbors-building',
+    'finalize_meta_object': 'arbors-building',
+    'connect_arbors_to_soma': 'joining',
+    'join_mesh_object_into_single_object': 'joining',
+    'decimate_neuron_mesh': 'post-processing',
+    'add_surface_noise_to_arbor': 'post-processing',
+    'add_surface_roughness': 'post-processing',
+    'add_spines_to_surface': 'post-processing',
+    'transform_to_global_coordinates': 'post-processing',
+    'collect_mesh_stats': 'statistics',
+}
+
+# The extensions of the report files
+JSON_REPORT_EXTENSION = '.profile.json'
+CHROME_TRACE_EXTENSION = '.trace.json'
+
+
+####################################################################################################
+# @get_peak_rss
+####################################################################################################
+def get_peak_rss():
+    """Gets the peak resident set size of the current process.
+
+    :return:
+        The peak resident set size in bytes, or None if it cannot be queried on this platform.
+    """
+
+    if not RESOURCE_AVAILABLE:
+        return None
+
+    # The maximum resident set size is reported in kilobytes on Linux and in bytes on macOS
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        return peak_rss
+    return peak_rss * 1024
+
+
+####################################################################################################
+# @ProfilingSpan
+####################################################################################################
+class ProfilingSpan:
+    """A named and timed stage of the pipeline, used as a context manager.
+    """
+
+    ################################################################################################
+    # @__init__
+    ################################################################################################
+    def __init__(self,
+                 profiler,
+                 name,
+                 category):
+        """Constructor
+
+        :param profiler:
+            The profiler that records the span.
+        :param name:
+            The name of the span.
+        :param category:
+            The category of the span, for example reading, soma-building or rendering.
+        """
+
+        # The profiler that records the span
+        self.profiler = profiler
+
+        # The name and the category of the span
+        self.name = name
+        self.category = category
+
+        # The starting wall and CPU times, in seconds
+        self.wall_start = 0.0
+        self.cpu_start = 0.0
+
+        # The wall and CPU durations, in seconds
+        self.wall_time = 0.0
+        self.cpu_time = 0.0
+
+        # The peak resident set size of the process at the end of the span, in bytes
+        self.peak_rss = None
+
+        # The growth of the peak resident set size during the span, in bytes
+        self.peak_rss_increase = None
+
+        # The depth of the span, zero for the top level spans
+        self.depth = 0
+
+        # The counts of the objects, vertices or any other items that are produced in the span
+        self.counts = dict()
+
+    ################################################################################################
+    # @add_count
+    ################################################################################################
+    def add_count(self,
+                  name,
+                  value=1):
+        """Adds a value to a named count of the span.
+
+        :param name:
+            The name of the count, for example objects or vertices.
+        :param value:
+            The value to add.
+        """
+
+        self.counts[name] = self.counts.get(name, 0) + value
+
+    ################################################################################################
+    # @add_mesh_counts
+    ################################################################################################
+    def add_mesh_counts(self,
+                        mesh_objects):
+        """Adds the number of the given mesh objects, their vertices and their faces to the counts
+        of the span.
+
+        :param mesh_objects:
+            A list of Blender mesh objects.
+        """
+
+        for mesh_object in mesh_objects:
+            if mesh_object is None or mesh_object.type != 'MESH':
+                continue
+            self.add_count('objects')
+            self.add_count('vertices', len(mesh_object.data.vertices))
+            self.add_count('faces', len(mesh_object.data.polygons))
+
+    ################################################################################################
+    # @__enter__
+    ################################################################################################
+    def __enter__(self):
+        """Starts the span.
+
+        :return:
+            The span itself.
+        """
+
+        self.profiler.begin_span(self)
+        self.wall_start = time.perf_counter()
+        self.cpu_start = time.process_time()
+        self.peak_rss = get_peak_rss()
+        return self
+
+    ################################################################################################
+    # @__exit__
+    ################################################################################################
+    def __exit__(self,
+                 exception_type,
+                 exception_value,
+                 traceback):
+        """Ends the span, even if an exception has been raised.
+        """
+
+        self.wall_time = time.perf_counter() - self.wall_start
+        self.cpu_time = time.process_time() - self.cpu_start
+        peak_rss = get_peak_rss()
+        if peak_rss is not None:
+            self.peak_rss_increase = peak_rss - self.peak_rss
+            self.peak_rss = peak_rss
+        self.profiler.end_span(self)
+        return False
+
+    ################################################################################################
+    # @as_dict
+    ################################################################################################
+    def as_dict(self):
+        """Returns the span as a dictionary, relative to the start of the profiler.
+
+        :return:
+            A dictionary that can be serialized to JSON.
+        """
+
+        return {'name': self.name,
+                'category': self.category,
+                'depth': self.depth,
+                'start': self.wall_start - self.profiler.origin,
+                'wall_time': self.wall_time,
+                'cpu_time': self.cpu_time,
+                'peak_rss': self.peak_rss,
+                'peak_rss_increase': self.peak_rss_increase,
+                'counts': dict(self.counts)}
+
+
+####################################################################################################
+# @NullProfilingSpan
+####################################################################################################
+class NullProfilingSpan:
+    """A span that does nothing, returned when the profiling is disabled to keep the overhead of
+    the instrumented code negligible.
+    """
+
+    ################################################################################################
+    # @add_count
+    ################################################################################################
+    def add_count(self,
+                  name,
+                  value=1):
+        pass
+
+    ################################################################################################
+    # @add_mesh_counts
+    ################################################################################################
+    def add_mesh_counts(self,
+                        mesh_objects):
+        pass
+
+    ################################################################################################
+    # @__enter__
+    ################################################################################################
+    def __enter__(self):
+        return self
+
+    ################################################################################################
+    # @__exit__
+    ################################################################################################
+    def __exit__(self,
+                 exception_type,
+                 exception_value,
+                 traceback):
+        return False
+
+
+####################################################################################################
+# @Profiler
+####################################################################################################
+class Profiler:
+    """Records the named spans of the stages of the pipeline and writes them into JSON reports or
+    Chrome trace files (chrome://tracing or https://ui.perfetto.dev).
+    """
+
+    ################################################################################################
+    # @__init__
+    ################################################################################################
+    def __init__(self):
+        """Constructor
+        """
+
+        # Is the profiling enabled, disabled by default
+        self.enabled = False
+
+        # A label that identifies the profiled run, for example the label of the morphology
+        self.label = None
+
+        # The recorded spans, in the order of their completion
+        self.spans = list()
+
+        # The currently open spans
+        self.open_spans = list()
+
+        # The time origin of the profiler
+        self.origin = time.perf_counter()
+
+        # A null span that is returned when the profiling is disabled
+        self.null_span = NullProfilingSpan()
+
+    ################################################################################################
+    # @enable
+    ################################################################################################
+    def enable(self,
+               label=None):
+        """Enables the profiling and resets any recorded spans.
+
+        :param label:
+            A label that identifies the profiled run.
+        """
+
+        self.enabled = True
+        self.label = label
+        self.spans = list()
+        self.open_spans = list()
+        self.origin = time.perf_counter()
+
+    ################################################################################################
+    # @disable
+    ################################################################################################
+    def disable(self):
+        """Disables the profiling.
+        """
+
+        self.enabled = False
+
+    ################################################################################################
+    # @span
+    ################################################################################################
+    def span(self,
+             name,
+             category=None):
+        """Creates a span to be used as a context manager around a stage of the pipeline.
+
+        :param name:
+            The name of the span.
+        :param category:
+            The category of the span, if None, it is looked up in SPANS_CATEGORIES.
+        :return:
+            A new ProfilingSpan, or a null span if the profiling is disabled.
+        """
+
+        if not self.enabled:
+            return self.null_span
+
+        if category is None:
+            category = SPANS_CATEGORIES.get(name, 'other')
+
+        return ProfilingSpan(profiler=self, name=name, category=category)
+
+    ################################################################################################
+    # @begin_span
+    ################################################################################################
+    def begin_span(self,
+                   span):
+        """Registers the start of a span.
+
+        :param span:
+            The span that has been started.
+        """
+
+        span.depth = len(self.open_spans)
+        self.open_spans.append(span)
+
+    ################################################################################################
+    # @end_span
+    ################################################################################################
+    def end_span(self,
+                 span):
+        """Registers the end of a span.
+
+        :param span:
+            The span that has been ended.
+        """
+
+        if span in self.open_spans:
+            self.open_spans.remove(span)
+        self.spans.append(span)
+
+    ################################################################################################
+    # @get_report
+    ################################################################################################
+    def get_report(self):
+        """Returns the recorded spans, with the accumulated times per category.
+
+        :return:
+            A dictionary that can be serialized to JSON.
+        """
+
+        # Accumulate the top level spans per category, the nested spans are already included
+        categories = dict()
+        for span in self.spans:
+            if span.depth > 0:
+                continue
+            category = categories.setdefault(span.category, {'wall_time': 0.0, 'cpu_time': 0.0})
+            category['wall_time'] += span.wall_time
+            category['cpu_time'] += span.cpu_time
+
+        return {'label': self.label,
+                'process': os.getpid(),
+                'peak_rss': get_peak_rss(),
+                'categories': categories,
+                'spans': [span.as_dict() for span in
+                          sorted(self.spans, key=lambda span: span.wall_start)]}
+
+    ################################################################################################
+    # @get_chrome_trace_events
+    ################################################################################################
+    def get_chrome_trace_events(self,
+                                process_id=None):
+        """Returns the recorded spans as complete events in the Chrome trace event format.
+
+        :param process_id:
+            The process ID of the events, by default the ID of the current process.
+        :return:
+            A list of trace events.
+        """
+
+        if process_id is None:
+            process_id = os.getpid()
+
+        # Name the process after the label to separate the neurons of a batch in the viewer
+        events = [{'name': 'process_name', 'ph': 'M', 'pid': process_id, 'tid': 0,
+                   'args': {'name': self.label if self.label is not None else str(process_id)}}]
+
+        for span in self.spans:
+            arguments = {'cpu_time': span.cpu_time,
+                         'peak_rss': span.peak_rss,
+                         'peak_rss_increase': span.peak_rss_increase}
+            arguments.update(span.counts)
+            events.append({'name': span.name,
+                           'cat': span.category,
+                           'ph': 'X',
+                           'ts': (span.wall_start - self.origin) * 1e6,
+                           'dur': span.wall_time * 1e6,
+                           'pid': process_id,
+                           'tid': 0,
+                           'args': arguments})
+        return events
+
+    ################################################################################################
+    # @write_report
+    ################################################################################################
+    def write_report(self,
+                     output_directory,
+                     file_name,
+                     report_format='json'):
+        """Writes the recorded spans into a report file.
+
+        :param output_directory:
+            The directory where the report will be written.
+        :param file_name:
+            The name of the report file without extension.
+        :param report_format:
+            Either 'json' for a JSON report or 'chrome-trace' for a Chrome trace file.
+        :return:
+            The path to the written report, or None if the profiling is disabled.
+        """
+
+        if not self.enabled:
+            return None
+
+        if not os.path.exists(output_directory):
+            os.makedirs(output_directory)
+
+        if report_format == 'chrome-trace':
+            file_path = '%s/%s%s' % (output_directory, file_name, CHROME_TRACE_EXTENSION)
+            data = {'traceEvents': self.get_chrome_trace_events(), 'displayTimeUnit': 'ms'}
+        else:
+            file_path = '%s/%s%s' % (output_directory, file_name, JSON_REPORT_EXTENSION)
+            data = self.get_report()
+
+        with open(file_path, 'w') as report_file:
+            json.dump(data, report_file, indent=1)
+
+        return file_path
+
+
+####################################################################################################
+# @merge_profiling_reports
+####################################################################################################
+def merge_profiling_reports(directory,
+                            report_format='json',
+                            file_name='batch'):
+    """Merges the profiling reports of all the neurons of a batch, written into the same
+    directory, into a single report. The merged JSON report lists the reports of every run with
+    the accumulated times per category across the batch, and the merged Chrome trace shows every
+    run as a separate process.
+
+    :param directory:
+        The directory that contains the reports.
+    :param report_format:
+        Either 'json' or 'chrome-trace'.
+    :param file_name:
+        The name of the merged report file without extension.
+    :return:
+        The path to the merged report, or None if there are no reports in the directory.
+    """
+
+    extension = CHROME_TRACE_EXTENSION if report_format == 'chrome-trace' else \
+        JSON_REPORT_EXTENSION
+    merged_file_path = '%s/%s%s' % (directory, file_name, extension)
+
+    # Collect the reports, excluding any previously merged one
+    if not os.path.isdir(directory):
+        return None
+    file_paths = sorted('%s/%s' % (directory, f) for f in os.listdir(directory)
+                        if f.endswith(extension) and f != file_name + extension)
+    if len(file_paths) == 0:
+        return None
+
+    reports = list()
+    for file_path in file_paths:
+        with open(file_path, 'r') as report_file:
+            reports.append(json.load(report_file))
+
+    if report_format == 'chrome-trace':
+
+        # Use the index of the run as a process ID, the runs may have reused the same IDs
+        events = list()
+        for i, report in enumerate(reports):
+            for event in report['traceEvents']:
+                event['pid'] = i
+                events.append(event)
+        data = {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    else:
+
+        # Accumulate the times of every category across the runs
+        categories = dict()
+        for report in reports:
+            for name, times in report['categories'].items():
+                category = categories.setdefault(name, {'wall_time': 0.0, 'cpu_time': 0.0})
+                category['wall_time'] += times['wall_time']
+                category['cpu_time'] += times['cpu_time']
+        data = {'categories': categories, 'runs': reports}
+
+    with open(merged_file_path, 'w') as merged_file:
+        json.dump(data, merged_file, indent=1)
+
+    return merged_file_path
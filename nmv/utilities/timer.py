@@ -81,11 +81,15 @@ def profile_function(function, *args):
         Function result, Profiling string.
     """
 
+    # Internal imports
+    import nmv
+
     # Start the timer
     starting_time = time.time()
 
-    # Run the function
-    function_return = function(*args)
+    # Run the function, within a span of the profiler if the profiling is enabled
+    with nmv.profiler.span(function.__name__):
+        function_return = function(*args)
 
     # Stop the timer
     ending_time = time.time()
@@ -141,3 +141,21 @@ def is_blender_290():
         return True
     return False
 
+
+
+####################################################################################################
+# @is_blender_available
+####################################################################################################
+def is_blender_available():
+    """Checks if NeuroMorphoVis is running in Blender or in a plain Python interpreter, where
+    only the Blender-free operations, for example the analysis kernels, can be used.
+
+    :return:
+        True if the Blender Python API can be imported, otherwise False.
+    """
+
+    try:
+        import bpy
+    except ImportError:
+        return False
+    return True
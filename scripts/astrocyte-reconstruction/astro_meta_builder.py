@@ -15,9 +15,6 @@
 # If not, see <http://www.gnu.org/licenses/>.
 ####################################################################################################
 
-# System imports
-import copy
-
 # Blender imports
 import bpy, mathutils
 
@@ -63,7 +60,7 @@ class AstroMetaBuilder:
         """
 
         # Morphology
-        self.morphology = copy.deepcopy(morphology)
+        self.morphology = morphology.clone()
 
         # Soma centroid
         self.soma_centroid = soma_centroid
@@ -0,0 +1,79 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+import sys, os
+import argparse
+import runpy
+import time
+
+sys.path.append(('%s/core' % (os.path.dirname(os.path.realpath(__file__)))))
+
+import benchmark_results
+
+
+####################################################################################################
+# @parse_command_line_arguments
+####################################################################################################
+def parse_command_line_arguments(arguments=None):
+    """Parses the input arguments.
+
+    :param arguments:
+        Command line arguments.
+    :return:
+        Arguments list.
+    """
+
+    # add all the options
+    description = 'Timing the imports of a NeuroMorphoVis command line script in a fresh ' \
+                  'interpreter, this script is launched by run-import-benchmark.py in a ' \
+                  'background Blender'
+    parser = argparse.ArgumentParser(description=description)
+
+    arg_help = 'The command line script whose imports are timed, it is not executed'
+    parser.add_argument('--script',
+                        action='store', dest='script', help=arg_help)
+
+    arg_help = 'The output JSON file of the timed imports'
+    parser.add_argument('--output',
+                        action='store', dest='output', help=arg_help)
+
+    # Parse the arguments
+    return parser.parse_args(arguments)
+
+
+####################################################################################################
+# @ Run the main function if invoked from the command line.
+####################################################################################################
+if __name__ == "__main__":
+
+    # Ignore blender extra arguments required to launch blender given to the command line interface
+    args = sys.argv
+    sys.argv = args[args.index("--") + 1:]
+    args = parse_command_line_arguments(sys.argv)
+
+    # Run the script under another name to execute its imports only
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    runpy.run_path(args.script, run_name='nmv_import_benchmark')
+    cpu_time = time.process_time() - cpu_start
+    wall_time = time.perf_counter() - wall_start
+
+    benchmark_results.write_results(
+        {'wall_time': wall_time,
+         'cpu_time': cpu_time,
+         'nmv_modules': len([name for name in sys.modules if name.split('.')[0] == 'nmv'])},
+        args.output)
@@ -0,0 +1,231 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import sys, os
+import argparse
+import shutil
+import tempfile
+
+# Append the internal modules into the system paths to avoid Blender importing conflicts
+sys.path.append(('%s/../..' % (os.path.dirname(os.path.realpath(__file__)))))
+sys.path.append(('%s/core' % (os.path.dirname(os.path.realpath(__file__)))))
+
+# Internal imports
+import nmv
+import nmv.builders
+import nmv.enums
+import nmv.file
+import nmv.interface
+import nmv.options
+import nmv.scene
+import nmv.skeleton
+import benchmark_results
+
+
+####################################################################################################
+# @parse_command_line_arguments
+####################################################################################################
+def parse_command_line_arguments(arguments=None):
+    """Parses the input arguments.
+
+    :param arguments:
+        Command line arguments.
+    :return:
+        Arguments list.
+    """
+
+    # add all the options
+    description = 'Benchmarking the Blender stages of the NeuroMorphoVis pipeline on a single ' \
+                  'morphology, this script is launched by run-benchmark.py in a background Blender'
+    parser = argparse.ArgumentParser(description=description)
+
+    arg_help = 'The morphology file'
+    parser.add_argument('--morphology',
+                        action='store', dest='morphology', help=arg_help)
+
+    arg_help = 'The output JSON file of the timed stages'
+    parser.add_argument('--output',
+                        action='store', dest='output', help=arg_help)
+
+    arg_help = 'Number of the timed runs of every stage, the median is reported'
+    parser.add_argument('--repeats',
+                        action='store', dest='repeats', type=int, default=3, help=arg_help)
+
+    arg_help = 'Skip the meshing stages, which are the slowest ones'
+    parser.add_argument('--skip-meshing',
+                        action='store_true', dest='skip_meshing', default=False, help=arg_help)
+
+    # Parse the arguments
+    return parser.parse_args(arguments)
+
+
+####################################################################################################
+# @resample_morphology
+####################################################################################################
+def resample_morphology(morphology):
+    """Resamples all the sections of a morphology adaptively.
+
+    :param morphology:
+        A given morphology, resampled in place.
+    :return:
+        The resampled morphology.
+    """
+
+    nmv.skeleton.ops.apply_operation_to_morphology(
+        *[morphology, nmv.skeleton.ops.resample_section_adaptively])
+    return morphology
+
+
+####################################################################################################
+# @draw_morphology_skeleton
+####################################################################################################
+def draw_morphology_skeleton(morphology,
+                             options):
+    """Draws the skeleton of a morphology with disconnected sections in an empty scene.
+
+    :param morphology:
+        A given morphology.
+    :param options:
+        NeuroMorphoVis options.
+    :return:
+        The drawn skeleton objects.
+    """
+
+    builder = nmv.builders.DisconnectedSectionsBuilder(morphology=morphology, options=options)
+    return builder.draw_morphology_skeleton()
+
+
+####################################################################################################
+# @reconstruct_mesh
+####################################################################################################
+def reconstruct_mesh(morphology,
+                     options):
+    """Reconstructs the mesh of a morphology with the skinning builder in an empty scene.
+
+    :param morphology:
+        A given morphology.
+    :param options:
+        NeuroMorphoVis options.
+    :return:
+        The meshes in the scene.
+    """
+
+    builder = nmv.builders.SkinningBuilder(morphology=morphology, options=options)
+    builder.reconstruct_mesh()
+    return nmv.scene.get_list_of_meshes_in_scene()
+
+
+####################################################################################################
+# @benchmark_blender_stages
+####################################################################################################
+def benchmark_blender_stages(args,
+                             output_directory):
+    """Benchmarks the Blender stages of the pipeline on a single morphology.
+
+    :param args:
+        The command line arguments.
+    :param output_directory:
+        A temporary directory for the statistics and the exported meshes.
+    :return:
+        A dictionary of timed stages.
+    """
+
+    # The default options, with all the side outputs written to the temporary directory
+    options = nmv.options.NeuroMorphoVisOptions()
+    options.io.output_directory = output_directory
+    options.io.statistics_directory = output_directory
+    options.io.meshes_directory = output_directory
+
+    stages = dict()
+
+    # Read the morphology
+    stages['read_morphology'] = benchmark_results.time_stage(
+        lambda: nmv.file.read_morphology_from_file_naively(args.morphology), args.repeats)
+    loading_flag, morphology = stages['read_morphology']['result']
+    if not loading_flag:
+        nmv.logger.log('ERROR: Cannot load the morphology file [%s]' % args.morphology)
+        return stages
+    options.morphology.label = morphology.label
+
+    # Clone the morphology
+    stages['clone_morphology'] = benchmark_results.time_stage(morphology.clone, args.repeats)
+
+    # Resample a clone of the morphology, the cloning is not timed
+    stages['resample_morphology'] = benchmark_results.time_stage(
+        resample_morphology, args.repeats, setup=morphology.clone)
+
+    # Compute the bounding box, on a fresh clone to skip the cached box
+    stages['compute_bounding_box'] = benchmark_results.time_stage(
+        nmv.skeleton.compute_morphology_bounding_box, args.repeats, setup=morphology.clone)
+
+    # Analyze the morphology
+    stages['analyze_morphology'] = benchmark_results.time_stage(
+        lambda: nmv.interface.analyze_morphology(morphology=morphology), args.repeats)
+
+    # Draw the skeleton in an empty scene
+    def clear_scene_and_clone():
+        nmv.scene.ops.clear_scene()
+        return morphology.clone()
+    stages['draw_morphology_skeleton'] = benchmark_results.time_stage(
+        lambda clone: draw_morphology_skeleton(clone, options), args.repeats,
+        setup=clear_scene_and_clone)
+
+    if args.skip_meshing:
+        return stages
+
+    # Reconstruct the mesh in an empty scene
+    stages['reconstruct_mesh'] = benchmark_results.time_stage(
+        lambda clone: reconstruct_mesh(clone, options), args.repeats,
+        setup=clear_scene_and_clone)
+    mesh_objects = stages['reconstruct_mesh']['result']
+
+    # Export the reconstructed mesh
+    stages['export_mesh'] = benchmark_results.time_stage(
+        lambda: nmv.file.export_mesh_objects_to_file(
+            mesh_objects, output_directory, morphology.label,
+            nmv.enums.Meshing.ExportFormat.PLY, False), args.repeats)
+
+    return stages
+
+
+####################################################################################################
+# @ Run the main function if invoked from the command line.
+####################################################################################################
+if __name__ == "__main__":
+
+    # Ignore blender extra arguments required to launch blender given to the command line interface
+    args = sys.argv
+    sys.argv = args[args.index("--") + 1:]
+    args = parse_command_line_arguments(sys.argv)
+
+    # Record the spans of the pipeline during the benchmark to break down the stages
+    nmv.profiler.enable(label=os.path.basename(args.morphology))
+
+    # Benchmark the stages in a temporary directory
+    output_directory = tempfile.mkdtemp()
+    try:
+        stages = benchmark_blender_stages(args, output_directory)
+    finally:
+        shutil.rmtree(output_directory, ignore_errors=True)
+
+    # Attach the accumulated times of the profiling categories to the results
+    stages = benchmark_results.strip_results(stages)
+    for category, times in nmv.profiler.get_report()['categories'].items():
+        stages['profile:%s' % category] = times
+
+    benchmark_results.write_results(stages, args.output)
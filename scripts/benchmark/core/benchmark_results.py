@@ -0,0 +1,243 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import os
+import sys
+import json
+import time
+import platform
+import subprocess
+import multiprocessing
+
+
+####################################################################################################
+# @time_stage
+####################################################################################################
+def time_stage(function,
+               repeats=3,
+               setup=None):
+    """Times a stage of the pipeline several times and reports the median wall and CPU times.
+
+    :param function:
+        The function of the stage. If a setup function is given, the function is called with the
+        result of the setup, otherwise it is called without arguments.
+    :param repeats:
+        The number of the timed runs.
+    :param setup:
+        An optional function that is called before every run and is not timed.
+    :return:
+        A dictionary with the median and the individual wall and CPU times in seconds, and the
+        result of the last run under the key 'result'.
+    """
+
+    wall_times = list()
+    cpu_times = list()
+    result = None
+    for i in range(max(1, repeats)):
+
+        # Prepare the run
+        argument = setup() if setup is not None else None
+
+        # Time the run
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        result = function(argument) if setup is not None else function()
+        cpu_times.append(time.process_time() - cpu_start)
+        wall_times.append(time.perf_counter() - wall_start)
+
+    return {'wall_time': get_median(wall_times),
+            'cpu_time': get_median(cpu_times),
+            'wall_times': wall_times,
+            'cpu_times': cpu_times,
+            'result': result}
+
+
+####################################################################################################
+# @get_median
+####################################################################################################
+def get_median(values):
+    """Returns the median of a list of values.
+
+    :param values:
+        A non-empty list of values.
+    :return:
+        The median value.
+    """
+
+    values = sorted(values)
+    middle = len(values) // 2
+    if len(values) % 2 == 1:
+        return values[middle]
+    return 0.5 * (values[middle - 1] + values[middle])
+
+
+####################################################################################################
+# @strip_results
+####################################################################################################
+def strip_results(stages):
+    """Removes the results of the runs from the timed stages to be able to serialize them.
+
+    :param stages:
+        A dictionary of timed stages, see @time_stage.
+    :return:
+        The same dictionary without the results.
+    """
+
+    for stage in stages.values():
+        stage.pop('result', None)
+    return stages
+
+
+####################################################################################################
+# @get_git_revision
+####################################################################################################
+def get_git_revision(directory):
+    """Returns the git revision of the repository and whether it has uncommitted changes.
+
+    :param directory:
+        A directory in the repository.
+    :return:
+        A tuple (revision, dirty), the revision is None if git is not available.
+    """
+
+    try:
+        revision = subprocess.check_output(
+            ['git', 'rev-parse', 'HEAD'], cwd=directory, stderr=subprocess.DEVNULL)
+        status = subprocess.check_output(
+            ['git', 'status', '--porcelain', '--untracked-files=no'], cwd=directory,
+            stderr=subprocess.DEVNULL)
+        return revision.decode().strip(), len(status.strip()) > 0
+    except (OSError, subprocess.CalledProcessError):
+        return None, False
+
+
+####################################################################################################
+# @get_environment
+####################################################################################################
+def get_environment(directory):
+    """Returns a description of the machine and the revision the benchmark is running on.
+
+    :param directory:
+        A directory in the repository.
+    :return:
+        A dictionary that can be serialized to JSON.
+    """
+
+    revision, dirty = get_git_revision(directory)
+    return {'revision': revision,
+            'dirty': dirty,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'platform': platform.platform(),
+            'processor': platform.processor(),
+            'cpu_count': multiprocessing.cpu_count(),
+            'python': sys.version.split()[0]}
+
+
+####################################################################################################
+# @write_results
+####################################################################################################
+def write_results(results,
+                  file_path):
+    """Writes the results of a benchmark into a JSON file.
+
+    :param results:
+        A dictionary of results.
+    :param file_path:
+        The path to the JSON file.
+    """
+
+    directory = os.path.dirname(os.path.abspath(file_path))
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+    with open(file_path, 'w') as results_file:
+        json.dump(results, results_file, indent=1, sort_keys=True)
+
+
+####################################################################################################
+# @read_results
+####################################################################################################
+def read_results(file_path):
+    """Reads the results of a benchmark from a JSON file.
+
+    :param file_path:
+        The path to the JSON file.
+    :return:
+        A dictionary of results.
+    """
+
+    with open(file_path, 'r') as results_file:
+        return json.load(results_file)
+
+
+####################################################################################################
+# @compare_results
+####################################################################################################
+def compare_results(baseline,
+                    current,
+                    threshold=0.1):
+    """Compares the median wall times of the stages of two benchmarks, stage by stage and case by
+    case. Only the stages that are present in both benchmarks are compared.
+
+    :param baseline:
+        The results of the baseline benchmark.
+    :param current:
+        The results of the current benchmark.
+    :param threshold:
+        The relative slowdown above which a stage is reported as a regression.
+    :return:
+        A list of rows (case, stage, baseline time, current time, ratio, regression).
+    """
+
+    rows = list()
+    for case_name, case in sorted(current['cases'].items()):
+        if case_name not in baseline['cases']:
+            continue
+        baseline_stages = baseline['cases'][case_name]['stages']
+        for stage_name, stage in sorted(case['stages'].items()):
+            if stage_name not in baseline_stages:
+                continue
+            baseline_time = baseline_stages[stage_name]['wall_time']
+            current_time = stage['wall_time']
+            ratio = current_time / baseline_time if baseline_time > 0.0 else float('inf')
+            rows.append((case_name, stage_name, baseline_time, current_time, ratio,
+                         ratio > 1.0 + threshold))
+    return rows
+
+
+####################################################################################################
+# @print_comparison
+####################################################################################################
+def print_comparison(rows):
+    """Prints the comparison of two benchmarks as a table.
+
+    :param rows:
+        The rows returned by @compare_results.
+    :return:
+        The number of the regressions.
+    """
+
+    print('%-36s %-30s %12s %12s %8s' % ('Case', 'Stage', 'Baseline [s]', 'Current [s]',
+                                          'Ratio'))
+    regressions = 0
+    for case_name, stage_name, baseline_time, current_time, ratio, regression in rows:
+        print('%-36s %-30s %12.4f %12.4f %7.2fx%s' % (
+            case_name, stage_name, baseline_time, current_time, ratio,
+            '  REGRESSION' if regression else ''))
+        if regression:
+            regressions += 1
+    return regressions
@@ -0,0 +1,271 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import math
+import random
+
+
+####################################################################################################
+# SWC sample types
+####################################################################################################
+SWC_SOMA = 1
+SWC_AXON = 2
+SWC_BASAL_DENDRITE = 3
+SWC_APICAL_DENDRITE = 4
+
+
+####################################################################################################
+# The presets of the synthetic morphologies: (arbors, branching depth, samples per section)
+####################################################################################################
+PRESETS = {
+    'tiny': (2, 3, 5),
+    'small': (4, 5, 10),
+    'medium': (6, 7, 20),
+    'large': (8, 9, 40),
+}
+
+
+####################################################################################################
+# @SyntheticMorphology
+####################################################################################################
+class SyntheticMorphology:
+    """The parameters of a synthetic morphology, whose arbors are full binary trees.
+    """
+
+    ################################################################################################
+    # @__init__
+    ################################################################################################
+    def __init__(self,
+                 number_arbors=4,
+                 branching_depth=5,
+                 samples_per_section=10,
+                 seed=0,
+                 soma_radius=6.0,
+                 sampling_step=2.0,
+                 initial_radius=1.5):
+        """Constructor
+
+        :param number_arbors:
+            The number of the arbors, the first one is an axon and the second one, if any, is an
+            apical dendrite, the rest are basal dendrites.
+        :param branching_depth:
+            The maximum branching order of the arbors, each arbor has 2 ** depth - 1 sections.
+        :param samples_per_section:
+            The number of the samples of every section, including the branching point.
+        :param seed:
+            The seed of the random generator, the same parameters always give the same morphology.
+        :param soma_radius:
+            The radius of the soma in microns.
+        :param sampling_step:
+            The distance between two successive samples in microns.
+        :param initial_radius:
+            The radius of the first sample of every arbor in microns.
+        """
+
+        self.number_arbors = number_arbors
+        self.branching_depth = branching_depth
+        self.samples_per_section = max(2, samples_per_section)
+        self.seed = seed
+        self.soma_radius = soma_radius
+        self.sampling_step = sampling_step
+        self.initial_radius = initial_radius
+
+    ################################################################################################
+    # @get_name
+    ################################################################################################
+    def get_name(self):
+        """Returns a name that identifies the parameters of the morphology.
+
+        :return:
+            The name of the morphology.
+        """
+
+        return 'synthetic-a%d-d%d-s%d-r%d' % (self.number_arbors, self.branching_depth,
+                                              self.samples_per_section, self.seed)
+
+    ################################################################################################
+    # @get_number_sections
+    ################################################################################################
+    def get_number_sections(self):
+        """Returns the total number of the sections of the arbors.
+
+        :return:
+            The number of the sections.
+        """
+
+        return self.number_arbors * (2 ** self.branching_depth - 1)
+
+    ################################################################################################
+    # @get_number_samples
+    ################################################################################################
+    def get_number_samples(self):
+        """Returns the total number of the samples, including the soma sample. The branching point
+        is shared between a section and its children.
+
+        :return:
+            The number of the samples.
+        """
+
+        return 1 + self.get_number_sections() * (self.samples_per_section - 1) + \
+            self.number_arbors
+
+
+####################################################################################################
+# @get_arbor_type
+####################################################################################################
+def get_arbor_type(arbor_index):
+    """Returns the SWC type of an arbor from its index.
+
+    :param arbor_index:
+        The index of the arbor.
+    :return:
+        The SWC type of the arbor.
+    """
+
+    if arbor_index == 0:
+        return SWC_AXON
+    elif arbor_index == 1:
+        return SWC_APICAL_DENDRITE
+    return SWC_BASAL_DENDRITE
+
+
+####################################################################################################
+# @get_fibonacci_direction
+####################################################################################################
+def get_fibonacci_direction(index,
+                            count):
+    """Returns the index-th of count directions that are evenly distributed on the unit sphere.
+
+    :param index:
+        The index of the direction.
+    :param count:
+        The number of the directions.
+    :return:
+        A unit direction (x, y, z).
+    """
+
+    z = 1.0 - (2.0 * index + 1.0) / count
+    radius = math.sqrt(max(0.0, 1.0 - z * z))
+    angle = index * math.pi * (3.0 - math.sqrt(5.0))
+    return radius * math.cos(angle), radius * math.sin(angle), z
+
+
+####################################################################################################
+# @perturb_direction
+####################################################################################################
+def perturb_direction(direction,
+                      generator,
+                      spread):
+    """Returns a random unit direction around a given one.
+
+    :param direction:
+        A unit direction.
+    :param generator:
+        A random.Random generator.
+    :param spread:
+        The magnitude of the perturbation.
+    :return:
+        A unit direction (x, y, z).
+    """
+
+    x = direction[0] + generator.uniform(-spread, spread)
+    y = direction[1] + generator.uniform(-spread, spread)
+    z = direction[2] + generator.uniform(-spread, spread)
+    length = math.sqrt(x * x + y * y + z * z)
+    if length == 0.0:
+        return direction
+    return x / length, y / length, z / length
+
+
+####################################################################################################
+# @generate_swc_samples
+####################################################################################################
+def generate_swc_samples(morphology):
+    """Generates the samples of a synthetic morphology in the SWC order.
+
+    :param morphology:
+        A SyntheticMorphology.
+    :return:
+        A list of SWC samples (index, type, x, y, z, radius, parent index).
+    """
+
+    generator = random.Random(morphology.seed)
+
+    # The soma is a single sample at the origin
+    samples = [(1, SWC_SOMA, 0.0, 0.0, 0.0, morphology.soma_radius, -1)]
+
+    for arbor_index in range(morphology.number_arbors):
+        arbor_type = get_arbor_type(arbor_index)
+        direction = get_fibonacci_direction(arbor_index, morphology.number_arbors)
+
+        # The first sample of the arbor is on the surface of the soma and connected to it
+        point = tuple(morphology.soma_radius * d for d in direction)
+        samples.append((len(samples) + 1, arbor_type, point[0], point[1], point[2],
+                        morphology.initial_radius, 1))
+
+        # Walk the sections with an explicit stack of (parent sample, point, direction, radius,
+        # branching order)
+        stack = [(len(samples), point, direction, morphology.initial_radius, 1)]
+        while stack:
+            parent, point, direction, radius, order = stack.pop()
+
+            # The radius tapers by 20 % along each section
+            end_radius = radius * 0.8
+            for i in range(1, morphology.samples_per_section):
+                direction = perturb_direction(direction, generator, 0.2)
+                point = tuple(p + morphology.sampling_step * d for p, d in zip(point, direction))
+                sample_radius = radius + (end_radius - radius) * i / \
+                    (morphology.samples_per_section - 1)
+                samples.append((len(samples) + 1, arbor_type, point[0], point[1], point[2],
+                                sample_radius, parent))
+                parent = len(samples)
+
+            # Bifurcate until the branching depth is reached
+            if order < morphology.branching_depth:
+                for side in (-1.0, 1.0):
+                    child_direction = perturb_direction(
+                        (direction[0] + side * direction[1] * 0.6,
+                         direction[1] - side * direction[0] * 0.6,
+                         direction[2]), generator, 0.3)
+                    stack.append((parent, point, child_direction, end_radius, order + 1))
+
+    # Return the samples
+    return samples
+
+
+####################################################################################################
+# @write_synthetic_swc
+####################################################################################################
+def write_synthetic_swc(morphology,
+                        swc_file):
+    """Writes a synthetic morphology into an SWC file.
+
+    :param morphology:
+        A SyntheticMorphology.
+    :param swc_file:
+        The path to the output SWC file.
+    :return:
+        The number of the written samples.
+    """
+
+    samples = generate_swc_samples(morphology)
+    with open(swc_file, 'w') as output_file:
+        output_file.write('# %s\n' % morphology.get_name())
+        for sample in samples:
+            output_file.write('%d %d %.4f %.4f %.4f %.4f %d\n' % sample)
+    return len(samples)
@@ -0,0 +1,268 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import sys, os
+import argparse
+import glob
+import shutil
+import subprocess
+import tempfile
+
+# Internal imports
+sys.path.append(('%s/core' % (os.path.dirname(os.path.realpath(__file__)))))
+sys.path.append(('%s/../skeleton-thumbnails/core' % (os.path.dirname(os.path.realpath(__file__)))))
+
+import benchmark_results
+import synthetic_morphology
+import skeleton_rasterizer
+
+
+####################################################################################################
+# @parse_command_line_arguments
+####################################################################################################
+def parse_command_line_arguments(arguments=None):
+    """Parses the input arguments.
+
+    :param arguments:
+        Command line arguments.
+    :return:
+        Arguments list.
+    """
+
+    # add all the options
+    description = 'Benchmarking the stages of the NeuroMorphoVis pipeline on synthetic and ' \
+                  'bundled morphologies, the results are stored as JSON to be compared between ' \
+                  'revisions'
+    parser = argparse.ArgumentParser(description=description)
+
+    arg_help = 'The output directory of the results and the synthetic morphologies'
+    parser.add_argument('--output-directory',
+                        action='store', dest='output_directory', help=arg_help)
+
+    arg_help = 'The presets of the synthetic morphologies, comma separated: %s' % \
+               ', '.join(sorted(synthetic_morphology.PRESETS.keys()))
+    parser.add_argument('--presets',
+                        action='store', dest='presets', default='tiny,small,medium', help=arg_help)
+
+    arg_help = 'The seed of the synthetic morphologies'
+    parser.add_argument('--seed',
+                        action='store', dest='seed', type=int, default=0, help=arg_help)
+
+    arg_help = 'Number of the timed runs of every stage, the median is reported'
+    parser.add_argument('--repeats',
+                        action='store', dest='repeats', type=int, default=3, help=arg_help)
+
+    arg_help = 'A directory of .swc or .h5 morphologies to be benchmarked along with the ' \
+               'synthetic ones, for example data/morphologies/swc'
+    parser.add_argument('--morphologies-directory',
+                        action='store', dest='morphologies_directory', default=None, help=arg_help)
+
+    arg_help = 'Blender executable, the Blender stages are benchmarked only if it is given ' \
+               'or found in the PATH'
+    parser.add_argument('--blender',
+                        action='store', dest='blender', default=shutil.which('blender'),
+                        help=arg_help)
+
+    arg_help = 'Skip the Blender stages'
+    parser.add_argument('--skip-blender',
+                        action='store_true', dest='skip_blender', default=False, help=arg_help)
+
+    arg_help = 'Skip the meshing stages in Blender, which are the slowest ones'
+    parser.add_argument('--skip-meshing',
+                        action='store_true', dest='skip_meshing', default=False, help=arg_help)
+
+    arg_help = 'A JSON file of a previous benchmark to compare the results with'
+    parser.add_argument('--compare',
+                        action='store', dest='compare', default=None, help=arg_help)
+
+    arg_help = 'The relative slowdown above which a stage is reported as a regression'
+    parser.add_argument('--threshold',
+                        action='store', dest='threshold', type=float, default=0.1, help=arg_help)
+
+    # Parse the arguments
+    return parser.parse_args(arguments)
+
+
+####################################################################################################
+# @benchmark_python_stages
+####################################################################################################
+def benchmark_python_stages(morphology_file,
+                            repeats):
+    """Benchmarks the stages that run in plain Python, without Blender.
+
+    :param morphology_file:
+        The path to the morphology file.
+    :param repeats:
+        Number of the timed runs of every stage.
+    :return:
+        A dictionary of timed stages.
+    """
+
+    stages = dict()
+
+    # Read the skeleton
+    stages['read_skeleton_arrays'] = benchmark_results.time_stage(
+        lambda: skeleton_rasterizer.read_skeleton_arrays(morphology_file), repeats)
+    skeleton = stages['read_skeleton_arrays']['result']
+
+    # Rasterize the skeleton
+    stages['rasterize_skeleton'] = benchmark_results.time_stage(
+        lambda: skeleton_rasterizer.rasterize_skeleton(skeleton), repeats)
+
+    return stages
+
+
+####################################################################################################
+# @benchmark_blender_stages
+####################################################################################################
+def benchmark_blender_stages(morphology_file,
+                             args):
+    """Benchmarks the stages that run in Blender in a background Blender process.
+
+    :param morphology_file:
+        The path to the morphology file.
+    :param args:
+        The command line arguments.
+    :return:
+        A dictionary of timed stages, or an empty dictionary if Blender has failed.
+    """
+
+    # A temporary file to collect the results from Blender
+    handle, output_file = tempfile.mkstemp(suffix='.json')
+    os.close(handle)
+
+    # Run Blender in the background
+    script = '%s/blender-stages.py' % os.path.dirname(os.path.realpath(__file__))
+    shell_command = [args.blender, '-b', '--python-exit-code', '1', '--python', script, '--',
+                     '--morphology', morphology_file, '--output', output_file,
+                     '--repeats', str(args.repeats)]
+    if args.skip_meshing:
+        shell_command.append('--skip-meshing')
+
+    try:
+        subprocess.check_call(shell_command, stdout=subprocess.DEVNULL)
+        return benchmark_results.read_results(output_file)
+    except (OSError, subprocess.CalledProcessError, ValueError):
+        print('WARNING: The Blender stages have failed for [%s]' % morphology_file)
+        return dict()
+    finally:
+        os.remove(output_file)
+
+
+####################################################################################################
+# @benchmark_morphology
+####################################################################################################
+def benchmark_morphology(morphology_file,
+                         args):
+    """Benchmarks all the stages on a given morphology file.
+
+    :param morphology_file:
+        The path to the morphology file.
+    :param args:
+        The command line arguments.
+    :return:
+        A dictionary of timed stages.
+    """
+
+    stages = dict()
+
+    # The Python stages, the h5 reader needs h5py
+    try:
+        stages.update(benchmark_python_stages(morphology_file, args.repeats))
+    except ImportError as error:
+        print('WARNING: Skipping the Python stages of [%s], %s' % (morphology_file, str(error)))
+
+    # The Blender stages
+    if args.blender is not None and not args.skip_blender:
+        stages.update(benchmark_blender_stages(morphology_file, args))
+
+    return benchmark_results.strip_results(stages)
+
+
+####################################################################################################
+# @ Main
+####################################################################################################
+if __name__ == "__main__":
+
+    # Parse the command line arguments
+    args = parse_command_line_arguments()
+
+    # Create the output directory if it does not exist
+    morphologies_directory = '%s/morphologies' % args.output_directory
+    if not os.path.exists(morphologies_directory):
+        os.makedirs(morphologies_directory)
+
+    # The environment of the benchmark
+    results = {'environment': benchmark_results.get_environment(
+                   os.path.dirname(os.path.realpath(__file__))),
+               'settings': {'repeats': args.repeats,
+                            'seed': args.seed,
+                            'blender': args.blender if not args.skip_blender else None,
+                            'skip_meshing': args.skip_meshing},
+               'cases': dict()}
+
+    # The synthetic morphologies
+    for preset in [preset.strip() for preset in args.presets.split(',') if preset.strip()]:
+        if preset not in synthetic_morphology.PRESETS:
+            print('WARNING: Unknown preset [%s]' % preset)
+            continue
+        arbors, depth, samples = synthetic_morphology.PRESETS[preset]
+        morphology = synthetic_morphology.SyntheticMorphology(
+            number_arbors=arbors, branching_depth=depth, samples_per_section=samples,
+            seed=args.seed)
+        morphology_file = '%s/%s.swc' % (morphologies_directory, morphology.get_name())
+
+        print('Benchmarking [%s]' % morphology.get_name())
+        generation = benchmark_results.time_stage(
+            lambda: synthetic_morphology.write_synthetic_swc(morphology, morphology_file),
+            args.repeats)
+        stages = benchmark_morphology(morphology_file, args)
+        stages['generate_synthetic_morphology'] = generation
+        results['cases'][morphology.get_name()] = {
+            'preset': preset,
+            'number_samples': morphology.get_number_samples(),
+            'number_sections': morphology.get_number_sections(),
+            'stages': benchmark_results.strip_results(stages)}
+
+    # The given morphologies
+    if args.morphologies_directory is not None:
+        morphology_files = list()
+        for extension in ['h5', 'swc', 'H5', 'SWC']:
+            morphology_files.extend(
+                glob.glob('%s/*.%s' % (args.morphologies_directory, extension)))
+        for morphology_file in sorted(set(morphology_files)):
+            print('Benchmarking [%s]' % os.path.basename(morphology_file))
+            results['cases'][os.path.basename(morphology_file)] = {
+                'preset': None,
+                'stages': benchmark_morphology(morphology_file, args)}
+
+    # Write the results, named after the revision
+    revision = results['environment']['revision']
+    results_file = '%s/benchmark-%s%s.json' % (
+        args.output_directory, revision[:12] if revision is not None else 'unknown',
+        '-dirty' if results['environment']['dirty'] else '')
+    benchmark_results.write_results(results, results_file)
+    print('Results: [%s]' % results_file)
+
+    # Compare with a previous benchmark
+    if args.compare is not None:
+        rows = benchmark_results.compare_results(
+            benchmark_results.read_results(args.compare), results, threshold=args.threshold)
+        regressions = benchmark_results.print_comparison(rows)
+        print('[%d] regressions above [%d%%]' % (regressions, int(args.threshold * 100)))
+        sys.exit(1 if regressions > 0 else 0)
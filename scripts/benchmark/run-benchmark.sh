@@ -0,0 +1,56 @@
+#!/usr/bin/env bash
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# Python executable
+PYTHON='python3'
+
+# Blender executable, leave empty to benchmark the Blender-free stages only
+BLENDER=''
+
+# The output directory of the results
+OUTPUT_DIRECTORY='benchmark'
+
+# The presets of the synthetic morphologies: tiny, small, medium or large
+PRESETS='tiny,small,medium'
+
+# Number of the timed runs of every stage
+REPEATS=3
+
+# A directory of morphologies to be benchmarked along with the synthetic ones
+MORPHOLOGIES_DIRECTORY='../../data/morphologies/swc'
+
+# A previous results file to compare with, leave empty to skip the comparison
+COMPARE=''
+
+####################################################################################################
+EXTRA_ARGUMENTS=''
+if [ -n "$BLENDER" ]; then
+    EXTRA_ARGUMENTS="$EXTRA_ARGUMENTS --blender=$BLENDER"
+else
+    EXTRA_ARGUMENTS="$EXTRA_ARGUMENTS --skip-blender"
+fi
+if [ -n "$COMPARE" ]; then
+    EXTRA_ARGUMENTS="$EXTRA_ARGUMENTS --compare=$COMPARE"
+fi
+
+$PYTHON run-benchmark.py                                                                           \
+    --output-directory=$OUTPUT_DIRECTORY                                                           \
+    --presets=$PRESETS                                                                             \
+    --repeats=$REPEATS                                                                             \
+    --morphologies-directory=$MORPHOLOGIES_DIRECTORY                                               \
+    $EXTRA_ARGUMENTS
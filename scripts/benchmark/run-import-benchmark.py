@@ -0,0 +1,188 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+import sys, os
+import argparse
+import shutil
+import subprocess
+import tempfile
+
+sys.path.append(('%s/core' % (os.path.dirname(os.path.realpath(__file__)))))
+
+import benchmark_results
+
+
+####################################################################################################
+# @parse_command_line_arguments
+####################################################################################################
+def parse_command_line_arguments(arguments=None):
+    """Parses the input arguments.
+
+    :param arguments:
+        Command line arguments.
+    :return:
+        Arguments list.
+    """
+
+    # add all the options
+    description = 'Benchmarking the startup of the NeuroMorphoVis command line scripts, every ' \
+                  'run imports a script in a fresh background Blender. The results are stored ' \
+                  'as JSON to be compared between revisions'
+    parser = argparse.ArgumentParser(description=description)
+
+    arg_help = 'The output directory of the results'
+    parser.add_argument('--output-directory',
+                        action='store', dest='output_directory', help=arg_help)
+
+    arg_help = 'The command line scripts in nmv/interface/cli, comma separated'
+    parser.add_argument('--scripts',
+                        action='store', dest='scripts',
+                        default='morphology_analysis,soma_reconstruction', help=arg_help)
+
+    arg_help = 'Number of the timed runs of every script, the median is reported'
+    parser.add_argument('--repeats',
+                        action='store', dest='repeats', type=int, default=5, help=arg_help)
+
+    arg_help = 'Blender executable'
+    parser.add_argument('--blender',
+                        action='store', dest='blender', default=shutil.which('blender'),
+                        help=arg_help)
+
+    arg_help = 'A JSON file of a previous benchmark to compare the results with'
+    parser.add_argument('--compare',
+                        action='store', dest='compare', default=None, help=arg_help)
+
+    arg_help = 'The relative slowdown above which a script is reported as a regression'
+    parser.add_argument('--threshold',
+                        action='store', dest='threshold', type=float, default=0.1, help=arg_help)
+
+    # Parse the arguments
+    return parser.parse_args(arguments)
+
+
+####################################################################################################
+# @time_script_imports
+####################################################################################################
+def time_script_imports(script,
+                        args):
+    """Times the imports of a command line script in a background Blender process.
+
+    :param script:
+        The path to the command line script.
+    :param args:
+        The command line arguments.
+    :return:
+        A dictionary of the wall and CPU times of the imports and the number of the imported
+        NeuroMorphoVis modules, or None if Blender has failed.
+    """
+
+    # A temporary file to collect the results from Blender
+    handle, output_file = tempfile.mkstemp(suffix='.json')
+    os.close(handle)
+
+    # Run Blender in the background
+    timer = '%s/blender-imports.py' % os.path.dirname(os.path.realpath(__file__))
+    shell_command = [args.blender, '-b', '--factory-startup', '--python-exit-code', '1',
+                     '--python', timer, '--', '--script', script, '--output', output_file]
+
+    try:
+        subprocess.check_call(shell_command, stdout=subprocess.DEVNULL)
+        return benchmark_results.read_results(output_file)
+    except (OSError, subprocess.CalledProcessError, ValueError):
+        print('WARNING: Timing the imports of [%s] has failed' % script)
+        return None
+    finally:
+        os.remove(output_file)
+
+
+####################################################################################################
+# @benchmark_script
+####################################################################################################
+def benchmark_script(script,
+                     args):
+    """Benchmarks the imports of a command line script in several fresh processes.
+
+    :param script:
+        The path to the command line script.
+    :param args:
+        The command line arguments.
+    :return:
+        A dictionary of timed stages, empty if all the runs have failed.
+    """
+
+    runs = [time_script_imports(script, args) for i in range(max(1, args.repeats))]
+    runs = [run for run in runs if run is not None]
+    if len(runs) == 0:
+        return dict()
+
+    wall_times = [run['wall_time'] for run in runs]
+    cpu_times = [run['cpu_time'] for run in runs]
+    return {'import': {'wall_time': benchmark_results.get_median(wall_times),
+                       'cpu_time': benchmark_results.get_median(cpu_times),
+                       'wall_times': wall_times,
+                       'cpu_times': cpu_times,
+                       'nmv_modules': runs[-1]['nmv_modules']}}
+
+
+####################################################################################################
+# @ Main
+####################################################################################################
+if __name__ == "__main__":
+
+    # Parse the command line arguments
+    args = parse_command_line_arguments()
+    if args.blender is None:
+        print('ERROR: Blender is required, use --blender')
+        sys.exit(1)
+
+    # The environment of the benchmark
+    results = {'environment': benchmark_results.get_environment(
+                   os.path.dirname(os.path.realpath(__file__))),
+               'settings': {'repeats': args.repeats,
+                            'blender': args.blender},
+               'cases': dict()}
+
+    # The command line scripts
+    cli_directory = '%s/../../nmv/interface/cli' % os.path.dirname(os.path.realpath(__file__))
+    for script_name in [name.strip() for name in args.scripts.split(',') if name.strip()]:
+        script = os.path.realpath('%s/%s.py' % (cli_directory, script_name))
+        if not os.path.isfile(script):
+            print('WARNING: Unknown script [%s]' % script_name)
+            continue
+
+        print('Benchmarking [%s]' % script_name)
+        stages = benchmark_script(script, args)
+        results['cases'][script_name] = {'preset': None, 'stages': stages}
+        if 'import' in stages:
+            print('  [%f] seconds, [%d] modules' % (stages['import']['wall_time'],
+                                                    stages['import']['nmv_modules']))
+
+    # Write the results, named after the revision
+    revision = results['environment']['revision']
+    results_file = '%s/imports-%s%s.json' % (
+        args.output_directory, revision[:12] if revision is not None else 'unknown',
+        '-dirty' if results['environment']['dirty'] else '')
+    benchmark_results.write_results(results, results_file)
+    print('Results: [%s]' % results_file)
+
+    # Compare with a previous benchmark, the ratio shows the speedup of the startup
+    if args.compare is not None:
+        rows = benchmark_results.compare_results(
+            benchmark_results.read_results(args.compare), results, threshold=args.threshold)
+        regressions = benchmark_results.print_comparison(rows)
+        print('[%d] regressions above [%d%%]' % (regressions, int(args.threshold * 100)))
+        sys.exit(1 if regressions > 0 else 0)
@@ -0,0 +1,159 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import sys, os
+
+sys.path.append(('%s/../../' %(os.path.dirname(os.path.realpath(__file__)))))
+
+# System imports
+import argparse
+import copy
+import time
+
+# NeuroMorphoVis imports
+import nmv.file
+
+
+####################################################################################################
+# @parse_command_line_arguments
+####################################################################################################
+def parse_command_line_arguments(arguments=None):
+    """Parses the input arguments.
+
+    :param arguments:
+        Command line arguments.
+    :return:
+        Arguments list.
+    """
+
+    # add all the options
+    description = 'Benchmarking Morphology.clone() against copy.deepcopy()'
+    parser = argparse.ArgumentParser(description=description)
+
+    arg_help = 'An input morphology'
+    parser.add_argument('--morphology',
+                        action='store', dest='morphology', help=arg_help)
+
+    arg_help = 'Number of copies made by each method'
+    parser.add_argument('--iterations',
+                        action='store', dest='iterations', type=int, default=10, help=arg_help)
+
+    # Parse the arguments
+    return parser.parse_args()
+
+
+####################################################################################################
+# @get_arbors_samples
+####################################################################################################
+def get_arbors_samples(morphology):
+    """Returns a flat list of the samples (position and radius) of all the arbors of a morphology.
+
+    :param morphology:
+        A given morphology.
+    :return:
+        A list of tuples (x, y, z, radius).
+    """
+
+    samples = list()
+    for arbors in [morphology.axons, morphology.basal_dendrites, morphology.apical_dendrites]:
+        if arbors is None:
+            continue
+        for arbor in arbors:
+            stack = [arbor]
+            while stack:
+                section = stack.pop()
+                for sample in section.samples:
+                    samples.append((sample.point[0], sample.point[1], sample.point[2],
+                                    sample.radius))
+                stack.extend(section.children)
+    return samples
+
+
+####################################################################################################
+# @time_copies
+####################################################################################################
+def time_copies(copy_function, morphology, iterations):
+    """Returns the average time in seconds required to copy the morphology.
+
+    :param copy_function:
+        A function that takes a morphology and returns a copy.
+    :param morphology:
+        A given morphology.
+    :param iterations:
+        Number of copies.
+    :return:
+        The average time per copy in seconds.
+    """
+
+    start = time.time()
+    for i in range(iterations):
+        copy_function(morphology)
+    return (time.time() - start) / iterations
+
+
+####################################################################################################
+# @ Main
+####################################################################################################
+if __name__ == "__main__":
+
+    # Get all arguments after the '--'
+    args = sys.argv
+    sys.argv = args[args.index("--") + 0:]
+
+    # Parse the command line arguments
+    args = parse_command_line_arguments()
+
+    # Load the morphology file
+    loading_flag, morphology_object = \
+        nmv.file.readers.read_morphology_from_file_naively(args.morphology)
+
+    # Verify the loading operation
+    if not loading_flag:
+        print({'ERROR'}, 'Invalid Morphology File')
+        exit(0)
+
+    # Make sure that both copies are identical to the original morphology
+    original_samples = get_arbors_samples(morphology_object)
+    if get_arbors_samples(morphology_object.clone()) != original_samples or \
+            get_arbors_samples(copy.deepcopy(morphology_object)) != original_samples:
+        print({'ERROR'}, 'The copies do not match the original morphology')
+        exit(0)
+
+    # Make sure that modifying the clone does not affect the original morphology
+    cloned_morphology = morphology_object.clone()
+    for arbors in [cloned_morphology.axons, cloned_morphology.basal_dendrites,
+                   cloned_morphology.apical_dendrites]:
+        if arbors is None:
+            continue
+        for arbor in arbors:
+            for sample in arbor.samples:
+                sample.point[0] += 1.0
+                sample.radius *= 2.0
+    if get_arbors_samples(morphology_object) != original_samples:
+        print({'ERROR'}, 'Modifying the clone has affected the original morphology')
+        exit(0)
+
+    # Timing
+    deepcopy_time = time_copies(copy.deepcopy, morphology_object, args.iterations)
+    clone_time = time_copies(lambda morphology: morphology.clone(), morphology_object,
+                             args.iterations)
+
+    print('Samples         : %d' % len(original_samples))
+    print('copy.deepcopy() : %f seconds' % deepcopy_time)
+    print('clone()         : %f seconds' % clone_time)
+    print('Speedup         : %2.2fx' % (deepcopy_time / clone_time))
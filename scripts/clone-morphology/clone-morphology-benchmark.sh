@@ -0,0 +1,31 @@
+#!/usr/bin/env bash
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# Blender executable
+BLENDER='blender'
+
+# The input morphology
+INPUT_MORPHOLOGY='morphology.h5'
+
+# Number of copies made by each method
+ITERATIONS=10
+
+####################################################################################################
+$BLENDER -b --verbose 0 --python clone-morphology-benchmark.py --                                  \
+    --morphology=$INPUT_MORPHOLOGY                                                                 \
+    --iterations=$ITERATIONS
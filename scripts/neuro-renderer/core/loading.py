@@ -21,6 +21,11 @@ import os
 # Blender imports
 import bpy
 
+# NeuroMorphoVis imports
+import nmv.consts
+import nmv.file
+import nmv.mesh
+
 
 ####################################################################################################
 # @import_obj_file
@@ -166,7 +171,7 @@ def load_neurons_membrane_meshes_into_scene(input_directory,
     :param neurons_list:
         A list of all the neurons parsed from the configuration file.
     :param input_type:
-        The types of the input meshes, 'blend', 'ply' or 'obj' .
+        The types of the input meshes, 'blend', 'ply', 'obj' or 'nmv'.
     """
 
     # Get the neurons meshes
@@ -187,12 +192,17 @@ def load_neurons_membrane_meshes_into_scene(input_directory,
             input_file_name = 'neuron_%s.obj' % str(neuron.gid)
             neuron.membrane_meshes = [load_obj_file(input_directory, input_file_name)]
 
+        # .nmvmesh neurons, memory-mapped and created without the importers
+        elif input_type == 'nmv':
+            input_file_name = 'neuron_%s%s' % (str(neuron.gid),
+                                               nmv.consts.Meshing.NMV_MESH_EXTENSION)
+            neuron.membrane_meshes = nmv.file.import_nmv_mesh_file(input_directory,
+                                                                   input_file_name)
+
         else:
             print('ERROR: Unrecognized input type [%s]' % input_type)
 
     if transform:
         print('Transforming')
         for i_neuron in neurons_list:
-            for i_object in i_neuron.membrane_meshes:
-                for vertex in i_object.data.vertices:
-                    vertex.co = i_neuron.transform * vertex.co
\ No newline at end of file
+            nmv.mesh.transform_mesh_objects(i_neuron.membrane_meshes, i_neuron.transform)
\ No newline at end of file
@@ -51,7 +51,7 @@ def parse_command_line_arguments(arguments=None):
     parser.add_argument('--input-directory',
                         action='store', dest='input_directory', help=arg_help)
 
-    arg_help = 'Input data type: blend, ply, obj'
+    arg_help = 'Input data type: blend, ply, obj, nmv'
     parser.add_argument('--input-type',
                         action='store', dest='input_type', help=arg_help)
 
@@ -29,6 +29,7 @@ MESHES_DIRECTORY='/data/neurorender-data/meshes'
 # Use ['blend'] if the neurons are stored in .blend files
 # Use ['ply'] if the neurons are stored in .ply meshes
 # Use ['obj'] if the neurons are stored in .obj meshes.
+# Use ['nmv'] if the neurons are stored in .nmvmesh binary meshes
 INPUT_TYPE='blend'
 
 # The output directory where the scene and images will be generated
@@ -0,0 +1,501 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import os
+import struct
+import zlib
+
+# External imports
+import numpy
+
+
+####################################################################################################
+# Sample types, shared by the SWC samples and the H5 sections
+####################################################################################################
+SOMA_TYPE = 1
+AXON_TYPE = 2
+BASAL_DENDRITE_TYPE = 3
+APICAL_DENDRITE_TYPE = 4
+
+# The default colors of the arbors, the same defaults used by nmv.enums.Color
+DEFAULT_COLORS = {
+    SOMA_TYPE: (1.0, 0.8, 0.15),
+    AXON_TYPE: (0.4, 0.7, 1.0),
+    BASAL_DENDRITE_TYPE: (0.9, 0.1, 0.075),
+    APICAL_DENDRITE_TYPE: (0.4, 0.9, 0.2),
+}
+
+# The color of the samples with unknown or custom types
+DEFAULT_UNKNOWN_COLOR = (0.5, 0.5, 0.5)
+
+# The projection axes of each view, the second axis points upwards in the image
+VIEW_AXES = {
+    'front': (0, 1),
+    'side': (2, 1),
+    'top': (0, 2),
+}
+
+# The minimum radius of a projected segment in pixels, to keep the thin branches visible
+MINIMUM_PIXEL_RADIUS = 0.5
+
+
+####################################################################################################
+# @SkeletonArrays
+####################################################################################################
+class SkeletonArrays:
+    """A flat, array-based representation of a morphology skeleton.
+
+    Every neurite segment is stored as a row in the arrays, which is all the rasterizer needs to
+    draw the morphology without building the section tree of NeuroMorphoVis.
+    """
+
+    ################################################################################################
+    # @__init__
+    ################################################################################################
+    def __init__(self,
+                 starts,
+                 ends,
+                 start_radii,
+                 end_radii,
+                 types,
+                 soma_center,
+                 soma_radius):
+        """Constructor
+
+        :param starts:
+            An Nx3 array of the first points of the segments.
+        :param ends:
+            An Nx3 array of the last points of the segments.
+        :param start_radii:
+            An N array of the radii at the first points of the segments.
+        :param end_radii:
+            An N array of the radii at the last points of the segments.
+        :param types:
+            An N array of the types of the arbors the segments belong to.
+        :param soma_center:
+            The center of the soma, or None if the morphology has no soma.
+        :param soma_radius:
+            The mean radius of the soma.
+        """
+
+        self.starts = starts
+        self.ends = ends
+        self.start_radii = start_radii
+        self.end_radii = end_radii
+        self.types = types
+        self.soma_center = soma_center
+        self.soma_radius = soma_radius
+
+
+####################################################################################################
+# @get_soma_center_and_radius
+####################################################################################################
+def get_soma_center_and_radius(points,
+                               radii):
+    """Computes the center and the mean radius of the soma from its samples.
+
+    :param points:
+        An Nx3 array of the soma samples.
+    :param radii:
+        An N array of the radii of the soma samples.
+    :return:
+        A tuple of the center (or None if there are no samples) and the radius of the soma.
+    """
+
+    # No soma
+    if len(points) == 0:
+        return None, 0.0
+
+    # A single sample defines the soma by its radius
+    if len(points) == 1:
+        return points[0], float(radii[0])
+
+    # Otherwise, it is a profile, use the mean distance to the centroid
+    center = points.mean(axis=0)
+    return center, float(numpy.linalg.norm(points - center, axis=1).mean())
+
+
+####################################################################################################
+# @read_swc_skeleton_arrays
+####################################################################################################
+def read_swc_skeleton_arrays(swc_file):
+    """Reads an SWC morphology file into skeleton arrays.
+
+    :param swc_file:
+        The path to the SWC file.
+    :return:
+        A SkeletonArrays object.
+    """
+
+    # Each row has the index, type, x, y, z, radius and the index of the parent sample
+    data = numpy.loadtxt(swc_file, comments='#', ndmin=2)
+    indices = data[:, 0].astype(numpy.int64)
+    types = data[:, 1].astype(numpy.int64)
+    points = data[:, 2:5]
+    radii = data[:, 5]
+    parents = data[:, 6].astype(numpy.int64)
+
+    # Map the parent indices to rows, the indices in the file are not necessarily contiguous
+    lookup = numpy.full(indices.max() + 2, -1, dtype=numpy.int64)
+    lookup[indices] = numpy.arange(len(indices))
+    parent_rows = numpy.where(parents >= 0, lookup[numpy.clip(parents, 0, None)], -1)
+
+    # Every non-soma sample with a parent closes a segment
+    mask = (parent_rows >= 0) & (types != SOMA_TYPE)
+    children = numpy.nonzero(mask)[0]
+    parent_rows = parent_rows[children]
+
+    # Soma
+    soma_mask = types == SOMA_TYPE
+    soma_center, soma_radius = get_soma_center_and_radius(points[soma_mask], radii[soma_mask])
+
+    return SkeletonArrays(starts=points[parent_rows], ends=points[children],
+                          start_radii=radii[parent_rows], end_radii=radii[children],
+                          types=types[children],
+                          soma_center=soma_center, soma_radius=soma_radius)
+
+
+####################################################################################################
+# @read_h5_skeleton_arrays
+####################################################################################################
+def read_h5_skeleton_arrays(h5_file):
+    """Reads an H5 morphology file into skeleton arrays.
+
+    :param h5_file:
+        The path to the H5 file.
+    :return:
+        A SkeletonArrays object.
+    """
+
+    # h5py is only needed for H5 files
+    import h5py
+
+    # The points are (x, y, z, diameter) and the structure is (first point, type, parent)
+    with h5py.File(h5_file, 'r') as data:
+        points = numpy.array(data['/points'], dtype=numpy.float64)
+        structure = numpy.array(data['/structure'], dtype=numpy.int64)
+
+    # The samples of a section run up to the first sample of the next one
+    section_starts = structure[:, 0]
+    section_ends = numpy.append(section_starts[1:], len(points))
+    section_types = structure[:, 1]
+
+    # The type of each sample, taken from its section
+    sample_types = numpy.repeat(section_types, section_ends - section_starts)
+
+    # A segment connects every sample to the next one within the same section
+    last_samples = numpy.zeros(len(points), dtype=bool)
+    last_samples[section_ends - 1] = True
+    first = numpy.nonzero(~last_samples & (sample_types != SOMA_TYPE))[0]
+
+    # Soma
+    soma_mask = sample_types == SOMA_TYPE
+    soma_center, soma_radius = get_soma_center_and_radius(points[soma_mask, :3],
+                                                          points[soma_mask, 3] * 0.5)
+
+    return SkeletonArrays(starts=points[first, :3], ends=points[first + 1, :3],
+                          start_radii=points[first, 3] * 0.5, end_radii=points[first + 1, 3] * 0.5,
+                          types=sample_types[first],
+                          soma_center=soma_center, soma_radius=soma_radius)
+
+
+####################################################################################################
+# @read_skeleton_arrays
+####################################################################################################
+def read_skeleton_arrays(morphology_file):
+    """Reads a morphology file into skeleton arrays based on its extension.
+
+    :param morphology_file:
+        The path to an .h5 or .swc morphology file.
+    :return:
+        A SkeletonArrays object.
+    """
+
+    extension = os.path.splitext(morphology_file)[1].lower()
+    if extension == '.swc':
+        return read_swc_skeleton_arrays(morphology_file)
+    elif extension == '.h5':
+        return read_h5_skeleton_arrays(morphology_file)
+    raise ValueError('Unsupported morphology format [%s]' % morphology_file)
+
+
+####################################################################################################
+# @rasterize_capsule
+####################################################################################################
+def rasterize_capsule(coverage,
+                      color_buffer,
+                      start,
+                      end,
+                      start_radius,
+                      end_radius,
+                      color):
+    """Rasterizes a tapered, anti-aliased capsule into the coverage and color buffers.
+
+    The coverage of a pixel is the distance from the pixel center to the boundary of the capsule,
+    clamped to a one-pixel wide ramp. A pixel takes the color of the capsule that covers it the
+    most, which keeps the joints between consecutive segments free of seams.
+
+    :param coverage:
+        An HxW buffer of the coverage of the pixels.
+    :param color_buffer:
+        An HxWx3 buffer of the colors of the pixels.
+    :param start:
+        The first point of the segment in pixel coordinates.
+    :param end:
+        The last point of the segment in pixel coordinates.
+    :param start_radius:
+        The radius at the first point in pixels.
+    :param end_radius:
+        The radius at the last point in pixels.
+    :param color:
+        The RGB color of the segment.
+    """
+
+    height, width = coverage.shape
+
+    # The pixels that can be touched by the capsule
+    reach = max(start_radius, end_radius) + 1.0
+    x_min = max(int(numpy.floor(min(start[0], end[0]) - reach)), 0)
+    x_max = min(int(numpy.ceil(max(start[0], end[0]) + reach)), width - 1)
+    y_min = max(int(numpy.floor(min(start[1], end[1]) - reach)), 0)
+    y_max = min(int(numpy.ceil(max(start[1], end[1]) + reach)), height - 1)
+    if x_min > x_max or y_min > y_max:
+        return
+
+    # The centers of the pixels
+    x, y = numpy.meshgrid(numpy.arange(x_min, x_max + 1) + 0.5,
+                          numpy.arange(y_min, y_max + 1) + 0.5)
+
+    # Project the pixels on the segment
+    direction = end - start
+    length_squared = float(direction.dot(direction))
+    if length_squared > 0.0:
+        t = ((x - start[0]) * direction[0] + (y - start[1]) * direction[1]) / length_squared
+        t = numpy.clip(t, 0.0, 1.0)
+    else:
+        t = numpy.zeros_like(x)
+
+    # Distance to the axis and the interpolated radius
+    distance = numpy.hypot(x - (start[0] + t * direction[0]), y - (start[1] + t * direction[1]))
+    radius = start_radius + t * (end_radius - start_radius)
+    pixel_coverage = numpy.clip(radius - distance + 0.5, 0.0, 1.0)
+
+    # Keep the strongest coverage
+    window = (slice(y_min, y_max + 1), slice(x_min, x_max + 1))
+    stronger = pixel_coverage > coverage[window]
+    coverage[window][stronger] = pixel_coverage[stronger]
+    color_buffer[window][stronger] = color
+
+
+####################################################################################################
+# @rasterize_skeleton
+####################################################################################################
+def rasterize_skeleton(skeleton,
+                       resolution=512,
+                       view='front',
+                       scale=None,
+                       margin=0.05,
+                       colors=None,
+                       background=(1.0, 1.0, 1.0, 0.0)):
+    """Projects the skeleton orthographically and rasterizes it into an RGBA image.
+
+    :param skeleton:
+        A SkeletonArrays object.
+    :param resolution:
+        The resolution of the longest side of the image, if the scale is not given.
+    :param view:
+        The projection view, 'front', 'side' or 'top'.
+    :param scale:
+        If given, the number of pixels per micron, and the image fits the morphology to scale.
+    :param margin:
+        The margin around the morphology as a fraction of its extent.
+    :param colors:
+        A dictionary mapping the arbor types to RGB colors, defaults to DEFAULT_COLORS.
+    :param background:
+        The RGBA color of the background.
+    :return:
+        An HxWx4 uint8 image.
+    """
+
+    colors = DEFAULT_COLORS if colors is None else colors
+    axes = list(VIEW_AXES[view])
+
+    # Projected segments
+    starts = skeleton.starts[:, axes]
+    ends = skeleton.ends[:, axes]
+
+    # Projected soma
+    soma_center = None if skeleton.soma_center is None else skeleton.soma_center[axes]
+
+    # The extent of the morphology in microns, including the radii
+    points = [starts - skeleton.start_radii[:, None], starts + skeleton.start_radii[:, None],
+              ends - skeleton.end_radii[:, None], ends + skeleton.end_radii[:, None]]
+    if soma_center is not None:
+        points.append([soma_center - skeleton.soma_radius, soma_center + skeleton.soma_radius])
+    points = numpy.concatenate([numpy.asarray(p, dtype=numpy.float64).reshape(-1, 2)
+                                for p in points])
+    if len(points) == 0:
+        points = numpy.zeros((1, 2))
+    p_min = points.min(axis=0)
+    p_max = points.max(axis=0)
+    extent = numpy.maximum(p_max - p_min, 1e-6)
+    p_min = p_min - extent * margin
+    extent = extent * (1.0 + 2.0 * margin)
+
+    # Pixels per micron and the image size
+    if scale is None:
+        scale = resolution / float(extent.max())
+    width, height = [max(int(numpy.ceil(e * scale)), 1) for e in extent]
+
+    # Microns to pixels, the image rows run downwards
+    def to_pixels(p):
+        pixels = (p - p_min) * scale
+        pixels[..., 1] = height - pixels[..., 1]
+        return pixels
+
+    starts = to_pixels(starts)
+    ends = to_pixels(ends)
+    start_radii = numpy.maximum(skeleton.start_radii * scale, MINIMUM_PIXEL_RADIUS)
+    end_radii = numpy.maximum(skeleton.end_radii * scale, MINIMUM_PIXEL_RADIUS)
+
+    # Rasterize the segments, then the soma on top
+    coverage = numpy.zeros((height, width))
+    color_buffer = numpy.zeros((height, width, 3))
+    for i in range(len(starts)):
+        rasterize_capsule(coverage, color_buffer, starts[i], ends[i], start_radii[i],
+                          end_radii[i], colors.get(int(skeleton.types[i]), DEFAULT_UNKNOWN_COLOR))
+    if soma_center is not None:
+        center = to_pixels(numpy.array(soma_center, dtype=numpy.float64))
+        radius = max(skeleton.soma_radius * scale, MINIMUM_PIXEL_RADIUS)
+        rasterize_capsule(coverage, color_buffer, center, center, radius, radius,
+                          colors.get(SOMA_TYPE, DEFAULT_UNKNOWN_COLOR))
+
+    # Composite over the background
+    background = numpy.asarray(background, dtype=numpy.float64)
+    alpha = coverage[..., None]
+    image = numpy.empty((height, width, 4))
+    image[..., :3] = color_buffer * alpha + background[:3] * (1.0 - alpha)
+    image[..., 3] = coverage + background[3] * (1.0 - coverage)
+    return (numpy.clip(image, 0.0, 1.0) * 255.0 + 0.5).astype(numpy.uint8)
+
+
+####################################################################################################
+# @write_png
+####################################################################################################
+def write_png(image,
+              png_file):
+    """Writes an RGBA uint8 image into a PNG file without any imaging library.
+
+    :param image:
+        An HxWx4 uint8 image.
+    :param png_file:
+        The path to the output PNG file.
+    """
+
+    height, width = image.shape[:2]
+
+    def chunk(tag, data):
+        return struct.pack('>I', len(data)) + tag + data + \
+            struct.pack('>I', zlib.crc32(tag + data) & 0xffffffff)
+
+    # Each row starts with the filter type, zero means no filtering
+    rows = numpy.zeros((height, width * 4 + 1), dtype=numpy.uint8)
+    rows[:, 1:] = image.reshape(height, width * 4)
+
+    # 8-bit RGBA
+    header = struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0)
+    with open(png_file, 'wb') as f:
+        f.write(b'\x89PNG\r\n\x1a\n')
+        f.write(chunk(b'IHDR', header))
+        f.write(chunk(b'IDAT', zlib.compress(rows.tobytes(), 6)))
+        f.write(chunk(b'IEND', b''))
+
+
+####################################################################################################
+# @render_skeleton_thumbnail
+####################################################################################################
+def render_skeleton_thumbnail(morphology_file,
+                              output_directory,
+                              **kwargs):
+    """Renders a thumbnail of a morphology file into a PNG image in the output directory.
+
+    :param morphology_file:
+        The path to the morphology file.
+    :param output_directory:
+        The directory where the image will be written.
+    :param kwargs:
+        Rasterization parameters, see rasterize_skeleton.
+    :return:
+        The path to the image, or None if the morphology could not be rendered.
+    """
+
+    label = os.path.splitext(os.path.basename(morphology_file))[0]
+    png_file = '%s/%s.png' % (output_directory, label)
+    try:
+        skeleton = read_skeleton_arrays(morphology_file)
+        write_png(rasterize_skeleton(skeleton, **kwargs), png_file)
+    except Exception as e:
+        print('ERROR: Cannot render [%s]: %s' % (morphology_file, str(e)))
+        return None
+    return png_file
+
+
+####################################################################################################
+# @_render_skeleton_thumbnail_task
+####################################################################################################
+def _render_skeleton_thumbnail_task(task):
+    """Unpacks a task of the pool and renders it.
+
+    :param task:
+        A tuple of the morphology file, the output directory and the rasterization parameters.
+    :return:
+        The path to the image, or None if the morphology could not be rendered.
+    """
+
+    morphology_file, output_directory, kwargs = task
+    return render_skeleton_thumbnail(morphology_file, output_directory, **kwargs)
+
+
+####################################################################################################
+# @render_skeleton_thumbnails
+####################################################################################################
+def render_skeleton_thumbnails(morphology_files,
+                               output_directory,
+                               processes=1,
+                               **kwargs):
+    """Renders the thumbnails of a list of morphology files, distributed over a pool of processes.
+
+    :param morphology_files:
+        A list of morphology files.
+    :param output_directory:
+        The directory where the images will be written.
+    :param processes:
+        The number of processes, one renders the files in the calling process.
+    :param kwargs:
+        Rasterization parameters, see rasterize_skeleton.
+    :return:
+        A list of the paths to the images, with None for the files that could not be rendered.
+    """
+
+    tasks = [(morphology_file, output_directory, kwargs) for morphology_file in morphology_files]
+    if processes <= 1:
+        return [_render_skeleton_thumbnail_task(task) for task in tasks]
+
+    import multiprocessing
+    with multiprocessing.Pool(processes) as pool:
+        return pool.map(_render_skeleton_thumbnail_task, tasks, chunksize=1)
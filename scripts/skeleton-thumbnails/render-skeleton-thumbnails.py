@@ -0,0 +1,109 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import sys, os
+import argparse
+import glob
+import multiprocessing
+import time
+
+sys.path.append(('%s/core' %(os.path.dirname(os.path.realpath(__file__)))))
+
+# Internal imports
+import skeleton_rasterizer
+
+
+####################################################################################################
+# @parse_command_line_arguments
+####################################################################################################
+def parse_command_line_arguments(arguments=None):
+    """Parses the input arguments.
+
+    :param arguments:
+        Command line arguments.
+    :return:
+        Arguments list.
+    """
+
+    # add all the options
+    description = 'Rendering thumbnails of morphology skeletons in plain Python, without Blender'
+    parser = argparse.ArgumentParser(description=description)
+
+    arg_help = 'A directory containing .h5 or .swc morphology files'
+    parser.add_argument('--morphologies-directory',
+                        action='store', dest='morphologies_directory', help=arg_help)
+
+    arg_help = 'The output directory of the images'
+    parser.add_argument('--output-directory',
+                        action='store', dest='output_directory', help=arg_help)
+
+    arg_help = 'The resolution of the longest side of the images'
+    parser.add_argument('--resolution',
+                        action='store', dest='resolution', type=int, default=512, help=arg_help)
+
+    arg_help = 'Render the images to scale with this number of pixels per micron, ' \
+               'overrides the resolution'
+    parser.add_argument('--scale',
+                        action='store', dest='scale', type=float, default=None, help=arg_help)
+
+    arg_help = 'The projection view: front, side or top'
+    parser.add_argument('--view',
+                        action='store', dest='view', default='front',
+                        choices=sorted(skeleton_rasterizer.VIEW_AXES.keys()), help=arg_help)
+
+    arg_help = 'Use an opaque white background instead of a transparent one'
+    parser.add_argument('--opaque-background',
+                        action='store_true', dest='opaque_background', default=False, help=arg_help)
+
+    arg_help = 'Number of processes, defaults to the number of cores'
+    parser.add_argument('--processes',
+                        action='store', dest='processes', type=int,
+                        default=multiprocessing.cpu_count(), help=arg_help)
+
+    # Parse the arguments
+    return parser.parse_args()
+
+
+####################################################################################################
+# @ Main
+####################################################################################################
+if __name__ == "__main__":
+
+    # Parse the command line arguments
+    args = parse_command_line_arguments()
+
+    # Collect the morphology files
+    morphology_files = list()
+    for extension in ['h5', 'swc', 'H5', 'SWC']:
+        morphology_files.extend(glob.glob('%s/*.%s' % (args.morphologies_directory, extension)))
+    morphology_files = sorted(set(morphology_files))
+
+    # Create the output directory if it does not exist
+    if not os.path.exists(args.output_directory):
+        os.makedirs(args.output_directory)
+
+    # Render the thumbnails
+    start = time.time()
+    images = skeleton_rasterizer.render_skeleton_thumbnails(
+        morphology_files, args.output_directory, processes=args.processes,
+        resolution=args.resolution, scale=args.scale, view=args.view,
+        background=(1.0, 1.0, 1.0, 1.0) if args.opaque_background else (1.0, 1.0, 1.0, 0.0))
+    end = time.time()
+
+    rendered = len([image for image in images if image is not None])
+    print('Rendered [%d/%d] thumbnails in [%f] seconds' % (rendered, len(images), end - start))
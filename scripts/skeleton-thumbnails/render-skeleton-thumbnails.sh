@@ -0,0 +1,43 @@
+#!/usr/bin/env bash
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# Python executable, Blender is not needed
+PYTHON='python3'
+
+# A directory containing the input morphologies
+MORPHOLOGIES_DIRECTORY='morphologies'
+
+# The output directory of the images
+OUTPUT_DIRECTORY='thumbnails'
+
+# The resolution of the longest side of the images
+RESOLUTION=512
+
+# The projection view: front, side or top
+VIEW='front'
+
+# Number of processes
+PROCESSES=8
+
+####################################################################################################
+$PYTHON render-skeleton-thumbnails.py                                                              \
+    --morphologies-directory=$MORPHOLOGIES_DIRECTORY                                               \
+    --output-directory=$OUTPUT_DIRECTORY                                                           \
+    --resolution=$RESOLUTION                                                                       \
+    --view=$VIEW                                                                                   \
+    --processes=$PROCESSES
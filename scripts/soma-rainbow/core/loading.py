@@ -21,6 +21,9 @@ import os
 # Blender imports
 import bpy
 
+# NeuroMorphoVis imports
+import nmv.mesh
+
 
 ####################################################################################################
 # @import_obj_file
@@ -193,6 +196,4 @@ def load_neurons_membrane_meshes_into_scene(input_directory,
     if transform:
         print('Transforming')
         for i_neuron in neurons_list:
-            for i_object in i_neuron.membrane_meshes:
-                for vertex in i_object.data.vertices:
-                    vertex.co = i_neuron.transform * vertex.co
\ No newline at end of file
+            nmv.mesh.transform_mesh_objects(i_neuron.membrane_meshes, i_neuron.transform)
\ No newline at end of file
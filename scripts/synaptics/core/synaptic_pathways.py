@@ -16,9 +16,9 @@
 ####################################################################################################
 
 # System imports
-import random
 import os
 import sys
+import numpy
 
 # BBP imports
 import bluepy
@@ -36,6 +36,7 @@ import nmv.shading
 import nmv.mesh
 import nmv.enums
 import nmv.options
+import nmv.physics
 import nmv.skeleton
 import nmv.utilities
 
@@ -242,48 +243,29 @@ def create_shared_synapses_mesh(circuit,
 
     # Get the GIDs of the pre-synaptic cells
     pre_gids = circuit.connectome.synapse_properties(
-        afferent_synapses_ids, [bluepy.v2.enums.Synapse.PRE_GID]).values
-    pre_gids = [gid[0] for gid in pre_gids]
+        afferent_synapses_ids, [bluepy.v2.enums.Synapse.PRE_GID]).values[:, 0]
 
-    # A list that will contain all the synapse meshes
-    synapse_objects = list()
+    # Get only the shared synapses with the pre-synaptic gid
+    selection = pre_gids.astype(numpy.int64) == int(pre_gid)
 
     # Get the positions of the incoming synapses at the post synaptic side
     post_synaptic_positions = circuit.connectome.synapse_positions(
-        afferent_synapses_ids, 'post', 'center').values.tolist()
+        afferent_synapses_ids, 'post', 'center').values[selection]
     pre_synaptic_positions = circuit.connectome.synapse_positions(
-        afferent_synapses_ids, 'pre', 'contour').values.tolist()
+        afferent_synapses_ids, 'pre', 'contour').values[selection]
 
-    # Do it for all the synapses
-    for i in range(len(pre_gids)):
+    # Synapse position is the mid-way between the pre- and post-synaptic centers
+    positions = 0.5 * (post_synaptic_positions + pre_synaptic_positions)
 
-        # Get only the shared synapses with the pre-synaptic gid
-        if pre_gid == int(pre_gids[i]):
+    # Replicate an ico-sphere at all the synapses in a single mesh
+    template_vertices, template_triangles = nmv.physics.create_ico_sphere_arrays(
+        radius=1.0, subdivisions=3)
+    vertices, triangles = nmv.mesh.get_instanced_mesh_arrays(
+        template_vertices, template_triangles, positions, scales=synapse_size)
+    synapse_group = nmv.mesh.create_mesh_object_from_arrays('synapses', vertices, triangles)
 
-            # Synapse position is the mid-way between the pre- and post-synaptic centers
-            post_synaptic_position = Vector((post_synaptic_positions[i][0],
-                                             post_synaptic_positions[i][1],
-                                             post_synaptic_positions[i][2]))
-
-            pre_synaptic_position = Vector((pre_synaptic_positions[i][0],
-                                            pre_synaptic_positions[i][1],
-                                            pre_synaptic_positions[i][2]))
-
-            position = 0.5 * (post_synaptic_position + pre_synaptic_position)
-
-            # A synapse sphere object
-            synapse_sphere = nmv.geometry.create_ico_sphere(
-                radius=synapse_size, location=position, subdivisions=3, name='synapse_%d' % i)
-
-            # Add the sphere to the group
-            synapse_objects.append(synapse_sphere)
-
-            # Material
-            nmv.shading.set_material_to_object(mesh_object=synapse_sphere,
-                                               material_reference=material)
-
-    # Join the meshes into a group
-    synapse_group = nmv.mesh.join_mesh_objects(mesh_list=synapse_objects, name='synapses')
+    # Material
+    nmv.shading.set_material_to_object(mesh_object=synapse_group, material_reference=material)
 
     return synapse_group
 
@@ -16,9 +16,9 @@
 ####################################################################################################
 
 # System imports
-import random
 import os
 import sys
+import numpy
 
 # Internal imports
 import_paths = ['core']
@@ -42,12 +42,46 @@ import nmv.enums
 import nmv.geometry
 import nmv.options
 import nmv.mesh
+import nmv.physics
 import nmv.rendering
 import nmv.scene
 import nmv.shading
 import nmv.utilities
 
 
+####################################################################################################
+# @get_synapses_colors_indices
+####################################################################################################
+def get_synapses_colors_indices(circuit,
+                                pre_synaptic_gids,
+                                color_map_keys):
+    """Gets the indices of the colors of the synapses in the color-map from the mtypes of their
+    pre-synaptic cells. Every pre-synaptic cell is queried only once.
+
+    :param circuit:
+        BBP circuit.
+    :param pre_synaptic_gids:
+        A NumPy array of the GIDs of the pre-synaptic cells of the synapses.
+    :param color_map_keys:
+        A list of the mtypes of the color-map.
+    :return:
+        A NumPy array of the indices of the colors of the synapses, -1 if the mtype of a synapse
+        is not in the color-map.
+    """
+
+    # The mtypes of the unique pre-synaptic cells
+    unique_gids, inverse = numpy.unique(pre_synaptic_gids, return_inverse=True)
+    if len(unique_gids) == 0:
+        return numpy.zeros(0, dtype=numpy.int64)
+    unique_mtypes = circuit.cells.get(unique_gids, properties=['mtype']).loc[unique_gids, 'mtype']
+
+    # Map the mtypes to the color-map
+    color_map_indices = {mtype: i for i, mtype in enumerate(color_map_keys)}
+    unique_indices = numpy.array([color_map_indices.get(mtype, -1) for mtype in unique_mtypes],
+                                 dtype=numpy.int64)
+    return unique_indices[inverse]
+
+
 ####################################################################################################
 # @create_synapses_mesh
 ####################################################################################################
@@ -56,8 +90,12 @@ def create_synapses_mesh(circuit,
                          synapse_size,
                          synapse_percentage,
                          inverted_transformation,
-                         color_map_materials):
-    """Creates a mesh of all the synapses
+                         color_map):
+    """Creates a mesh of all the synapses.
+
+    The synapses are selected with masks over the arrays of the circuit, and drawn as a single
+    mesh of ico-spheres, where the color of every synapse is stored in a color attribute rather
+    than in a material per color.
 
     :param circuit:
         BBP circuit.
@@ -69,95 +107,56 @@ def create_synapses_mesh(circuit,
         The percentage of the syanpses to be drawn.
     :param inverted_transformation:
         The inverted transformation that will take the synapses to the origin.
-    :param color_map_materials:
-        A dictionary of all the mtype materials.
+    :param color_map:
+        A dictionary of the colors of the pre-synaptic mtypes.
     :return:
-        A reference to the created synapse mesh.
+        A reference to the created synapse mesh, or None if no synapses are selected.
     """
 
     # Get the IDs of the afferent synapses of a given GID
     afferent_synapses_ids = circuit.connectome.afferent_synapses(gid)
 
-    # Get the synapse type
-    synapse_types = circuit.connectome.synapse_properties(
-        afferent_synapses_ids, [bluepy.v2.enums.Synapse.TYPE]).values
-
     # Get the positions of the incoming synapses at the post synaptic side
     post_synaptic_positions = circuit.connectome.synapse_positions(
-        afferent_synapses_ids, 'post', 'center').values.tolist()
-    pre_synaptic_positions = circuit.connectome.synapse_positions(
-        afferent_synapses_ids, 'pre', 'contour').values.tolist()
+        afferent_synapses_ids, 'post', 'center').values
 
     # Get the GIDs of the pre-synaptic cells
-    pre_gids = circuit.connectome.synapse_properties(
-        afferent_synapses_ids, [bluepy.v2.enums.Synapse.PRE_GID]).values
-    pre_synaptic_gids = [gid[0] for gid in pre_gids]
-
-    # Get the pre-synaptic mtypes
-    pre_synaptic_mtypes = circuit.cells.get(pre_synaptic_gids)['mtype'].values.tolist()
-
-    # We need the color and the position to draw the synaptome
-    synapse_objects = list()
-    synapse_groups = list()
-
-    # Do it for all the synapses
-    for i in range(len(post_synaptic_positions)):
-
-        # Show progress
-        nmv.utilities.time_line.show_iteration_progress('Synapses', i, len(post_synaptic_positions))
-
-        # Random selection
-        if synapse_percentage < random.uniform(0, 100):
-            continue
-
-            # Material
-        if not (pre_synaptic_mtypes[i] in color_map_materials):
-            continue
-
-        material = color_map_materials[pre_synaptic_mtypes[i]]
-
-        # Position
-        post_synaptic_position = Vector((post_synaptic_positions[i][0],
-                                         post_synaptic_positions[i][1],
-                                         post_synaptic_positions[i][2]))
-        position = inverted_transformation @ post_synaptic_position
-
-        # A synapse sphere object
-        synapse_sphere = nmv.geometry.create_ico_sphere(
-            radius=synapse_size, location=position, subdivisions=3, name='synapse_%d' % i)
-
-        # Add the sphere to the group
-        synapse_objects.append(synapse_sphere)
-
-        # Material
-        nmv.shading.set_material_to_object(mesh_object=synapse_sphere, material_reference=material)
-
-        # Group every 100 objects into a single group
-        if i % 50 == 0:
-
-            # Join the meshes into a group
-            synapse_group = nmv.mesh.join_mesh_objects(
-                mesh_list=synapse_objects, name='group_%d' % (i % 100))
-
-            # Add the group to the list
-            synapse_groups.append(synapse_group)
-
-            # Clear the object list
-            synapse_objects.clear()
-
-    # Join the meshes into a group
-    synapse_group = nmv.mesh.join_mesh_objects(
-        mesh_list=synapse_objects, name='group_%d' % (i % 100))
-
-    # Add the group to the list
-    synapse_groups.append(synapse_group)
-
-    # Done
-    nmv.utilities.time_line.show_iteration_progress(
-        'Synapses', len(post_synaptic_positions), len(post_synaptic_positions), done=True)
-
-    # Join the meshes into a group
-    synapses_mesh = nmv.mesh.join_mesh_objects(mesh_list=synapse_groups, name='synapses')
+    pre_synaptic_gids = circuit.connectome.synapse_properties(
+        afferent_synapses_ids, [bluepy.v2.enums.Synapse.PRE_GID]).values[:, 0].astype(numpy.int64)
+
+    # Get the colors of the synapses from the pre-synaptic mtypes
+    color_map_keys = list(color_map.keys())
+    colors_indices = get_synapses_colors_indices(circuit, pre_synaptic_gids, color_map_keys)
+
+    # Random selection of the synapses whose mtypes are in the color-map
+    selection = numpy.random.uniform(0, 100, len(colors_indices)) <= synapse_percentage
+    selection &= colors_indices >= 0
+
+    # No synapses are selected, an empty mesh cannot be colored
+    if selection.sum() == 0:
+        return None
+
+    # Take the selected synapses to the origin
+    positions = nmv.geometry.transform_points(
+        post_synaptic_positions[selection], inverted_transformation)
+
+    # Replicate an ico-sphere at all the synapses
+    template_vertices, template_triangles = nmv.physics.create_ico_sphere_arrays(
+        radius=1.0, subdivisions=3)
+    vertices, triangles = nmv.mesh.get_instanced_mesh_arrays(
+        template_vertices, template_triangles, positions, scales=synapse_size)
+    synapses_mesh = nmv.mesh.create_mesh_object_from_arrays('synapses', vertices, triangles)
+
+    # Every face of a synapse takes the color of the synapse
+    colors = numpy.array([color_map[mtype][:3] for mtype in color_map_keys], dtype=numpy.float32)
+    faces_colors = numpy.repeat(
+        colors.reshape(-1, 3)[colors_indices[selection]], len(template_triangles), axis=0)
+    nmv.mesh.set_mesh_object_faces_colors(synapses_mesh, faces_colors, 'synapse_color')
+
+    # A single material for all the synapses
+    material = nmv.shading.create_color_attribute_material(
+        name='synapses_material', attribute_name='synapse_color')
+    nmv.shading.set_material_to_object(mesh_object=synapses_mesh, material_reference=material)
 
     # Return a reference to the synapse mesh
     return synapses_mesh
@@ -217,7 +216,7 @@ def create_synaptome(circuit_config,
                      gid,
                      synapse_size,
                      synapse_percentage,
-                     synaptome_color_map_materials,
+                     synaptome_color_map,
                      neuron_material):
 
     # Loading a circuit
@@ -241,11 +240,16 @@ def create_synaptome(circuit_config,
                                          synapse_size=synapse_size,
                                          synapse_percentage=synapse_percentage,
                                          inverted_transformation=inverted_transformation,
-                                         color_map_materials=synaptome_color_map_materials)
-
-    # Merge
-    synaptome_mesh = nmv.mesh.join_mesh_objects(
-        mesh_list=[neuron_mesh, synapses_mesh], name='synaptome_%s_%d' % (mtype, gid))
+                                         color_map=synaptome_color_map)
+
+    # Merge, unless no synapses are selected
+    synaptome_name = 'synaptome_%s_%d' % (mtype, gid)
+    if synapses_mesh is None:
+        synaptome_mesh = neuron_mesh
+        synaptome_mesh.name = synaptome_name
+    else:
+        synaptome_mesh = nmv.mesh.join_mesh_objects(
+            mesh_list=[neuron_mesh, synapses_mesh], name=synaptome_name)
 
     # Returns a reference to the synaptome mesh
     return synaptome_mesh
\ No newline at end of file
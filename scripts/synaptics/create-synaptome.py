@@ -49,15 +49,15 @@ if __name__ == "__main__":
     # Clear the scene
     nmv.scene.clear_scene()
 
-
+    # Flat shading
+    shader = nmv.enums.Shader.FLAT
 
     # Neuron material
     neuron_material = color_map.create_neuron_material(neuron_color=args.neuron_color,
                                                        shader=shader)
 
-    # Create the color-map dictionary of the synapses
-    synaptome_color_map_materials = color_map.create_color_map(color_map_file=args.color_map_file,
-                                                               material_type=shader)
+    # Create the color-map dictionary of the synapses, the synapses share a single material
+    synaptome_color_map = parsing.parse_color_map(color_map_file=args.color_map_file)
 
     # Create the synaptome
     synaptome_mesh = synaptome.create_synaptome(
@@ -65,7 +65,7 @@ if __name__ == "__main__":
         gid=args.gid,
         synapse_size=args.synapse_size,
         synapse_percentage=args.synapse_percentage,
-        synaptome_color_map_materials=synaptome_color_map_materials,
+        synaptome_color_map=synaptome_color_map,
         neuron_material=neuron_material)
 
     # Create the dummy material to adjust the renderer
@@ -0,0 +1,171 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import argparse
+import os
+import subprocess
+import sys
+
+# Import vasculature scripts
+sys.path.append(os.path.dirname(os.path.realpath(__file__)))
+import vasculature_tiles
+
+
+####################################################################################################
+# @parse_command_line_arguments
+####################################################################################################
+def parse_command_line_arguments():
+    """Parses the input arguments of the tiled vasculature pipeline.
+
+    :return:
+        Arguments list.
+    """
+
+    # Create an argument parser, and then add the options one by one
+    parser = argparse.ArgumentParser()
+
+    arg_help = 'The vasculature dataset (.h5)'
+    parser.add_argument('--dataset', action='store', required=True, help=arg_help)
+
+    arg_help = 'The output directory of the tiles meshes'
+    parser.add_argument('--output-directory', action='store', required=True, help=arg_help)
+
+    arg_help = 'The size of the tiles in microns'
+    parser.add_argument('--tile-size', action='store', type=float, default=250.0, help=arg_help)
+
+    arg_help = 'A region of interest (x0 y0 z0 x1 y1 z1), only its tiles are built'
+    parser.add_argument('--region', action='store', type=float, nargs=6, default=None,
+                        help=arg_help)
+
+    arg_help = 'The number of the edges read at once while building the tiles index'
+    parser.add_argument('--chunk-size', action='store', type=int, default=1000000, help=arg_help)
+
+    arg_help = 'The number of Blender processes building the tiles in parallel'
+    parser.add_argument('--processes', action='store', type=int, default=1, help=arg_help)
+
+    arg_help = 'The Blender executable'
+    parser.add_argument('--blender', action='store', default='blender', help=arg_help)
+
+    arg_help = 'The number of the sides of the cross-sections of the vessels'
+    parser.add_argument('--bevel-sides', action='store', type=int, default=8, help=arg_help)
+
+    arg_help = 'Rebuild the tiles that already have meshes in the output directory'
+    parser.add_argument('--overwrite', action='store_true', default=False, help=arg_help)
+
+    arg_help = 'Load all the tiles meshes into a single scene when done'
+    parser.add_argument('--stitch', action='store_true', default=False, help=arg_help)
+
+    # Parse the arguments
+    return parser.parse_args()
+
+
+####################################################################################################
+# @get_tiles_index
+####################################################################################################
+def get_tiles_index(arguments):
+    """Loads the tiles index of the dataset from the output directory, or builds it in a single
+    chunked pass over the dataset if it does not exist or has a different tile size.
+
+    :param arguments:
+        Command line arguments.
+    :return:
+        The path to the index file and the VasculatureTileIndex.
+    """
+
+    # The index is stored next to the tiles
+    index_file = '%s/tiles-index.npz' % arguments.output_directory
+    if os.path.isfile(index_file):
+        index = vasculature_tiles.VasculatureTileIndex.load(index_file)
+        if index.tile_size == arguments.tile_size:
+            return index_file, index
+
+    # Build the index and save it
+    print('Building the tiles index of [%s]' % arguments.dataset)
+    index = vasculature_tiles.build_tile_index(
+        arguments.dataset, arguments.tile_size, chunk_size=arguments.chunk_size)
+    index.save(index_file)
+    return index_file, index
+
+
+####################################################################################################
+# @run_blender_workers
+####################################################################################################
+def run_blender_workers(arguments,
+                        workers_arguments):
+    """Runs a Blender worker per list of arguments in parallel and waits for all of them.
+
+    :param arguments:
+        Command line arguments.
+    :param workers_arguments:
+        A list of the arguments lists of the workers.
+    """
+
+    # The worker script
+    worker = '%s/tiled_worker.py' % os.path.dirname(os.path.realpath(__file__))
+
+    # Launch the workers
+    processes = list()
+    for worker_arguments in workers_arguments:
+        shell_command = [arguments.blender, '-b', '--python', worker, '--'] + worker_arguments
+        processes.append(subprocess.Popen(shell_command))
+
+    # Wait until all the workers are done
+    for process in processes:
+        process.wait()
+
+
+####################################################################################################
+# @ Run the main function if invoked from the command line.
+####################################################################################################
+if __name__ == "__main__":
+
+    # Parse the command line arguments
+    arguments = parse_command_line_arguments()
+    if not os.path.exists(arguments.output_directory):
+        os.makedirs(arguments.output_directory)
+
+    # Get the tiles index
+    index_file, index = get_tiles_index(arguments)
+
+    # Select the tiles of the region of interest
+    if arguments.region is None:
+        tiles = index.get_tiles()
+    else:
+        tiles = index.get_tiles_in_region(arguments.region[:3], arguments.region[3:])
+
+    # Skip the tiles that were already built
+    tiles_names = ['%d_%d_%d' % tuple(tile) for tile in tiles]
+    if not arguments.overwrite:
+        tiles_names = [name for name in tiles_names if not os.path.isfile(
+            '%s/tile_%s.nmvmesh' % (arguments.output_directory, name))]
+    print('Building [%d] tiles' % len(tiles_names))
+
+    # Distribute the tiles among the workers, every tile is built independently
+    workers_arguments = list()
+    for i in range(min(arguments.processes, len(tiles_names))):
+        workers_arguments.append(['--dataset', arguments.dataset,
+                                  '--index-file', index_file,
+                                  '--output-directory', arguments.output_directory,
+                                  '--bevel-sides', str(arguments.bevel_sides),
+                                  '--tiles'] + tiles_names[i::arguments.processes])
+    run_blender_workers(arguments, workers_arguments)
+
+    # Load all the tiles into a single scene
+    if arguments.stitch:
+        run_blender_workers(arguments, [['--output-directory', arguments.output_directory,
+                                         '--stitch']])
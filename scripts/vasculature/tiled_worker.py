@@ -0,0 +1,118 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import argparse
+import os
+import sys
+
+# Internal imports
+sys.path.append(('%s/../../' % (os.path.dirname(os.path.realpath(__file__)))))
+sys.path.append(os.path.dirname(os.path.realpath(__file__)))
+
+# NeuroMorphoVis imports
+import nmv.consts
+import nmv.file
+import nmv.scene
+
+# Import vasculature scripts
+import vasculature_tiles
+import vasculature_tile_sketcher
+
+
+####################################################################################################
+# @parse_command_line_arguments
+####################################################################################################
+def parse_command_line_arguments():
+    """Parses the input arguments of a worker.
+
+    :return:
+        Arguments list.
+    """
+
+    # Create an argument parser, and then add the options one by one
+    parser = argparse.ArgumentParser()
+
+    arg_help = 'The vasculature dataset (.h5)'
+    parser.add_argument('--dataset', action='store', help=arg_help)
+
+    arg_help = 'The tiles index file (.npz)'
+    parser.add_argument('--index-file', action='store', help=arg_help)
+
+    arg_help = 'The tiles to build, for example 0_0_0 0_1_0'
+    parser.add_argument('--tiles', action='store', nargs='*', default=list(), help=arg_help)
+
+    arg_help = 'The output directory of the tiles meshes'
+    parser.add_argument('--output-directory', action='store', help=arg_help)
+
+    arg_help = 'The number of the sides of the cross-sections of the vessels'
+    parser.add_argument('--bevel-sides', action='store', type=int, default=8, help=arg_help)
+
+    arg_help = 'Load all the tiles meshes into a single scene instead of building tiles'
+    parser.add_argument('--stitch', action='store_true', default=False, help=arg_help)
+
+    # Parse the arguments
+    return parser.parse_args()
+
+
+####################################################################################################
+# @stitch_tiles
+####################################################################################################
+def stitch_tiles(output_directory):
+    """Loads the meshes of all the tiles, an object per tile, and saves them in a single scene.
+    The tiles own disjoint sets of sections, so their meshes do not overlap.
+
+    :param output_directory:
+        The directory of the tiles meshes.
+    """
+
+    # Clear the scene
+    nmv.scene.ops.clear_scene()
+
+    # Load the tiles, the arrays are memory-mapped
+    extension = nmv.consts.Meshing.NMV_MESH_EXTENSION
+    for tile_file in sorted(os.listdir(output_directory)):
+        if tile_file.startswith('tile_') and tile_file.endswith(extension):
+            nmv.file.import_nmv_mesh_file(output_directory, tile_file)
+
+    # Save the scene
+    nmv.file.export_scene_to_blend_file(output_directory, 'vasculature')
+
+
+####################################################################################################
+# @ Run the main function if invoked from the command line.
+####################################################################################################
+if __name__ == "__main__":
+
+    # Ignore blender extra arguments required to launch blender given to the command line interface
+    args = sys.argv
+    sys.argv = args[args.index("--") + 1:]
+
+    # Parse the command line arguments
+    arguments = parse_command_line_arguments()
+
+    # Stitch the tiles
+    if arguments.stitch:
+        stitch_tiles(arguments.output_directory)
+
+    # Build the tiles one by one
+    else:
+        index = vasculature_tiles.VasculatureTileIndex.load(arguments.index_file)
+        for tile in arguments.tiles:
+            vasculature_tile_sketcher.build_tile_mesh(
+                arguments.dataset, index, tuple(int(i) for i in tile.split('_')),
+                arguments.output_directory, bevel_sides=arguments.bevel_sides)
@@ -0,0 +1,117 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import numpy
+
+# Blender imports
+import bpy
+
+# NeuroMorphoVis imports
+import nmv.enums
+import nmv.file
+import nmv.mesh
+import nmv.scene
+
+# Import vasculature scripts
+import vasculature_tiles
+
+
+####################################################################################################
+# @sketch_tile
+####################################################################################################
+def sketch_tile(tile,
+                bevel_object,
+                caps=True):
+    """Sketches all the sections of a tile as poly-lines in a single curve object. The points and
+    radii of every poly-line are set in bulk.
+
+    :param tile:
+        A given VasculatureTile.
+    :param bevel_object:
+        A bevel object to shape the cross-sections of the poly-lines.
+    :param caps:
+        Close the poly-lines at their terminals.
+    :return:
+        A reference to the curve object of the tile.
+    """
+
+    # A single curve for the tile
+    curve_data = bpy.data.curves.new(name=tile.get_name(), type='CURVE')
+    curve_data.dimensions = '3D'
+    curve_data.fill_mode = 'FULL'
+    curve_data.bevel_object = bevel_object
+    curve_data.use_fill_caps = caps
+
+    # The poly-line points are 4D
+    coordinates = numpy.ones((len(tile.points), 4), dtype=numpy.float32)
+    coordinates[:, :3] = tile.points
+    radii = numpy.asarray(tile.radii, dtype=numpy.float32)
+
+    # A poly-line per section
+    offsets = tile.samples_offsets
+    for i in range(len(tile.sections)):
+        spline = curve_data.splines.new('POLY')
+        spline.points.add(int(offsets[i + 1] - offsets[i]) - 1)
+        spline.points.foreach_set('co', coordinates[offsets[i]:offsets[i + 1]].reshape(-1))
+        spline.points.foreach_set('radius', radii[offsets[i]:offsets[i + 1]])
+
+    # Link the curve to the scene
+    curve_object = bpy.data.objects.new(tile.get_name(), curve_data)
+    nmv.scene.link_object_to_scene(curve_object)
+    return curve_object
+
+
+####################################################################################################
+# @build_tile_mesh
+####################################################################################################
+def build_tile_mesh(dataset,
+                    index,
+                    tile,
+                    output_directory,
+                    bevel_sides=8):
+    """Loads a tile, builds its mesh and writes it to an NMV binary mesh file, independently from
+    the other tiles.
+
+    :param dataset:
+        A path to the vasculature h5 file.
+    :param index:
+        The VasculatureTileIndex of the dataset.
+    :param tile:
+        A given (i, j, k) tile.
+    :param output_directory:
+        The directory where the mesh of the tile will be written.
+    :param bevel_sides:
+        The number of the sides of the cross-sections of the vessels.
+    """
+
+    # Clear the scene
+    nmv.scene.ops.clear_scene()
+
+    # Load only the sections of this tile
+    tile_data = vasculature_tiles.load_tile(dataset, index, tile)
+
+    # Sketch the tile and convert it to a mesh
+    bevel_object = nmv.mesh.create_bezier_circle(radius=1.0, vertices=bevel_sides, name='bevel')
+    tile_curve = sketch_tile(tile_data, bevel_object)
+    tile_mesh = nmv.scene.ops.convert_object_to_mesh(tile_curve)
+
+    # Write the mesh
+    nmv.file.export_mesh_objects_arrays_to_files(
+        [tile_mesh], output_directory, tile_data.get_name(),
+        [nmv.enums.Meshing.ExportFormat.NMV],
+        metadata={'tile': list(tile_data.tile), 'sections': len(tile_data.sections)})
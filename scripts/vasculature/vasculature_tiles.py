@@ -0,0 +1,356 @@
+####################################################################################################
+# Copyright (c) 2016 - 2020, EPFL / Blue Brain Project
+#               Marwan Abdellah <marwan.abdellah@epfl.ch>
+#
+# This file is part of NeuroMorphoVis <https://github.com/BlueBrain/NeuroMorphoVis>
+#
+# This program is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation, version 3 of the License.
+#
+# This Blender-based tool is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <http://www.gnu.org/licenses/>.
+####################################################################################################
+
+# System imports
+import h5py
+import numpy
+
+
+####################################################################################################
+# @get_sections_offsets
+####################################################################################################
+def get_sections_offsets(data):
+    """Gets the offsets of the first edges of the sections, followed by the number of the edges.
+
+    :param data:
+        An opened vasculature h5 file.
+    :return:
+        A NumPy array of S + 1 offsets, the edges of the section i are in the range
+        [offsets[i], offsets[i + 1]).
+    """
+
+    # The structure has the first edge of every section
+    structure = numpy.asarray(data['chains']['structure'][()])
+    offsets = structure.reshape(len(structure), -1)[:, 0].astype(numpy.int64)
+
+    # Close the last section
+    number_edges = data['edges'].shape[0]
+    if len(offsets) == 0 or offsets[-1] < number_edges:
+        offsets = numpy.append(offsets, number_edges)
+    return offsets
+
+
+####################################################################################################
+# @read_points
+####################################################################################################
+def read_points(points_dataset,
+                indices):
+    """Reads a group of points from the dataset with a single h5py selection.
+
+    :param points_dataset:
+        The points dataset.
+    :param indices:
+        A NumPy array of the indices of the points.
+    :return:
+        A NumPy array of the points in the order of the indices.
+    """
+
+    # h5py selections must be increasing
+    unique_indices, inverse = numpy.unique(indices, return_inverse=True)
+    if len(unique_indices) == 0:
+        return numpy.zeros((0, points_dataset.shape[1]), dtype=numpy.float64)
+
+    # Read a contiguous range if the points are close to each other, this is much faster
+    first, last = int(unique_indices[0]), int(unique_indices[-1]) + 1
+    if last - first <= 4 * len(unique_indices):
+        points = points_dataset[first:last][unique_indices - first]
+    else:
+        points = points_dataset[unique_indices.tolist()]
+
+    return numpy.asarray(points, dtype=numpy.float64)[inverse.reshape(-1)]
+
+
+####################################################################################################
+# VasculatureTileIndex
+####################################################################################################
+class VasculatureTileIndex:
+    """A spatial index of the sections of a vasculature dataset. The dataset is divided into cubic
+    tiles, and every section belongs to the tile that contains the center of its bounding box, so
+    that every tile can be loaded and built independently."""
+
+    ################################################################################################
+    # @__init__
+    ################################################################################################
+    def __init__(self,
+                 sections_offsets,
+                 sections_bounds_min,
+                 sections_bounds_max,
+                 origin,
+                 tile_size):
+        """Constructor
+
+        :param sections_offsets:
+            The offsets of the edges of the sections, see @get_sections_offsets.
+        :param sections_bounds_min:
+            A NumPy array of shape (S, 3) of the minimum bounds of the sections.
+        :param sections_bounds_max:
+            A NumPy array of shape (S, 3) of the maximum bounds of the sections.
+        :param origin:
+            The origin of the tiles grid.
+        :param tile_size:
+            The size of a tile.
+        """
+
+        self.sections_offsets = numpy.asarray(sections_offsets, dtype=numpy.int64)
+        self.sections_bounds_min = numpy.asarray(sections_bounds_min, dtype=numpy.float64)
+        self.sections_bounds_max = numpy.asarray(sections_bounds_max, dtype=numpy.float64)
+        self.origin = numpy.asarray(origin, dtype=numpy.float64)
+        self.tile_size = float(tile_size)
+
+        # The tile of every section, the sections without edges have no bounds and no tile
+        centers = 0.5 * (self.sections_bounds_min + self.sections_bounds_max)
+        self.valid_sections = numpy.all(numpy.isfinite(centers), axis=1)
+        self.sections_tiles = numpy.zeros((len(centers), 3), dtype=numpy.int64)
+        self.sections_tiles[self.valid_sections] = numpy.floor(
+            (centers[self.valid_sections] - self.origin) / self.tile_size)
+
+    ################################################################################################
+    # @get_tiles
+    ################################################################################################
+    def get_tiles(self):
+        """Gets all the tiles that have sections.
+
+        :return:
+            A sorted list of (i, j, k) tiles.
+        """
+
+        tiles = numpy.unique(self.sections_tiles[self.valid_sections], axis=0)
+        return [tuple(tile) for tile in tiles.tolist()]
+
+    ################################################################################################
+    # @get_tiles_in_region
+    ################################################################################################
+    def get_tiles_in_region(self,
+                            region_min,
+                            region_max):
+        """Gets the tiles that intersect a region of interest.
+
+        :param region_min:
+            The minimum bound of the region.
+        :param region_max:
+            The maximum bound of the region.
+        :return:
+            A sorted list of (i, j, k) tiles.
+        """
+
+        first = numpy.floor((numpy.asarray(region_min) - self.origin) / self.tile_size)
+        last = numpy.floor((numpy.asarray(region_max) - self.origin) / self.tile_size)
+        return [tile for tile in self.get_tiles()
+                if numpy.all(first <= tile) and numpy.all(numpy.asarray(tile) <= last)]
+
+    ################################################################################################
+    # @get_tile_sections
+    ################################################################################################
+    def get_tile_sections(self,
+                          tile):
+        """Gets the indices of the sections of a tile.
+
+        :param tile:
+            A given (i, j, k) tile.
+        :return:
+            A sorted NumPy array of the indices of the sections.
+        """
+
+        return numpy.flatnonzero(self.valid_sections &
+                                 numpy.all(self.sections_tiles == numpy.asarray(tile), axis=1))
+
+    ################################################################################################
+    # @save
+    ################################################################################################
+    def save(self,
+             file_path):
+        """Saves the index to a .npz file to be reused by the other processes.
+
+        :param file_path:
+            The path of the index file.
+        """
+
+        numpy.savez(file_path,
+                    sections_offsets=self.sections_offsets,
+                    sections_bounds_min=self.sections_bounds_min,
+                    sections_bounds_max=self.sections_bounds_max,
+                    origin=self.origin,
+                    tile_size=self.tile_size)
+
+    ################################################################################################
+    # @load
+    ################################################################################################
+    @staticmethod
+    def load(file_path):
+        """Loads an index that was saved before.
+
+        :param file_path:
+            The path of the index file.
+        :return:
+            A VasculatureTileIndex.
+        """
+
+        with numpy.load(file_path) as data:
+            return VasculatureTileIndex(
+                sections_offsets=data['sections_offsets'],
+                sections_bounds_min=data['sections_bounds_min'],
+                sections_bounds_max=data['sections_bounds_max'],
+                origin=data['origin'],
+                tile_size=float(data['tile_size']))
+
+
+####################################################################################################
+# @build_tile_index
+####################################################################################################
+def build_tile_index(dataset,
+                     tile_size,
+                     chunk_size=1000000):
+    """Builds the spatial index of the sections of a vasculature dataset. The edges are read in
+    chunks, so the whole dataset is never loaded into memory at once.
+
+    :param dataset:
+        A path to the vasculature h5 file.
+    :param tile_size:
+        The size of a tile.
+    :param chunk_size:
+        The number of the edges that are read at once.
+    :return:
+        A VasculatureTileIndex.
+    """
+
+    with h5py.File(dataset, 'r') as data:
+
+        # The sections
+        offsets = get_sections_offsets(data)
+        number_sections = len(offsets) - 1
+        bounds_min = numpy.full((number_sections, 3), numpy.inf)
+        bounds_max = numpy.full((number_sections, 3), -numpy.inf)
+
+        # The bounds of the sections, chunk by chunk
+        edges_dataset = data['edges']
+        for start in range(0, edges_dataset.shape[0], chunk_size):
+            edges = numpy.asarray(edges_dataset[start:start + chunk_size], dtype=numpy.int64)
+
+            # The sections of the edges
+            edges_sections = numpy.searchsorted(
+                offsets, numpy.arange(start, start + len(edges)), side='right') - 1
+
+            # The radii extend the bounds
+            points = read_points(data['points'], edges.reshape(-1)).reshape(len(edges), 2, -1)
+            radii = points[:, :, 3:4]
+            numpy.minimum.at(bounds_min, edges_sections, (points[:, :, :3] - radii).min(axis=1))
+            numpy.maximum.at(bounds_max, edges_sections, (points[:, :, :3] + radii).max(axis=1))
+
+    # Sections without edges have no bounds
+    empty = numpy.isinf(bounds_min[:, 0])
+    bounds_min[empty] = numpy.nan
+    bounds_max[empty] = numpy.nan
+
+    # The grid starts at the corner of the dataset
+    origin = numpy.nanmin(bounds_min, axis=0) if not numpy.all(empty) else numpy.zeros(3)
+    return VasculatureTileIndex(offsets, bounds_min, bounds_max, origin, tile_size)
+
+
+####################################################################################################
+# VasculatureTile
+####################################################################################################
+class VasculatureTile:
+    """The sections of a tile as arrays, without a Python object per section or sample."""
+
+    ################################################################################################
+    # @__init__
+    ################################################################################################
+    def __init__(self,
+                 tile,
+                 sections,
+                 points,
+                 radii,
+                 samples_offsets):
+        """Constructor
+
+        :param tile:
+            The (i, j, k) tile.
+        :param sections:
+            The indices of the sections of the tile.
+        :param points:
+            A NumPy array of shape (N, 3) of the samples of all the sections.
+        :param radii:
+            A NumPy array of the radii of the samples.
+        :param samples_offsets:
+            The samples of the section i are in the range [offsets[i], offsets[i + 1]).
+        """
+
+        self.tile = tuple(tile)
+        self.sections = sections
+        self.points = points
+        self.radii = radii
+        self.samples_offsets = samples_offsets
+
+    ################################################################################################
+    # @get_name
+    ################################################################################################
+    def get_name(self):
+        """Gets the name of the tile.
+
+        :return:
+            The name of the tile, for example tile_0_1_2.
+        """
+
+        return 'tile_%d_%d_%d' % self.tile
+
+
+####################################################################################################
+# @load_tile
+####################################################################################################
+def load_tile(dataset,
+              index,
+              tile):
+    """Loads the sections of a single tile with h5py slicing. The samples of a section are the
+    first points of its edges followed by the last point of its last edge, so that the sections
+    meet at the branching points without auxiliary sections.
+
+    :param dataset:
+        A path to the vasculature h5 file.
+    :param index:
+        The VasculatureTileIndex of the dataset.
+    :param tile:
+        A given (i, j, k) tile.
+    :return:
+        A VasculatureTile.
+    """
+
+    sections = index.get_tile_sections(tile)
+    offsets = index.sections_offsets
+    number_edges = offsets[sections + 1] - offsets[sections]
+
+    with h5py.File(dataset, 'r') as data:
+
+        # Read the edges of consecutive sections with a single slice
+        edges = list()
+        runs = numpy.split(sections, numpy.flatnonzero(numpy.diff(sections) != 1) + 1)
+        for run in runs:
+            if len(run) > 0:
+                edges.append(data['edges'][offsets[run[0]]:offsets[run[-1] + 1]])
+        edges = numpy.concatenate(edges).astype(numpy.int64) if edges else \
+            numpy.zeros((0, 2), dtype=numpy.int64)
+
+        # The samples of every section, and one more sample per section
+        edges_offsets = numpy.concatenate(([0], numpy.cumsum(number_edges)))
+        samples_indices = numpy.insert(edges[:, 0], edges_offsets[1:],
+                                       edges[edges_offsets[1:] - 1, 1] if len(edges) else [])
+        samples_offsets = edges_offsets + numpy.arange(len(edges_offsets))
+
+        # Read the points of the samples at once
+        points = read_points(data['points'], samples_indices)
+
+    return VasculatureTile(tile=tile, sections=sections, points=points[:, :3],
+                           radii=points[:, 3], samples_offsets=samples_offsets)